@@ -14,8 +14,10 @@ distinct colors per satellite.
 import logging
 import math
 from collections import Counter
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from backend.constants.colors import get_satellite_color_rgba_by_index, hex_to_rgba
 
@@ -45,6 +47,9 @@ class CZMLGenerator:
         sensor_fov_half_angle_deg: Optional[float] = None,
         max_spacecraft_roll_deg: Optional[float] = None,
         imaging_type: Optional[str] = None,  # "optical" or "sar"
+        ephemerides: Optional[
+            Dict[str, Any]
+        ] = None,  # Dict of satellite_id -> Ephemeris for the mission window
     ) -> None:
         # Constellation support: satellites dict takes precedence
         if satellites:
@@ -60,6 +65,21 @@ class CZMLGenerator:
             self.satellite = satellite
             self.is_constellation = False
 
+        # Shared ephemerides are queried instead of re-propagating each orbit
+        ephemerides = ephemerides or {}
+        self._ephemeris_by_orbit: Dict[int, Any] = {}
+        for sat_id, sat_orbit in self.satellites.items():
+            ephemeris = ephemerides.get(sat_id) or next(
+                (
+                    eph
+                    for eph in ephemerides.values()
+                    if eph.satellite_name == getattr(sat_orbit, "satellite_name", None)
+                ),
+                None,
+            )
+            if ephemeris is not None:
+                self._ephemeris_by_orbit[id(sat_orbit)] = ephemeris
+
         self.satellite_colors = satellite_colors or {}
         self.targets = targets or []
         self.passes = passes or []
@@ -305,6 +325,42 @@ class CZMLGenerator:
         # Fall back to shared color palette (handles any constellation size)
         return get_satellite_color_rgba_by_index(index)
 
+    def _position_source(self, sat_orbit: Any) -> Any:
+        """Shared ephemeris for an orbit if one was provided, else the orbit."""
+        return self._ephemeris_by_orbit.get(id(sat_orbit), sat_orbit)
+
+    def _propagate_track(
+        self, sat_orbit: Any, time_step: timedelta
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Propagate a satellite over the mission window in a single batch.
+
+        Returns (seconds_from_start, llh) arrays with non-finite samples dropped,
+        or None when the orbit object has no batch propagate() API, in which case
+        callers fall back to per-sample get_position().
+        """
+        propagate = getattr(self._position_source(sat_orbit), "propagate", None)
+        if not callable(propagate) or self.start_time is None or self.end_time is None:
+            return None
+
+        step_s = time_step.total_seconds()
+        span_s = (self.end_time - self.start_time).total_seconds()
+        offsets = np.arange(int(span_s // step_s) + 1, dtype=np.float64) * step_s
+        start = self.start_time
+        if start.tzinfo is not None:
+            start = start.astimezone(timezone.utc).replace(tzinfo=None)
+        times = np.datetime64(start, "us") + (offsets * 1e6).astype("timedelta64[us]")
+
+        try:
+            llh = np.asarray(propagate(times).position_llh, dtype=np.float64)
+        except Exception as e:
+            logger.warning("Batch propagation failed, falling back per sample: %s", e)
+            return None
+        if llh.shape != (offsets.shape[0], 3):
+            return None
+
+        finite = np.isfinite(llh).all(axis=1)
+        return offsets[finite], llh[finite]
+
     def _generate_positions_for_satellite(self, sat_orbit: Any) -> List[float]:
         """Generate position array for a specific satellite orbit."""
         positions: List[float] = []
@@ -312,11 +368,22 @@ class CZMLGenerator:
             return positions
 
         time_step = timedelta(minutes=2)
+        track = self._propagate_track(sat_orbit, time_step)
+        if track is not None:
+            offsets, llh = track
+            return (
+                np.column_stack((offsets, llh[:, 1], llh[:, 0], llh[:, 2] * 1000))
+                .ravel()
+                .tolist()
+            )
+
         current_time: datetime = self.start_time
 
         while current_time <= self.end_time:
             try:
-                lat, lon, alt = sat_orbit.get_position(current_time)
+                lat, lon, alt = self._position_source(sat_orbit).get_position(
+                    current_time
+                )
                 seconds_from_start = (current_time - self.start_time).total_seconds()
                 positions.extend([seconds_from_start, lon, lat, alt * 1000])
             except Exception as e:
@@ -392,18 +459,32 @@ class CZMLGenerator:
         time_step = timedelta(minutes=2)
         current_time: datetime = self.start_time
 
-        while current_time <= self.end_time:
-            try:
-                lat, lon, _ = sat_orbit.get_position(current_time)
-                seconds_from_start = (current_time - self.start_time).total_seconds()
-                positions.extend(
-                    [seconds_from_start, lon, lat, 0]
-                )  # Altitude 0 for ground track
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get ground track position at {current_time}: {e}"
-                )
-            current_time = current_time + time_step
+        track = self._propagate_track(sat_orbit, time_step)
+        if track is not None:
+            offsets, llh = track
+            # Altitude 0 for ground track
+            positions = (
+                np.column_stack((offsets, llh[:, 1], llh[:, 0], np.zeros_like(offsets)))
+                .ravel()
+                .tolist()
+            )
+        else:
+            while current_time <= self.end_time:
+                try:
+                    lat, lon, _ = self._position_source(sat_orbit).get_position(
+                        current_time
+                    )
+                    seconds_from_start = (
+                        current_time - self.start_time
+                    ).total_seconds()
+                    positions.extend(
+                        [seconds_from_start, lon, lat, 0]
+                    )  # Altitude 0 for ground track
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get ground track position at {current_time}: {e}"
+                    )
+                current_time = current_time + time_step
 
         # Semi-transparent ground track
         track_color = color_rgba[:3] + [100]
@@ -499,17 +580,32 @@ class CZMLGenerator:
         current_time: datetime = self.start_time
         time_step = timedelta(minutes=1)  # 1-minute intervals for smoother polar tracks
 
-        while current_time <= self.end_time:
-            try:
-                lat, lon, alt = self.satellite.get_position(current_time)
-                seconds_from_epoch = (current_time - self.start_time).total_seconds()
-                ground_positions.extend(
-                    [seconds_from_epoch, lon, lat, 0]
-                )  # Altitude = 0
-            except Exception as e:
-                logger.warning("Failed to get ground position at %s: %s", current_time, e)
+        track = self._propagate_track(self.satellite, time_step)
+        if track is not None:
+            offsets, llh = track
+            ground_positions = (
+                np.column_stack((offsets, llh[:, 1], llh[:, 0], np.zeros_like(offsets)))
+                .ravel()
+                .tolist()
+            )
+        else:
+            while current_time <= self.end_time:
+                try:
+                    lat, lon, alt = self._position_source(self.satellite).get_position(
+                        current_time
+                    )
+                    seconds_from_epoch = (
+                        current_time - self.start_time
+                    ).total_seconds()
+                    ground_positions.extend(
+                        [seconds_from_epoch, lon, lat, 0]
+                    )  # Altitude = 0
+                except Exception as e:
+                    logger.warning(
+                        "Failed to get ground position at %s: %s", current_time, e
+                    )
 
-            current_time = current_time + time_step
+                current_time = current_time + time_step
 
         logger.debug(
             "Generated dynamic ground track with %d position samples",
@@ -574,7 +670,9 @@ class CZMLGenerator:
         while current_time <= self.end_time:
             try:
                 # Get satellite position
-                sat_lat, sat_lon, alt_km = self.satellite.get_position(current_time)
+                sat_lat, sat_lon, alt_km = self._position_source(
+                    self.satellite
+                ).get_position(current_time)
                 seconds_from_epoch = (current_time - self.start_time).total_seconds()
 
                 # Calculate footprint based on sensor FOV and altitude
@@ -614,7 +712,9 @@ class CZMLGenerator:
         time_step = timedelta(minutes=2)
 
         while current_time <= self.end_time:
-            sat_lat, sat_lon, alt_km = self.satellite.get_position(current_time)
+            sat_lat, sat_lon, alt_km = self._position_source(
+                self.satellite
+            ).get_position(current_time)
             seconds_from_epoch = (current_time - self.start_time).total_seconds()
             ellipse_positions.extend([seconds_from_epoch, sat_lon, sat_lat, 0])
 
@@ -726,7 +826,9 @@ class CZMLGenerator:
         alt_km: float = 0.0
 
         while current_time <= self.end_time:
-            sat_lat, sat_lon, alt_km = sat_orbit.get_position(current_time)
+            sat_lat, sat_lon, alt_km = self._position_source(sat_orbit).get_position(
+                current_time
+            )
             seconds_from_epoch = (current_time - self.start_time).total_seconds()
             ellipse_positions.extend([seconds_from_epoch, sat_lon, sat_lat, 0])
 
@@ -1065,37 +1167,56 @@ class CZMLGenerator:
             f"Generating satellite positions from {self.start_time} to {self.end_time}"
         )
 
-        while current_time <= self.end_time:
-            try:
-                lat, lon, alt = self.satellite.get_position(current_time)
-                seconds_from_epoch = (current_time - self.start_time).total_seconds()
-
-                # Validate all values are finite numbers
-                if not all(
-                    isinstance(x, (int, float))
-                    and not (x != x or x == float("inf") or x == float("-inf"))
-                    for x in [seconds_from_epoch, lon, lat, alt]
-                ):
+        track = self._propagate_track(self.satellite, time_step)
+        if track is not None:
+            offsets, llh = track
+            positions = (
+                np.column_stack(
+                    (offsets, llh[:, 1], llh[:, 0], llh[:, 2] * 1000)  # km to meters
+                )
+                .ravel()
+                .tolist()
+            )
+        else:
+            while current_time <= self.end_time:
+                try:
+                    lat, lon, alt = self._position_source(self.satellite).get_position(
+                        current_time
+                    )
+                    seconds_from_epoch = (
+                        current_time - self.start_time
+                    ).total_seconds()
+
+                    # Validate all values are finite numbers
+                    if not all(
+                        isinstance(x, (int, float))
+                        and not (x != x or x == float("inf") or x == float("-inf"))
+                        for x in [seconds_from_epoch, lon, lat, alt]
+                    ):
+                        logger.error(
+                            f"Invalid position values at {current_time}: "
+                            f"seconds={seconds_from_epoch}, lon={lon}, lat={lat}, "
+                            f"alt={alt}"
+                        )
+                        continue
+
+                    position_values = [
+                        seconds_from_epoch,
+                        lon,
+                        lat,
+                        alt * 1000,  # Convert km to meters
+                    ]
+                    positions.extend(position_values)
+
+                    if len(positions) <= 8:  # Log first 2 position entries
+                        logger.info(f"Position at {current_time}: {position_values}")
+
+                except Exception as e:
                     logger.error(
-                        f"Invalid position values at {current_time}: seconds={seconds_from_epoch}, lon={lon}, lat={lat}, alt={alt}"
+                        f"Failed to get satellite position at {current_time}: {e}"
                     )
-                    continue
-
-                position_values = [
-                    seconds_from_epoch,
-                    lon,
-                    lat,
-                    alt * 1000,  # Convert km to meters
-                ]
-                positions.extend(position_values)
-
-                if len(positions) <= 8:  # Log first 2 position entries
-                    logger.info(f"Position at {current_time}: {position_values}")
 
-            except Exception as e:
-                logger.error(f"Failed to get satellite position at {current_time}: {e}")
-
-            current_time = current_time + time_step
+                current_time = current_time + time_step
 
         logger.info(
             f"Generated {len(positions)//4} position samples, total array length: {len(positions)}"
@@ -44,6 +44,8 @@ try:
         get_preset_scenario,
         run_algorithm_audit,
     )
+    from mission_planner.constellation import Constellation
+    from mission_planner.ephemeris import Ephemeris
     from mission_planner.orbit import SatelliteOrbit
     from mission_planner.parallel import cleanup_process_pool
     from mission_planner.planner import MissionPlanner
@@ -62,6 +64,7 @@ try:
         SchedulerConfig,
     )
     from mission_planner.targets import GroundTarget, TargetManager
+    from mission_planner.tle_catalog import TLECatalog, get_tle_catalog
     from mission_planner.utils import (
         reset_log_context,
         set_log_context,
@@ -72,6 +75,8 @@ try:
         update_log_context,
     )
     from mission_planner.visibility import VisibilityCalculator
+    from mission_planner.visibility_cache import get_visibility_cache
+    from mission_planner.visibility_store import get_visibility_store
 except ImportError as e:
     # Use sys.stderr for critical import errors (before logger setup)
     sys.stderr.write(f"Error importing mission planner modules: {e}\n")
@@ -880,6 +885,17 @@ def _pass_identity_key(pass_detail: Any) -> tuple[str, str, str]:
     return (satellite_name, target_name, max_time_text)
 
 
+def _build_ephemerides(
+    satellites_dict: Dict[str, Any], start_time: datetime, end_time: datetime
+) -> Dict[str, "Ephemeris"]:
+    """Propagate all satellites in one batch into per-satellite Ephemeris tables."""
+    try:
+        return Constellation(satellites_dict).build_ephemerides(start_time, end_time)
+    except Exception as e:
+        logger.warning("Could not build constellation ephemerides: %s", e)
+        return {}
+
+
 def _get_pass_off_nadir_time(pass_detail: Any) -> datetime:
     """Return the pass timestamp used for off-nadir time filtering."""
     timestamp = getattr(pass_detail, "max_elevation_time", None)
@@ -1287,15 +1303,20 @@ def _enrich_and_convert_pass(
     pass_index: int,
     targets: List[Any],
     vis_calc: Any,
+    sections: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Enrich a pass with STK-like comprehensive data and convert to dictionary.
 
+    Enrichment is attached lazily, so only the serialized sections are
+    computed; the others stay available on the PassDetails on demand.
+
     Args:
         pass_details: PassDetails object
         pass_index: Index of this pass in the list
         targets: List of GroundTarget objects
         vis_calc: VisibilityCalculator instance
+        sections: Enrichment sections to include (default: all)
 
     Returns:
         Dictionary with all pass data including STK-like enhancements
@@ -1314,12 +1335,13 @@ def _enrich_and_convert_pass(
                 target,
                 max_roll_rate_dps=1.0,  # Default roll rate
                 sensor_gsd_base_m=None,  # GSD not computed for now
+                lazy=True,
             )
         except Exception as e:
             logger.warning(f"Failed to enrich pass {pass_index}: {e}")
 
-    # Use the PassDetails.to_dict() method which includes all STK-like data
-    result: Dict[str, Any] = pass_details.to_dict()
+    # Use the PassDetails.to_dict() method which includes the STK-like data
+    result: Dict[str, Any] = pass_details.to_dict(sections=sections)
     return result
 
 
@@ -1875,9 +1897,14 @@ async def analyze_mission(request: MissionRequest) -> MissionResponse:
                 sar_input_params.pass_direction.value,
             )
 
+        # Propagate the whole constellation in one batch; all targets, SAR analysis,
+        # enrichment and CZML generation query the per-satellite interpolated tables
+        ephemerides = _build_ephemerides(satellites_dict, start_time, end_time)
+
         for sat_id, sat_orbit in satellites_dict.items():
             # Get satellite name from ID (remove "sat_" prefix)
             sat_name = sat_id.replace("sat_", "")
+            sat_ephemeris = ephemerides.get(sat_id)
 
             logger.info("Computing passes for satellite: %s (%s)", sat_name, sat_id)
 
@@ -1893,6 +1920,10 @@ async def analyze_mission(request: MissionRequest) -> MissionResponse:
                 use_adaptive=(
                     request.use_adaptive if request.use_adaptive is not None else True
                 ),
+                ephemeris=sat_ephemeris,
+                # Re-analyses of a shifted or extended horizon only search new time
+                visibility_cache=get_visibility_cache(),
+                visibility_store=get_visibility_store(),
             )
 
             # Flatten passes and tag with satellite_id
@@ -1906,7 +1937,7 @@ async def analyze_mission(request: MissionRequest) -> MissionResponse:
             # SAR-specific analysis: enhance passes with SAR attributes
             if is_sar_mission and sar_input_params:
                 base_vis_calc = VisibilityCalculator(
-                    satellite=sat_orbit, use_adaptive=False
+                    satellite=sat_orbit, use_adaptive=False, ephemeris=sat_ephemeris
                 )
                 sar_calc = SARVisibilityCalculator(base_vis_calc, sar_input_params)
 
@@ -2011,10 +2042,22 @@ async def analyze_mission(request: MissionRequest) -> MissionResponse:
 
         # Create visibility calculator for STK-like pass enrichment
         # Use primary satellite for enrichment (constellation passes are tagged with sat_id)
-        primary_vis_calc = VisibilityCalculator(satellite=satellite, use_adaptive=False)
+        primary_ephemeris = next(
+            (
+                ephemerides[sat_id]
+                for sat_id, sat_orbit in satellites_dict.items()
+                if sat_orbit is satellite and sat_id in ephemerides
+            ),
+            None,
+        )
+        primary_vis_calc = VisibilityCalculator(
+            satellite=satellite, use_adaptive=False, ephemeris=primary_ephemeris
+        )
 
         passes_payload = [
-            _enrich_and_convert_pass(p, idx, targets, primary_vis_calc)
+            _enrich_and_convert_pass(
+                p, idx, targets, primary_vis_calc, sections=request.pass_sections
+            )
             for idx, p in enumerate(all_passes)
         ]
         run_order_summary, planning_demands, planning_demand_summary = (
@@ -2125,6 +2168,7 @@ async def analyze_mission(request: MissionRequest) -> MissionResponse:
             sensor_fov_half_angle_deg=actual_sensor_fov,
             max_spacecraft_roll_deg=actual_max_spacecraft_roll,
             imaging_type=request.imaging_type,  # "optical" or "sar"
+            ephemerides=ephemerides,
         )
         logger.debug(
             "CZMLGenerator initialized with sensor_fov=%s°, max_roll=%s°",
@@ -2541,12 +2585,15 @@ async def enrich_passes_batch(
                     pass_index=idx,
                 )
 
-                # Enrich
+                # Enrich only the requested sections
                 vis_calc.enrich_pass_with_stk_data(
-                    pass_details, target, request.max_roll_rate_dps
+                    pass_details,
+                    target,
+                    request.max_roll_rate_dps,
+                    sections=request.sections,
                 )
 
-                enriched_passes.append(pass_details.to_dict())
+                enriched_passes.append(pass_details.to_dict(sections=request.sections))
 
             except Exception as e:
                 logger.warning(f"Failed to enrich pass {idx}: {e}")
@@ -2630,45 +2677,66 @@ async def get_tle_sources() -> Dict[str, List[Dict[str, str]]]:
     return {"sources": formatted_sources}
 
 
-@app.get("/api/v1/tle/catalog/{source_id}")
-async def get_satellite_catalog(source_id: str) -> Dict[str, Any]:
-    """Get satellite catalog from specified Celestrak source"""
-    sources = get_common_tle_sources()
+# Downloaded Celestrak catalogs, indexed by TLECatalog; Celestrak updates its
+# GP data about every two hours and asks clients not to poll more often
+TLE_CATALOG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tle_catalogs"
+)
+TLE_CATALOG_MAX_AGE_SECONDS = 2 * 3600
 
+
+def _get_source_catalog(source_id: str) -> TLECatalog:
+    """Return the indexed catalog for a TLE source, downloading it when stale."""
+    sources = get_common_tle_sources()
     if source_id not in sources:
         raise HTTPException(status_code=404, detail="TLE source not found")
 
-    try:
+    path = os.path.join(TLE_CATALOG_DIR, f"{source_id}.tle")
+    now = datetime.now(timezone.utc).timestamp()
+    if (
+        not os.path.exists(path)
+        or now - os.path.getmtime(path) > TLE_CATALOG_MAX_AGE_SECONDS
+    ):
         url = sources[source_id]
-        logger.info(f"Fetching TLE data from: {url}")
-
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        try:
+            logger.info(f"Fetching TLE data from: {url}")
+            response = requests.get(url, timeout=30)
+            response.raise_for_status()
 
-        tle_data = response.text.strip()
+            os.makedirs(TLE_CATALOG_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=TLE_CATALOG_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(response.text.strip() + "\n")
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except requests.RequestException as e:
+            if not os.path.exists(path):
+                logger.error(f"Failed to fetch TLE data from {url}: {e}")
+                raise HTTPException(
+                    status_code=500, detail=f"Failed to fetch TLE data: {str(e)}"
+                )
+            logger.warning(f"Failed to refresh {source_id}, using cached copy: {e}")
 
-        # Parse TLE data into satellite list
-        satellites = []
-        lines = tle_data.split("\n")
+    return get_tle_catalog(path)
 
-        for i in range(0, len(lines) - 2, 3):
-            if i + 2 < len(lines):
-                name = lines[i].strip()
-                line1 = lines[i + 1].strip()
-                line2 = lines[i + 2].strip()
 
-                if name and line1.startswith("1 ") and line2.startswith("2 "):
-                    satellites.append({"name": name, "line1": line1, "line2": line2})
+@app.get("/api/v1/tle/catalog/{source_id}")
+async def get_satellite_catalog(source_id: str) -> Dict[str, Any]:
+    """Get satellite catalog from specified Celestrak source"""
+    catalog = _get_source_catalog(source_id)
 
+    try:
+        satellites = [entry.to_dict() for entry in catalog]
         logger.info(f"Parsed {len(satellites)} satellites from {source_id}")
 
         return {"source": source_id, "count": len(satellites), "satellites": satellites}
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch TLE data from {url}: {e}")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to fetch TLE data: {str(e)}"
-        )
     except Exception as e:
         logger.error(f"Error parsing TLE data: {e}")
         raise HTTPException(status_code=500, detail=f"Error parsing TLE data: {str(e)}")
@@ -2684,21 +2752,15 @@ async def search_satellites(request: Dict[str, Any]) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="Search query is required")
 
     try:
-        # Get catalog from specified source
-        catalog_response = await get_satellite_catalog(source_id)
-        satellites = catalog_response["satellites"]
-
-        # Filter satellites by search term
-        matching_satellites = []
-        for sat in satellites:
-            if search_term in sat["name"].lower():
-                matching_satellites.append(sat)
+        # Trigram-indexed lookup instead of scanning the whole catalog
+        catalog = _get_source_catalog(source_id)
+        matching_satellites = catalog.search(search_term, limit=50)
 
         return {
             "query": search_term,
             "source": source_id,
-            "count": len(matching_satellites),
-            "satellites": matching_satellites[:50],  # Limit to 50 results
+            "count": catalog.count(search_term),
+            "satellites": [entry.to_dict() for entry in matching_satellites],
         }
 
     except Exception as e:
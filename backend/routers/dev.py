@@ -8,7 +8,7 @@ Endpoints:
 - GET  /api/v1/dev/schedule-snapshot  — snapshot metadata + acquisition IDs for a workspace
 - GET  /api/v1/dev/reshuffle-explainer — latest persisted revision diff/explainer for a workspace
 - POST /api/v1/dev/write-artifacts    — write demo evidence artifacts to disk
-- GET  /api/v1/dev/metrics            — process RSS/VMS + last feasibility timing
+- GET  /api/v1/dev/metrics            — process memory, feasibility timing, store hits
 - GET  /api/v1/dev/route-latency      — inspect in-memory route latency batches
 """
 
@@ -28,6 +28,8 @@ from pydantic import BaseModel, Field
 from backend.reshuffle_explainer import get_reshuffle_artifact_paths
 from backend.security import require_dev_access
 from backend.schedule_persistence import get_schedule_db
+from mission_planner.visibility_cache import get_visibility_cache
+from mission_planner.visibility_store import get_visibility_store
 
 # ---------------------------------------------------------------------------
 # Lightweight process-level metrics (no psutil dependency)
@@ -169,6 +171,10 @@ class MetricsResponse(BaseModel):
     last_pass_count: Optional[int] = None
     last_request_params: Optional[LastRequestParams] = None
     gc_stats: Optional[GcStats] = None
+    visibility_cache: Optional[Dict[str, Any]] = None
+    visibility_store: Optional[Dict[str, Any]] = Field(
+        default=None, description="Persistent pass store hit/miss counters"
+    )
 
 
 class RouteLatencyEntry(BaseModel):
@@ -447,7 +453,8 @@ async def get_metrics() -> MetricsResponse:
     Dev-only endpoint returning process-level metrics.
 
     Returns RSS/VMS memory usage, last feasibility timing stats,
-    last response/pass metadata, and GC collection counts.
+    last response/pass metadata, GC collection counts, and visibility
+    cache/store statistics.
     """
     # GC stats
     gc_counts = list(gc.get_count())
@@ -467,6 +474,13 @@ async def get_metrics() -> MetricsResponse:
             duration_days=_last_feasibility_stats.get("duration_days"),
         )
 
+    store = get_visibility_store()
+    try:
+        store_stats = store.stats() if store is not None else None
+    except Exception as e:
+        logger.warning(f"Visibility store stats unavailable: {e}")
+        store_stats = None
+
     return MetricsResponse(
         success=True,
         process=ProcessMetrics(
@@ -481,6 +495,8 @@ async def get_metrics() -> MetricsResponse:
         last_pass_count=_last_feasibility_stats.get("pass_count"),
         last_request_params=last_req_params,
         gc_stats=gc_info,
+        visibility_cache=get_visibility_cache().stats(),
+        visibility_store=store_stats,
     )
 
 
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 import requests  # type: ignore[import-untyped]
 import yaml  # type: ignore[import-untyped]
+from mission_planner.ephemeris_cache import get_ephemeris_cache
 
 logger = logging.getLogger(__name__)
 
@@ -210,6 +211,12 @@ class SatelliteManager:
                 self.satellites[i] = updated_satellite
                 self.save_config()
 
+                if (sat.line1, sat.line2) != (
+                    updated_satellite.line1,
+                    updated_satellite.line2,
+                ):
+                    self._invalidate_ephemeris_cache(sat)
+
                 logger.info(
                     f"Updated satellite: {updated_satellite.name} ({satellite_id})"
                 )
@@ -217,6 +224,12 @@ class SatelliteManager:
 
         return None
 
+    def _invalidate_ephemeris_cache(self, satellite: Satellite) -> None:
+        """Drop cached ephemeris blocks propagated from a superseded TLE"""
+        cache = get_ephemeris_cache()
+        if cache is not None:
+            cache.invalidate([satellite.line1, satellite.line2])
+
     def remove_satellite(self, satellite_id: str) -> bool:
         """Remove satellite from configuration"""
         for i, sat in enumerate(self.satellites):
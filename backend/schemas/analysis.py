@@ -1,12 +1,15 @@
 """STK-like analysis and pass enrichment schemas."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
 from backend.schemas.tle import TLEData
 from backend.schemas.target import TargetData
 
+# Mirrors mission_planner.visibility.ENRICHMENT_SECTIONS
+PassEnrichmentSection = Literal["geometry", "lighting", "quality", "maneuver"]
+
 
 class PassGeometryResponse(BaseModel):
     """Geometry data at a specific point in a pass."""
@@ -122,3 +125,7 @@ class BatchPassEnrichmentRequest(BaseModel):
     targets: List[TargetData]
     passes: List[Dict[str, Any]] = Field(description="List of pass data to enrich")
     max_roll_rate_dps: float = Field(default=1.0)
+    sections: Optional[List[PassEnrichmentSection]] = Field(
+        default=None,
+        description="Enrichment sections to compute and return (default: all)",
+    )
@@ -11,6 +11,7 @@ from backend.time_windows import (
     parse_hhmm_time,
 )
 
+from backend.schemas.analysis import PassEnrichmentSection
 from backend.schemas.tle import TLEData
 from backend.schemas.target import TargetData
 
@@ -297,6 +298,13 @@ class MissionRequest(BaseModel):
             "off-nadir time across the planning horizon"
         ),
     )
+    pass_sections: Optional[List[PassEnrichmentSection]] = Field(
+        default=None,
+        description=(
+            "Pass enrichment sections to compute and return "
+            "(geometry, lighting, quality, maneuver; default: all)"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_satellite_input(self) -> "MissionRequest":
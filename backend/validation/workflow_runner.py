@@ -355,6 +355,7 @@ class WorkflowValidationRunner:
         from mission_planner.orbit import SatelliteOrbit
         from mission_planner.targets import GroundTarget
         from mission_planner.visibility import VisibilityCalculator
+        from mission_planner.visibility_store import get_visibility_store
 
         start_time = datetime.fromisoformat(
             scenario.config.start_time.replace("Z", "+00:00")
@@ -363,6 +364,7 @@ class WorkflowValidationRunner:
             scenario.config.end_time.replace("Z", "+00:00")
         ).replace(tzinfo=None)
 
+        store = get_visibility_store()
         targets = [
             GroundTarget(
                 name=t.name,
@@ -380,7 +382,20 @@ class WorkflowValidationRunner:
             satellite = self._create_satellite(sat_config)
             vis_calc = VisibilityCalculator(satellite=satellite, use_adaptive=True)
 
-            passes_dict = vis_calc.get_visibility_windows(targets, start_time, end_time)
+            if store is not None:
+                # Re-runs of a scenario are answered from the persistent store
+                passes_dict = store.get_visibility_windows(
+                    satellite,
+                    targets,
+                    start_time,
+                    end_time,
+                    vis_calc.get_visibility_windows,
+                    search_key="adaptive",
+                )
+            else:
+                passes_dict = vis_calc.get_visibility_windows(
+                    targets, start_time, end_time
+                )
 
             for target_name, passes in passes_dict.items():
                 for idx, pass_detail in enumerate(passes):
@@ -265,6 +265,10 @@ echo ""
 echo "Starting backend with hot reload..."
 (
     cd "$ROOT_DIR"
+    # Share ephemeris blocks across workers and persist pass results across
+    # restarts (set a variable empty to disable it)
+    export MISSION_PLANNER_EPHEMERIS_CACHE_DIR="${MISSION_PLANNER_EPHEMERIS_CACHE_DIR-$ROOT_DIR/data/ephemeris_cache}"
+    export MISSION_PLANNER_VISIBILITY_STORE_PATH="${MISSION_PLANNER_VISIBILITY_STORE_PATH-$ROOT_DIR/data/visibility_store.sqlite}"
     PYTHONPATH=. "$PYTHON_BIN" -m uvicorn backend.main:app --reload --host 0.0.0.0 --port 8000
 ) &
 BACKEND_PID=$!
@@ -381,6 +381,7 @@ def run_algorithm_audit(
             "roll_pitch_first_fit": AlgorithmType.ROLL_PITCH_FIRST_FIT,
             "best_fit_roll_pitch": AlgorithmType.ROLL_PITCH_BEST_FIT,
             "roll_pitch_best_fit": AlgorithmType.ROLL_PITCH_BEST_FIT,
+            "optimal_dp": AlgorithmType.OPTIMAL_DP,
         }
 
         if algorithm_name not in algorithm_map:
@@ -52,13 +52,18 @@ def main(log_level: str, log_file: Optional[str]) -> None:
 @click.option('--output', type=click.Path(),
               help='Output directory for results')
 @click.option('--format', 'output_format', default='json',
-              type=click.Choice(['json', 'csv']),
+              type=click.Choice(['json', 'jsonl', 'csv']),
               help='Schedule output format')
 @click.option('--mission-type', default='imaging',
               type=click.Choice(['communication', 'imaging']),
               help='Mission type: communication (elevation only) or imaging (pointing cone)')
 @click.option('--pointing-angle', default=5.0, type=float,
               help='Satellite pointing angle in degrees for imaging missions (default: 5.0)')
+@click.option('--stream', is_flag=True,
+              help='Stream passes straight to the schedule file with bounded memory '
+                   '(requires --output; skips summary and plots)')
+@click.option('--chunk-hours', default=24.0, type=float,
+              help='Time block searched at once when streaming (default: 24)')
 def plan(
     tle: str,
     satellite: str,
@@ -69,7 +74,9 @@ def plan(
     output: Optional[str],
     output_format: str,
     mission_type: str,
-    pointing_angle: float
+    pointing_angle: float,
+    stream: bool,
+    chunk_hours: float
 ) -> None:
     """Plan a satellite mission with specified targets.
     
@@ -83,6 +90,10 @@ def plan(
     
     # Imaging mission (finds passes for taking pictures)
     plan --tle data.tle --satellite "ICEYE-X44" --target "Space42" 24.44 54.83 --mission-type imaging --pointing-angle 10.0
+
+    # Year-long analysis streamed to JSON Lines
+    plan --tle data.tle --satellite "ICEYE-X44" --target "Space42" 24.44 54.83 \\
+        --duration 8760 --output out --format jsonl --stream
     """
     
     try:
@@ -109,7 +120,7 @@ def plan(
                     longitude=lon, 
                     elevation_mask=elevation_mask,
                     mission_type=mission_type,
-                    pointing_angle=pointing_angle
+                    sensor_fov_half_angle_deg=pointing_angle
                 )
                 target_objects.append(target)
                 click.echo(f"Added target: {target} (mission: {mission_type})")
@@ -124,6 +135,25 @@ def plan(
         # Create mission planner
         planner = MissionPlanner(sat, target_objects)
         
+        if stream:
+            if not output:
+                click.echo("--stream requires --output", err=True)
+                return
+            output_dir = ensure_directory_exists(output)
+            schedule_file = output_dir / f"mission_schedule.{output_format}"
+            click.echo(f"Streaming passes from {start_dt} for {duration} hours...")
+            count = planner.export_schedule(
+                planner.iter_passes(
+                    start_dt,
+                    start_dt + timedelta(hours=duration),
+                    chunk=timedelta(hours=chunk_hours),
+                ),
+                schedule_file,
+                format=output_format,
+            )
+            click.echo(f"Exported {count} passes to: {schedule_file}")
+            return
+
         # Run analysis
         click.echo(f"Analyzing mission from {start_dt} for {duration} hours...")
         results = planner.run_mission_analysis(
@@ -0,0 +1,276 @@
+"""
+Constellation-wide batched propagation.
+
+Propagates every satellite of a request in one vectorized SGP4 call
+(sgp4's SatrecArray) and returns (N_sat, N_time, 3) state tensors. Per-
+satellite consumers take slices: PropagatedStates for direct array work,
+or Ephemeris tables for visibility, scheduling and CZML, which are built
+from a single batched propagation of the shared node grid.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from sgp4.api import SatrecArray
+
+from .ephemeris import (
+    DEFAULT_NODE_STEP_SECONDS,
+    EPHEMERIS_MARGIN_SECONDS,
+    Ephemeris,
+    node_grid,
+)
+from .ephemeris_cache import get_ephemeris_cache
+from .orbit import (
+    PropagatedStates,
+    SatelliteOrbit,
+    TimesLike,
+    datetime_to_epoch_seconds,
+    epoch_seconds_to_datetime,
+    julian_from_epoch_seconds,
+    states_from_eci,
+    to_epoch_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConstellationStates:
+    """
+    Batched states of every satellite in a constellation.
+
+    Attributes:
+        satellite_ids: Satellite IDs in row order, length S
+        times: Epoch seconds (UTC) of each sample, shape (T,)
+        position_ecef: ECEF position in km, shape (S, T, 3)
+        velocity_ecef: ECEF-rotated velocity in km/s, shape (S, T, 3)
+        position_llh: Geodetic (lat_deg, lon_deg, alt_km), shape (S, T, 3)
+    """
+
+    satellite_ids: Tuple[str, ...]
+    times: np.ndarray
+    position_ecef: np.ndarray
+    velocity_ecef: np.ndarray
+    position_llh: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.satellite_ids)
+
+    def __getitem__(self, satellite_id: str) -> PropagatedStates:
+        """Per-satellite slice (views into the constellation arrays)."""
+        row = self.satellite_ids.index(satellite_id)
+        return PropagatedStates(
+            times=self.times,
+            position_ecef=self.position_ecef[row],
+            velocity_ecef=self.velocity_ecef[row],
+            position_llh=self.position_llh[row],
+        )
+
+
+class Constellation:
+    """
+    Set of satellites propagated together.
+
+    Satellites whose predictor wraps an sgp4 Satrec are propagated in one
+    SatrecArray call; any others fall back to their own propagate_eci().
+    """
+
+    def __init__(self, satellites: Mapping[str, SatelliteOrbit]) -> None:
+        """
+        Initialize constellation.
+
+        Args:
+            satellites: Mapping of satellite ID to orbit (order is preserved)
+        """
+        self.satellites: Dict[str, SatelliteOrbit] = dict(satellites)
+        self.satellite_ids: Tuple[str, ...] = tuple(self.satellites)
+
+    def __len__(self) -> int:
+        return len(self.satellites)
+
+    def propagate_eci(
+        self, epoch_s: np.ndarray, satellite_ids: Optional[Sequence[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Propagate satellites to inertial (SGP4 TEME) state tensors.
+
+        Args:
+            epoch_s: 1-D array of Unix epoch seconds (UTC), shape (T,)
+            satellite_ids: Optional subset of satellites (default: all)
+
+        Returns:
+            Tuple of (position_km, velocity_km_s) arrays, each shape (S, T, 3)
+
+        Raises:
+            ValueError: If SGP4 reports an error for any satellite and sample
+        """
+        satellite_ids = list(satellite_ids or self.satellite_ids)
+        errors, position_eci, velocity_eci = self._propagate_batch(
+            epoch_s, satellite_ids
+        )
+        if errors.any():
+            row, col = (int(i) for i in np.argwhere(errors)[0])
+            raise ValueError(
+                f"SGP4 propagation failed for {satellite_ids[row]} at "
+                f"{epoch_seconds_to_datetime(epoch_s[col])} "
+                f"(error code {int(errors[row, col])})"
+            )
+        return position_eci, velocity_eci
+
+    def propagate(self, times: TimesLike) -> ConstellationStates:
+        """
+        Propagate every satellite to ECEF and geodetic state tensors.
+
+        Args:
+            times: Sample times (see SatelliteOrbit.propagate)
+
+        Returns:
+            ConstellationStates with (S, T, 3) arrays
+
+        Raises:
+            ValueError: If SGP4 reports an error for any satellite and sample
+        """
+        epoch_s = to_epoch_seconds(times)
+        position_eci, velocity_eci = self.propagate_eci(epoch_s)
+        n_sat, n_time = position_eci.shape[:2]
+
+        # Rotate all satellites at once as one flat (S*T, 3) batch
+        flat = states_from_eci(
+            np.tile(epoch_s, n_sat),
+            position_eci.reshape(-1, 3),
+            velocity_eci.reshape(-1, 3),
+        )
+        return ConstellationStates(
+            satellite_ids=self.satellite_ids,
+            times=epoch_s,
+            position_ecef=flat.position_ecef.reshape(n_sat, n_time, 3),
+            velocity_ecef=flat.velocity_ecef.reshape(n_sat, n_time, 3),
+            position_llh=flat.position_llh.reshape(n_sat, n_time, 3),
+        )
+
+    def build_ephemerides(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        step_seconds: float = DEFAULT_NODE_STEP_SECONDS,
+        margin_seconds: float = EPHEMERIS_MARGIN_SECONDS,
+    ) -> Dict[str, Ephemeris]:
+        """
+        Build an Ephemeris per satellite from one batched propagation.
+
+        Satellites already in the disk ephemeris cache are loaded from it;
+        the rest are propagated together on the shared node grid and written
+        back. Satellites that fail to propagate are left out with a warning.
+
+        Args:
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            step_seconds: Node spacing in seconds
+            margin_seconds: Extra coverage on each side of the horizon
+
+        Returns:
+            Mapping of satellite ID to Ephemeris covering the horizon
+        """
+        cache = get_ephemeris_cache()
+        ephemerides: Dict[str, Ephemeris] = {}
+        pending: List[str] = []
+        for sat_id, orbit in self.satellites.items():
+            cached = None
+            if cache is not None:
+                try:
+                    cached = cache.lookup(
+                        orbit, start_time, end_time, step_seconds, margin_seconds
+                    )
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ephemeris cache lookup failed for {sat_id}: {e}")
+            if cached is not None:
+                ephemerides[sat_id] = cached
+            else:
+                pending.append(sat_id)
+
+        if pending:
+            if cache is not None:
+                node_times = cache.block_node_times(
+                    start_time, end_time, step_seconds, margin_seconds
+                )
+            else:
+                node_times = node_grid(
+                    datetime_to_epoch_seconds(start_time) - margin_seconds,
+                    datetime_to_epoch_seconds(end_time) + margin_seconds,
+                    step_seconds,
+                )
+            errors, position_eci, velocity_eci = self._propagate_batch(
+                node_times, pending
+            )
+
+            for row, sat_id in enumerate(pending):
+                if errors[row].any():
+                    logger.warning(
+                        f"Could not build ephemeris for {sat_id}: SGP4 error code "
+                        f"{int(errors[row][errors[row] != 0][0])}"
+                    )
+                    continue
+                orbit = self.satellites[sat_id]
+                ephemeris = Ephemeris(
+                    orbit.satellite_name,
+                    node_times,
+                    position_eci[row],
+                    velocity_eci[row],
+                    tle_lines=list(orbit.tle_lines),
+                    orbit=orbit,
+                )
+                if cache is not None:
+                    try:
+                        cache.store(ephemeris)
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Could not cache ephemeris for {sat_id}: {e}")
+                ephemerides[sat_id] = ephemeris
+
+        logger.debug(
+            "Built %d ephemerides (%d propagated, %d from cache)",
+            len(ephemerides),
+            len(pending),
+            len(self.satellites) - len(pending),
+        )
+        return {
+            sat_id: ephemerides[sat_id]
+            for sat_id in self.satellite_ids
+            if sat_id in ephemerides
+        }
+
+    def _propagate_batch(
+        self, epoch_s: np.ndarray, satellite_ids: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Propagate satellites, returning (errors, position, velocity) tensors."""
+        epoch_s = np.asarray(epoch_s, dtype=np.float64)
+        orbits = [self.satellites[sat_id] for sat_id in satellite_ids]
+        satrecs = [getattr(orbit.predictor, "_propagator", None) for orbit in orbits]
+
+        if satrecs and all(hasattr(satrec, "sgp4_array") for satrec in satrecs):
+            jd, fr = julian_from_epoch_seconds(epoch_s)
+            errors, position_eci, velocity_eci = SatrecArray(satrecs).sgp4(jd, fr)
+            return (
+                errors,
+                np.ascontiguousarray(position_eci, dtype=np.float64),
+                np.ascontiguousarray(velocity_eci, dtype=np.float64),
+            )
+
+        # Predictors without a Satrec are propagated one satellite at a time
+        n_sat, n_time = len(orbits), epoch_s.shape[0]
+        errors = np.zeros((n_sat, n_time), dtype=np.uint8)
+        position_eci = np.full((n_sat, n_time, 3), np.nan)
+        velocity_eci = np.full((n_sat, n_time, 3), np.nan)
+        for row, orbit in enumerate(orbits):
+            try:
+                position_eci[row], velocity_eci[row] = orbit.propagate_eci(epoch_s)
+            except ValueError as e:
+                logger.debug(f"Propagation failed for {orbit.satellite_name}: {e}")
+                errors[row] = 1
+        return errors, position_eci, velocity_eci
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"Constellation(satellites={list(self.satellite_ids)})"
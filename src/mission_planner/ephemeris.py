@@ -0,0 +1,592 @@
+"""
+Interpolated satellite ephemeris tables.
+
+An Ephemeris is built once per (TLE, horizon): the orbit is propagated with
+SGP4 at coarse, evenly spaced nodes and any time inside the horizon is then
+answered by cubic Hermite interpolation of the inertial position/velocity
+nodes. Every target in a run can query the same table instead of
+re-propagating the satellite.
+
+Accuracy: for node spacing h, cubic Hermite interpolation of a smooth
+trajectory has position error bounded by ``h**4 / 384 * max|r''''|``.
+For orbital motion ``|r''''| <= r * w**4`` where w is the angular rate, so
+the bound reported by ``Ephemeris.error_bound_km`` is
+``SAFETY * h**4 / 384 * r_max * w_max**4`` plus a 10 cm floor. For a
+400-700 km LEO orbit at the default 60 s spacing this is under one metre,
+far below the resolution of the 1 s visibility search.
+
+That bound assumes the SGP4 node velocities are the derivative of the node
+positions, which holds to the floor for near-earth orbits only. For
+deep-space orbits (period of 225 minutes or more, propagated with SDP4) the
+velocities can be off by up to ~20 m/s, and a velocity error dv adds at
+most ``h / 4 * dv`` to the interpolation error. For those orbits the bound
+therefore adds ``SAFETY * h / 4 * dv_max``, with dv_max measured at the
+nodes against central differences of the source orbit's positions; without
+a source orbit it is infinite.
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .orbit import (
+    SECONDS_PER_DAY,
+    UNIX_EPOCH_JD,
+    PropagatedStates,
+    SatelliteOrbit,
+    TimesLike,
+    datetime_to_epoch_seconds,
+    ecef_to_llh,
+    epoch_seconds_to_datetime,
+    gmst_from_julian,
+    states_from_eci,
+    to_epoch_seconds,
+)
+
+if TYPE_CHECKING:
+    from orbit_predictor.predictors.base import Position
+
+logger = logging.getLogger(__name__)
+
+# Default spacing between SGP4 nodes
+DEFAULT_NODE_STEP_SECONDS = 60.0
+
+# Extra nodes kept on each side of the requested horizon so that edge
+# refinement and finite differences just outside the window stay covered
+EPHEMERIS_MARGIN_SECONDS = 120.0
+
+# Safety factor applied to the analytic Hermite bound (perturbations, drag)
+ERROR_BOUND_SAFETY_FACTOR = 2.0
+
+# Node positions or velocities: one (N, 3) array, or consecutive segments
+NodeArrays = Union[np.ndarray, Sequence[np.ndarray]]
+
+# SGP4 velocities are not the exact derivative of SGP4 positions; this floor
+# (10 cm) covers that inconsistency at small node spacings
+SGP4_CONSISTENCY_FLOOR_KM = 1e-4
+
+# SGP4 switches to the deep-space (SDP4) model from this orbital period on
+DEEP_SPACE_PERIOD_SECONDS = 225 * 60.0
+
+# Earth gravitational parameter (km^3/s^2, WGS-72 as used by SGP4)
+EARTH_MU_KM3_S2 = 398600.8
+
+# Half-width of the central differences measuring SDP4 velocity errors
+VELOCITY_CHECK_SECONDS = 0.5
+
+
+class Ephemeris:
+    """
+    Coarse SGP4 node table with cubic Hermite interpolation.
+
+    Exposes the same position API as SatelliteOrbit (get_position and
+    propagate) so it can be used wherever an orbit is queried, plus
+    get_state() returning an orbit_predictor Position for code that works
+    with predictor positions. Times outside the table fall back to the
+    source orbit when one is attached, and raise ValueError otherwise.
+
+    The nodes may be held as consecutive segments of equal length (one per
+    cache block) that are interpolated in place, so memory-mapped blocks are
+    never copied into a joined table.
+    """
+
+    def __init__(
+        self,
+        satellite_name: str,
+        node_times: np.ndarray,
+        position_eci: NodeArrays,
+        velocity_eci: NodeArrays,
+        tle_lines: Optional[list] = None,
+        orbit: Optional[SatelliteOrbit] = None,
+    ) -> None:
+        """
+        Initialize from precomputed inertial nodes.
+
+        Args:
+            satellite_name: Name of the satellite
+            node_times: Evenly spaced node epoch seconds, shape (N,), N >= 2
+            position_eci: Inertial node positions in km, shape (N, 3), or a
+                list of segments of equal shape (M + 1, 3) where each
+                segment starts with the last node of the previous one
+            velocity_eci: Inertial node velocities in km/s, laid out like
+                position_eci
+            tle_lines: TLE the nodes were propagated from (informational)
+            orbit: Source orbit used for times outside the table
+
+        Raises:
+            ValueError: If fewer than two nodes are given, spacing is uneven
+                or the node arrays do not match node_times
+        """
+        node_times = np.ascontiguousarray(node_times, dtype=np.float64)
+        if node_times.shape[0] < 2:
+            raise ValueError("Ephemeris needs at least two nodes")
+
+        step = float(node_times[1] - node_times[0])
+        if step <= 0 or not np.allclose(np.diff(node_times), step, atol=1e-6):
+            raise ValueError("Ephemeris nodes must be evenly spaced and increasing")
+
+        self.satellite_name = satellite_name
+        self.tle_lines = tle_lines
+        self.orbit = orbit
+        self.node_times = node_times
+        self._position_segments = _node_segments(position_eci)
+        self._velocity_segments = _node_segments(velocity_eci)
+        n_segments = len(self._position_segments)
+        # Node intervals per segment
+        self._segment_steps = (node_times.shape[0] - 1) // max(n_segments, 1)
+        segment_shape = (self._segment_steps + 1, 3)
+        if (
+            n_segments == 0
+            or len(self._velocity_segments) != n_segments
+            or n_segments * self._segment_steps + 1 != node_times.shape[0]
+            or any(
+                segment.shape != segment_shape
+                for segment in self._position_segments + self._velocity_segments
+            )
+        ):
+            raise ValueError("Ephemeris node arrays do not match node_times")
+        self.step_seconds = step
+        self.start_epoch = float(node_times[0])
+        self.end_epoch = float(node_times[-1])
+        self._error_bound_km: Optional[float] = None
+
+        # Python-float copies of the nodes for the scalar fast path; indexing
+        # numpy arrays element by element is slower than SGP4 itself. Built
+        # on first scalar use so node arrays in shared memory are not copied
+        # by processes that only run batch queries.
+        self._node_rows: Optional[Tuple[list, list]] = None
+
+    @classmethod
+    def from_orbit(
+        cls,
+        satellite: SatelliteOrbit,
+        start_time: datetime,
+        end_time: datetime,
+        step_seconds: float = DEFAULT_NODE_STEP_SECONDS,
+        margin_seconds: float = EPHEMERIS_MARGIN_SECONDS,
+    ) -> "Ephemeris":
+        """
+        Propagate a satellite at coarse nodes covering a time horizon.
+
+        Nodes are aligned to multiples of step_seconds in epoch time so tables
+        built for overlapping horizons share node instants.
+
+        Args:
+            satellite: Orbit to propagate
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            step_seconds: Node spacing in seconds
+            margin_seconds: Extra coverage on each side of the horizon
+
+        Returns:
+            Ephemeris covering [start_time, end_time]
+        """
+        node_times = node_grid(
+            datetime_to_epoch_seconds(start_time) - margin_seconds,
+            datetime_to_epoch_seconds(end_time) + margin_seconds,
+            step_seconds,
+        )
+        position_eci, velocity_eci = satellite.propagate_eci(node_times)
+
+        ephemeris = cls(
+            satellite.satellite_name,
+            node_times,
+            position_eci,
+            velocity_eci,
+            tle_lines=list(satellite.tle_lines),
+            orbit=satellite,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Built ephemeris for %s: %d nodes at %.0fs (bound %.2e km)",
+                satellite.satellite_name,
+                node_times.shape[0],
+                step_seconds,
+                ephemeris.error_bound_km,
+            )
+        return ephemeris
+
+    @property
+    def position_eci(self) -> np.ndarray:
+        """Inertial node positions in km, shape (N, 3) (joined if segmented)."""
+        return _join_segments(self._position_segments)
+
+    @property
+    def velocity_eci(self) -> np.ndarray:
+        """Inertial node velocities in km/s, shape (N, 3) (joined if segmented)."""
+        return _join_segments(self._velocity_segments)
+
+    @property
+    def error_bound_km(self) -> float:
+        """Position error bound of the interpolation in km (computed once)."""
+        if self._error_bound_km is None:
+            self._error_bound_km = self._compute_error_bound_km()
+        return self._error_bound_km
+
+    def _compute_error_bound_km(self) -> float:
+        """Analytic position error bound of the interpolation (km)."""
+        bound = max(
+            hermite_error_bound_km(position, velocity, self.step_seconds)
+            for position, velocity in zip(
+                self._position_segments, self._velocity_segments
+            )
+        )
+        first_position = self._position_segments[0][0]
+        first_velocity = self._velocity_segments[0][0]
+        if not is_deep_space(first_position, first_velocity):
+            return bound
+        if self.orbit is None:
+            return math.inf
+
+        # SDP4 node velocities are not the derivative of SDP4 positions
+        try:
+            velocity_error = node_velocity_error_km_s(
+                self.orbit, self.node_times, self.velocity_eci
+            )
+        except ValueError:
+            return math.inf
+        scale = ERROR_BOUND_SAFETY_FACTOR * self.step_seconds / 4.0
+        return bound + scale * velocity_error
+
+    def covers(self, start_time: Any, end_time: Any = None) -> bool:
+        """
+        Check whether a time (or time range) lies inside the node table.
+
+        Args:
+            start_time: datetime or epoch seconds
+            end_time: Optional end of range (datetime or epoch seconds)
+
+        Returns:
+            True if every requested instant can be interpolated
+        """
+        start_s = _as_epoch(start_time)
+        end_s = start_s if end_time is None else _as_epoch(end_time)
+        return self.start_epoch <= start_s and end_s <= self.end_epoch
+
+    def interpolate_eci(self, epoch_s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cubic Hermite interpolation of inertial position and velocity.
+
+        Args:
+            epoch_s: Epoch seconds to evaluate, shape (M,)
+
+        Returns:
+            Tuple of (position_km, velocity_km_s) arrays, each shape (M, 3)
+
+        Raises:
+            ValueError: If any time is outside the table
+        """
+        epoch_s = np.asarray(epoch_s, dtype=np.float64)
+        if epoch_s.size and (
+            epoch_s.min() < self.start_epoch or epoch_s.max() > self.end_epoch
+        ):
+            raise ValueError(
+                f"Requested time outside ephemeris for {self.satellite_name} "
+                f"({epoch_seconds_to_datetime(self.start_epoch)} to "
+                f"{epoch_seconds_to_datetime(self.end_epoch)})"
+            )
+
+        h = self.step_seconds
+        u = (epoch_s - self.start_epoch) / h
+        k = np.minimum(u.astype(np.int64), self.node_times.shape[0] - 2)
+        s = (u - k)[:, None]
+        s2 = s * s
+        s3 = s2 * s
+
+        p0, p1, v0, v1 = self._interval_nodes(k)
+        m0 = v0 * h
+        m1 = v1 * h
+
+        position = (
+            (2 * s3 - 3 * s2 + 1) * p0
+            + (s3 - 2 * s2 + s) * m0
+            + (-2 * s3 + 3 * s2) * p1
+            + (s3 - s2) * m1
+        )
+        velocity = (
+            (6 * s2 - 6 * s) * p0
+            + (3 * s2 - 4 * s + 1) * m0
+            + (-6 * s2 + 6 * s) * p1
+            + (3 * s2 - 2 * s) * m1
+        ) / h
+        return position, velocity
+
+    def _interval_nodes(
+        self, k: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Positions and velocities at both ends of node intervals k."""
+        if len(self._position_segments) == 1:
+            position, velocity = self._position_segments[0], self._velocity_segments[0]
+            return position[k], position[k + 1], velocity[k], velocity[k + 1]
+
+        segment, local = np.divmod(k, self._segment_steps)
+        # Group the queries by segment (a no-op reordering for sorted times)
+        order = np.argsort(segment, kind="stable")
+        bounds = np.searchsorted(
+            segment[order], np.arange(len(self._position_segments) + 1)
+        ).tolist()
+        nodes = [np.empty((k.shape[0], 3)) for _ in range(4)]
+        for index in range(len(self._position_segments)):
+            if bounds[index] == bounds[index + 1]:
+                continue
+            rows = order[bounds[index] : bounds[index + 1]]
+            at = local[rows]
+            position = self._position_segments[index]
+            velocity = self._velocity_segments[index]
+            nodes[0][rows] = position[at]
+            nodes[1][rows] = position[at + 1]
+            nodes[2][rows] = velocity[at]
+            nodes[3][rows] = velocity[at + 1]
+        return nodes[0], nodes[1], nodes[2], nodes[3]
+
+    def propagate(self, times: TimesLike) -> PropagatedStates:
+        """
+        Interpolated states at many timestamps (same API as SatelliteOrbit.propagate).
+
+        Args:
+            times: Epoch seconds, numpy datetime64 array or sequence of datetimes
+
+        Returns:
+            PropagatedStates with ECEF position/velocity and LLH arrays
+        """
+        epoch_s = to_epoch_seconds(times)
+        if self.orbit is not None and epoch_s.size and not self.covers(
+            float(epoch_s.min()), float(epoch_s.max())
+        ):
+            return self.orbit.propagate(epoch_s)
+        position_eci, velocity_eci = self.interpolate_eci(epoch_s)
+        return states_from_eci(epoch_s, position_eci, velocity_eci)
+
+    def _ecef_at(
+        self, epoch_s: float
+    ) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+        """Scalar interpolation straight to ECEF position/velocity tuples."""
+        if not self.start_epoch <= epoch_s <= self.end_epoch:
+            raise ValueError(
+                f"Requested time {epoch_seconds_to_datetime(epoch_s)} outside "
+                f"ephemeris for {self.satellite_name}"
+            )
+
+        if self._node_rows is None:
+            self._node_rows = (
+                _join_segment_rows(self._position_segments),
+                _join_segment_rows(self._velocity_segments),
+            )
+        position_rows, velocity_rows = self._node_rows
+
+        h = self.step_seconds
+        u = (epoch_s - self.start_epoch) / h
+        k = min(int(u), len(position_rows) - 2)
+        s = u - k
+        s2 = s * s
+        s3 = s2 * s
+
+        h00 = 2 * s3 - 3 * s2 + 1
+        h10 = (s3 - 2 * s2 + s) * h
+        h01 = -2 * s3 + 3 * s2
+        h11 = (s3 - s2) * h
+        d00 = (6 * s2 - 6 * s) / h
+        d10 = 3 * s2 - 4 * s + 1
+        d01 = -d00
+        d11 = 3 * s2 - 2 * s
+
+        p0 = position_rows[k]
+        p1 = position_rows[k + 1]
+        v0 = velocity_rows[k]
+        v1 = velocity_rows[k + 1]
+        rx, ry, rz = (
+            h00 * p0[i] + h10 * v0[i] + h01 * p1[i] + h11 * v1[i] for i in range(3)
+        )
+        vx, vy, vz = (
+            d00 * p0[i] + d10 * v0[i] + d01 * p1[i] + d11 * v1[i] for i in range(3)
+        )
+
+        days = math.floor(epoch_s / SECONDS_PER_DAY)
+        gmst = float(
+            gmst_from_julian(
+                UNIX_EPOCH_JD + days,
+                (epoch_s - days * SECONDS_PER_DAY) / SECONDS_PER_DAY,
+            )
+        )
+        cos_g = math.cos(gmst)
+        sin_g = math.sin(gmst)
+        position = (rx * cos_g + ry * sin_g, -rx * sin_g + ry * cos_g, rz)
+        velocity = (vx * cos_g + vy * sin_g, -vx * sin_g + vy * cos_g, vz)
+        return position, velocity
+
+    def get_state(self, timestamp: datetime) -> "Position":
+        """
+        Interpolated state as an orbit_predictor Position.
+
+        Args:
+            timestamp: UTC datetime
+
+        Returns:
+            Position with ECEF position/velocity (position_llh is derived)
+        """
+        if self.orbit is not None and not self.covers(timestamp):
+            return self.orbit.predictor.get_position(timestamp)
+        from orbit_predictor.predictors.base import Position
+
+        position, velocity = self._ecef_at(datetime_to_epoch_seconds(timestamp))
+        return Position(
+            when_utc=timestamp,
+            position_ecef=position,
+            velocity_ecef=velocity,
+            error_estimate=self.error_bound_km,
+        )
+
+    def get_position(self, timestamp: datetime) -> Tuple[float, float, float]:
+        """
+        Interpolated satellite position (same API as SatelliteOrbit.get_position).
+
+        Args:
+            timestamp: UTC datetime
+
+        Returns:
+            Tuple of (latitude, longitude, altitude_km)
+        """
+        if self.orbit is not None and not self.covers(timestamp):
+            return self.orbit.get_position(timestamp)
+        position, _ = self._ecef_at(datetime_to_epoch_seconds(timestamp))
+        return ecef_to_llh(position)
+
+    def position_at(self, epoch_s: float) -> Tuple[float, float, float]:
+        """
+        Interpolated satellite position at epoch seconds, without datetimes.
+
+        Args:
+            epoch_s: Unix epoch seconds (UTC)
+
+        Returns:
+            Tuple of (latitude, longitude, altitude_km)
+        """
+        if self.orbit is not None and not self.start_epoch <= epoch_s <= self.end_epoch:
+            return self.orbit.get_position(epoch_seconds_to_datetime(epoch_s))
+        position, _ = self._ecef_at(epoch_s)
+        return ecef_to_llh(position)
+
+    def __repr__(self) -> str:
+        return (
+            f"Ephemeris(name='{self.satellite_name}', "
+            f"start={epoch_seconds_to_datetime(self.start_epoch)}, "
+            f"end={epoch_seconds_to_datetime(self.end_epoch)}, "
+            f"step={self.step_seconds:.0f}s, nodes={self.node_times.shape[0]})"
+        )
+
+
+def _node_segments(nodes: NodeArrays) -> List[np.ndarray]:
+    """Node segments as float64 arrays (views of the inputs where possible)."""
+    if isinstance(nodes, np.ndarray):
+        nodes = [nodes]
+    return [np.ascontiguousarray(segment, dtype=np.float64) for segment in nodes]
+
+
+def _join_segments(segments: List[np.ndarray]) -> np.ndarray:
+    """One node array from segments sharing their edge nodes."""
+    if len(segments) == 1:
+        return segments[0]
+    return np.concatenate([segments[0]] + [segment[1:] for segment in segments[1:]])
+
+
+def _join_segment_rows(segments: List[np.ndarray]) -> list:
+    """Node rows as Python lists, joined across segments."""
+    rows: list = segments[0].tolist()
+    for segment in segments[1:]:
+        rows.extend(segment[1:].tolist())
+    return rows
+
+
+def node_grid(start_s: float, end_s: float, step_seconds: float) -> np.ndarray:
+    """
+    Evenly spaced node epochs aligned to multiples of step_seconds.
+
+    The grid always brackets [start_s, end_s] and has at least two nodes.
+    """
+    first = math.floor(start_s / step_seconds) * step_seconds
+    last = math.ceil(end_s / step_seconds) * step_seconds
+    count = max(int(round((last - first) / step_seconds)) + 1, 2)
+    return first + np.arange(count, dtype=np.float64) * step_seconds
+
+
+def hermite_error_bound_km(
+    position_eci: np.ndarray, velocity_eci: np.ndarray, step_seconds: float
+) -> float:
+    """
+    Upper bound on cubic Hermite position error for orbital nodes.
+
+    Uses |r''''| <= r_max * w_max**4 with w the instantaneous angular rate
+    |r x v| / |r|**2, scaled by ERROR_BOUND_SAFETY_FACTOR, plus
+    SGP4_CONSISTENCY_FLOOR_KM. Holds for near-earth orbits only; deep-space
+    nodes need the velocity term added by Ephemeris.error_bound_km.
+    """
+    radius = np.linalg.norm(position_eci, axis=1)
+    angular_rate = np.linalg.norm(np.cross(position_eci, velocity_eci), axis=1) / (
+        radius * radius
+    )
+    return float(
+        ERROR_BOUND_SAFETY_FACTOR
+        * step_seconds**4
+        / 384.0
+        * radius.max()
+        * angular_rate.max() ** 4
+        + SGP4_CONSISTENCY_FLOOR_KM
+    )
+
+
+def is_deep_space(position_eci: np.ndarray, velocity_eci: np.ndarray) -> bool:
+    """
+    Whether a state lies on an orbit SGP4 propagates with the SDP4 model.
+
+    Args:
+        position_eci: Inertial position in km, shape (3,)
+        velocity_eci: Inertial velocity in km/s, shape (3,)
+
+    Returns:
+        True for an orbital period of DEEP_SPACE_PERIOD_SECONDS or more (or
+        an unbound orbit)
+    """
+    radius = float(np.linalg.norm(position_eci))
+    speed = float(np.linalg.norm(velocity_eci))
+    energy = speed * speed / 2.0 - EARTH_MU_KM3_S2 / radius
+    if energy >= 0:
+        return True
+    semi_major_axis = -EARTH_MU_KM3_S2 / (2.0 * energy)
+    period = 2.0 * math.pi * math.sqrt(semi_major_axis**3 / EARTH_MU_KM3_S2)
+    return period >= DEEP_SPACE_PERIOD_SECONDS
+
+
+def node_velocity_error_km_s(
+    orbit: SatelliteOrbit, node_times: np.ndarray, velocity_eci: np.ndarray
+) -> float:
+    """
+    Largest difference between node velocities and the position derivative.
+
+    The derivative is a central difference of the orbit's positions over
+    2 * VELOCITY_CHECK_SECONDS around each node.
+
+    Args:
+        orbit: Orbit the nodes were propagated from
+        node_times: Node epoch seconds, shape (N,)
+        velocity_eci: Node velocities in km/s, shape (N, 3)
+
+    Returns:
+        Velocity error in km/s
+
+    Raises:
+        ValueError: If the orbit cannot be propagated in batch
+    """
+    after, _ = orbit.propagate_eci(node_times + VELOCITY_CHECK_SECONDS)
+    before, _ = orbit.propagate_eci(node_times - VELOCITY_CHECK_SECONDS)
+    derivative = (after - before) / (2.0 * VELOCITY_CHECK_SECONDS)
+    return float(np.nanmax(np.linalg.norm(derivative - velocity_eci, axis=1)))
+
+
+def _as_epoch(value: Any) -> float:
+    """Convert a datetime or number to epoch seconds."""
+    if isinstance(value, datetime):
+        return datetime_to_epoch_seconds(value)
+    return float(value)
@@ -0,0 +1,524 @@
+"""
+Persistent on-disk cache of ephemeris node blocks.
+
+Node tables are split into fixed-length time blocks aligned to multiples of
+the block length in epoch time. Each block is stored as a raw ``.npy`` file
+of shape (2, N, 3) holding the inertial positions and velocities of its
+nodes (both block edges included), and is opened with ``mmap_mode="r"`` so
+the API process and visibility worker processes share the same pages
+through the OS page cache.
+
+A horizon spanning several blocks is served as an Ephemeris holding one
+node segment per block, so every block stays a view of its memory map.
+
+Files are keyed by a hash of (TLE lines, node step, block index) and
+prefixed with a hash of the TLE alone so every block of a TLE can be
+dropped when it is replaced. Total size is bounded with LRU eviction using
+file modification times as the access clock, so eviction decisions are
+shared by every process using the directory.
+
+The cache is enabled process-wide by setting the
+``MISSION_PLANNER_EPHEMERIS_CACHE_DIR`` environment variable (inherited by
+worker processes), or by calling :func:`configure_ephemeris_cache`.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .ephemeris import DEFAULT_NODE_STEP_SECONDS, EPHEMERIS_MARGIN_SECONDS, Ephemeris
+from .orbit import SatelliteOrbit, datetime_to_epoch_seconds
+
+logger = logging.getLogger(__name__)
+
+EPHEMERIS_CACHE_DIR_ENV = "MISSION_PLANNER_EPHEMERIS_CACHE_DIR"
+EPHEMERIS_CACHE_MAX_MB_ENV = "MISSION_PLANNER_EPHEMERIS_CACHE_MAX_MB"
+
+# Six hours of 60 s nodes is ~17 KB per block
+DEFAULT_BLOCK_SECONDS = 6 * 3600.0
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_default_caches: Dict[Tuple[str, int], "EphemerisCache"] = {}
+
+
+class EphemerisCache:
+    """
+    Size-bounded directory of memory-mapped ephemeris blocks.
+
+    Safe to share between processes: blocks are written to a temporary file
+    and atomically renamed into place, and readers only ever see complete
+    files.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        block_seconds: float = DEFAULT_BLOCK_SECONDS,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the block files (created if missing)
+            max_bytes: Upper bound on the total size of cached blocks
+            block_seconds: Length of one block in seconds
+
+        Raises:
+            ValueError: If max_bytes or block_seconds is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if block_seconds <= 0:
+            raise ValueError("block_seconds must be positive")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.block_seconds = float(block_seconds)
+
+    @staticmethod
+    def tle_key(tle_lines: Sequence[str]) -> str:
+        """
+        Hash identifying a TLE, independent of the satellite name line.
+
+        Args:
+            tle_lines: TLE as [line1, line2] or [name, line1, line2]
+
+        Returns:
+            Hex digest of the two element lines
+        """
+        element_lines = [line.strip() for line in tle_lines[-2:]]
+        return hashlib.sha256("\n".join(element_lines).encode()).hexdigest()[:16]
+
+    def block_path(
+        self, tle_lines: Sequence[str], step_seconds: float, block_index: int
+    ) -> Path:
+        """
+        Path of the cached block for (TLE, step, block).
+
+        Args:
+            tle_lines: TLE the block is propagated from
+            step_seconds: Node spacing in seconds
+            block_index: Block number (block start = index * block_seconds)
+
+        Returns:
+            Path of the ``.npy`` file
+        """
+        tle_key = self.tle_key(tle_lines)
+        block_key = hashlib.sha256(
+            f"{tle_key}:{step_seconds!r}:{self.block_seconds!r}:{block_index}".encode()
+        ).hexdigest()[:16]
+        return self.directory / f"{tle_key}_{block_key}.npy"
+
+    def block_node_times(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        step_seconds: float = DEFAULT_NODE_STEP_SECONDS,
+        margin_seconds: float = EPHEMERIS_MARGIN_SECONDS,
+    ) -> np.ndarray:
+        """
+        Node epochs spanning the whole blocks that cover a horizon.
+
+        Args:
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            step_seconds: Node spacing in seconds
+            margin_seconds: Extra coverage on each side of the horizon
+
+        Returns:
+            Node epoch seconds from the first block start to the last block end
+
+        Raises:
+            ValueError: If the block length is not a multiple of the step
+        """
+        first, last = self._block_span(
+            start_time, end_time, step_seconds, margin_seconds
+        )
+        n_steps = (last - first + 1) * self._steps_per_block(step_seconds)
+        return first * self.block_seconds + np.arange(n_steps + 1) * step_seconds
+
+    def get_ephemeris(
+        self,
+        satellite: SatelliteOrbit,
+        start_time: datetime,
+        end_time: datetime,
+        step_seconds: float = DEFAULT_NODE_STEP_SECONDS,
+        margin_seconds: float = EPHEMERIS_MARGIN_SECONDS,
+    ) -> Ephemeris:
+        """
+        Build an Ephemeris covering a horizon from cached blocks.
+
+        Missing blocks are propagated and written back; horizons already seen
+        (or overlapping ones inside cached blocks) need no propagation.
+
+        Args:
+            satellite: Orbit to propagate on cache misses
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            step_seconds: Node spacing in seconds
+            margin_seconds: Extra coverage on each side of the horizon
+
+        Returns:
+            Ephemeris covering [start_time, end_time]
+
+        Raises:
+            ValueError: If the block length is not a multiple of the step
+        """
+        first, last = self._block_span(
+            start_time, end_time, step_seconds, margin_seconds
+        )
+        blocks = []
+        for index in range(first, last + 1):
+            block = self._load_block(satellite.tle_lines, step_seconds, index)
+            if block is None:
+                block = self._build_block(satellite, step_seconds, index)
+            blocks.append(block)
+        return self._assemble(satellite, step_seconds, first, blocks)
+
+    def lookup(
+        self,
+        satellite: SatelliteOrbit,
+        start_time: datetime,
+        end_time: datetime,
+        step_seconds: float = DEFAULT_NODE_STEP_SECONDS,
+        margin_seconds: float = EPHEMERIS_MARGIN_SECONDS,
+    ) -> Optional[Ephemeris]:
+        """
+        Build an Ephemeris from cached blocks only.
+
+        Args:
+            satellite: Orbit the blocks were propagated from
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            step_seconds: Node spacing in seconds
+            margin_seconds: Extra coverage on each side of the horizon
+
+        Returns:
+            Ephemeris covering [start_time, end_time], or None if any block
+            is missing
+        """
+        first, last = self._block_span(
+            start_time, end_time, step_seconds, margin_seconds
+        )
+        blocks = []
+        for index in range(first, last + 1):
+            block = self._load_block(satellite.tle_lines, step_seconds, index)
+            if block is None:
+                return None
+            blocks.append(block)
+        return self._assemble(satellite, step_seconds, first, blocks)
+
+    def store(self, ephemeris: Ephemeris) -> None:
+        """
+        Write an ephemeris built on block_node_times() into the cache.
+
+        Args:
+            ephemeris: Ephemeris whose nodes start on a block boundary and
+                span whole blocks
+
+        Raises:
+            ValueError: If the ephemeris has no TLE or is not block aligned
+        """
+        if not ephemeris.tle_lines:
+            raise ValueError("Only ephemerides propagated from a TLE can be cached")
+
+        step_seconds = ephemeris.step_seconds
+        steps = self._steps_per_block(step_seconds)
+        first = ephemeris.start_epoch / self.block_seconds
+        n_blocks = (ephemeris.node_times.shape[0] - 1) / steps
+        if first != math.floor(first) or n_blocks != math.floor(n_blocks):
+            raise ValueError("Ephemeris nodes are not aligned to cache blocks")
+
+        position_eci = ephemeris.position_eci
+        velocity_eci = ephemeris.velocity_eci
+        for offset in range(int(n_blocks)):
+            rows = slice(offset * steps, (offset + 1) * steps + 1)
+            block = np.stack([position_eci[rows], velocity_eci[rows]])
+            path = self.block_path(
+                ephemeris.tle_lines, step_seconds, int(first) + offset
+            )
+            self._write_block(path, block)
+        self.evict()
+
+    def _steps_per_block(self, step_seconds: float) -> int:
+        """Node intervals per block, validating that the step divides the block."""
+        steps = self.block_seconds / step_seconds
+        if abs(steps - round(steps)) > 1e-9:
+            raise ValueError(
+                f"Block length {self.block_seconds}s is not a multiple of "
+                f"the node step {step_seconds}s"
+            )
+        return int(round(steps))
+
+    def _block_span(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        step_seconds: float,
+        margin_seconds: float,
+    ) -> Tuple[int, int]:
+        """First and last block index covering a horizon plus margin."""
+        self._steps_per_block(step_seconds)
+        first = math.floor(
+            (datetime_to_epoch_seconds(start_time) - margin_seconds)
+            / self.block_seconds
+        )
+        last = math.floor(
+            (datetime_to_epoch_seconds(end_time) + margin_seconds) / self.block_seconds
+        )
+        return first, max(first, last)
+
+    def _assemble(
+        self,
+        satellite: SatelliteOrbit,
+        step_seconds: float,
+        first: int,
+        blocks: List[np.ndarray],
+    ) -> Ephemeris:
+        """
+        Build one Ephemeris over consecutive blocks.
+
+        Each block becomes a node segment of the Ephemeris (adjacent blocks
+        share their edge node), so no block is copied out of its memory map.
+        """
+        steps = self._steps_per_block(step_seconds)
+        node_times = (
+            first * self.block_seconds
+            + np.arange(len(blocks) * steps + 1) * step_seconds
+        )
+
+        return Ephemeris(
+            satellite.satellite_name,
+            node_times,
+            [block[0] for block in blocks],
+            [block[1] for block in blocks],
+            tle_lines=list(satellite.tle_lines),
+            orbit=satellite,
+        )
+
+    def _load_block(
+        self, tle_lines: Sequence[str], step_seconds: float, block_index: int
+    ) -> Optional[np.ndarray]:
+        """Return the memory-mapped block, or None when it is not cached."""
+        path = self.block_path(tle_lines, step_seconds, block_index)
+        if not path.exists():
+            return None
+
+        n_nodes = self._steps_per_block(step_seconds) + 1
+        try:
+            block: np.ndarray = np.load(path, mmap_mode="r")
+            if block.shape == (2, n_nodes, 3):
+                _touch(path)
+                return block
+            logger.warning(f"Discarding malformed ephemeris block {path.name}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable ephemeris block {path}: {e}")
+        _unlink(path)
+        return None
+
+    def _build_block(
+        self, satellite: SatelliteOrbit, step_seconds: float, block_index: int
+    ) -> np.ndarray:
+        """Propagate one block and write it back to the cache."""
+        n_nodes = self._steps_per_block(step_seconds) + 1
+        node_times = (
+            block_index * self.block_seconds + np.arange(n_nodes) * step_seconds
+        )
+        position_eci, velocity_eci = satellite.propagate_eci(node_times)
+        block = np.stack([position_eci, velocity_eci])
+
+        path = self.block_path(satellite.tle_lines, step_seconds, block_index)
+        try:
+            self._write_block(path, block)
+            self.evict()
+        except OSError as e:
+            logger.warning(f"Could not write ephemeris block {path}: {e}")
+
+        return block
+
+    def _write_block(self, path: Path, block: np.ndarray) -> None:
+        """Write a block atomically so concurrent readers never see partial files."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, block)
+            os.replace(tmp_name, path)
+        except BaseException:
+            _unlink(Path(tmp_name))
+            raise
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List cached blocks as (mtime, size, path)."""
+        entries = []
+        for path in self.directory.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by another process
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Total size of cached blocks in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """
+        Remove least recently used blocks until the cache fits in max_bytes.
+
+        Returns:
+            Number of blocks removed
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            _unlink(path)
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug(f"Evicted {removed} ephemeris blocks")
+        return removed
+
+    def invalidate(self, tle_lines: Sequence[str]) -> int:
+        """
+        Remove every cached block propagated from a TLE.
+
+        Args:
+            tle_lines: TLE whose blocks should be dropped
+
+        Returns:
+            Number of blocks removed
+        """
+        removed = 0
+        for path in self.directory.glob(f"{self.tle_key(tle_lines)}_*.npy"):
+            _unlink(path)
+            removed += 1
+        if removed:
+            logger.info(f"Invalidated {removed} cached ephemeris blocks")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every cached block.
+
+        Returns:
+            Number of blocks removed
+        """
+        entries = self._entries()
+        for _, _, path in entries:
+            _unlink(path)
+        return len(entries)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"EphemerisCache(directory='{self.directory}', "
+            f"max_bytes={self.max_bytes}, block_seconds={self.block_seconds})"
+        )
+
+
+def configure_ephemeris_cache(
+    directory: Optional[Union[str, Path]], max_bytes: Optional[int] = None
+) -> None:
+    """
+    Enable (or disable) the process-wide ephemeris cache.
+
+    The settings are stored in the environment so worker processes started
+    afterwards use the same directory.
+
+    Args:
+        directory: Cache directory, or None to disable caching
+        max_bytes: Optional size bound in bytes
+    """
+    if directory is None:
+        os.environ.pop(EPHEMERIS_CACHE_DIR_ENV, None)
+        return
+    os.environ[EPHEMERIS_CACHE_DIR_ENV] = str(directory)
+    if max_bytes is not None:
+        os.environ[EPHEMERIS_CACHE_MAX_MB_ENV] = str(max_bytes / (1024 * 1024))
+
+
+def get_ephemeris_cache() -> Optional[EphemerisCache]:
+    """
+    Return the process-wide cache configured through the environment.
+
+    Returns:
+        EphemerisCache, or None when caching is not enabled
+    """
+    directory = os.environ.get(EPHEMERIS_CACHE_DIR_ENV, "").strip()
+    if not directory:
+        return None
+
+    try:
+        max_mb = float(os.environ.get(EPHEMERIS_CACHE_MAX_MB_ENV, ""))
+        max_bytes = int(max_mb * 1024 * 1024)
+    except ValueError:
+        max_bytes = DEFAULT_CACHE_MAX_BYTES
+
+    key = (directory, max_bytes)
+    cache = _default_caches.get(key)
+    if cache is None:
+        try:
+            cache = EphemerisCache(directory, max_bytes=max_bytes)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ephemeris cache disabled ({directory}): {e}")
+            return None
+        _default_caches[key] = cache
+    return cache
+
+
+def build_ephemeris(
+    satellite: SatelliteOrbit,
+    start_time: datetime,
+    end_time: datetime,
+    step_seconds: float = DEFAULT_NODE_STEP_SECONDS,
+) -> Ephemeris:
+    """
+    Build an Ephemeris for a horizon, through the disk cache when enabled.
+
+    Args:
+        satellite: Orbit to propagate
+        start_time: Start of horizon (UTC)
+        end_time: End of horizon (UTC)
+        step_seconds: Node spacing in seconds
+
+    Returns:
+        Ephemeris covering [start_time, end_time]
+    """
+    cache = get_ephemeris_cache()
+    if cache is not None:
+        try:
+            return cache.get_ephemeris(satellite, start_time, end_time, step_seconds)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ephemeris cache unavailable, propagating directly: {e}")
+    return Ephemeris.from_orbit(satellite, start_time, end_time, step_seconds)
+
+
+def _touch(path: Path) -> None:
+    """Mark a block as recently used."""
+    try:
+        now = time.time()
+        os.utime(path, (now, now))
+    except OSError:
+        pass
+
+
+def _unlink(path: Path) -> None:
+    """Remove a file, ignoring files already removed or still in use elsewhere."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
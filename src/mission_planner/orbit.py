@@ -5,18 +5,259 @@ This module provides functionality to load TLE data and propagate satellite
 orbits using the orbit-predictor library.
 """
 
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 import logging
+import math
 
 from orbit_predictor.sources import get_predictor_from_tle_lines, MemoryTLESource
 from orbit_predictor.predictors import TLEPredictor
 from orbit_predictor.locations import Location
 import numpy as np
 
+from .tle_catalog import get_tle_catalog
+
 logger = logging.getLogger(__name__)
 
+# WGS-84 ellipsoid (same constants orbit_predictor uses for position_llh)
+WGS84_A_KM = 6378.1370
+WGS84_B_KM = 6356.752314
+
+# Julian date of the Unix epoch (1970-01-01T00:00:00Z)
+UNIX_EPOCH_JD = 2440587.5
+SECONDS_PER_DAY = 86400.0
+
+TimesLike = Union[np.ndarray, Sequence[datetime], Sequence[float]]
+
+
+@dataclass(frozen=True)
+class PropagatedStates:
+    """
+    Batched satellite states returned by SatelliteOrbit.propagate().
+
+    All arrays are C-contiguous float64 and share the leading dimension N.
+
+    Attributes:
+        times: Epoch seconds (UTC) of each sample, shape (N,)
+        position_ecef: ECEF position in km, shape (N, 3)
+        velocity_ecef: ECEF-rotated velocity in km/s, shape (N, 3)
+        position_llh: Geodetic (lat_deg, lon_deg, alt_km) on WGS-84, shape (N, 3)
+    """
+
+    times: np.ndarray
+    position_ecef: np.ndarray
+    velocity_ecef: np.ndarray
+    position_llh: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.times.shape[0])
+
+    @property
+    def lat(self) -> np.ndarray:
+        """Geodetic latitude in degrees."""
+        return self.position_llh[:, 0]
+
+    @property
+    def lon(self) -> np.ndarray:
+        """Longitude in degrees (-180..180)."""
+        return self.position_llh[:, 1]
+
+    @property
+    def alt(self) -> np.ndarray:
+        """Altitude above the WGS-84 ellipsoid in km."""
+        return self.position_llh[:, 2]
+
+    def datetimes(self) -> List[datetime]:
+        """Return sample times as naive UTC datetimes."""
+        return [epoch_seconds_to_datetime(t) for t in self.times]
+
+
+def datetime_to_epoch_seconds(timestamp: datetime) -> float:
+    """
+    Convert a datetime to Unix epoch seconds.
+
+    Naive datetimes are interpreted as UTC, matching the rest of the package.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+def epoch_seconds_to_datetime(seconds: float) -> datetime:
+    """Convert Unix epoch seconds to a naive UTC datetime."""
+    return datetime.fromtimestamp(float(seconds), tz=timezone.utc).replace(tzinfo=None)
+
+
+def to_epoch_seconds(times: Union[TimesLike, Iterable[datetime]]) -> np.ndarray:
+    """
+    Normalize a batch of timestamps to a float64 array of epoch seconds.
+
+    Args:
+        times: Array/sequence of epoch seconds, numpy datetime64 values or
+            Python datetimes (naive datetimes are treated as UTC)
+
+    Returns:
+        1-D float64 array of Unix epoch seconds
+    """
+    if isinstance(times, np.ndarray):
+        arr = times
+    else:
+        items = list(times)
+        if items and isinstance(items[0], datetime):
+            return np.fromiter(
+                (datetime_to_epoch_seconds(t) for t in items),
+                dtype=np.float64,
+                count=len(items),
+            )
+        arr = np.asarray(items)
+
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return arr.astype("datetime64[ns]").astype(np.int64).ravel() / 1e9
+    if arr.dtype == object:
+        return to_epoch_seconds(list(arr.ravel()))
+    return np.ascontiguousarray(arr, dtype=np.float64).ravel()
+
+
+def gmst_from_julian(
+    jd: Union[float, np.ndarray], fr: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Vectorized IAU-82 Greenwich mean sidereal time (radians).
+
+    Same formula as sgp4.propagation.gstime, which orbit_predictor uses for
+    its ECI to ECEF rotation.
+    """
+    tut1 = ((jd - 2451545.0) + fr) / 36525.0
+    temp = (
+        -6.2e-6 * tut1 * tut1 * tut1
+        + 0.093104 * tut1 * tut1
+        + (876600.0 * 3600 + 8640184.812866) * tut1
+        + 67310.54841
+    )
+    return np.mod(np.radians(temp / 240.0), 2.0 * np.pi)
+
+
+def ecef_to_llh(
+    position_ecef: Tuple[float, float, float],
+) -> Tuple[float, float, float]:
+    """
+    Scalar WGS-84 ECEF to geodetic conversion (Bowring's method).
+
+    Same operations as orbit_predictor.coordinate_systems.ecef_to_llh, so
+    results are identical.
+
+    Args:
+        position_ecef: ECEF position in km
+
+    Returns:
+        Tuple of (lat_deg, lon_deg, alt_km)
+    """
+    a = WGS84_A_KM
+    b = WGS84_B_KM
+    x, y, z = position_ecef
+
+    p = math.sqrt(x**2 + y**2)
+    theta = math.atan(z * a / (p * b))
+    esq = 1.0 - (b / a) ** 2
+    epsq = (a / b) ** 2 - 1.0
+
+    lat = math.atan(
+        (z + epsq * b * math.sin(theta) ** 3) / (p - esq * a * math.cos(theta) ** 3)
+    )
+    lon = math.atan2(y, x)
+    n = a * a / math.sqrt(a * a * math.cos(lat) ** 2 + b**2 * math.sin(lat) ** 2)
+    alt = p / math.cos(lat) - n
+    return math.degrees(lat), math.degrees(lon), alt
+
+
+def ecef_to_llh_array(position_ecef: np.ndarray) -> np.ndarray:
+    """
+    Vectorized WGS-84 ECEF to geodetic conversion (Bowring's method).
+
+    Mirrors orbit_predictor.coordinate_systems.ecef_to_llh so batched and
+    per-sample positions agree to floating point precision.
+
+    Args:
+        position_ecef: ECEF positions in km, shape (N, 3)
+
+    Returns:
+        Array of (lat_deg, lon_deg, alt_km), shape (N, 3)
+    """
+    a = WGS84_A_KM
+    b = WGS84_B_KM
+    x = position_ecef[:, 0]
+    y = position_ecef[:, 1]
+    z = position_ecef[:, 2]
+
+    p = np.hypot(x, y)
+    theta = np.arctan(z * a / (p * b))
+    esq = 1.0 - (b / a) ** 2
+    epsq = (a / b) ** 2 - 1.0
+
+    lat = np.arctan(
+        (z + epsq * b * np.sin(theta) ** 3) / (p - esq * a * np.cos(theta) ** 3)
+    )
+    lon = np.arctan2(y, x)
+    n = a * a / np.sqrt(a * a * np.cos(lat) ** 2 + b**2 * np.sin(lat) ** 2)
+    alt = p / np.cos(lat) - n
+
+    llh = np.empty_like(position_ecef)
+    llh[:, 0] = np.degrees(lat)
+    llh[:, 1] = np.degrees(lon)
+    llh[:, 2] = alt
+    return llh
+
+
+def julian_from_epoch_seconds(epoch_s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split epoch seconds into (jd, fr) Julian date pairs as used by SGP4."""
+    days = np.floor(epoch_s / SECONDS_PER_DAY)
+    jd = UNIX_EPOCH_JD + days
+    fr = (epoch_s - days * SECONDS_PER_DAY) / SECONDS_PER_DAY
+    return jd, fr
+
+
+def states_from_eci(
+    epoch_s: np.ndarray, position_eci: np.ndarray, velocity_eci: np.ndarray
+) -> PropagatedStates:
+    """
+    Rotate inertial states into ECEF and derive geodetic coordinates.
+
+    Velocity is rotated without the Earth-rotation term, matching
+    orbit_predictor's Position.velocity_ecef.
+
+    Args:
+        epoch_s: Epoch seconds of each sample, shape (N,)
+        position_eci: Inertial positions in km, shape (N, 3)
+        velocity_eci: Inertial velocities in km/s, shape (N, 3)
+
+    Returns:
+        PropagatedStates for the samples
+    """
+    n = epoch_s.shape[0]
+    jd, fr = julian_from_epoch_seconds(epoch_s)
+    gmst = gmst_from_julian(jd, fr)
+    cos_g = np.cos(gmst)
+    sin_g = np.sin(gmst)
+
+    position_ecef = np.empty((n, 3), dtype=np.float64)
+    position_ecef[:, 0] = position_eci[:, 0] * cos_g + position_eci[:, 1] * sin_g
+    position_ecef[:, 1] = -position_eci[:, 0] * sin_g + position_eci[:, 1] * cos_g
+    position_ecef[:, 2] = position_eci[:, 2]
+
+    velocity_ecef = np.empty((n, 3), dtype=np.float64)
+    velocity_ecef[:, 0] = velocity_eci[:, 0] * cos_g + velocity_eci[:, 1] * sin_g
+    velocity_ecef[:, 1] = -velocity_eci[:, 0] * sin_g + velocity_eci[:, 1] * cos_g
+    velocity_ecef[:, 2] = velocity_eci[:, 2]
+
+    return PropagatedStates(
+        times=epoch_s,
+        position_ecef=position_ecef,
+        velocity_ecef=velocity_ecef,
+        position_llh=ecef_to_llh_array(position_ecef),
+    )
+
 
 class SatelliteOrbit:
     """
@@ -76,23 +317,43 @@ class SatelliteOrbit:
             raise FileNotFoundError(f"TLE file not found: {tle_file_path}")
         
         try:
-            with open(tle_path, 'r') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
-            
-            # Parse TLE file to find the specified satellite
-            for i in range(0, len(lines) - 2, 3):
-                if i + 2 < len(lines):
-                    name_line = lines[i]
-                    if satellite_name.upper() in name_line.upper():
-                        tle_lines = [lines[i], lines[i + 1], lines[i + 2]]
-                        return cls(tle_lines, satellite_name)
-            
-            raise ValueError(f"Satellite '{satellite_name}' not found in TLE file")
+            # Indexed once per file (reindexed when it changes) and shared
+            entry = get_tle_catalog(tle_path).find(satellite_name)
+            if entry is None:
+                raise ValueError(f"Satellite '{satellite_name}' not found in TLE file")
+            return cls(entry.lines(), satellite_name)
             
         except Exception as e:
             logger.error(f"Error reading TLE file {tle_file_path}: {e}")
             raise
     
+    @classmethod
+    def from_norad_id(
+        cls, tle_file_path: Union[str, Path], norad_id: Union[int, str]
+    ) -> "SatelliteOrbit":
+        """
+        Create SatelliteOrbit instance from a TLE file entry by NORAD ID.
+
+        Args:
+            tle_file_path: Path to TLE file
+            norad_id: NORAD catalog number of the satellite
+
+        Returns:
+            SatelliteOrbit instance named after the catalog entry
+
+        Raises:
+            FileNotFoundError: If TLE file doesn't exist
+            ValueError: If NORAD ID not found in TLE file
+        """
+        tle_path = Path(tle_file_path)
+        if not tle_path.exists():
+            raise FileNotFoundError(f"TLE file not found: {tle_file_path}")
+
+        entry = get_tle_catalog(tle_path).get_by_norad_id(norad_id)
+        if entry is None:
+            raise ValueError(f"NORAD ID {norad_id} not found in TLE file")
+        return cls(entry.lines(), entry.name)
+
     @classmethod
     def from_online_source(cls, satellite_name: str, source_url: Optional[str] = None) -> "SatelliteOrbit":
         """
@@ -139,6 +400,74 @@ class SatelliteOrbit:
             logger.error(f"Error calculating position for {timestamp}: {e}")
             raise
     
+    def propagate(self, times: TimesLike) -> PropagatedStates:
+        """
+        Propagate the orbit at many timestamps in a single call.
+
+        Uses the SGP4 batch propagator (C-accelerated when available) and
+        vectorized frame conversions, so the per-sample Python overhead of
+        get_position() is avoided. Results match get_position() sample by
+        sample.
+
+        Args:
+            times: Epoch seconds (UTC), numpy datetime64 array or sequence
+                of UTC datetimes
+
+        Returns:
+            PropagatedStates with contiguous ECEF position/velocity and LLH arrays
+
+        Raises:
+            ValueError: If SGP4 reports an error for any sample (e.g. decayed orbit)
+        """
+        epoch_s = to_epoch_seconds(times)
+        position_eci, velocity_eci = self.propagate_eci(epoch_s)
+        return states_from_eci(epoch_s, position_eci, velocity_eci)
+
+    def propagate_eci(self, epoch_s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Propagate to inertial (SGP4 TEME) position and velocity arrays.
+
+        Args:
+            epoch_s: 1-D array of Unix epoch seconds (UTC)
+
+        Returns:
+            Tuple of (position_km, velocity_km_s) arrays, each shape (N, 3)
+
+        Raises:
+            ValueError: If SGP4 reports an error for any sample, or the
+                predictor cannot provide inertial states
+        """
+        n = epoch_s.shape[0]
+        propagator = getattr(self.predictor, "_propagator", None)
+        if propagator is None or not hasattr(propagator, "sgp4_array"):
+            # Predictors without a batch propagator fall back to per-sample calls
+            if not hasattr(self.predictor, "propagate_eci"):
+                raise ValueError(
+                    f"Predictor for {self.satellite_name} does not provide "
+                    "inertial states"
+                )
+            position_eci = np.empty((n, 3), dtype=np.float64)
+            velocity_eci = np.empty((n, 3), dtype=np.float64)
+            for i, t in enumerate(epoch_s):
+                r, v = self.predictor.propagate_eci(epoch_seconds_to_datetime(t))
+                position_eci[i] = r
+                velocity_eci[i] = v
+            return position_eci, velocity_eci
+
+        jd, fr = julian_from_epoch_seconds(epoch_s)
+        errors, position_eci, velocity_eci = propagator.sgp4_array(jd, fr)
+        if n and np.any(errors):
+            bad = int(np.flatnonzero(errors)[0])
+            raise ValueError(
+                f"SGP4 propagation failed for {self.satellite_name} at "
+                f"{epoch_seconds_to_datetime(epoch_s[bad])} "
+                f"(error code {int(errors[bad])})"
+            )
+        return (
+            np.ascontiguousarray(position_eci, dtype=np.float64),
+            np.ascontiguousarray(velocity_eci, dtype=np.float64),
+        )
+
     def get_ground_track(
         self, 
         start_time: datetime, 
@@ -5,18 +5,38 @@ This module provides parallel processing capabilities for CPU-intensive
 mission planning tasks, enabling significant speedups on multi-core systems.
 """
 
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from concurrent.futures.process import BrokenProcessPool
-from typing import List, Dict, Any, Callable, Optional, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Callable, Optional, Tuple, TYPE_CHECKING
+from datetime import datetime, timedelta
 import atexit
 import logging
+import math
 import os
 import multiprocessing as mp
+import pickle
 import platform
 import signal
 import sys
+import time
 from functools import partial
+from multiprocessing.context import BaseContext
+from types import FrameType
+
+if TYPE_CHECKING:
+    from mission_planner.orbit import SatelliteOrbit
+    from mission_planner.pass_table import PassTable
+    from mission_planner.scheduler import (
+        AlgorithmType,
+        MissionScheduler,
+        Opportunity,
+        ScheduledOpportunity,
+        ScheduleMetrics,
+    )
+    from mission_planner.shared_ephemeris import SharedEphemeris, SharedEphemerisSpec
+    from mission_planner.targets import GroundTarget
+    from mission_planner.visibility import VisibilityCalculator
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +44,43 @@ logger = logging.getLogger(__name__)
 _process_pool: Optional[ProcessPoolExecutor] = None
 _pool_max_workers: Optional[int] = None
 
+# Per-worker calculators keyed by (TLE hash, use_adaptive). Lives in each
+# worker process so the satellite is parsed once per worker, not per target.
+_worker_calculators: "OrderedDict[Tuple[str, bool], VisibilityCalculator]" = (
+    OrderedDict()
+)
+_WORKER_CALCULATOR_CACHE_SIZE = 8
+
+# Per-worker attachments to shared ephemeris blocks published by the parent,
+# by block name: (shared memory block, Ephemeris viewing it)
+_worker_ephemerides: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+_WORKER_EPHEMERIS_CACHE_SIZE = 2
+
+# Per-worker scheduling inputs unpickled from shared payload blocks, by
+# block name: (scheduler, opportunities, target positions)
+_SchedulingPayload = Tuple[
+    "MissionScheduler", List["Opportunity"], Dict[str, Tuple[float, float]]
+]
+_worker_payloads: "OrderedDict[str, _SchedulingPayload]" = OrderedDict()
+_WORKER_PAYLOAD_CACHE_SIZE = 2
+
+# Target batching: aim for tasks of about TASK_TARGET_SECONDS once the
+# per-target cost is known, but keep at least BATCHES_PER_WORKER batches
+# per worker in the remaining work so the tail stays balanced.
+TASK_TARGET_SECONDS = 0.25
+INITIAL_BATCH_SIZE = 2
+BATCHES_PER_WORKER = 4
+TASKS_IN_FLIGHT_PER_WORKER = 2
+
+# Time slicing: with fewer targets than workers, split the window so every
+# worker has work. Each slice searches up to half an hour past its end to
+# finish its last passes, so slices are kept at least MIN_SLICE_SECONDS
+# long; their lengths are whole multiples of SLICE_ALIGN_SECONDS so
+# fixed-step sample grids line up with a single search over the window.
+SLICES_PER_WORKER = 2
+MIN_SLICE_SECONDS = 6 * 3600
+SLICE_ALIGN_SECONDS = 3600
+
 
 def get_optimal_workers(max_workers: Optional[int] = None, num_targets: int = 0) -> int:
     """
@@ -55,7 +112,7 @@ def get_optimal_workers(max_workers: Optional[int] = None, num_targets: int = 0)
     return cpu_count
 
 
-def _get_mp_context():
+def _get_mp_context() -> Optional[BaseContext]:
     """
     Get the appropriate multiprocessing context for the current platform.
 
@@ -72,7 +129,7 @@ def _get_mp_context():
         # macOS: avoid raw 'fork' — orphaned children don't receive death
         # signals.  'forkserver' is fastest safe alternative.
         try:
-            ctx = mp.get_context("forkserver")
+            ctx: BaseContext = mp.get_context("forkserver")
             logger.debug("Using 'forkserver' context (macOS safe)")
             return ctx
         except ValueError:
@@ -91,7 +148,92 @@ def _get_mp_context():
     return None
 
 
-def get_or_create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+def next_batch_size(
+    remaining: int, workers: int, seconds_per_target: Optional[float] = None
+) -> int:
+    """
+    Number of targets to put in the next worker task.
+
+    Args:
+        remaining: Targets not yet submitted
+        workers: Number of worker processes
+        seconds_per_target: Measured mean cost per target (None = unknown)
+
+    Returns:
+        Batch size between 1 and remaining
+    """
+    if remaining <= 0:
+        return 0
+    balance_cap = math.ceil(remaining / (max(1, workers) * BATCHES_PER_WORKER))
+    if seconds_per_target is None:
+        size = INITIAL_BATCH_SIZE
+    elif seconds_per_target <= 0:
+        size = balance_cap
+    else:
+        size = int(TASK_TARGET_SECONDS / seconds_per_target)
+    return max(1, min(size, balance_cap, remaining))
+
+
+def time_slices(
+    start_time: datetime, end_time: datetime, num_targets: int, workers: int
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split an analysis window into slices for time-parallel pass search.
+
+    Args:
+        start_time: Start of analysis window
+        end_time: End of analysis window
+        num_targets: Number of targets searched in every slice
+        workers: Number of worker processes
+
+    Returns:
+        Consecutive (slice_start, slice_end) pairs covering the window, or
+        an empty list when the targets alone keep the workers busy or the
+        window is too short to split
+    """
+    if num_targets <= 0 or num_targets >= workers:
+        return []
+    horizon = (end_time - start_time).total_seconds()
+    count = min(workers * SLICES_PER_WORKER, int(horizon // MIN_SLICE_SECONDS))
+    if count < 2:
+        return []
+
+    length = timedelta(
+        seconds=math.ceil(horizon / count / SLICE_ALIGN_SECONDS) * SLICE_ALIGN_SECONDS
+    )
+    slices = []
+    slice_start = start_time
+    while slice_start < end_time:
+        slice_end = min(slice_start + length, end_time)
+        slices.append((slice_start, slice_end))
+        slice_start = slice_end
+    return slices
+
+
+def should_run_parallel(
+    num_targets: int,
+    start_time: datetime,
+    end_time: datetime,
+    max_workers: Optional[int] = None,
+) -> bool:
+    """
+    Whether a pass search has enough independent work for the process pool.
+
+    Several targets are split across workers; a single target (or fewer
+    targets than workers) only when the window can be sliced in time.
+    """
+    if num_targets > 1:
+        return True
+    workers = get_optimal_workers(max_workers, num_targets)
+    return bool(time_slices(start_time, end_time, num_targets, workers))
+
+
+def get_or_create_process_pool(
+    max_workers: int,
+    satellite_tle_data: Optional[Dict[str, Any]] = None,
+    use_adaptive: bool = False,
+    shared_ephemeris: Optional["SharedEphemerisSpec"] = None,
+) -> ProcessPoolExecutor:
     """
     Get or create a reusable process pool to avoid repeated spawn overhead.
 
@@ -100,8 +242,17 @@ def get_or_create_process_pool(max_workers: int) -> ProcessPoolExecutor:
     - Registers atexit + SIGTERM handlers so the pool is cleaned up even
       if the application doesn't go through a graceful ASGI shutdown.
 
+    When ``satellite_tle_data`` is given, a newly created pool installs
+    that satellite's calculator in every worker at startup, attached to
+    ``shared_ephemeris`` when one is published. An existing pool is reused
+    for any satellite; workers build other satellites' calculators and
+    attach other ephemeris blocks on their first task and keep them.
+
     Args:
         max_workers: Number of worker processes
+        satellite_tle_data: Satellite to warm workers with (name, line1, line2)
+        use_adaptive: Adaptive mode of the warmed calculator
+        shared_ephemeris: Published ephemeris block to attach workers to
 
     Returns:
         ProcessPoolExecutor instance
@@ -118,10 +269,21 @@ def get_or_create_process_pool(max_workers: int) -> ProcessPoolExecutor:
 
     mp_context = _get_mp_context()
 
+    # Start the resource tracker before any worker exists so workers share
+    # it; a worker-private tracker would unlink shared ephemeris blocks it
+    # saw when that worker exits.
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.ensure_running()
+    except (ImportError, OSError) as e:
+        logger.debug(f"Resource tracker unavailable: {e}")
+
     _process_pool = ProcessPoolExecutor(
         max_workers=max_workers,
         mp_context=mp_context,
-        initializer=_configure_worker_signals,
+        initializer=_initialize_worker,
+        initargs=(satellite_tle_data, use_adaptive, shared_ephemeris),
     )
     _pool_max_workers = max_workers
 
@@ -132,12 +294,13 @@ def get_or_create_process_pool(max_workers: int) -> ProcessPoolExecutor:
     return _process_pool
 
 
-def cleanup_process_pool():
+def cleanup_process_pool() -> None:
     """
     Clean up the global process pool on shutdown.
 
     Call this when the application is shutting down to gracefully
-    terminate worker processes.  Safe to call multiple times.
+    terminate worker processes.  Also unlinks any shared ephemeris blocks
+    still published for the workers.  Safe to call multiple times.
     """
     global _process_pool, _pool_max_workers
 
@@ -151,6 +314,9 @@ def cleanup_process_pool():
         _process_pool = None
         _pool_max_workers = None
 
+    if "mission_planner.shared_ephemeris" in sys.modules:
+        sys.modules["mission_planner.shared_ephemeris"].release_shared_ephemerides()
+
 
 _signal_installed = False
 
@@ -170,7 +336,115 @@ def _configure_worker_signals() -> None:
         return
 
 
-def _install_signal_cleanup():
+def _initialize_worker(
+    satellite_tle_data: Optional[Dict[str, Any]] = None,
+    use_adaptive: bool = False,
+    shared_ephemeris: Optional["SharedEphemerisSpec"] = None,
+) -> None:
+    """
+    Process pool initializer: quiet signals and warm the satellite cache.
+
+    Args:
+        satellite_tle_data: Satellite to install up front (None = none)
+        use_adaptive: Adaptive mode of the installed calculator
+        shared_ephemeris: Published ephemeris block to attach the calculator to
+    """
+    _configure_worker_signals()
+    if satellite_tle_data is None:
+        return
+    try:
+        calc = _get_worker_calculator(satellite_tle_data, use_adaptive)
+        if shared_ephemeris is not None:
+            _attach_worker_ephemeris(calc, shared_ephemeris)
+    except Exception as e:
+        # The first task for this satellite retries and reports the error
+        logger.warning(
+            f"Could not warm worker for {satellite_tle_data.get('name')}: {e}"
+        )
+
+
+def _get_worker_calculator(
+    satellite_tle_data: Dict[str, Any], use_adaptive: bool
+) -> "VisibilityCalculator":
+    """
+    Return this process's VisibilityCalculator for a satellite.
+
+    The calculator is built from the TLE lines on first use and kept,
+    keyed by TLE hash, so later targets reuse its parsed predictor,
+    position cache and interpolated ephemeris.
+
+    Args:
+        satellite_tle_data: Dictionary with satellite name, line1 and line2
+        use_adaptive: Enable adaptive time-stepping algorithm
+
+    Returns:
+        VisibilityCalculator for the satellite
+    """
+    from mission_planner.ephemeris_cache import EphemerisCache
+
+    tle_lines = [
+        satellite_tle_data['name'],
+        satellite_tle_data['line1'],
+        satellite_tle_data['line2'],
+    ]
+    key = (EphemerisCache.tle_key(tle_lines), use_adaptive)
+    calc = _worker_calculators.get(key)
+    if calc is not None:
+        _worker_calculators.move_to_end(key)
+        return calc
+
+    from mission_planner.orbit import SatelliteOrbit
+    from mission_planner.visibility import VisibilityCalculator
+
+    satellite = SatelliteOrbit(tle_lines, satellite_tle_data['name'])
+    calc = VisibilityCalculator(satellite, use_adaptive=use_adaptive)
+    _worker_calculators[key] = calc
+    if len(_worker_calculators) > _WORKER_CALCULATOR_CACHE_SIZE:
+        _worker_calculators.popitem(last=False)
+    return calc
+
+
+def _attach_worker_ephemeris(calc: Any, spec: "SharedEphemerisSpec") -> None:
+    """
+    Point a worker calculator at a shared ephemeris block.
+
+    Attachments are kept per worker by block name, so each block is mapped
+    once per worker however many targets use it. The oldest attachment is
+    dropped once more than _WORKER_EPHEMERIS_CACHE_SIZE are held.
+
+    Args:
+        calc: This worker's VisibilityCalculator for the satellite
+        spec: Published ephemeris block
+
+    Raises:
+        FileNotFoundError: If the parent already released the block
+    """
+    attached = _worker_ephemerides.get(spec.block_name)
+    if attached is None:
+        from mission_planner.shared_ephemeris import attach_shared_ephemeris
+
+        attached = attach_shared_ephemeris(spec, orbit=calc.satellite)
+        _worker_ephemerides[spec.block_name] = attached
+        while len(_worker_ephemerides) > _WORKER_EPHEMERIS_CACHE_SIZE:
+            _, (old_block, old_ephemeris) = _worker_ephemerides.popitem(last=False)
+            for other in _worker_calculators.values():
+                if other.ephemeris is old_ephemeris:
+                    other.set_ephemeris(None)
+            del old_ephemeris
+            try:
+                old_block.close()
+            except BufferError:
+                # Still viewed somewhere; the mapping goes away with it
+                pass
+    else:
+        _worker_ephemerides.move_to_end(spec.block_name)
+
+    ephemeris = attached[1]
+    if calc.ephemeris is not ephemeris:
+        calc.set_ephemeris(ephemeris)
+
+
+def _install_signal_cleanup() -> None:
     """
     Install SIGTERM/SIGINT handlers that clean up the process pool before
     the default handler runs.  This prevents orphan worker processes when
@@ -187,7 +461,9 @@ def _install_signal_cleanup():
     for sig in (signal.SIGTERM, signal.SIGINT):
         prev_handler = signal.getsignal(sig)
 
-        def _handler(signum, frame, _prev=prev_handler):
+        def _handler(
+            signum: int, frame: Optional[FrameType], _prev: Any = prev_handler
+        ) -> None:
             cleanup_process_pool()
             # Chain to previous handler (uvicorn's or default)
             if callable(_prev):
@@ -203,87 +479,191 @@ def _install_signal_cleanup():
             pass
 
 
-def _compute_target_passes_worker(
+def _build_target(target_data: Dict[str, Any]) -> "GroundTarget":
+    """Rebuild a GroundTarget from its serialized fields."""
+    # Import here to avoid pickling issues
+    from mission_planner.targets import GroundTarget
+
+    target = GroundTarget(
+        name=target_data['name'],
+        latitude=target_data['latitude'],
+        longitude=target_data['longitude'],
+        description=target_data.get('description', ''),
+        mission_type=target_data.get('mission_type', 'communication'),
+        elevation_mask=target_data.get('elevation_mask', 10.0),
+        sensor_fov_half_angle_deg=target_data.get('sensor_fov_half_angle_deg'),
+        max_spacecraft_roll=target_data.get('max_spacecraft_roll')
+    )
+
+    # Set imaging_type if applicable
+    if 'imaging_type' in target_data:
+        target.imaging_type = target_data['imaging_type']
+    return target
+
+
+def _get_window_calculator(
+    satellite_tle_data: Dict[str, Any],
+    use_adaptive: bool,
+    shared_ephemeris: Optional["SharedEphemerisSpec"] = None,
+) -> "VisibilityCalculator":
+    """This worker's calculator, attached to the published ephemeris if any."""
+    # Reuse this worker's calculator (parsed TLE, caches, ephemeris)
+    calc = _get_worker_calculator(satellite_tle_data, use_adaptive)
+    if shared_ephemeris is not None:
+        try:
+            _attach_worker_ephemeris(calc, shared_ephemeris)
+        except FileNotFoundError:
+            logger.warning(
+                f"Shared ephemeris {shared_ephemeris.block_name} is gone; "
+                "propagating locally"
+            )
+    return calc
+
+
+def _find_target_passes(
     target_data: Dict[str, Any],
     satellite_tle_data: Dict[str, Any],
     start_time: datetime,
     end_time: datetime,
+    time_step_seconds: int,
+    use_adaptive: bool,
+    shared_ephemeris: Optional["SharedEphemerisSpec"] = None,
+) -> List[Any]:
+    """
+    Find passes for one serialized target with this worker's calculator.
+
+    Returns:
+        List of PassDetails objects
+    """
+    target = _build_target(target_data)
+    calc = _get_window_calculator(satellite_tle_data, use_adaptive, shared_ephemeris)
+
+    # Find passes (adaptive or fixed-step based on flag)
+    return calc.find_passes(target, start_time, end_time, time_step_seconds)
+
+
+def _compute_target_batch_worker(
+    target_data_list: List[Dict[str, Any]],
+    satellite_tle_data: Dict[str, Any],
+    start_time: datetime,
+    end_time: datetime,
     time_step_seconds: int = 1,
-    use_adaptive: bool = False
-) -> Tuple[str, List[Any]]:
+    use_adaptive: bool = False,
+    shared_ephemeris: Optional["SharedEphemerisSpec"] = None,
+    time_slice: Optional[Tuple[datetime, datetime]] = None,
+) -> Tuple["PassTable", float]:
     """
-    Worker function to compute passes for a single target.
-    
-    This function is designed to be pickled and run in a separate process.
-    
+    Worker function to compute passes for a batch of targets.
+
+    The passes of the whole batch come back as one PassTable, whose
+    structured array pickles as a single buffer instead of a list of
+    dictionaries per target. A target that fails is logged and
+    contributes no passes.
+
+    With a time slice, only passes starting inside the slice are returned,
+    each searched to its end even past the slice (see
+    VisibilityCalculator.find_block_passes), so the tables of consecutive
+    slices concatenate to the passes of the whole window.
+
     Args:
-        target_data: Dictionary with target information
+        target_data_list: Dictionaries with target information
         satellite_tle_data: Dictionary with satellite TLE data
         start_time: Start of analysis window
         end_time: End of analysis window
         time_step_seconds: Time step for calculations (fixed-step mode only)
         use_adaptive: Enable adaptive time-stepping algorithm
-        
+        shared_ephemeris: Parent-published ephemeris block for the window
+        time_slice: (slice_start, slice_end) inside the window (None = whole
+            window)
+
     Returns:
-        Tuple of (target_name, list_of_passes)
+        Tuple of (PassTable of the batch's passes, compute time in seconds)
     """
-    try:
-        # Import here to avoid pickling issues
-        from mission_planner.orbit import SatelliteOrbit
-        from mission_planner.targets import GroundTarget
-        from mission_planner.visibility import VisibilityCalculator
-        import tempfile
-        import os
-        
-        # Recreate satellite orbit from TLE data
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.tle', delete=False) as f:
-            f.write(f"{satellite_tle_data['name']}\n")
-            f.write(f"{satellite_tle_data['line1']}\n")
-            f.write(f"{satellite_tle_data['line2']}\n")
-            tle_file = f.name
-        
+    from mission_planner.pass_table import PassTable
+
+    started = time.perf_counter()
+    passes: List[Any] = []
+    if time_slice is not None:
+        slice_start, slice_end = time_slice
         try:
-            satellite = SatelliteOrbit.from_tle_file(
-                tle_file, 
-                satellite_name=satellite_tle_data['name']
+            calc = _get_window_calculator(
+                satellite_tle_data, use_adaptive, shared_ephemeris
             )
-            
-            # Recreate target from data
-            target = GroundTarget(
-                name=target_data['name'],
-                latitude=target_data['latitude'],
-                longitude=target_data['longitude'],
-                description=target_data.get('description', ''),
-                mission_type=target_data.get('mission_type', 'communication'),
-                elevation_mask=target_data.get('elevation_mask', 10.0),
-                sensor_fov_half_angle_deg=target_data.get('sensor_fov_half_angle_deg'),
-                max_spacecraft_roll=target_data.get('max_spacecraft_roll')
+            passes = calc.find_block_passes(
+                [_build_target(target_data) for target_data in target_data_list],
+                slice_start,
+                slice_end,
+                end_time,
+                include_block_start=slice_start <= start_time,
             )
-            
-            # Set imaging_type if applicable
-            if 'imaging_type' in target_data:
-                target.imaging_type = target_data['imaging_type']
-            
-            # Create visibility calculator
-            from mission_planner.visibility import VisibilityCalculator
-            calc = VisibilityCalculator(satellite, use_adaptive=use_adaptive)
-            
-            # Find passes (adaptive or fixed-step based on flag)
-            passes = calc.find_passes(target, start_time, end_time, time_step_seconds)
-            
-            # Convert PassDetails to dictionaries for serialization
-            passes_dict = [p.to_dict() for p in passes]
-            
-            return (target_data['name'], passes_dict)
-            
+        except Exception as e:
+            logger.error(
+                f"Error computing passes for time slice starting {slice_start}: {e}"
+            )
+        return PassTable.from_passes(passes), time.perf_counter() - started
+
+    for target_data in target_data_list:
+        try:
+            passes.extend(
+                _find_target_passes(
+                    target_data,
+                    satellite_tle_data,
+                    start_time,
+                    end_time,
+                    time_step_seconds,
+                    use_adaptive,
+                    shared_ephemeris,
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error computing passes for target {target_data['name']}: {e}"
+            )
+    return PassTable.from_passes(passes), time.perf_counter() - started
+
+
+def _attach_worker_payload(block_name: str, size: int) -> _SchedulingPayload:
+    """
+    Scheduling inputs published by the parent, unpickled once per worker.
+
+    The mapping is closed right after unpickling; the objects are kept
+    per worker by block name for the run's remaining starts.
+
+    Raises:
+        FileNotFoundError: If the parent already released the block
+    """
+    payload = _worker_payloads.get(block_name)
+    if payload is None:
+        from multiprocessing import shared_memory
+
+        block = shared_memory.SharedMemory(name=block_name)
+        assert block.buf is not None
+        view = block.buf[:size]
+        try:
+            payload = pickle.loads(view)
         finally:
-            # Clean up temp file
-            if os.path.exists(tle_file):
-                os.unlink(tle_file)
-        
-    except Exception as e:
-        logger.error(f"Error computing passes for target {target_data['name']}: {e}")
-        return (target_data['name'], [])
+            view.release()
+            block.close()
+        _worker_payloads[block_name] = payload
+        while len(_worker_payloads) > _WORKER_PAYLOAD_CACHE_SIZE:
+            _worker_payloads.popitem(last=False)
+    else:
+        _worker_payloads.move_to_end(block_name)
+    return payload
+
+
+def _schedule_start_worker(
+    block_name: str, size: int, algorithm_value: str, seed: Optional[int]
+) -> Tuple[List["ScheduledOpportunity"], "ScheduleMetrics"]:
+    """Worker: one randomized scheduling start on the shared inputs."""
+    from mission_planner.scheduler import AlgorithmType
+
+    scheduler, opportunities, target_positions = _attach_worker_payload(
+        block_name, size
+    )
+    return scheduler.schedule_perturbed(
+        opportunities, target_positions, AlgorithmType(algorithm_value), seed
+    )
 
 
 class ParallelVisibilityCalculator:
@@ -294,7 +674,12 @@ class ParallelVisibilityCalculator:
     speedup on systems with multiple cores.
     """
     
-    def __init__(self, satellite, max_workers: Optional[int] = None, use_adaptive: bool = False):
+    def __init__(
+        self,
+        satellite: "SatelliteOrbit",
+        max_workers: Optional[int] = None,
+        use_adaptive: bool = False,
+    ) -> None:
         """
         Initialize parallel visibility calculator.
         
@@ -357,104 +742,325 @@ class ParallelVisibilityCalculator:
         """
         if not targets:
             return {}
-        
+
+        table = self.compute_pass_table(
+            targets, start_time, end_time, time_step_seconds, progress_callback
+        )
+
+        if start_time.tzinfo is None:
+            records = table.to_records()
+        else:
+            # Keep the caller's UTC offset in the ISO timestamps
+            records = [
+                p.to_dict(sections=()) for p in table.to_passes(tz=start_time.tzinfo)
+            ]
+
+        results: Dict[str, List[Any]] = {target.name: [] for target in targets}
+        for record in records:
+            results[record['target_name']].append(record)
+        return results
+
+    def compute_pass_table(
+        self,
+        targets: List[Any],
+        start_time: datetime,
+        end_time: datetime,
+        time_step_seconds: int = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> "PassTable":
+        """
+        Compute passes for multiple targets in parallel as one PassTable.
+
+        Targets are sent to workers in batches. The first batches are
+        small; later ones are sized from the measured per-target cost so
+        each task runs for about TASK_TARGET_SECONDS, while keeping enough
+        batches left over for the workers to finish together.
+
+        With fewer targets than workers, the window is split into time
+        slices instead (see time_slices) and each task searches all targets
+        over one slice; passes crossing a slice boundary are found whole by
+        the slice they start in. Progress then counts slices.
+
+        Args:
+            targets: List of GroundTarget objects
+            start_time: Start of analysis window
+            end_time: End of analysis window
+            time_step_seconds: Time step for calculations (fixed-step mode only)
+            progress_callback: Optional callback(completed, total) for progress
+
+        Returns:
+            PassTable of all passes
+
+        Raises:
+            BrokenProcessPool: If the worker pool dies (the pool is cleaned up
+                so callers can fall back to serial)
+        """
+        from mission_planner.pass_table import PassTable
+
+        if not targets:
+            return PassTable.concatenate([])
+
         # Optimize worker count based on target count
         optimal_workers = get_optimal_workers(self.max_workers, len(targets))
-        
-        # Serialize target data
-        target_data_list = []
-        for target in targets:
-            target_dict = {
-                'name': target.name,
-                'latitude': target.latitude,
-                'longitude': target.longitude,
-                'description': target.description,
-                'mission_type': target.mission_type,
-                'elevation_mask': target.elevation_mask,
-                'sensor_fov_half_angle_deg': target.sensor_fov_half_angle_deg,
-                'max_spacecraft_roll': target.max_spacecraft_roll
-            }
-            
-            # Include imaging_type if available
-            if hasattr(target, 'imaging_type'):
-                target_dict['imaging_type'] = target.imaging_type
-            
-            target_data_list.append(target_dict)
-        
-        # Create partial function with fixed parameters
-        worker_func = partial(
-            _compute_target_passes_worker,
-            satellite_tle_data=self.satellite_tle_data,
-            start_time=start_time,
-            end_time=end_time,
-            time_step_seconds=time_step_seconds,
-            use_adaptive=self.use_adaptive
-        )
-        
-        # Execute in parallel
-        results = {}
-        completed = 0
-        
+        target_data_list = [self._serialize_target(target) for target in targets]
+        slices = time_slices(start_time, end_time, len(targets), optimal_workers)
+
         logger.info(
-            "Computing passes for %d targets using %d workers",
+            "Computing passes for %d targets using %d workers%s",
             len(targets),
             optimal_workers,
+            f" over {len(slices)} time slices" if slices else "",
         )
-        
-        # Use persistent pool to avoid spawn overhead on repeated calls
-        executor = get_or_create_process_pool(optimal_workers)
-        
-        # Submit all tasks
-        future_to_target = {
-            executor.submit(worker_func, target_data): target_data['name']
-            for target_data in target_data_list
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_target):
-            target_name = future_to_target[future]
 
-            try:
-                target_name, passes = future.result()
-                results[target_name] = passes
-                completed += 1
-                
+        # Propagate once here; workers read the nodes from shared memory
+        shared = self._publish_ephemeris(start_time, end_time)
+        shared_spec = shared.spec if shared is not None else None
+        try:
+            # Create partial function with fixed parameters
+            worker_func = partial(
+                _compute_target_batch_worker,
+                satellite_tle_data=self.satellite_tle_data,
+                start_time=start_time,
+                end_time=end_time,
+                time_step_seconds=time_step_seconds,
+                use_adaptive=self.use_adaptive,
+                shared_ephemeris=shared_spec,
+            )
+
+            # Use persistent pool to avoid spawn overhead on repeated calls
+            executor = get_or_create_process_pool(
+                optimal_workers,
+                self.satellite_tle_data,
+                self.use_adaptive,
+                shared_spec,
+            )
+            tables = self._run_batches(
+                executor,
+                worker_func,
+                target_data_list,
+                optimal_workers,
+                progress_callback,
+                slices,
+            )
+        finally:
+            if shared is not None:
+                shared.close()
+
+        table = PassTable.concatenate(tables)
+        logger.info(
+            "Parallel computation complete: %d total passes across %d targets",
+            len(table),
+            len(targets),
+        )
+        return table
+
+    def _publish_ephemeris(
+        self, start_time: datetime, end_time: datetime
+    ) -> Optional["SharedEphemeris"]:
+        """
+        Build the window's ephemeris once and publish it for the workers.
+
+        Returns:
+            Published block, or None if it cannot be built or shared (workers
+            then propagate for themselves)
+        """
+        from mission_planner.ephemeris_cache import build_ephemeris
+        from mission_planner.orbit import SatelliteOrbit
+        from mission_planner.shared_ephemeris import SharedEphemeris
+
+        # Stand-in satellites (test doubles) have no TLE to propagate from
+        satellite: object = self.satellite
+        if not isinstance(satellite, SatelliteOrbit):
+            return None
+        try:
+            ephemeris = build_ephemeris(satellite, start_time, end_time)
+            return SharedEphemeris(ephemeris)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Shared ephemeris unavailable, workers will propagate: {e}")
+            return None
+
+    def _run_batches(
+        self,
+        executor: ProcessPoolExecutor,
+        worker_func: Callable[..., Tuple["PassTable", float]],
+        target_data_list: List[Dict[str, Any]],
+        workers: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        slices: Optional[List[Tuple[datetime, datetime]]] = None,
+    ) -> List["PassTable"]:
+        """
+        Submit target batches (or time slices of all targets) to the pool
+        and collect their tables.
+        """
+        tables = []
+        # future -> (units of progress, description for error logs)
+        pending: Dict[Any, Tuple[int, str]] = {}
+        total = len(slices) if slices else len(target_data_list)
+        submitted = 0
+        completed = 0
+        measured_targets = 0
+        measured_seconds = 0.0
+        max_in_flight = workers * TASKS_IN_FLIGHT_PER_WORKER
+
+        def submit_batches() -> None:
+            nonlocal submitted
+            while submitted < total and len(pending) < max_in_flight:
+                if slices:
+                    time_slice = slices[submitted]
+                    future = executor.submit(
+                        worker_func, target_data_list, time_slice=time_slice
+                    )
+                    pending[future] = (1, f"time slice starting {time_slice[0]}")
+                    submitted += 1
+                else:
+                    cost = None
+                    if measured_targets:
+                        cost = measured_seconds / measured_targets
+                    size = next_batch_size(total - submitted, workers, cost)
+                    batch = target_data_list[submitted:submitted + size]
+                    pending[executor.submit(worker_func, batch)] = (
+                        size,
+                        f"batch of {size} targets starting at {batch[0]['name']}",
+                    )
+                    submitted += size
+
+        submit_batches()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                units, description = pending.pop(future)
+                try:
+                    table, elapsed = future.result()
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        logger.error(
+                            "Parallel process pool failed while processing %s; "
+                            "cleaning up and falling back to serial",
+                            description,
+                        )
+                        cleanup_process_pool()
+                        raise
+                    logger.error("Error processing %s: %s", description, e)
+                else:
+                    tables.append(table)
+                    if not slices:
+                        measured_targets += units
+                        measured_seconds += elapsed
+
+                completed += units
                 logger.debug(
-                    "Completed %d/%d: %s (%d passes)",
+                    "Completed %d/%d %s",
                     completed,
-                    len(targets),
-                    target_name,
-                    len(passes),
+                    total,
+                    "time slices" if slices else "targets",
                 )
-                
+
                 # Call progress callback if provided
                 if progress_callback:
-                    progress_callback(completed, len(targets))
+                    progress_callback(completed, total)
 
-            except Exception as e:
-                if isinstance(e, BrokenProcessPool):
-                    logger.error(
-                        "Parallel process pool failed while processing %s; cleaning up and falling back to serial",
-                        target_name,
-                    )
-                    cleanup_process_pool()
-                    raise
-                logger.error("Error processing target %s: %s", target_name, e)
-                results[target_name] = []
-                completed += 1
-        
-        total_passes = sum(len(passes) for passes in results.values())
-        logger.info(
-            "Parallel computation complete: %d total passes across %d targets",
-            total_passes,
-            len(targets),
+            submit_batches()
+
+        return tables
+
+    @staticmethod
+    def _serialize_target(target: Any) -> Dict[str, Any]:
+        """Target fields needed to rebuild it in a worker."""
+        target_dict = {
+            'name': target.name,
+            'latitude': target.latitude,
+            'longitude': target.longitude,
+            'description': target.description,
+            'mission_type': target.mission_type,
+            'elevation_mask': target.elevation_mask,
+            'sensor_fov_half_angle_deg': target.sensor_fov_half_angle_deg,
+            'max_spacecraft_roll': target.max_spacecraft_roll
+        }
+
+        # Include imaging_type if available
+        if hasattr(target, 'imaging_type'):
+            target_dict['imaging_type'] = target.imaging_type
+
+        return target_dict
+
+
+def run_schedule_starts(
+    scheduler: "MissionScheduler",
+    opportunities: List["Opportunity"],
+    target_positions: Dict[str, Tuple[float, float]],
+    algorithm: "AlgorithmType",
+    seeds: List[Optional[int]],
+    max_workers: Optional[int] = None,
+) -> List[Tuple[List["ScheduledOpportunity"], "ScheduleMetrics"]]:
+    """
+    Run randomized scheduling starts (MissionScheduler.schedule_perturbed)
+    across the shared process pool.
+
+    The scheduler, opportunities and target positions are pickled once into
+    a shared memory block; each worker unpickles them on its first start and
+    tasks carry only the seed. Runs in-process with a single worker, and
+    falls back to in-process if the pool breaks.
+
+    Args:
+        scheduler: Scheduler whose config and satellites every start uses
+        opportunities: Opportunities to schedule
+        target_positions: Dict mapping target_id to (lat, lon)
+        algorithm: Algorithm to randomize
+        seeds: One seed per start (None = unperturbed)
+        max_workers: Maximum worker processes (None = all cores)
+
+    Returns:
+        (schedule, metrics) per start, in seed order
+    """
+    workers = get_optimal_workers(max_workers)
+    if workers <= 1 or len(seeds) <= 1:
+        return [
+            scheduler.schedule_perturbed(
+                opportunities, target_positions, algorithm, seed
+            )
+            for seed in seeds
+        ]
+
+    from multiprocessing import shared_memory
+
+    payload = pickle.dumps(
+        (scheduler, opportunities, target_positions),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    block = shared_memory.SharedMemory(create=True, size=len(payload))
+    try:
+        assert block.buf is not None
+        block.buf[: len(payload)] = payload
+        pool = get_or_create_process_pool(workers)
+        futures = [
+            pool.submit(
+                _schedule_start_worker, block.name, len(payload), algorithm.value, seed
+            )
+            for seed in seeds
+        ]
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        logger.error(
+            "Parallel process pool failed during multistart; cleaning up and "
+            "running starts serially"
         )
-        
-        return results
+        cleanup_process_pool()
+        return [
+            scheduler.schedule_perturbed(
+                opportunities, target_positions, algorithm, seed
+            )
+            for seed in seeds
+        ]
+    finally:
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
 
 
 def benchmark_parallel_speedup(
-    satellite,
+    satellite: "SatelliteOrbit",
     targets: List[Any],
     start_time: datetime,
     end_time: datetime,
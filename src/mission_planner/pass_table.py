@@ -0,0 +1,537 @@
+"""
+Columnar storage of satellite passes.
+
+A PassTable keeps the core fields of many passes in one NumPy structured
+array (times as float64 epoch seconds, target/satellite/mode as integer
+codes into shared label lists), about 80 bytes per pass instead of a
+PassDetails instance with its own ``__dict__`` and datetime objects.
+Rows are sorted by (satellite, target, start time), so the rows of one
+satellite, or of one target on one satellite, are contiguous and selected
+as views without copying. PassRow gives a row the PassDetails attribute
+API; to_records() serializes the whole table for the API layer and
+to_opportunities() feeds the scheduler.
+
+Enrichment sections (geometry, lighting, quality, maneuver) and SAR data
+are not columnar; convert rows with to_passes() where those are needed.
+"""
+
+import copy
+import math
+from datetime import datetime, timezone, tzinfo
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from .orbit import datetime_to_epoch_seconds, epoch_seconds_to_datetime
+from .scheduler import Opportunity
+from .visibility import PassDetails
+
+PASS_DTYPE = np.dtype(
+    [
+        ("satellite", np.int32),
+        ("target", np.int32),
+        ("start", np.float64),
+        ("tca", np.float64),
+        ("end", np.float64),
+        ("max_elevation", np.float64),
+        ("start_azimuth", np.float64),
+        ("max_elevation_azimuth", np.float64),
+        ("end_azimuth", np.float64),
+        ("incidence_angle", np.float64),  # NaN when unknown
+        ("pass_index", np.int32),
+        ("mode", np.int16),  # -1 when unset
+    ]
+)
+
+# (satellite_name, satellite_id) labels of the satellite column
+SatelliteLabel = Tuple[str, str]
+
+
+def _iso_strings(epoch_s: np.ndarray) -> List[str]:
+    """datetime.isoformat() of naive UTC datetimes for an array of epoch seconds."""
+    micros = np.round(epoch_s * 1e6).astype("datetime64[us]")
+    text = np.datetime_as_string(micros, unit="us")
+    return [s[:-7] if s.endswith(".000000") else s for s in text.tolist()]
+
+
+def _datetimes(epoch_s: np.ndarray, tz: Optional[tzinfo] = None) -> List[datetime]:
+    """Datetimes for an array of epoch seconds (naive UTC when tz is None)."""
+    naive: List[datetime] = np.round(epoch_s * 1e6).astype("datetime64[us]").tolist()
+    if tz is None:
+        return naive
+    return [t.replace(tzinfo=timezone.utc).astimezone(tz) for t in naive]
+
+
+def _pass_types(
+    start_azimuth: np.ndarray, max_elevation_azimuth: np.ndarray
+) -> np.ndarray:
+    """Vectorized PassDetails._determine_pass_type."""
+    mid = max_elevation_azimuth
+    crossing = ((mid > 45) & (mid < 135)) | ((mid > 225) & (mid < 315))
+    ascending = np.where(crossing, mid < 180, start_azimuth < 180)
+    return np.where(ascending, "ascending", "descending")
+
+
+class PassRow:
+    """
+    Read-only view of one PassTable row with the PassDetails attribute API.
+
+    Enrichment sections are not stored in the table and read as None.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    geometry_aos = geometry_tca = geometry_los = None
+    lighting = quality = maneuver = sar_data = None
+
+    def __init__(self, table: "PassTable", row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def _value(self, column: str) -> Any:
+        return self._table.data[column][self._row]
+
+    @property
+    def target_name(self) -> str:
+        return self._table.target_names[int(self._value("target"))]
+
+    @property
+    def satellite_name(self) -> str:
+        return self._table.satellites[int(self._value("satellite"))][0]
+
+    @property
+    def satellite_id(self) -> str:
+        return self._table.satellites[int(self._value("satellite"))][1]
+
+    @property
+    def start_time(self) -> datetime:
+        return epoch_seconds_to_datetime(self._value("start"))
+
+    @property
+    def max_elevation_time(self) -> datetime:
+        return epoch_seconds_to_datetime(self._value("tca"))
+
+    @property
+    def end_time(self) -> datetime:
+        return epoch_seconds_to_datetime(self._value("end"))
+
+    @property
+    def max_elevation(self) -> float:
+        return float(self._value("max_elevation"))
+
+    @property
+    def start_azimuth(self) -> float:
+        return float(self._value("start_azimuth"))
+
+    @property
+    def max_elevation_azimuth(self) -> float:
+        return float(self._value("max_elevation_azimuth"))
+
+    @property
+    def end_azimuth(self) -> float:
+        return float(self._value("end_azimuth"))
+
+    @property
+    def incidence_angle_deg(self) -> Optional[float]:
+        value = float(self._value("incidence_angle"))
+        return None if math.isnan(value) else value
+
+    @property
+    def mode(self) -> Optional[str]:
+        code = int(self._value("mode"))
+        return None if code < 0 else self._table.modes[code]
+
+    @property
+    def pass_index(self) -> int:
+        return int(self._value("pass_index"))
+
+    def to_pass_details(self) -> PassDetails:
+        """Materialize the row as a PassDetails instance."""
+        return PassDetails(
+            target_name=self.target_name,
+            satellite_name=self.satellite_name,
+            start_time=self.start_time,
+            max_elevation_time=self.max_elevation_time,
+            end_time=self.end_time,
+            max_elevation=self.max_elevation,
+            start_azimuth=self.start_azimuth,
+            max_elevation_azimuth=self.max_elevation_azimuth,
+            end_azimuth=self.end_azimuth,
+            satellite_id=self.satellite_id,
+            pass_index=self.pass_index,
+            incidence_angle_deg=self.incidence_angle_deg,
+            mode=self.mode,
+        )
+
+    def to_dict(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert the row to the PassDetails.to_dict() structure."""
+        return self.to_pass_details().to_dict(sections=sections)
+
+    def __str__(self) -> str:
+        """String representation of the pass."""
+        return str(self.to_pass_details())
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"PassRow({self.target_name!r}, {self.start_time.isoformat()})"
+
+
+class PassTable:
+    """
+    Columnar table of pass core fields backed by a NumPy structured array.
+
+    Tables returned by slicing and selection share label lists with their
+    parent and, where the selected rows are contiguous, the array too.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        target_names: Sequence[str],
+        satellites: Sequence[SatelliteLabel],
+        modes: Sequence[str] = (),
+    ) -> None:
+        """
+        Initialize a table from an already sorted structured array.
+
+        Args:
+            data: Array of PASS_DTYPE sorted by (satellite, target, start)
+            target_names: Labels of the target codes
+            satellites: (satellite_name, satellite_id) labels of the satellite codes
+            modes: Labels of the mode codes
+
+        Raises:
+            ValueError: If data does not have PASS_DTYPE
+        """
+        if data.dtype != PASS_DTYPE:
+            raise ValueError(f"PassTable data must have dtype {PASS_DTYPE}")
+        self.data = data
+        self.target_names = list(target_names)
+        self.satellites = list(satellites)
+        self.modes = list(modes)
+
+    @classmethod
+    def from_passes(cls, passes: Iterable[PassDetails]) -> "PassTable":
+        """
+        Build a table from PassDetails (or PassRow) objects.
+
+        Args:
+            passes: Passes in any order
+
+        Returns:
+            PassTable sorted by (satellite, target, start time)
+        """
+        passes = list(passes)
+        target_names = sorted({p.target_name for p in passes})
+        satellites = sorted({(p.satellite_name, p.satellite_id) for p in passes})
+        modes = sorted({p.mode for p in passes if p.mode is not None})
+        target_codes = {name: i for i, name in enumerate(target_names)}
+        satellite_codes = {label: i for i, label in enumerate(satellites)}
+        mode_codes = {mode: i for i, mode in enumerate(modes)}
+
+        data = np.empty(len(passes), dtype=PASS_DTYPE)
+        for i, p in enumerate(passes):
+            data[i] = (
+                satellite_codes[(p.satellite_name, p.satellite_id)],
+                target_codes[p.target_name],
+                datetime_to_epoch_seconds(p.start_time),
+                datetime_to_epoch_seconds(p.max_elevation_time),
+                datetime_to_epoch_seconds(p.end_time),
+                p.max_elevation,
+                p.start_azimuth,
+                p.max_elevation_azimuth,
+                p.end_azimuth,
+                np.nan if p.incidence_angle_deg is None else p.incidence_angle_deg,
+                p.pass_index,
+                -1 if p.mode is None else mode_codes[p.mode],
+            )
+
+        data.sort(order=["satellite", "target", "start"], kind="stable")
+        return cls(data, target_names, satellites, modes)
+
+    @classmethod
+    def from_windows(cls, windows: Dict[str, List[PassDetails]]) -> "PassTable":
+        """
+        Build a table from a get_visibility_windows() result.
+
+        Args:
+            windows: Dictionary mapping target names to pass lists
+
+        Returns:
+            PassTable of all passes
+        """
+        return cls.from_passes(p for passes in windows.values() for p in passes)
+
+    @classmethod
+    def concatenate(cls, tables: Iterable["PassTable"]) -> "PassTable":
+        """
+        Merge tables with independent label lists into one table.
+
+        Args:
+            tables: Tables to merge
+
+        Returns:
+            PassTable of all rows, sorted by (satellite, target, start time)
+        """
+        tables = list(tables)
+        target_names = sorted({name for t in tables for name in t.target_names})
+        satellites = sorted({label for t in tables for label in t.satellites})
+        modes = sorted({mode for t in tables for mode in t.modes})
+        target_codes = {name: i for i, name in enumerate(target_names)}
+        satellite_codes = {label: i for i, label in enumerate(satellites)}
+        mode_codes = {mode: i for i, mode in enumerate(modes)}
+
+        parts = []
+        for table in tables:
+            if not len(table):
+                continue
+            part = table.data.copy()
+            part["target"] = np.array(
+                [target_codes[name] for name in table.target_names], dtype=np.int32
+            )[part["target"]]
+            part["satellite"] = np.array(
+                [satellite_codes[label] for label in table.satellites], dtype=np.int32
+            )[part["satellite"]]
+            # Append -1 so unset modes (code -1) stay unset
+            remap = np.array(
+                [mode_codes[mode] for mode in table.modes] + [-1], dtype=np.int16
+            )
+            part["mode"] = remap[part["mode"]]
+            parts.append(part)
+
+        data = np.concatenate(parts) if parts else np.empty(0, dtype=PASS_DTYPE)
+        data.sort(order=["satellite", "target", "start"], kind="stable")
+        return cls(data, target_names, satellites, modes)
+
+    def _with_data(self, data: np.ndarray) -> "PassTable":
+        """Table of other rows sharing this table's labels."""
+        table = copy.copy(self)
+        table.data = data
+        return table
+
+    def _select(self, mask: np.ndarray) -> "PassTable":
+        """Rows where mask is set, as a view when they are contiguous."""
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            return self._with_data(self.data[:0])
+        if rows[-1] - rows[0] + 1 == rows.size:
+            return self._with_data(self.data[rows[0] : rows[-1] + 1])
+        return self._with_data(self.data[rows])
+
+    def for_satellite(self, satellite_id: str) -> "PassTable":
+        """
+        Passes of one satellite (a view of this table).
+
+        Args:
+            satellite_id: Satellite ID, or satellite name for passes without one
+
+        Returns:
+            PassTable of the satellite's passes
+        """
+        codes = [
+            i
+            for i, (name, sat_id) in enumerate(self.satellites)
+            if (sat_id or name) == satellite_id
+        ]
+        return self._select(np.isin(self.data["satellite"], codes))
+
+    def for_target(self, target_name: str) -> "PassTable":
+        """
+        Passes over one target.
+
+        A view when the table holds one satellite's passes (e.g. after
+        for_satellite); otherwise the target's rows are copied.
+
+        Args:
+            target_name: Target name
+
+        Returns:
+            PassTable of the target's passes
+        """
+        if target_name not in self.target_names:
+            return self._with_data(self.data[:0])
+        code = self.target_names.index(target_name)
+        return self._select(self.data["target"] == code)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[PassRow]:
+        return (PassRow(self, i) for i in range(len(self.data)))
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[PassRow, "PassTable"]:
+        if isinstance(key, slice):
+            return self._with_data(self.data[key])
+        index = int(key)
+        if index < 0:
+            index += len(self.data)
+        if not 0 <= index < len(self.data):
+            raise IndexError("PassTable index out of range")
+        return PassRow(self, index)
+
+    def to_passes(self, tz: Optional[tzinfo] = None) -> List[PassDetails]:
+        """
+        Materialize every row as a PassDetails instance.
+
+        Args:
+            tz: Time zone of the returned times (None = naive UTC)
+
+        Returns:
+            One PassDetails per row, in table order
+        """
+        data = self.data
+        names = [self.target_names[code] for code in data["target"].tolist()]
+        satellites = [self.satellites[code] for code in data["satellite"].tolist()]
+        starts = _datetimes(data["start"], tz)
+        tcas = _datetimes(data["tca"], tz)
+        ends = _datetimes(data["end"], tz)
+        max_elevations = data["max_elevation"].tolist()
+        start_azimuths = data["start_azimuth"].tolist()
+        tca_azimuths = data["max_elevation_azimuth"].tolist()
+        end_azimuths = data["end_azimuth"].tolist()
+        incidences = data["incidence_angle"].tolist()
+        pass_indices = data["pass_index"].tolist()
+        mode_codes = data["mode"].tolist()
+
+        passes = []
+        for i in range(len(data)):
+            satellite_name, satellite_id = satellites[i]
+            passes.append(
+                PassDetails(
+                    target_name=names[i],
+                    satellite_name=satellite_name,
+                    start_time=starts[i],
+                    max_elevation_time=tcas[i],
+                    end_time=ends[i],
+                    max_elevation=max_elevations[i],
+                    start_azimuth=start_azimuths[i],
+                    max_elevation_azimuth=tca_azimuths[i],
+                    end_azimuth=end_azimuths[i],
+                    satellite_id=satellite_id,
+                    pass_index=pass_indices[i],
+                    incidence_angle_deg=(
+                        None if math.isnan(incidences[i]) else incidences[i]
+                    ),
+                    mode=self.modes[mode_codes[i]] if mode_codes[i] >= 0 else None,
+                )
+            )
+        return passes
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Serialize the table for the API layer.
+
+        Returns:
+            One dictionary per row, equal to PassDetails.to_dict(sections=())
+        """
+        data = self.data
+        names = [self.target_names[code] for code in data["target"].tolist()]
+        satellites = [self.satellites[code] for code in data["satellite"].tolist()]
+        starts = _iso_strings(data["start"])
+        tcas = _iso_strings(data["tca"])
+        ends = _iso_strings(data["end"])
+        durations = (data["end"] - data["start"]).tolist()
+        pass_types = _pass_types(
+            data["start_azimuth"], data["max_elevation_azimuth"]
+        ).tolist()
+        max_elevations = data["max_elevation"].tolist()
+        start_azimuths = data["start_azimuth"].tolist()
+        tca_azimuths = data["max_elevation_azimuth"].tolist()
+        end_azimuths = data["end_azimuth"].tolist()
+        incidences = data["incidence_angle"].tolist()
+        pass_indices = data["pass_index"].tolist()
+        mode_codes = data["mode"].tolist()
+
+        records = []
+        for i in range(len(data)):
+            satellite_name, satellite_id = satellites[i]
+            record: Dict[str, Any] = {
+                "target": names[i],
+                "target_name": names[i],
+                "satellite_name": satellite_name,
+                "satellite_id": satellite_id or f"sat_{satellite_name}",
+                "pass_index": pass_indices[i],
+                "start_time": starts[i],
+                "max_elevation_time": tcas[i],
+                "end_time": ends[i],
+                "duration_s": round(durations[i], 1),
+                "max_elevation": round(max_elevations[i], 2),
+                "pass_type": pass_types[i],
+                "start_azimuth": round(start_azimuths[i], 2),
+                "max_elevation_azimuth": round(tca_azimuths[i], 2),
+                "end_azimuth": round(end_azimuths[i], 2),
+                "off_nadir_deg": round(90.0 - max_elevations[i], 2),
+            }
+            if not math.isnan(incidences[i]):
+                record["incidence_angle_deg"] = round(incidences[i], 2)
+            if mode_codes[i] >= 0:
+                record["mode"] = self.modes[mode_codes[i]]
+            records.append(record)
+        return records
+
+    def to_opportunities(self) -> List[Opportunity]:
+        """
+        Scheduler opportunities spanning each pass (roll-only, pitch zero).
+
+        Opportunity ids number the passes of each satellite-target pair in
+        start order, since pass_index is not set by visibility search.
+
+        Returns:
+            One Opportunity per row, in table order
+        """
+        data = self.data
+        durations = (data["end"] - data["start"]).tolist()
+        pass_types = _pass_types(
+            data["start_azimuth"], data["max_elevation_azimuth"]
+        ).tolist()
+        # Rows are sorted by satellite, target and start: number each group
+        positions = np.arange(len(data))
+        group_first = np.ones(len(data), dtype=bool)
+        group_first[1:] = (data["satellite"][1:] != data["satellite"][:-1]) | (
+            data["target"][1:] != data["target"][:-1]
+        )
+        ordinals = (
+            positions - np.maximum.accumulate(np.where(group_first, positions, 0))
+        ).tolist()
+        opportunities = []
+        for i, row in enumerate(self):
+            satellite_id = row.satellite_id or row.satellite_name
+            incidence = row.incidence_angle_deg
+            opportunities.append(
+                Opportunity(
+                    id=f"{satellite_id}_{row.target_name}_{ordinals[i]}",
+                    satellite_id=satellite_id,
+                    target_id=row.target_name,
+                    start_time=row.start_time,
+                    end_time=row.end_time,
+                    duration_seconds=durations[i],
+                    max_elevation=row.max_elevation,
+                    azimuth=row.start_azimuth,
+                    orbit_direction=pass_types[i],
+                    incidence_angle=incidence if incidence else 0.0,
+                    pitch_angle=0.0,
+                )
+            )
+        return opportunities
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the row array in bytes."""
+        return int(self.data.nbytes)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"PassTable(passes={len(self)}, targets={len(self.target_names)}, "
+            f"satellites={len(self.satellites)})"
+        )
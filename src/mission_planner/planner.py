@@ -9,20 +9,44 @@ import csv
 import json
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from .ephemeris import Ephemeris
 from .orbit import SatelliteOrbit
 from .targets import GroundTarget, TargetManager
-from .visibility import PassDetails, VisibilityCalculator
+from .visibility import STREAM_CHUNK, PassDetails, VisibilityCalculator
+from .visibility_cache import ComputeFunction, VisibilityCache
+from .visibility_store import VisibilityStore
 from .visualization import Visualizer, create_mission_overview_plot
 
 logger = logging.getLogger(__name__)
 
+# Columns of streamed CSV exports (core PassDetails.to_dict() fields)
+STREAM_CSV_FIELDS = [
+    "target_name",
+    "satellite_name",
+    "satellite_id",
+    "pass_index",
+    "start_time",
+    "max_elevation_time",
+    "end_time",
+    "duration_s",
+    "max_elevation",
+    "pass_type",
+    "start_azimuth",
+    "max_elevation_azimuth",
+    "end_azimuth",
+    "off_nadir_deg",
+    "incidence_angle_deg",
+    "mode",
+]
+
 
 class MissionPlanner:
     """
@@ -70,6 +94,9 @@ class MissionPlanner:
         max_workers: Optional[int] = None,
         progress_callback: Optional[Any] = None,
         use_adaptive: bool = True,
+        ephemeris: Optional[Ephemeris] = None,
+        visibility_cache: Optional[VisibilityCache] = None,
+        visibility_store: Optional[VisibilityStore] = None,
     ) -> Dict[str, List[PassDetails]]:
         """
         Compute satellite passes over targets.
@@ -82,6 +109,11 @@ class MissionPlanner:
             max_workers: Maximum parallel workers (None = auto-detect)
             progress_callback: Optional callback(completed, total) for progress
             use_adaptive: Use adaptive time-stepping algorithm (default: True)
+            ephemeris: Shared ephemeris covering the period (built on demand if None)
+            visibility_cache: Optional pass cache; only the parts of the period
+                it does not cover yet are searched
+            visibility_store: Optional persistent result store; targets with a
+                stored result for this exact period are not searched
 
         Returns:
             Dictionary mapping target names to pass lists
@@ -96,7 +128,7 @@ class MissionPlanner:
         # Recreate visibility calculator with the specified use_adaptive setting
         # This allows switching between adaptive and fixed-step on a per-call basis
         self.visibility_calculator = VisibilityCalculator(
-            self.satellite, use_adaptive=use_adaptive
+            self.satellite, use_adaptive=use_adaptive, ephemeris=ephemeris
         )
 
         mode = "parallel" if use_parallel else "serial"
@@ -106,14 +138,76 @@ class MissionPlanner:
             f"for {len(targets)} targets ({mode} mode, {algo} algorithm)"
         )
 
-        return self.visibility_calculator.get_visibility_windows(
-            targets,
-            start_time,
-            end_time,
-            use_parallel=use_parallel,
-            max_workers=max_workers,
-            progress_callback=progress_callback,
+        if visibility_cache is None and visibility_store is None:
+            return self.visibility_calculator.get_visibility_windows(
+                targets,
+                start_time,
+                end_time,
+                use_parallel=use_parallel,
+                max_workers=max_workers,
+                progress_callback=progress_callback,
+            )
+
+        def compute(
+            batch: List[GroundTarget], batch_start: datetime, batch_end: datetime
+        ) -> Dict[str, List[PassDetails]]:
+            return self.visibility_calculator.get_visibility_windows(
+                batch,
+                batch_start,
+                batch_end,
+                use_parallel=use_parallel,
+                max_workers=max_workers,
+            )
+
+        search: ComputeFunction = compute
+        if visibility_cache is not None:
+            search = partial(
+                visibility_cache.get_visibility_windows,
+                self.satellite,
+                compute=compute,
+                search_key=algo,
+            )
+
+        if visibility_store is not None:
+            passes = visibility_store.get_visibility_windows(
+                self.satellite, targets, start_time, end_time, search, search_key=algo
+            )
+        else:
+            passes = search(targets, start_time, end_time)
+        if progress_callback:
+            progress_callback(len(targets), len(targets))
+        return passes
+
+    def iter_passes(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        targets: Optional[List[GroundTarget]] = None,
+        chunk: timedelta = STREAM_CHUNK,
+        use_adaptive: bool = True,
+    ) -> Iterator[PassDetails]:
+        """
+        Stream passes over targets in chronological order with bounded memory.
+
+        Args:
+            start_time: Start of analysis period (UTC)
+            end_time: End of analysis period (UTC)
+            targets: Optional specific targets (uses all if None)
+            chunk: Length of each searched time block
+            use_adaptive: Use adaptive time-stepping algorithm (default: True)
+
+        Yields:
+            PassDetails ordered by start time
+        """
+        if targets is None:
+            targets = list(self.target_manager.targets)
+
+        calculator = VisibilityCalculator(self.satellite, use_adaptive=use_adaptive)
+        logger.info(
+            f"Streaming passes from {start_time} to {end_time} "
+            f"for {len(targets)} targets in {chunk} blocks"
         )
+        return calculator.iter_passes(targets, start_time, end_time, chunk=chunk)
 
     def get_mission_summary(
         self, passes: Dict[str, List[PassDetails]]
@@ -179,49 +273,111 @@ class MissionPlanner:
 
     def export_schedule(
         self,
-        passes: Dict[str, List[PassDetails]],
+        passes: Union[Dict[str, List[PassDetails]], Iterable[PassDetails]],
         output_file: Union[str, Path],
         format: str = "auto",
-    ) -> None:
+    ) -> int:
         """
         Export mission schedule to file.
 
+        Passes given as an iterable (e.g. from iter_passes) are written as
+        they arrive without being held in memory; they should already be in
+        chronological order.
+
         Args:
-            passes: Pass data from compute_passes
+            passes: Pass data from compute_passes, or an iterable of passes
             output_file: Output file path
-            format: Output format ("json", "csv", or "auto")
+            format: Output format ("json", "jsonl", "csv", or "auto")
+
+        Returns:
+            Number of exported passes
         """
         output_path = Path(output_file)
 
         # Auto-detect format from extension
         if format == "auto":
             format = output_path.suffix.lower().lstrip(".")
-            if format not in ["json", "csv"]:
+            if format not in ["json", "jsonl", "csv"]:
                 format = "json"
 
-        # Flatten passes data
-        all_passes = []
-        for target_name, target_passes in passes.items():
-            for pass_detail in target_passes:
-                all_passes.append(pass_detail.to_dict())
-
-        # Sort by start time
-        all_passes.sort(key=lambda p: p["start_time"])
-
         try:
-            if format == "json":
-                self._export_json(all_passes, output_path)
-            elif format == "csv":
-                self._export_csv(all_passes, output_path)
+            if isinstance(passes, dict):
+                # Flatten passes data
+                all_passes = []
+                for target_name, target_passes in passes.items():
+                    for pass_detail in target_passes:
+                        all_passes.append(pass_detail.to_dict())
+
+                # Sort by start time
+                all_passes.sort(key=lambda p: p["start_time"])
+
+                if format == "json":
+                    self._export_json(all_passes, output_path)
+                elif format == "csv":
+                    self._export_csv(all_passes, output_path)
+                elif format == "jsonl":
+                    self._export_jsonl(all_passes, output_path)
+                else:
+                    raise ValueError(f"Unsupported format: {format}")
+                count = len(all_passes)
             else:
-                raise ValueError(f"Unsupported format: {format}")
-
-            logger.info(f"Exported {len(all_passes)} passes to {output_path}")
+                records = (p.to_dict() for p in passes)
+                if format == "json":
+                    count = self._stream_json(records, output_path)
+                elif format == "csv":
+                    count = self._stream_csv(records, output_path)
+                elif format == "jsonl":
+                    count = self._export_jsonl(records, output_path)
+                else:
+                    raise ValueError(f"Unsupported format: {format}")
+
+            logger.info(f"Exported {count} passes to {output_path}")
+            return count
 
         except Exception as e:
             logger.error(f"Error exporting schedule: {e}")
             raise
 
+    def _export_jsonl(self, passes: Iterable[Dict], output_path: Path) -> int:
+        """Export passes to JSON Lines format, one pass per line."""
+        count = 0
+        with open(output_path, "w") as f:
+            for record in passes:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def _stream_json(self, passes: Iterable[Dict], output_path: Path) -> int:
+        """Export streamed passes to JSON, writing metadata after the passes."""
+        count = 0
+        with open(output_path, "w") as f:
+            f.write('{\n  "passes": [')
+            for record in passes:
+                f.write(",\n    " if count else "\n    ")
+                f.write(json.dumps(record))
+                count += 1
+            metadata = {
+                "satellite": self.satellite.satellite_name,
+                "export_time": datetime.now(timezone.utc).isoformat(),
+                "total_passes": count,
+            }
+            f.write("\n  ],\n" if count else "],\n")
+            f.write(f'  "metadata": {json.dumps(metadata)}\n}}\n')
+        return count
+
+    def _stream_csv(self, passes: Iterable[Dict], output_path: Path) -> int:
+        """Export streamed passes to CSV with the STREAM_CSV_FIELDS columns."""
+        count = 0
+        with open(output_path, "w", newline="") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=STREAM_CSV_FIELDS, extrasaction="ignore"
+            )
+            writer.writeheader()
+            for record in passes:
+                writer.writerow(record)
+                count += 1
+        return count
+
     def _export_json(self, passes: List[Dict], output_path: Path) -> None:
         """Export passes to JSON format."""
         # Add metadata
@@ -15,7 +15,7 @@ import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -48,9 +48,9 @@ class SARPassDetails(PassDetails):
     # SAR-specific attributes
     sar_data: Optional[SAROpportunityData] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary including SAR data."""
-        result = super().to_dict()
+    def to_dict(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert to dictionary including SAR data (sections as in PassDetails)."""
+        result = super().to_dict(sections)
 
         if self.sar_data is not None:
             result["sar"] = self.sar_data.to_dict()
@@ -283,7 +283,8 @@ class SARVisibilityCalculator:
 
     def _get_satellite_ecef(self, timestamp: datetime) -> np.ndarray:
         """Get satellite position in ECEF coordinates (km)."""
-        lat, lon, alt = self.satellite.get_position(timestamp)
+        # Served from the base calculator's shared ephemeris when it covers timestamp
+        lat, lon, alt = self.base_calc.get_satellite_position(timestamp)
 
         lat_rad = math.radians(lat)
         lon_rad = math.radians(lon)
@@ -8,16 +8,22 @@ and optimizing for different objectives (chronological, priority, value-density)
 
 import logging
 import math
+import random
 import time
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 
 # Import for satellite position tracking
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 if TYPE_CHECKING:
+    from .ephemeris import Ephemeris
     from .orbit import SatelliteOrbit
+    from .pass_table import PassTable
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,22 @@ PITCH_THRESHOLD_DEG = 0.1  # Below this, pitch is considered negligible
 ROLL_ONLY_PITCH_THRESHOLD_DEG = 1.0  # Below this, opportunity is roll-only
 DELTA_PITCH_THRESHOLD_DEG = 5.0  # Below this delta, no pitch reset needed
 
+# Optimal-DP (Lagrangian relaxation of one-acquisition-per-target)
+OPTIMAL_DP_MAX_ITERATIONS = 500  # Subgradient iterations
+OPTIMAL_DP_GAP_TOLERANCE = 1e-6  # Relative gap at which the schedule is optimal
+OPTIMAL_DP_STALL_ITERATIONS = 5  # Halve the step after this many without a better bound
+
+# Local-search improvement (simulated annealing)
+LOCAL_SEARCH_CHECK_MOVES = 64  # Moves between clock checks
+LOCAL_SEARCH_START_TEMPERATURE = 1.0  # x mean opportunity value
+LOCAL_SEARCH_END_TEMPERATURE = 0.02  # x mean opportunity value
+
+# Multistart randomization per start: value-driven algorithms see values
+# scaled by up to +/- MULTISTART_VALUE_NOISE; chronological (value-blind)
+# ones skip each opportunity with MULTISTART_SKIP_PROBABILITY
+MULTISTART_VALUE_NOISE = 0.05
+MULTISTART_SKIP_PROBABILITY = 0.05
+
 
 class AlgorithmType(Enum):
     """Supported scheduling algorithms."""
@@ -44,6 +66,7 @@ class AlgorithmType(Enum):
     ROLL_PITCH_BEST_FIT = (
         "roll_pitch_best_fit"  # 2D slew (roll+pitch) global best geometry
     )
+    OPTIMAL_DP = "optimal_dp"  # Max total value: DP over slew-feasible chains
 
 
 @dataclass
@@ -102,7 +125,7 @@ class Opportunity:
             self.duration_seconds = (self.end_time - self.start_time).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledOpportunity:
     """
     A selected opportunity with scheduling metadata.
@@ -241,6 +264,18 @@ class ScheduleMetrics:
         None  # Opportunities accepted due to pitch capability
     )
 
+    # Optimality metrics (for optimal_dp)
+    value_upper_bound: Optional[float] = None  # No schedule can exceed this value
+    optimality_gap: Optional[float] = None  # (upper bound - total value) / upper bound
+
+    # Local-search improvement metrics (when improve_budget_ms or
+    # improve_max_moves enables it)
+    local_search_moves: Optional[int] = None  # Moves evaluated
+    local_search_gain: Optional[float] = None  # Value added over the seed schedule
+
+    # Multistart metrics (schedule_multistart)
+    multistart_values: Optional[List[float]] = None  # Total value of every start
+
     # Determinism
     seed: Optional[int] = None
 
@@ -275,6 +310,24 @@ class ScheduleMetrics:
         if self.opportunities_saved_by_pitch is not None:
             result["opportunities_saved_by_pitch"] = self.opportunities_saved_by_pitch
 
+        # Add optional optimality metrics
+        if self.value_upper_bound is not None:
+            result["value_upper_bound"] = round(self.value_upper_bound, 2)
+        if self.optimality_gap is not None:
+            result["optimality_gap"] = round(self.optimality_gap, 4)
+
+        # Add optional local-search metrics
+        if self.local_search_moves is not None:
+            result["local_search_moves"] = self.local_search_moves
+        if self.local_search_gain is not None:
+            result["local_search_gain"] = round(self.local_search_gain, 2)
+
+        # Add optional multistart metrics
+        if self.multistart_values is not None:
+            result["multistart_values"] = [
+                round(value, 2) for value in self.multistart_values
+            ]
+
         return result
 
 
@@ -302,6 +355,10 @@ class SchedulerConfig:
 
     # Algorithm parameters
     look_window_s: float = 600.0  # candidate window for Best-Fit/Value-Density
+    optimal_budget_ms: float = 2000.0  # wall-clock budget for Optimal-DP
+    improve_budget_ms: float = 0.0  # local-search budget after any algorithm (0 = off)
+    improve_max_moves: Optional[int] = None  # local-search move cap (reproducible)
+    improve_seed: Optional[int] = None  # local-search random seed
 
     # Value source
     value_source: str = "uniform"  # uniform | target_priority | custom
@@ -330,6 +387,18 @@ class SchedulerConfig:
             raise ValueError(
                 f"max_spacecraft_pitch_deg must be non-negative, got {self.max_spacecraft_pitch_deg}"
             )
+        if self.optimal_budget_ms <= 0:
+            raise ValueError(
+                f"optimal_budget_ms must be positive, got {self.optimal_budget_ms}"
+            )
+        if self.improve_budget_ms < 0:
+            raise ValueError(
+                f"improve_budget_ms must be non-negative, got {self.improve_budget_ms}"
+            )
+        if self.improve_max_moves is not None and self.improve_max_moves < 1:
+            raise ValueError(
+                f"improve_max_moves must be positive, got {self.improve_max_moves}"
+            )
 
 
 class FeasibilityKernel:
@@ -343,16 +412,22 @@ class FeasibilityKernel:
     """
 
     def __init__(
-        self, config: SchedulerConfig, satellite: Optional["SatelliteOrbit"] = None
+        self,
+        config: SchedulerConfig,
+        satellite: Optional["SatelliteOrbit"] = None,
+        ephemeris: Optional["Ephemeris"] = None,
     ):
         """Initialize with scheduler configuration and satellite object.
 
         Args:
             config: Scheduler configuration
             satellite: SatelliteOrbit object for getting actual altitude (production-ready)
+            ephemeris: Interpolated ephemeris for the satellite; queried instead
+                of the SGP4 predictor when given
         """
         self.config = config
         self.satellite = satellite
+        self.ephemeris = ephemeris
 
         # Track current satellite attitude (persistent across passes)
         # Legacy single-satellite mode
@@ -362,9 +437,23 @@ class FeasibilityKernel:
         # NEW: Per-satellite attitude tracking for constellation support
         self._satellite_attitudes: Dict[str, Dict[str, float]] = {}
 
+        # Opportunities of the current scheduling run (prepare_transitions)
+        # and their transition matrices by pitch mode, then satellite
+        self._transition_opportunities: Optional[List[Opportunity]] = None
+        self._transition_matrices: Dict[bool, Dict[str, SlewTransitionMatrix]] = {}
+
         # Earth radius in km
         self.R_EARTH = EARTH_RADIUS_KM
 
+    def _get_satellite_position(
+        self, timestamp: datetime
+    ) -> Tuple[float, float, float]:
+        """Satellite (lat, lon, alt_km), from the ephemeris when one is attached."""
+        if self.ephemeris is not None:
+            return self.ephemeris.get_position(timestamp)
+        assert self.satellite is not None
+        return self.satellite.get_position(timestamp)
+
     def get_satellite_attitude(self, satellite_id: str) -> Tuple[float, float]:
         """
         Get current attitude state for a specific satellite.
@@ -472,6 +561,116 @@ class FeasibilityKernel:
 
         return t_maneuver
 
+    def compute_maneuver_times(
+        self, delta_roll: np.ndarray, delta_pitch: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized compute_maneuver_time over arrays of angle changes.
+
+        Args:
+            delta_roll: Roll angle changes in degrees
+            delta_pitch: Pitch angle changes in degrees (None = no pitch)
+
+        Returns:
+            Maneuver times in seconds, same shape as delta_roll
+        """
+        roll_rate = self.config.max_roll_rate_dps
+        roll_accel = self.config.max_roll_accel_dps2
+        pitch_rate = (
+            self.config.max_pitch_rate_dps
+            if self.config.max_pitch_rate_dps > 0
+            else roll_rate
+        )
+        pitch_accel = (
+            self.config.max_pitch_accel_dps2
+            if self.config.max_pitch_accel_dps2 > 0
+            else roll_accel
+        )
+
+        def axis_times(delta: np.ndarray, rate: float, accel: float) -> np.ndarray:
+            delta = np.abs(np.asarray(delta, dtype=np.float64))
+            t_accel = rate / accel
+            d_total_accel = 2 * (0.5 * accel * t_accel * t_accel)
+            return np.where(
+                delta <= d_total_accel,
+                2 * np.sqrt(delta / accel),
+                2 * t_accel + (delta - d_total_accel) / rate,
+            )
+
+        times = axis_times(delta_roll, roll_rate, roll_accel)
+        if delta_pitch is not None:
+            times = np.maximum(times, axis_times(delta_pitch, pitch_rate, pitch_accel))
+        return times
+
+    def prepare_transitions(self, opportunities: Optional[List[Opportunity]]) -> None:
+        """
+        Register the opportunities of a scheduling run for transition matrices.
+
+        Matrices are built per pitch mode by transition_matrices(), for
+        algorithms that evaluate many pairs (Optimal-DP, local search).
+        Once built, is_feasible and is_feasible_2d take the maneuver and
+        available time between two of these opportunities from them instead
+        of computing them; a single greedy pass would not recover the cost
+        of building them.
+
+        Args:
+            opportunities: Chronologically sorted opportunities of the
+                scheduling run (None = release the matrices)
+        """
+        self._transition_opportunities = opportunities
+        self._transition_matrices = {}
+
+    def transition_matrices(self, use_pitch: bool) -> Dict[str, "SlewTransitionMatrix"]:
+        """
+        Transition matrices of the prepared opportunities, by satellite.
+
+        Args:
+            use_pitch: Include pitch (is_feasible_2d) or roll only (is_feasible)
+        """
+        matrices = self._transition_matrices.get(use_pitch)
+        if matrices is None:
+            opps_by_sat: Dict[str, List[Opportunity]] = {}
+            for opp in self._transition_opportunities or []:
+                opps_by_sat.setdefault(opp.satellite_id or "default", []).append(opp)
+            matrices = {
+                sat_id: SlewTransitionMatrix(self, sat_opps, use_pitch)
+                for sat_id, sat_opps in opps_by_sat.items()
+            }
+            self._transition_matrices[use_pitch] = matrices
+        return matrices
+
+    def _lookup_transition(
+        self,
+        last_opportunity: ScheduledOpportunity,
+        candidate: Opportunity,
+        use_pitch: bool,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        (maneuver_time, available_time) from a built transition matrix, or
+        None when the pair is not in one (none built, other satellite, out
+        of order, or the scheduled item's attitude/timing differs from the
+        opportunity's).
+        """
+        matrices = self._transition_matrices.get(use_pitch)
+        if matrices is None:
+            return None
+        matrix = matrices.get(candidate.satellite_id or "default")
+        if matrix is None:
+            return None
+        j = matrix.index.get(candidate.id)
+        i = matrix.index.get(last_opportunity.opportunity_id)
+        if (
+            i is None
+            or j is None
+            or i >= j
+            or matrix.opportunities[j] is not candidate
+            or matrix.roll[i] != last_opportunity.roll_angle
+            or matrix.pitch[i] != last_opportunity.pitch_angle
+            or matrix.end_times[i] != last_opportunity.end_time
+        ):
+            return None
+        return matrix.transition(i, j)
+
     def compute_roll_angle_from_satellite(
         self,
         target_position: Tuple[float, float],
@@ -559,9 +758,9 @@ class FeasibilityKernel:
         target_lat, target_lon = target_position
 
         # Get satellite velocity vector by computing position at t+1 second
-        if self.satellite is not None:
+        if self.satellite is not None or self.ephemeris is not None:
             try:
-                sat_pos_future = self.satellite.get_position(
+                sat_pos_future = self._get_satellite_position(
                     timestamp + timedelta(seconds=1)
                 )
                 sat_lat_future, sat_lon_future, _ = sat_pos_future
@@ -666,9 +865,9 @@ class FeasibilityKernel:
             return 0.0, 0.0
 
         # Get satellite position at this time
-        if self.satellite is not None:
+        if self.satellite is not None or self.ephemeris is not None:
             try:
-                sat_pos = self.satellite.get_position(timestamp)
+                sat_pos = self._get_satellite_position(timestamp)
                 actual_altitude = sat_pos[2]
                 logger.debug(
                     f"Using actual satellite altitude from TLE: {actual_altitude:.1f} km at {timestamp}"
@@ -837,18 +1036,19 @@ class FeasibilityKernel:
                 pitch_angle,
             )
 
-        # Compute required maneuver time (both roll and pitch)
-        maneuver_time = self.compute_maneuver_time(abs(delta_roll), abs(delta_pitch))
-
-        # Available time window
-        # = time between (last_end + imaging_time) and candidate_start
-        available_time = (
-            candidate.start_time
-            - (
-                last_opportunity.end_time
-                + timedelta(seconds=self.config.imaging_time_s)
+        # Required maneuver time (both roll and pitch) and available time
+        # window = time between (last_end + imaging_time) and
+        # candidate_start, precomputed when the pair is in a transition matrix
+        transition = self._lookup_transition(last_opportunity, candidate, False)
+        if transition is not None:
+            maneuver_time, available_time = transition
+        else:
+            maneuver_time = self.compute_maneuver_time(
+                abs(delta_roll), abs(delta_pitch)
             )
-        ).total_seconds()
+            available_time = (
+                candidate.start_time - last_opportunity.end_time
+            ).total_seconds() - self.config.imaging_time_s
 
         # Slack time
         slack = available_time - maneuver_time
@@ -900,9 +1100,13 @@ class FeasibilityKernel:
 
         # Log the angles being used
         logger.debug(
-            f"[2D FEASIBILITY] Candidate {candidate.target_id}: "
-            f"roll={roll_angle:.2f}°, pitch={pitch_angle:.2f}° "
-            f"(from opportunity: incidence={candidate.incidence_angle}, pitch={candidate.pitch_angle})"
+            "[2D FEASIBILITY] Candidate %s: roll=%.2f°, pitch=%.2f° "
+            "(from opportunity: incidence=%s, pitch=%s)",
+            candidate.target_id,
+            roll_angle,
+            pitch_angle,
+            candidate.incidence_angle,
+            candidate.pitch_angle,
         )
 
         # Compute delta from previous attitude
@@ -947,17 +1151,18 @@ class FeasibilityKernel:
                 pitch_angle,
             )
 
-        # Compute required maneuver time (both roll and pitch)
-        maneuver_time = self.compute_maneuver_time(abs(delta_roll), abs(delta_pitch))
-
-        # Available time window
-        available_time = (
-            candidate.start_time
-            - (
-                last_opportunity.end_time
-                + timedelta(seconds=self.config.imaging_time_s)
+        # Required maneuver time (both roll and pitch) and available time
+        # window, precomputed when the pair is in a transition matrix
+        transition = self._lookup_transition(last_opportunity, candidate, True)
+        if transition is not None:
+            maneuver_time, available_time = transition
+        else:
+            maneuver_time = self.compute_maneuver_time(
+                abs(delta_roll), abs(delta_pitch)
             )
-        ).total_seconds()
+            available_time = (
+                candidate.start_time - last_opportunity.end_time
+            ).total_seconds() - self.config.imaging_time_s
 
         # Slack time
         slack = available_time - maneuver_time
@@ -976,6 +1181,530 @@ class FeasibilityKernel:
         )
 
 
+class SatelliteTimeline:
+    """
+    Scheduled imaging intervals of one satellite, ordered by start time.
+
+    Intervals in a timeline do not overlap, so ordering by start also
+    orders them by end and the neighbours of a candidate are found with a
+    binary search. Each entry is a (start_time, end_time, item) tuple.
+    """
+
+    __slots__ = (
+        "_starts",
+        "_entries",
+        "_order",
+        "_added",
+        "max_duration_s",
+        "max_abs_incidence",
+    )
+
+    def __init__(self) -> None:
+        self._starts: List[datetime] = []
+        self._entries: List[Tuple[datetime, datetime, ScheduledOpportunity]] = []
+        # Insertion sequence number of each entry
+        self._order: List[int] = []
+        self._added = 0
+        # Running maxima (not lowered on removal), bounding how far away an
+        # entry can still constrain a candidate
+        self.max_duration_s = 0.0
+        self.max_abs_incidence = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Tuple[datetime, datetime, ScheduledOpportunity]]:
+        return iter(self._entries)
+
+    def add(
+        self, start_time: datetime, end_time: datetime, item: ScheduledOpportunity
+    ) -> None:
+        """Insert an interval, after any entry with the same start time."""
+        index = bisect_right(self._starts, start_time)
+        self._starts.insert(index, start_time)
+        self._entries.insert(index, (start_time, end_time, item))
+        self._order.insert(index, self._added)
+        self._added += 1
+        self.max_duration_s = max(
+            self.max_duration_s, (end_time - start_time).total_seconds()
+        )
+        self.max_abs_incidence = max(
+            self.max_abs_incidence, abs(item.incidence_angle or 0)
+        )
+
+    def remove(self, item: ScheduledOpportunity) -> None:
+        """Remove an item's entry, if present."""
+        index = bisect_left(self._starts, item.start_time)
+        while index < len(self._entries) and self._starts[index] == item.start_time:
+            if self._entries[index][2].opportunity_id == item.opportunity_id:
+                del self._starts[index]
+                del self._entries[index]
+                del self._order[index]
+                return
+            index += 1
+
+    def neighbors(self, start_time: datetime) -> Tuple[
+        Optional[Tuple[datetime, datetime, ScheduledOpportunity]],
+        Optional[Tuple[datetime, datetime, ScheduledOpportunity]],
+    ]:
+        """
+        Entries adjacent to a candidate starting at start_time.
+
+        Returns:
+            Tuple of (last entry starting before start_time, first entry
+            starting at or after it); either is None at the ends
+        """
+        index = bisect_left(self._starts, start_time)
+        before = self._entries[index - 1] if index > 0 else None
+        after = self._entries[index] if index < len(self._entries) else None
+        return before, after
+
+    def overlapping(
+        self, start_time: datetime, end_time: datetime
+    ) -> List[Tuple[datetime, datetime, ScheduledOpportunity]]:
+        """
+        Entries intersecting [start_time, end_time], in insertion order.
+
+        Insertion order is the order a plain list of the same entries
+        would be scanned in.
+        """
+        lo = bisect_left(
+            self._starts, start_time - timedelta(seconds=self.max_duration_s)
+        )
+        hi = bisect_right(self._starts, end_time)
+        found = [
+            (self._order[i], self._entries[i])
+            for i in range(lo, hi)
+            if self._entries[i][1] >= start_time
+        ]
+        found.sort(key=lambda pair: pair[0])
+        return [entry for _, entry in found]
+
+    def slew_reach_s(
+        self, incidence_angle: Optional[float], roll_rate_dps: float
+    ) -> float:
+        """
+        Longest roll-only gap an entry could require from a candidate.
+
+        Beyond this distance from the candidate's interval no entry can
+        conflict with it under a max(MIN_GAP_SECONDS, roll difference /
+        roll rate) gap rule.
+        """
+        roll_diff = max(abs(incidence_angle or 0), self.max_abs_incidence)
+        roll_time = roll_diff / roll_rate_dps if roll_rate_dps > 0 else 0
+        return max(MIN_GAP_SECONDS, roll_time)
+
+
+class SlewTransitionMatrix:
+    """
+    Precomputed slew transitions between one satellite's opportunities.
+
+    Opportunities are indexed chronologically, with their pointing angles
+    cached (roll = incidence angle; pitch = pitch angle when pitch is used,
+    else 0). Opportunity j can follow i (i < j) when the time between them
+    covers the maneuver, as in FeasibilityKernel.is_feasible:
+    start_j - start_i - 2 x imaging time >= maneuver time.
+
+    Every i below free_before[j] is far enough back to precede j from any
+    attitude. For the window [free_before[j], j) the maneuver and available
+    times of every pair are computed at once with NumPy and stored as a
+    sparse matrix; rows are contiguous, so a pair is found by offset. Values
+    are bitwise identical to the kernel's scalar computation.
+
+    Maneuver time is subadditive (concave per axis, simultaneous axes), so
+    dropping an opportunity from a feasible chain leaves it feasible.
+    """
+
+    # Margin (s) added to the window so pairs outside it are feasible
+    # whatever the float rounding
+    WINDOW_MARGIN_S = 1.0
+
+    def __init__(
+        self,
+        kernel: "FeasibilityKernel",
+        opportunities: List[Opportunity],
+        use_pitch: bool,
+    ) -> None:
+        config = kernel.config
+        self.kernel = kernel
+        self.opportunities = opportunities
+        self.use_pitch = use_pitch
+        n = len(opportunities)
+
+        # Ids seen more than once are not indexed (lookups fall back)
+        self.index: Dict[str, Optional[int]] = {}
+        for i, opp in enumerate(opportunities):
+            self.index[opp.id] = None if opp.id in self.index else i
+
+        microsecond = timedelta(microseconds=1)
+        start_us = np.zeros(n, dtype=np.int64)
+        if n:
+            origin = opportunities[0].start_time
+            start_us[:] = [
+                (o.start_time - origin) // microsecond for o in opportunities
+            ]
+        self.start_s = start_us / 1e6
+        self.values = np.array([o.value for o in opportunities], dtype=np.float64)
+        roll = np.array(
+            [
+                o.incidence_angle if o.incidence_angle is not None else 0.0
+                for o in opportunities
+            ],
+            dtype=np.float64,
+        )
+        pitch = np.array(
+            [
+                (o.pitch_angle if o.pitch_angle is not None else 0.0)
+                if use_pitch
+                else 0.0
+                for o in opportunities
+            ],
+            dtype=np.float64,
+        )
+        self.allowed = np.abs(roll) <= config.max_spacecraft_roll_deg
+        if use_pitch:
+            self.allowed &= np.abs(pitch) <= config.max_spacecraft_pitch_deg
+
+        # Longest maneuver between any two allowed opportunities
+        max_maneuver = 0.0
+        if self.allowed.any():
+            max_maneuver = kernel.compute_maneuver_time(
+                float(np.ptp(roll[self.allowed])), float(np.ptp(pitch[self.allowed]))
+            )
+        spacing = 2 * config.imaging_time_s
+        self.free_before = np.searchsorted(
+            self.start_s,
+            self.start_s - spacing - max_maneuver - self.WINDOW_MARGIN_S,
+            side="left",
+        )
+
+        # All (i, j) pairs inside the windows, row j at row_start[j]
+        counts = np.arange(n) - self.free_before
+        row_start = np.cumsum(counts) - counts
+        successor = np.repeat(np.arange(n), counts)
+        predecessor = np.repeat(self.free_before, counts) + (
+            np.arange(len(successor)) - np.repeat(row_start, counts)
+        )
+        maneuver = kernel.compute_maneuver_times(
+            roll[successor] - roll[predecessor],
+            pitch[successor] - pitch[predecessor] if use_pitch else None,
+        )
+        imaging_us = timedelta(seconds=config.imaging_time_s) // microsecond
+        available = (
+            start_us[successor] - start_us[predecessor] - imaging_us
+        ) / 1e6 - config.imaging_time_s
+        feasible = (maneuver <= available) & self.allowed[predecessor]
+        self._feasible_pairs = (predecessor[feasible], successor[feasible])
+        self._predecessors: Optional[List[List[int]]] = None
+
+        # Python lists for scalar lookups
+        imaging = timedelta(seconds=config.imaging_time_s)
+        self.end_times = [o.start_time + imaging for o in opportunities]
+        self.roll: List[float] = roll.tolist()
+        self.pitch: List[float] = pitch.tolist()
+        self._start_us: List[int] = start_us.tolist()
+        self._imaging_us = imaging_us
+        self._free_before: List[int] = self.free_before.tolist()
+        self._row_start: List[int] = row_start.tolist()
+        self._maneuver: List[float] = maneuver.tolist()
+        self._available: List[float] = available.tolist()
+        self._feasible: List[bool] = feasible.tolist()
+
+    def __len__(self) -> int:
+        return len(self.opportunities)
+
+    @property
+    def predecessors(self) -> List[List[int]]:
+        """Feasible predecessors in the window of each opportunity (lazy)."""
+        if self._predecessors is None:
+            self._predecessors = [[] for _ in range(len(self.opportunities))]
+            for i, j in zip(*(pairs.tolist() for pairs in self._feasible_pairs)):
+                self._predecessors[j].append(i)
+        return self._predecessors
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (window) transitions."""
+        return len(self._maneuver)
+
+    def can_follow(self, i: int, j: int) -> bool:
+        """Whether opportunity j can be scheduled right after i (i < j)."""
+        free = self._free_before[j]
+        return i < free or self._feasible[self._row_start[j] + i - free]
+
+    def transition(self, i: int, j: int) -> Tuple[float, float]:
+        """
+        Maneuver and available time from opportunity i to j (i < j).
+
+        Returns:
+            Tuple of (maneuver_time, available_time) in seconds
+        """
+        free = self._free_before[j]
+        if i >= free:
+            k = self._row_start[j] + i - free
+            return self._maneuver[k], self._available[k]
+        # Outside the window: always feasible, computed on demand
+        maneuver = self.kernel.compute_maneuver_time(
+            abs(self.roll[j] - self.roll[i]), abs(self.pitch[j] - self.pitch[i])
+        )
+        available = (
+            self._start_us[j] - self._start_us[i] - self._imaging_us
+        ) / 1e6 - self.kernel.config.imaging_time_s
+        return maneuver, available
+
+    def best_chain(self, weights: List[float]) -> Tuple[float, List[int]]:
+        """
+        Maximum-weight feasible chain (longest path over the transitions).
+
+        Opportunities with non-positive weight or outside the attitude
+        limits are left out; by subadditivity they are never needed to
+        connect others.
+
+        Returns:
+            Tuple of (chain weight, chronological opportunity indices)
+        """
+        n = len(weights)
+        chain_value = [0.0] * n
+        back = [-1] * n
+        # Best chain ending at or before each index
+        prefix_value = [0.0] * n
+        prefix_end = [-1] * n
+        best_value, best_end = 0.0, -1
+        allowed = self.allowed
+        predecessors = self.predecessors
+        for j in range(n):
+            weight = weights[j]
+            if weight > 0 and allowed[j]:
+                free = self._free_before[j]
+                if free > 0:
+                    base, base_end = prefix_value[free - 1], prefix_end[free - 1]
+                else:
+                    base, base_end = 0.0, -1
+                for i in predecessors[j]:
+                    if back[i] != -2 and chain_value[i] > base:
+                        base, base_end = chain_value[i], i
+                chain_value[j] = weight + base
+                back[j] = base_end
+                if chain_value[j] > best_value:
+                    best_value, best_end = chain_value[j], j
+            else:
+                back[j] = -2  # Excluded
+            prefix_value[j] = best_value
+            prefix_end[j] = best_end
+
+        chain = []
+        j = best_end
+        while j >= 0:
+            chain.append(j)
+            j = back[j]
+        chain.reverse()
+        return best_value, chain
+
+
+class _LocalSearch:
+    """
+    Simulated-annealing improvement of a feasible schedule.
+
+    The state is a chronological chain of opportunity indices per satellite
+    (see SlewTransitionMatrix) and the scheduled opportunity of each
+    target. A move picks a random opportunity:
+    - scheduled: remove it
+    - not scheduled: insert it, evicting the chain neighbours it conflicts
+      with and its target's current acquisition (a plain insert or a swap),
+      then re-place the evicted targets where they fit without evicting
+
+    Only inserted opportunities are checked, against the neighbours they end
+    up between; removals keep chains feasible, so no other pair is
+    re-checked. Rejected moves are undone. The best schedule seen is kept,
+    so stopping at any point returns it.
+    """
+
+    def __init__(
+        self,
+        transitions: Dict[str, SlewTransitionMatrix],
+        chains: Dict[str, List[int]],
+        rng: random.Random,
+    ) -> None:
+        self.transitions = transitions
+        self.rng = rng
+        self.values: Dict[str, List[float]] = {
+            sat_id: t.values.tolist() for sat_id, t in transitions.items()
+        }
+        self.targets = {
+            sat_id: [o.target_id for o in t.opportunities]
+            for sat_id, t in transitions.items()
+        }
+        self.candidates = [
+            (sat_id, i)
+            for sat_id, t in transitions.items()
+            for i in np.flatnonzero(t.allowed).tolist()
+        ]
+        # Re-placement order: each target's opportunities by value
+        self.by_target: Dict[str, List[Tuple[str, int]]] = {}
+        for sat_id, i in sorted(
+            self.candidates, key=lambda c: -self.values[c[0]][c[1]]
+        ):
+            self.by_target.setdefault(self.targets[sat_id][i], []).append((sat_id, i))
+
+        self.chains: Dict[str, List[int]] = {sat_id: [] for sat_id in transitions}
+        self.scheduled: Dict[str, Tuple[str, int]] = {}
+        self.value = 0.0
+        for sat_id, chain in chains.items():
+            for i in chain:
+                self._add(sat_id, i)
+                self.value += self.values[sat_id][i]
+        self.initial_value = self.value
+        self.best_value = self.value
+        self._best_chains: Optional[Dict[str, List[int]]] = None  # None: current
+
+    def best(self) -> Tuple[float, Dict[str, List[int]]]:
+        """Best value seen and its chains."""
+        if self._best_chains is None:
+            return self.value, {sat_id: list(c) for sat_id, c in self.chains.items()}
+        return self.best_value, self._best_chains
+
+    def run(self, deadline: float, max_moves: Optional[int] = None) -> int:
+        """
+        Anneal until the perf_counter() deadline or max_moves moves.
+
+        With max_moves the temperature cools with the move count, so a seed
+        reproduces the same result whenever the deadline is not reached.
+        Without it, cooling follows elapsed time and results depend on
+        machine load.
+
+        Args:
+            deadline: perf_counter() time to stop at (math.inf = none)
+            max_moves: Number of moves to stop after (None = no cap)
+
+        Returns:
+            Number of moves evaluated
+        """
+        if not self.candidates:
+            return 0
+        mean_value = sum(
+            self.values[sat_id][i] for sat_id, i in self.candidates
+        ) / len(self.candidates)
+        start_temperature = LOCAL_SEARCH_START_TEMPERATURE * mean_value
+        cooling = LOCAL_SEARCH_END_TEMPERATURE / LOCAL_SEARCH_START_TEMPERATURE
+        started = time.perf_counter()
+        span = max(deadline - started, 1e-9)
+        temperature = start_temperature
+
+        moves = 0
+        while max_moves is None or moves < max_moves:
+            if moves % LOCAL_SEARCH_CHECK_MOVES == 0:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if max_moves is not None:
+                    progress = moves / max_moves
+                else:
+                    progress = (now - started) / span
+                temperature = start_temperature * cooling**progress
+            moves += 1
+
+            sat_id, i = self.candidates[self.rng.randrange(len(self.candidates))]
+            values = self.values[sat_id]
+            target_id = self.targets[sat_id][i]
+            owner = self.scheduled.get(target_id)
+            changes: List[Tuple[bool, str, int]] = []  # (added, satellite, index)
+            if owner == (sat_id, i):
+                delta = -values[i]
+                self._drop(sat_id, i)
+                changes.append((False, sat_id, i))
+            else:
+                delta = self._insert(sat_id, i, changes)
+
+            if not (delta >= 0 or self.rng.random() < math.exp(delta / temperature)):
+                self._undo(changes)
+                continue
+            if delta < 0 and self._best_chains is None:
+                # Leaving the best state: keep a copy of it
+                self._undo(changes)
+                self._best_chains = {s: list(c) for s, c in self.chains.items()}
+                self._redo(changes)
+            self.value += delta
+            if self.value > self.best_value + 1e-9:
+                self.best_value = self.value
+                self._best_chains = None
+
+        return moves
+
+    def _insert(
+        self, sat_id: str, i: int, changes: List[Tuple[bool, str, int]]
+    ) -> float:
+        """Insert with evictions and re-placement; returns the value change."""
+        chain = self.chains[sat_id]
+        transitions = self.transitions[sat_id]
+        values = self.values[sat_id]
+        k = bisect_left(chain, i)
+        low = k - 1
+        while low >= 0 and not transitions.can_follow(chain[low], i):
+            low -= 1
+        high = k
+        while high < len(chain) and not transitions.can_follow(i, chain[high]):
+            high += 1
+
+        delta = values[i]
+        target_id = self.targets[sat_id][i]
+        freed = []
+        for j in chain[low + 1 : high]:
+            delta -= values[j]
+            if self.targets[sat_id][j] != target_id:
+                freed.append(self.targets[sat_id][j])
+            self._drop(sat_id, j)
+            changes.append((False, sat_id, j))
+        owner = self.scheduled.get(target_id)
+        if owner is not None:
+            delta -= self.values[owner[0]][owner[1]]
+            self._drop(*owner)
+            changes.append((False,) + owner)
+        self._add(sat_id, i)
+        changes.append((True, sat_id, i))
+
+        for freed_target in freed:
+            for other_sat, j in self.by_target[freed_target]:
+                if self._fits(other_sat, j):
+                    self._add(other_sat, j)
+                    changes.append((True, other_sat, j))
+                    delta += self.values[other_sat][j]
+                    break
+        return delta
+
+    def _fits(self, sat_id: str, i: int) -> bool:
+        """Whether i fits between its chain neighbours without evictions."""
+        chain = self.chains[sat_id]
+        transitions = self.transitions[sat_id]
+        k = bisect_left(chain, i)
+        if k > 0 and not transitions.can_follow(chain[k - 1], i):
+            return False
+        return k == len(chain) or transitions.can_follow(i, chain[k])
+
+    def _add(self, sat_id: str, i: int) -> None:
+        chain = self.chains[sat_id]
+        chain.insert(bisect_left(chain, i), i)
+        self.scheduled[self.targets[sat_id][i]] = (sat_id, i)
+
+    def _drop(self, sat_id: str, i: int) -> None:
+        chain = self.chains[sat_id]
+        del chain[bisect_left(chain, i)]
+        del self.scheduled[self.targets[sat_id][i]]
+
+    def _undo(self, changes: List[Tuple[bool, str, int]]) -> None:
+        for added, sat_id, i in reversed(changes):
+            if added:
+                self._drop(sat_id, i)
+            else:
+                self._add(sat_id, i)
+
+    def _redo(self, changes: List[Tuple[bool, str, int]]) -> None:
+        for added, sat_id, i in changes:
+            if added:
+                self._add(sat_id, i)
+            else:
+                self._drop(sat_id, i)
+
+
 class MissionScheduler:
     """
     Mission planning scheduler with multiple greedy algorithms.
@@ -989,6 +1718,7 @@ class MissionScheduler:
         config: SchedulerConfig,
         satellite: Optional["SatelliteOrbit"] = None,
         satellites: Optional[Dict[str, "SatelliteOrbit"]] = None,
+        ephemerides: Optional[Dict[str, "Ephemeris"]] = None,
     ):
         """Initialize scheduler with configuration and satellite object(s).
 
@@ -996,37 +1726,64 @@ class MissionScheduler:
             config: Scheduler configuration
             satellite: Primary SatelliteOrbit object (legacy, for single-satellite mode)
             satellites: Dictionary of satellite_id -> SatelliteOrbit for constellation mode
+            ephemerides: Dictionary of satellite_id -> Ephemeris built for the
+                planning horizon; used for position queries instead of SGP4
         """
         self.config = config
         self.satellite = satellite  # Legacy: single satellite for position queries
         self.satellites = satellites or {}  # Constellation: keyed by satellite_id
-        self.kernel = FeasibilityKernel(config, satellite)
-
-    def _get_satellite_for_opportunity(
-        self, satellite_id: str
-    ) -> Optional["SatelliteOrbit"]:
-        """Get the correct satellite object for an opportunity.
-
-        Args:
-            satellite_id: The satellite ID from the opportunity (e.g., 'ICEYE-X57' or 'sat_ICEYE-X57')
+        self.ephemerides = ephemerides or {}
+        primary_ephemeris = None
+        if satellite is not None:
+            primary_ephemeris = next(
+                (
+                    eph
+                    for eph in self.ephemerides.values()
+                    if eph.satellite_name == satellite.satellite_name
+                ),
+                None,
+            )
+        self.kernel = FeasibilityKernel(config, satellite, ephemeris=primary_ephemeris)
 
-        Returns:
-            SatelliteOrbit object or None if not found
-        """
+    @staticmethod
+    def _lookup_by_satellite_id(mapping: Dict[str, Any], satellite_id: str) -> Any:
+        """Find a per-satellite entry, tolerating a missing or extra 'sat_' prefix."""
         # Try exact match first
-        if satellite_id in self.satellites:
-            return self.satellites[satellite_id]
+        if satellite_id in mapping:
+            return mapping[satellite_id]
 
         # Try with 'sat_' prefix (satellites_dict uses 'sat_ICEYE-X57' but opportunity uses 'ICEYE-X57')
         prefixed_id = f"sat_{satellite_id}"
-        if prefixed_id in self.satellites:
-            return self.satellites[prefixed_id]
+        if prefixed_id in mapping:
+            return mapping[prefixed_id]
 
         # Try without 'sat_' prefix (in case opportunity has prefix but dict doesn't)
         if satellite_id.startswith("sat_"):
             unprefixed_id = satellite_id[4:]
-            if unprefixed_id in self.satellites:
-                return self.satellites[unprefixed_id]
+            if unprefixed_id in mapping:
+                return mapping[unprefixed_id]
+
+        return None
+
+    def _get_satellite_for_opportunity(self, satellite_id: str) -> Optional[Any]:
+        """Get the position source for an opportunity's satellite.
+
+        Prefers the satellite's Ephemeris when one was supplied; it has the
+        same get_position() API as SatelliteOrbit.
+
+        Args:
+            satellite_id: The satellite ID from the opportunity (e.g., 'ICEYE-X57' or 'sat_ICEYE-X57')
+
+        Returns:
+            Ephemeris or SatelliteOrbit object, or None if not found
+        """
+        ephemeris = self._lookup_by_satellite_id(self.ephemerides, satellite_id)
+        if ephemeris is not None:
+            return ephemeris
+
+        satellite = self._lookup_by_satellite_id(self.satellites, satellite_id)
+        if satellite is not None:
+            return satellite
 
         # Fallback to legacy single satellite
         logger.warning(
@@ -1036,7 +1793,7 @@ class MissionScheduler:
 
     def schedule(
         self,
-        opportunities: List[Opportunity],
+        opportunities: Union[List[Opportunity], "PassTable"],
         target_positions: Dict[str, Tuple[float, float]],
         algorithm: AlgorithmType = AlgorithmType.FIRST_FIT,
     ) -> Tuple[List[ScheduledOpportunity], ScheduleMetrics]:
@@ -1044,7 +1801,8 @@ class MissionScheduler:
         Run scheduling algorithm on opportunities.
 
         Args:
-            opportunities: List of visibility opportunities
+            opportunities: List of visibility opportunities, or a PassTable
+                whose passes are scheduled as roll-only opportunities
             target_positions: Dict mapping target_id to (lat, lon) in degrees
             algorithm: Algorithm to use
 
@@ -1053,30 +1811,58 @@ class MissionScheduler:
         """
         start_time = time.perf_counter()
 
+        if not isinstance(opportunities, list):
+            opportunities = opportunities.to_opportunities()
+
         # Sort opportunities chronologically
         sorted_opps = sorted(opportunities, key=lambda o: o.start_time)
+        # Feasibility checks look up precomputed transitions for this run
+        self.kernel.prepare_transitions(sorted_opps)
+        try:
+            # Dispatch to algorithm
+            if algorithm == AlgorithmType.FIRST_FIT:
+                schedule = self._first_fit(sorted_opps, target_positions)
+            elif algorithm == AlgorithmType.BEST_FIT:
+                schedule = self._best_fit(sorted_opps, target_positions)
+            elif algorithm == AlgorithmType.ROLL_PITCH_FIRST_FIT:
+                schedule = self._roll_pitch_first_fit(sorted_opps, target_positions)
+            elif algorithm == AlgorithmType.ROLL_PITCH_BEST_FIT:
+                schedule = self._roll_pitch_best_fit(sorted_opps, target_positions)
+            elif algorithm == AlgorithmType.OPTIMAL_DP:
+                schedule = self._optimal_dp(sorted_opps, target_positions)
+            else:
+                raise ValueError(f"Unknown algorithm: {algorithm}")
 
-        # Dispatch to algorithm
-        if algorithm == AlgorithmType.FIRST_FIT:
-            schedule = self._first_fit(sorted_opps, target_positions)
-        elif algorithm == AlgorithmType.BEST_FIT:
-            schedule = self._best_fit(sorted_opps, target_positions)
-        elif algorithm == AlgorithmType.ROLL_PITCH_FIRST_FIT:
-            schedule = self._roll_pitch_first_fit(sorted_opps, target_positions)
-        elif algorithm == AlgorithmType.ROLL_PITCH_BEST_FIT:
-            schedule = self._roll_pitch_best_fit(sorted_opps, target_positions)
-        else:
-            raise ValueError(f"Unknown algorithm: {algorithm}")
+            # Note: Algorithms now handle one-per-target internally during scheduling
+            # No post-filtering needed - kept for backwards compatibility
+            schedule = self._select_best_per_target(schedule, algorithm)
 
-        # Note: Algorithms now handle one-per-target internally during scheduling
-        # No post-filtering needed - kept for backwards compatibility
-        schedule = self._select_best_per_target(schedule, algorithm)
+            # Optional anytime improvement, seeded from the algorithm's schedule
+            moves = None
+            if (
+                self.config.improve_budget_ms > 0
+                or self.config.improve_max_moves is not None
+            ):
+                seed_value = sum(s.value for s in schedule)
+                use_pitch = self.config.max_spacecraft_pitch_deg > 0 and (
+                    algorithm
+                    not in (AlgorithmType.FIRST_FIT, AlgorithmType.BEST_FIT)
+                )
+                schedule, moves = self._improve(
+                    schedule, sorted_opps, target_positions, use_pitch
+                )
+        finally:
+            self.kernel.prepare_transitions(None)
 
         # Compute metrics
         runtime_ms = (time.perf_counter() - start_time) * 1000
         metrics = self._compute_metrics(
             algorithm.value, opportunities, schedule, runtime_ms
         )
+        if moves is not None:
+            metrics.local_search_moves = moves
+            metrics.local_search_gain = metrics.total_value - seed_value
+            metrics.seed = self.config.improve_seed
 
         logger.info(
             f"{algorithm.value}: Accepted {len(schedule)}/{len(opportunities)} opportunities "
@@ -1085,6 +1871,154 @@ class MissionScheduler:
 
         return schedule, metrics
 
+    def schedule_perturbed(
+        self,
+        opportunities: List[Opportunity],
+        target_positions: Dict[str, Tuple[float, float]],
+        algorithm: AlgorithmType,
+        seed: Optional[int],
+    ) -> Tuple[List[ScheduledOpportunity], ScheduleMetrics]:
+        """
+        Run one randomized start of an algorithm.
+
+        First-fit algorithms ignore values, so each opportunity is skipped
+        with probability MULTISTART_SKIP_PROBABILITY; for the others,
+        values are scaled by a random factor within ±MULTISTART_VALUE_NOISE
+        (changing value-driven choices and tie-breaks). The local search,
+        when enabled, uses the same seed. The schedule and metrics report
+        the true values.
+
+        A seed reproduces the same start unless the local search runs on
+        improve_budget_ms alone, which stops on the wall clock; set
+        improve_max_moves for reproducible starts.
+
+        Args:
+            opportunities: List of visibility opportunities
+            target_positions: Dict mapping target_id to (lat, lon) in degrees
+            algorithm: Algorithm to use
+            seed: Random seed (None = unperturbed, same as schedule())
+
+        Returns:
+            Tuple of (scheduled_opportunities, metrics)
+        """
+        if seed is None:
+            return self.schedule(opportunities, target_positions, algorithm)
+
+        rng = random.Random(seed)
+        if algorithm in (AlgorithmType.FIRST_FIT, AlgorithmType.ROLL_PITCH_FIRST_FIT):
+            perturbed = [
+                opp
+                for opp in opportunities
+                if rng.random() >= MULTISTART_SKIP_PROBABILITY
+            ]
+        else:
+            perturbed = [
+                replace(
+                    opp,
+                    value=opp.value
+                    * (
+                        1
+                        + rng.uniform(-MULTISTART_VALUE_NOISE, MULTISTART_VALUE_NOISE)
+                    ),
+                )
+                for opp in opportunities
+            ]
+        scheduler = MissionScheduler(
+            replace(self.config, improve_seed=seed),
+            satellite=self.satellite,
+            satellites=self.satellites,
+            ephemerides=self.ephemerides,
+        )
+        schedule, metrics = scheduler.schedule(perturbed, target_positions, algorithm)
+
+        values = {opp.id: opp.value for opp in opportunities}
+        for item in schedule:
+            item.value = values[item.opportunity_id]
+            item.density = (
+                item.value / item.maneuver_time
+                if item.maneuver_time > 0
+                else float("inf")
+            )
+        metrics = self._compute_metrics(
+            algorithm.value, opportunities, schedule, metrics.runtime_ms
+        )
+        metrics.seed = seed
+        return schedule, metrics
+
+    def schedule_multistart(
+        self,
+        opportunities: Union[List[Opportunity], "PassTable"],
+        target_positions: Dict[str, Tuple[float, float]],
+        n_starts: int = 8,
+        seed: int = 0,
+        algorithm: AlgorithmType = AlgorithmType.BEST_FIT,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[List[ScheduledOpportunity], ScheduleMetrics]:
+        """
+        Run randomized starts of a greedy algorithm concurrently and keep
+        the best.
+
+        Start 0 is the plain algorithm; start k uses schedule_perturbed()
+        with seed + k. Starts run in the shared process pool
+        (mission_planner.parallel.run_schedule_starts), or in-process on a
+        single core. Ties go to the earliest start, so the result is never
+        worse than schedule().
+
+        Pool and in-process runs give the same result, except when the
+        local search runs on improve_budget_ms alone: its wall-clock stop
+        depends on the load of each worker (see schedule_perturbed()).
+
+        Args:
+            opportunities: List of visibility opportunities, or a PassTable
+            target_positions: Dict mapping target_id to (lat, lon) in degrees
+            n_starts: Number of starts
+            seed: Base random seed
+            algorithm: Greedy algorithm to randomize
+            max_workers: Maximum worker processes (None = all cores)
+
+        Returns:
+            Tuple of (best schedule, its metrics). metrics.seed is the
+            winning start's seed (None for start 0) and
+            metrics.multistart_values the total value of every start.
+
+        Raises:
+            ValueError: If n_starts < 1 or algorithm is OPTIMAL_DP
+        """
+        if n_starts < 1:
+            raise ValueError(f"n_starts must be at least 1, got {n_starts}")
+        if algorithm == AlgorithmType.OPTIMAL_DP:
+            raise ValueError("schedule_multistart randomizes greedy algorithms only")
+
+        from .parallel import run_schedule_starts
+
+        start_time = time.perf_counter()
+        if not isinstance(opportunities, list):
+            opportunities = opportunities.to_opportunities()
+
+        seeds: List[Optional[int]] = [None] + [seed + k for k in range(1, n_starts)]
+        results = run_schedule_starts(
+            self, opportunities, target_positions, algorithm, seeds, max_workers
+        )
+
+        values = [metrics.total_value for _, metrics in results]
+        best = max(range(n_starts), key=lambda k: (values[k], -k))
+        schedule, metrics = results[best]
+        metrics.runtime_ms = (time.perf_counter() - start_time) * 1000
+        metrics.multistart_values = values
+
+        logger.info(
+            "%s multistart: best of %d starts %.2f (start %d), "
+            "range %.2f-%.2f in %.2fms",
+            algorithm.value,
+            n_starts,
+            values[best],
+            best,
+            min(values),
+            max(values),
+            metrics.runtime_ms,
+        )
+        return schedule, metrics
+
     def _first_fit(
         self,
         opportunities: List[Opportunity],
@@ -1416,7 +2350,8 @@ class MissionScheduler:
 
         Both aim for 100% coverage, but best_fit optimizes value while minimizing pitch.
 
-        O(n² log n) complexity.
+        O(n log n) complexity: conflicts and the predecessor are found by
+        binary search in a per-satellite SatelliteTimeline.
         """
 
         if self.config.max_spacecraft_pitch_deg == 0.0:
@@ -1465,9 +2400,7 @@ class MissionScheduler:
         schedule = []
         scheduled_targets = set()
         # Per-satellite schedule tracking for constellation support
-        scheduled_items_by_sat: Dict[
-            str, List[Tuple[datetime, datetime, ScheduledOpportunity]]
-        ] = {}
+        scheduled_items_by_sat: Dict[str, SatelliteTimeline] = {}
 
         for opp in sorted_opps:
             if opp.target_id in scheduled_targets:
@@ -1479,11 +2412,16 @@ class MissionScheduler:
 
             # Get satellite-specific schedule items
             sat_id = opp.satellite_id or "default"
-            scheduled_items = scheduled_items_by_sat.get(sat_id, [])
-
-            # Check for conflicts with already scheduled FOR THIS SATELLITE
+            scheduled_items = scheduled_items_by_sat.get(sat_id)
+            if scheduled_items is None:
+                scheduled_items = scheduled_items_by_sat[sat_id] = SatelliteTimeline()
+            before, after = scheduled_items.neighbors(opp_start)
+
+            # Check for conflicts with already scheduled FOR THIS SATELLITE.
+            # Scheduled items keep their slew gaps pairwise, so a candidate
+            # that clears both neighbours clears the rest of the timeline.
             conflicts = False
-            for sched_start, sched_end, sched_item in scheduled_items:
+            for sched_start, sched_end, sched_item in filter(None, (before, after)):
                 if opp_start > sched_end:
                     gap = (opp_start - sched_end).total_seconds()
                     roll_diff = abs(
@@ -1533,13 +2471,8 @@ class MissionScheduler:
             if conflicts:
                 continue
 
-            # Find previous scheduled for feasibility check
-            prev_scheduled = None
-            for sched_start, sched_end, sched_item in sorted(
-                scheduled_items, key=lambda x: x[0]
-            ):
-                if sched_start < opp_start:
-                    prev_scheduled = sched_item
+            # Previous scheduled for feasibility check
+            prev_scheduled = before[2] if before is not None else None
 
             # Use 2D feasibility check
             (
@@ -1601,9 +2534,7 @@ class MissionScheduler:
             )
             schedule.append(scheduled_opp)
             # Update per-satellite schedule items
-            if sat_id not in scheduled_items_by_sat:
-                scheduled_items_by_sat[sat_id] = []
-            scheduled_items_by_sat[sat_id].append((opp_start, opp_end, scheduled_opp))
+            scheduled_items.add(opp_start, opp_end, scheduled_opp)
 
             # Check if this is truly roll-only (no pitch maneuver needed)
             # Roll-only means: target pitch is ~0 AND delta_pitch is small (no pitch reset needed)
@@ -1637,10 +2568,16 @@ class MissionScheduler:
                 f"target(s): {sorted(uncovered_targets)}"
             )
 
+            opportunities_by_target: Dict[str, List[Opportunity]] = {}
+            for o in opportunities:
+                opportunities_by_target.setdefault(o.target_id, []).append(o)
+            # Scheduled items swapped out, dropped from schedule afterwards
+            swapped_out = set()
+
             for uncov_target in sorted(uncovered_targets):
                 # Best opportunities for the uncovered target (by value)
                 uncov_opps = sorted(
-                    [o for o in opportunities if o.target_id == uncov_target],
+                    opportunities_by_target[uncov_target],
                     key=lambda o: -o.value,
                 )
 
@@ -1655,8 +2592,22 @@ class MissionScheduler:
                         seconds=self.config.imaging_time_s
                     )
 
-                    # Find scheduled items on the SAME satellite that block this opportunity
-                    sat_items = scheduled_items_by_sat.get(uncov_sat, [])
+                    # Find scheduled items on the SAME satellite that block this
+                    # opportunity (only those within slew reach can)
+                    sat_items: List[
+                        Tuple[datetime, datetime, ScheduledOpportunity]
+                    ] = []
+                    sat_timeline = scheduled_items_by_sat.get(uncov_sat)
+                    if sat_timeline is not None:
+                        reach = timedelta(
+                            seconds=sat_timeline.slew_reach_s(
+                                uncov_opp.incidence_angle,
+                                self.config.max_roll_rate_dps,
+                            )
+                        )
+                        sat_items = sat_timeline.overlapping(
+                            uncov_start - reach, uncov_end + reach
+                        )
                     blocking_items = []
                     for sched_start, sched_end, sched_item in sat_items:
                         # Check if this scheduled item's time window conflicts
@@ -1709,9 +2660,8 @@ class MissionScheduler:
                         alt_opps = sorted(
                             [
                                 o
-                                for o in opportunities
-                                if o.target_id == blocker_target
-                                and (o.satellite_id or "default") != uncov_sat
+                                for o in opportunities_by_target[blocker_target]
+                                if (o.satellite_id or "default") != uncov_sat
                             ],
                             key=lambda o: -o.value,
                         )
@@ -1724,7 +2674,20 @@ class MissionScheduler:
                             )
 
                             # Check if alt fits on its satellite without conflicts
-                            alt_sat_items = scheduled_items_by_sat.get(alt_sat, [])
+                            alt_sat_items: List[
+                                Tuple[datetime, datetime, ScheduledOpportunity]
+                            ] = []
+                            alt_timeline = scheduled_items_by_sat.get(alt_sat)
+                            if alt_timeline is not None:
+                                reach = timedelta(
+                                    seconds=alt_timeline.slew_reach_s(
+                                        alt_opp.incidence_angle,
+                                        self.config.max_roll_rate_dps,
+                                    )
+                                )
+                                alt_sat_items = alt_timeline.overlapping(
+                                    alt_start - reach, alt_end + reach
+                                )
                             alt_conflicts = False
                             for s_start, s_end, s_item in alt_sat_items:
                                 if alt_start <= s_end and alt_end >= s_start:
@@ -1764,16 +2727,8 @@ class MissionScheduler:
 
                             # ── Execute the swap ──
                             # 1. Remove blocker from schedule and satellite tracking
-                            schedule = [
-                                s
-                                for s in schedule
-                                if s.opportunity_id != blocker.opportunity_id
-                            ]
-                            scheduled_items_by_sat[uncov_sat] = [
-                                (st, en, si)
-                                for st, en, si in scheduled_items_by_sat[uncov_sat]
-                                if si.opportunity_id != blocker.opportunity_id
-                            ]
+                            swapped_out.add(id(blocker))
+                            scheduled_items_by_sat[uncov_sat].remove(blocker)
                             scheduled_targets.discard(blocker_target)
 
                             # 2. Add uncovered target on freed satellite
@@ -1805,10 +2760,8 @@ class MissionScheduler:
                             )
                             schedule.append(uncov_scheduled)
                             scheduled_targets.add(uncov_target)
-                            if uncov_sat not in scheduled_items_by_sat:
-                                scheduled_items_by_sat[uncov_sat] = []
-                            scheduled_items_by_sat[uncov_sat].append(
-                                (uncov_start, uncov_end, uncov_scheduled)
+                            scheduled_items_by_sat[uncov_sat].add(
+                                uncov_start, uncov_end, uncov_scheduled
                             )
 
                             # 3. Add blocker's target on alternative satellite
@@ -1838,11 +2791,9 @@ class MissionScheduler:
                             )
                             schedule.append(alt_scheduled)
                             scheduled_targets.add(blocker_target)
-                            if alt_sat not in scheduled_items_by_sat:
-                                scheduled_items_by_sat[alt_sat] = []
-                            scheduled_items_by_sat[alt_sat].append(
-                                (alt_start, alt_end, alt_scheduled)
-                            )
+                            scheduled_items_by_sat.setdefault(
+                                alt_sat, SatelliteTimeline()
+                            ).add(alt_start, alt_end, alt_scheduled)
 
                             logger.info(
                                 f"[roll_pitch_best_fit] Coverage swap: "
@@ -1852,6 +2803,8 @@ class MissionScheduler:
                             swap_done = True
                             break
 
+            schedule = [s for s in schedule if id(s) not in swapped_out]
+
             final_uncovered = all_target_ids - scheduled_targets
             if final_uncovered:
                 logger.info(
@@ -1986,10 +2939,8 @@ class MissionScheduler:
         scheduled_targets = set()
 
         # Track timing per satellite to ensure valid chronological schedule
-        # Dict: satellite_id -> List of (start_time, end_time, ScheduledOpportunity) tuples
-        scheduled_items_by_sat: Dict[
-            str, List[Tuple[datetime, datetime, ScheduledOpportunity]]
-        ] = {}
+        # Dict: satellite_id -> timeline of (start_time, end_time, ScheduledOpportunity)
+        scheduled_items_by_sat: Dict[str, SatelliteTimeline] = {}
 
         for opp in sorted_opps:
             # Skip if target already scheduled
@@ -2002,15 +2953,19 @@ class MissionScheduler:
 
             # Get satellite-specific schedule items
             sat_id = opp.satellite_id or "default"
-            scheduled_items = scheduled_items_by_sat.get(sat_id, [])
+            scheduled_items = scheduled_items_by_sat.get(sat_id)
+            if scheduled_items is None:
+                scheduled_items = scheduled_items_by_sat[sat_id] = SatelliteTimeline()
 
             # Check if this opportunity conflicts with already-scheduled times FOR THIS SATELLITE
             opp_start = opp.start_time
             opp_end = opp_start + timedelta(seconds=self.config.imaging_time_s)
+            before, after = scheduled_items.neighbors(opp_start)
 
-            # Quick feasibility check - does it fit in the timeline?
+            # Quick feasibility check - does it fit in the timeline? Only the
+            # neighbours need checking: scheduled items keep their gaps pairwise
             conflicts = False
-            for sched_start, sched_end, sched_item in scheduled_items:
+            for sched_start, sched_end, sched_item in filter(None, (before, after)):
                 # Calculate required gap (maneuver time based on angle change)
                 if opp_start > sched_end:
                     # This opp is after scheduled - need time to maneuver FROM scheduled TO this
@@ -2049,15 +3004,8 @@ class MissionScheduler:
                 )
                 continue
 
-            # Find the ScheduledOpportunity that would be BEFORE this one chronologically
-            prev_scheduled = None
-            for sched_start, sched_end, sched_item in sorted(
-                scheduled_items, key=lambda x: x[0]
-            ):
-                if sched_start < opp_start:
-                    prev_scheduled = sched_item
-                else:
-                    break
+            # The ScheduledOpportunity that would be BEFORE this one chronologically
+            prev_scheduled = before[2] if before is not None else None
 
             # Full feasibility check using kernel
             (
@@ -2133,9 +3081,7 @@ class MissionScheduler:
             )
             schedule.append(scheduled_opp)
             # Update per-satellite schedule items
-            if sat_id not in scheduled_items_by_sat:
-                scheduled_items_by_sat[sat_id] = []
-            scheduled_items_by_sat[sat_id].append((opp_start, opp_end, scheduled_opp))
+            scheduled_items.add(opp_start, opp_end, scheduled_opp)
 
         # Sort schedule chronologically for output
         schedule.sort(key=lambda x: x.start_time)
@@ -2199,6 +3145,322 @@ class MissionScheduler:
         )
         return schedule
 
+    def _optimal_dp(
+        self,
+        opportunities: List[Opportunity],
+        target_positions: Dict[str, Tuple[float, float]],
+    ) -> List[ScheduledOpportunity]:
+        """
+        Optimal-DP (Maximum Total Value) algorithm.
+
+        Strategy:
+        1. Per satellite, list which opportunities can follow which within
+           the slew limits (same rule as the kernel's feasibility check)
+        2. Without the one-acquisition-per-target rule, the best schedule
+           of a satellite is a maximum-value chain: dynamic programming over
+           chronological opportunities with predecessor lists
+        3. The per-target rule is relaxed with Lagrange multipliers (a price
+           per extra acquisition), tuned by subgradient steps; each relaxed
+           solution bounds the optimum from above
+        4. Each relaxed solution is repaired into a valid schedule (best
+           acquisition per target, then uncovered targets inserted by
+           value where they fit); the best one is returned
+
+        Stops when the schedule is proven optimal, after
+        OPTIMAL_DP_MAX_ITERATIONS, or when config.optimal_budget_ms runs
+        out. The bound and gap are reported in ScheduleMetrics.
+
+        Uses roll+pitch slew when pitch is enabled, roll only otherwise.
+        O(n × k) per iteration, k = feasible predecessors per opportunity.
+        """
+        started = time.perf_counter()
+        deadline = started + self.config.optimal_budget_ms / 1000.0
+        use_pitch = self.config.max_spacecraft_pitch_deg > 0
+        transitions = self.kernel.transition_matrices(use_pitch)
+
+        target_index: Dict[str, int] = {}
+        target_of: Dict[str, np.ndarray] = {}
+        for sat_id, sat_transitions in transitions.items():
+            target_of[sat_id] = np.array(
+                [
+                    target_index.setdefault(o.target_id, len(target_index))
+                    for o in sat_transitions.opportunities
+                ],
+                dtype=np.intp,
+            )
+        # Fill order for the repair step: allowed opportunities by value
+        fill_order = sorted(
+            (
+                (-float(sat_transitions.values[i]), sat_id, i)
+                for sat_id, sat_transitions in transitions.items()
+                for i in np.flatnonzero(sat_transitions.allowed).tolist()
+            ),
+        )
+
+        multipliers = np.zeros(len(target_index))
+        upper_bound = float("inf")
+        best_value = 0.0
+        best_chains: Dict[str, List[int]] = {sat_id: [] for sat_id in transitions}
+        step_scale = 2.0
+        stalled = 0
+        iterations = 0
+
+        while iterations < OPTIMAL_DP_MAX_ITERATIONS:
+            if iterations and time.perf_counter() >= deadline:
+                break
+            iterations += 1
+
+            # Relaxed problem: independent max-weight chains per satellite
+            relaxed_value = float(multipliers.sum())
+            counts = np.zeros(len(target_index))
+            chains: Dict[str, List[int]] = {}
+            for sat_id, sat_transitions in transitions.items():
+                weights = sat_transitions.values - multipliers[target_of[sat_id]]
+                value, chain = sat_transitions.best_chain(weights.tolist())
+                relaxed_value += value
+                chains[sat_id] = chain
+                np.add.at(counts, target_of[sat_id][chain], 1)
+
+            if relaxed_value < upper_bound - 1e-9:
+                upper_bound = relaxed_value
+                stalled = 0
+            else:
+                stalled += 1
+                if stalled >= OPTIMAL_DP_STALL_ITERATIONS:
+                    step_scale /= 2
+                    stalled = 0
+
+            repaired, repaired_value = self._repair_chains(
+                transitions, target_of, chains, fill_order
+            )
+            if repaired_value > best_value:
+                best_value, best_chains = repaired_value, repaired
+
+            if upper_bound - best_value <= OPTIMAL_DP_GAP_TOLERANCE * max(
+                upper_bound, 1.0
+            ):
+                break
+
+            # Subgradient of the bound; prices stay non-negative
+            subgradient = 1.0 - counts
+            subgradient[(multipliers <= 0) & (subgradient > 0)] = 0.0
+            norm = float(np.dot(subgradient, subgradient))
+            if norm == 0:
+                # Relaxed chains already take each target at most once
+                break
+            step = step_scale * (relaxed_value - best_value) / norm
+            multipliers = np.maximum(0.0, multipliers - step * subgradient)
+
+        self._optimal_upper_bound = max(upper_bound, best_value)
+        logger.info(
+            "[optimal_dp] %d iterations in %.0fms: value=%.2f bound=%.2f",
+            iterations,
+            (time.perf_counter() - started) * 1000,
+            best_value,
+            self._optimal_upper_bound,
+        )
+
+        return self._chains_to_schedule(
+            transitions, best_chains, target_positions, use_pitch
+        )
+
+    def _chains_to_schedule(
+        self,
+        transitions: Dict[str, SlewTransitionMatrix],
+        chains: Dict[str, List[int]],
+        target_positions: Dict[str, Tuple[float, float]],
+        use_pitch: bool,
+    ) -> List[ScheduledOpportunity]:
+        """
+        Build the schedule for chains of opportunity indices.
+
+        Each item is re-checked with the kernel against its predecessor and
+        dropped if infeasible (e.g. float rounding at exact-fit gaps).
+        """
+        schedule = []
+        for sat_id, chain in chains.items():
+            prev_scheduled = None
+            for i in chain:
+                opp = transitions[sat_id].opportunities[i]
+                if use_pitch:
+                    feasibility = self.kernel.is_feasible_2d(
+                        prev_scheduled, opp, target_positions
+                    )
+                else:
+                    feasibility = self.kernel.is_feasible(
+                        prev_scheduled, opp, target_positions
+                    )
+                if not feasibility[0]:
+                    logger.debug("%s dropped: infeasible on kernel re-check", opp.id)
+                    continue
+                prev_scheduled = self._scheduled_from(opp, *feasibility[1:])
+                schedule.append(prev_scheduled)
+
+        schedule.sort(key=lambda x: x.start_time)
+        return schedule
+
+    def _improve(
+        self,
+        schedule: List[ScheduledOpportunity],
+        opportunities: List[Opportunity],
+        target_positions: Dict[str, Tuple[float, float]],
+        use_pitch: bool,
+    ) -> Tuple[List[ScheduledOpportunity], int]:
+        """
+        Anytime local-search improvement of a schedule (simulated annealing).
+
+        Seeded from the given schedule; runs insert/swap/remove moves (see
+        _LocalSearch) until config.improve_budget_ms, counted from the call,
+        runs out or config.improve_max_moves moves were made, whichever
+        comes first. The best schedule seen is returned, or the input
+        schedule unchanged when nothing better was found.
+
+        Only a move cap makes the result reproducible for a given
+        improve_seed: a wall-clock budget alone stops, and cools, at a
+        point that depends on machine load.
+
+        Returns:
+            Tuple of (schedule, moves evaluated)
+        """
+        deadline = math.inf
+        if self.config.improve_budget_ms > 0:
+            deadline = time.perf_counter() + self.config.improve_budget_ms / 1000.0
+        transitions = self.kernel.transition_matrices(use_pitch)
+
+        index = {
+            (sat_id, opp.id): i
+            for sat_id, sat_transitions in transitions.items()
+            for i, opp in enumerate(sat_transitions.opportunities)
+        }
+        chains: Dict[str, List[int]] = {}
+        for item in schedule:
+            sat_id = item.satellite_id or "default"
+            i = index.get((sat_id, item.opportunity_id))
+            if i is not None:
+                chains.setdefault(sat_id, []).append(i)
+
+        search = _LocalSearch(
+            transitions, chains, random.Random(self.config.improve_seed)
+        )
+        moves = search.run(deadline, self.config.improve_max_moves)
+        best_value, best_chains = search.best()
+        if best_value <= search.initial_value + 1e-9:
+            return schedule, moves
+
+        improved = self._chains_to_schedule(
+            transitions, best_chains, target_positions, use_pitch
+        )
+        if sum(s.value for s in improved) <= sum(s.value for s in schedule):
+            return schedule, moves
+        logger.info(
+            "[local_search] %d moves: value %.2f -> %.2f",
+            moves,
+            search.initial_value,
+            best_value,
+        )
+        return improved, moves
+
+    @staticmethod
+    def _repair_chains(
+        transitions: Dict[str, SlewTransitionMatrix],
+        target_of: Dict[str, np.ndarray],
+        chains: Dict[str, List[int]],
+        fill_order: List[Tuple[float, str, int]],
+    ) -> Tuple[Dict[str, List[int]], float]:
+        """
+        Turn relaxed chains into a schedule with one acquisition per target.
+
+        Keeps each target's most valuable acquisition, then inserts
+        opportunities of uncovered targets, best first, wherever both
+        chain neighbours allow.
+
+        Returns:
+            Tuple of (chains per satellite, total value)
+        """
+        keep: Dict[int, Tuple[float, str, int]] = {}
+        for sat_id, chain in chains.items():
+            values = transitions[sat_id].values
+            targets = target_of[sat_id]
+            for i in chain:
+                target = int(targets[i])
+                if target not in keep or values[i] > keep[target][0]:
+                    keep[target] = (float(values[i]), sat_id, i)
+
+        repaired: Dict[str, List[int]] = {sat_id: [] for sat_id in transitions}
+        for _, sat_id, i in keep.values():
+            repaired[sat_id].append(i)
+        for chain in repaired.values():
+            chain.sort()
+
+        total_value = sum(value for value, _, _ in keep.values())
+        covered = set(keep)
+        for negative_value, sat_id, i in fill_order:
+            target = int(target_of[sat_id][i])
+            if target in covered:
+                continue
+            sat_transitions = transitions[sat_id]
+            chain = repaired[sat_id]
+            k = bisect_left(chain, i)
+            if k > 0 and not sat_transitions.can_follow(chain[k - 1], i):
+                continue
+            if k < len(chain) and not sat_transitions.can_follow(i, chain[k]):
+                continue
+            chain.insert(k, i)
+            covered.add(target)
+            total_value -= negative_value
+
+        return repaired, total_value
+
+    def _scheduled_from(
+        self,
+        opp: Opportunity,
+        maneuver_time: float,
+        slack: float,
+        delta_roll: float,
+        delta_pitch: float,
+        roll_angle: float,
+        pitch_angle: float,
+    ) -> ScheduledOpportunity:
+        """ScheduledOpportunity for an accepted opportunity and its kernel check."""
+        imaging_start = opp.start_time
+        sat_lat, sat_lon, sat_alt = None, None, None
+        sat_obj = self._get_satellite_for_opportunity(opp.satellite_id)
+        if sat_obj:
+            try:
+                sat_lat, sat_lon, sat_alt = sat_obj.get_position(
+                    imaging_start - timedelta(seconds=maneuver_time)
+                )
+            except Exception:
+                pass
+
+        return ScheduledOpportunity(
+            opportunity_id=opp.id,
+            satellite_id=opp.satellite_id,
+            target_id=opp.target_id,
+            start_time=imaging_start,
+            end_time=imaging_start + timedelta(seconds=self.config.imaging_time_s),
+            delta_roll=delta_roll,
+            delta_pitch=delta_pitch,
+            roll_angle=roll_angle,
+            pitch_angle=pitch_angle,
+            maneuver_time=maneuver_time,
+            slack_time=slack,
+            value=opp.value,
+            density=opp.value / maneuver_time if maneuver_time > 0 else float("inf"),
+            incidence_angle=opp.incidence_angle,
+            satellite_lat=sat_lat,
+            satellite_lon=sat_lon,
+            satellite_alt=sat_alt,
+            # SAR-specific fields (copied from Opportunity)
+            mission_mode=opp.mission_mode,
+            sar_mode=opp.sar_mode,
+            look_side=opp.look_side,
+            pass_direction=opp.pass_direction,
+            incidence_center_deg=opp.incidence_center_deg,
+            swath_width_km=opp.swath_width_km,
+            scene_length_km=opp.scene_length_km,
+        )
+
     def _select_best_per_target(
         self, schedule: List[ScheduledOpportunity], algorithm: AlgorithmType
     ) -> List[ScheduledOpportunity]:
@@ -2262,6 +3524,18 @@ class MissionScheduler:
         n_accepted = len(schedule)
         n_rejected = n_evaluated - n_accepted
 
+        # Optimality metrics (bound set during scheduling)
+        value_upper_bound = None
+        optimality_gap = None
+        if algorithm_name == "optimal_dp" and hasattr(self, "_optimal_upper_bound"):
+            value_upper_bound = self._optimal_upper_bound
+            achieved = sum(s.value for s in schedule)
+            optimality_gap = (
+                max(0.0, value_upper_bound - achieved) / value_upper_bound
+                if value_upper_bound > 0
+                else 0.0
+            )
+
         if not schedule:
             return ScheduleMetrics(
                 algorithm=algorithm_name,
@@ -2277,6 +3551,8 @@ class MissionScheduler:
                 utilization=0.0,
                 mean_density=0.0,
                 median_density=0.0,
+                value_upper_bound=value_upper_bound,
+                optimality_gap=optimality_gap,
                 seed=None,
             )
 
@@ -2361,5 +3637,7 @@ class MissionScheduler:
             total_pitch_used_deg=total_pitch_used_deg,
             max_pitch_deg=max_pitch_deg,
             opportunities_saved_by_pitch=opportunities_saved_by_pitch,
+            value_upper_bound=value_upper_bound,
+            optimality_gap=optimality_gap,
             seed=None,
         )
@@ -0,0 +1,158 @@
+"""
+Ephemeris node tables in shared memory for process-pool workers.
+
+The parent process propagates a satellite once and publishes the Ephemeris
+nodes into a ``multiprocessing.shared_memory`` block. Workers attach to the
+block by name and wrap it in an Ephemeris whose node arrays are views of
+the shared buffer, so propagation cost does not grow with the number of
+workers and the nodes are held in memory once.
+
+Block layout (float64): N node times, then N x 3 inertial positions (km),
+then N x 3 inertial velocities (km/s).
+
+The publishing process owns the block: SharedEphemeris.close() (or
+release_shared_ephemerides() at shutdown) unlinks it. Attached workers
+only close their mapping.
+"""
+
+import logging
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .ephemeris import Ephemeris
+from .orbit import SatelliteOrbit
+
+logger = logging.getLogger(__name__)
+
+_FLOAT_BYTES = np.dtype(np.float64).itemsize
+
+# Blocks published by this process, by block name, until released
+_published: Dict[str, "SharedEphemeris"] = {}
+
+
+@dataclass(frozen=True)
+class SharedEphemerisSpec:
+    """Picklable description of a published ephemeris block."""
+
+    block_name: str
+    node_count: int
+    satellite_name: str
+    tle_lines: Tuple[str, ...] = ()
+
+
+def _node_views(
+    block: shared_memory.SharedMemory, node_count: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(node_times, position_eci, velocity_eci) arrays backed by an open block."""
+    buffer = block.buf
+    assert buffer is not None  # None only after close()
+    values = np.ndarray((7 * node_count,), dtype=np.float64, buffer=buffer)
+    node_times = values[:node_count]
+    position_eci = values[node_count : 4 * node_count].reshape(node_count, 3)
+    velocity_eci = values[4 * node_count :].reshape(node_count, 3)
+    return node_times, position_eci, velocity_eci
+
+
+class SharedEphemeris:
+    """
+    An Ephemeris published into a shared memory block (owner side).
+
+    Usable as a context manager; the block is unlinked on exit.
+    """
+
+    def __init__(self, ephemeris: Ephemeris) -> None:
+        """
+        Copy an ephemeris' nodes into a new shared memory block.
+
+        Args:
+            ephemeris: Ephemeris to publish
+
+        Raises:
+            OSError: If the shared memory block cannot be created
+        """
+        node_count = int(ephemeris.node_times.shape[0])
+        self._block: Optional[shared_memory.SharedMemory] = (
+            shared_memory.SharedMemory(create=True, size=7 * node_count * _FLOAT_BYTES)
+        )
+        node_times, position_eci, velocity_eci = _node_views(self._block, node_count)
+        node_times[:] = ephemeris.node_times
+        position_eci[:] = ephemeris.position_eci
+        velocity_eci[:] = ephemeris.velocity_eci
+        del node_times, position_eci, velocity_eci
+
+        self.spec = SharedEphemerisSpec(
+            block_name=self._block.name,
+            node_count=node_count,
+            satellite_name=ephemeris.satellite_name,
+            tle_lines=tuple(ephemeris.tle_lines or ()),
+        )
+        _published[self.spec.block_name] = self
+        logger.debug(
+            "Published ephemeris for %s in shared block %s (%d nodes)",
+            self.spec.satellite_name,
+            self.spec.block_name,
+            node_count,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._block is None
+
+    def close(self) -> None:
+        """Close and unlink the block. Safe to call more than once."""
+        if self._block is None:
+            return
+        block, self._block = self._block, None
+        _published.pop(block.name, None)
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SharedEphemeris":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def attach_shared_ephemeris(
+    spec: SharedEphemerisSpec, orbit: Optional[SatelliteOrbit] = None
+) -> Tuple[shared_memory.SharedMemory, Ephemeris]:
+    """
+    Attach to a published block and wrap it as an Ephemeris without copying.
+
+    The returned block must stay open while the Ephemeris is in use; drop
+    the Ephemeris before closing it.
+
+    Args:
+        spec: Description of the published block
+        orbit: Source orbit for times outside the table
+
+    Returns:
+        Tuple of (attached block, Ephemeris viewing its nodes)
+
+    Raises:
+        FileNotFoundError: If the block has already been released
+    """
+    block = shared_memory.SharedMemory(name=spec.block_name)
+    node_times, position_eci, velocity_eci = _node_views(block, spec.node_count)
+    ephemeris = Ephemeris(
+        spec.satellite_name,
+        node_times,
+        position_eci,
+        velocity_eci,
+        tle_lines=list(spec.tle_lines) or None,
+        orbit=orbit,
+    )
+    return block, ephemeris
+
+
+def release_shared_ephemerides() -> None:
+    """Unlink every block published by this process."""
+    for shared in list(_published.values()):
+        shared.close()
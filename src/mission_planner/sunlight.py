@@ -3,17 +3,41 @@ Sunlight and illumination calculations for optical imaging missions.
 
 This module provides functionality to determine if a ground target
 is illuminated by the sun for optical satellite imaging.
+
+The scalar functions take one datetime. Their *_array counterparts take
+Unix epoch seconds as numpy arrays and evaluate the same formulas for many
+times (and target locations) at once, and DaylightIntervals precomputes
+the sunlit intervals of targets over a search window so visibility scans
+can skip the night entirely.
 """
 
 import math
-from datetime import datetime
-from typing import Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Sequence, Tuple, Union, cast
 
 import numpy as np
 
 # Constants
 EARTH_RADIUS_KM = 6371.0
 AU_KM = 149597870.7  # Astronomical Unit in kilometers
+J2000_EPOCH_SECONDS = 946728000.0  # 2000-01-01 12:00:00 UTC
+
+# Sidereal rotation rate of the Earth (rad/s), from the GMST rate below
+EARTH_ROTATION_RATE_RAD_S = math.radians(360.98564736629) / 86400.0
+# Upper bound on the angular rate of the sun's ECI direction (~1.2°/day)
+SUN_DIRECTION_RATE_RAD_S = 2.1e-7
+# Margin on the sun-elevation rate bound used to rule out missed crossings
+SUN_RATE_SAFETY_FACTOR = 1.05
+
+# Coarse sampling of sun elevation when building daylight intervals
+DAYLIGHT_SAMPLE_SECONDS = 600.0
+# Sunrise/sunset times are located to within this many seconds
+DAYLIGHT_TOLERANCE_SECONDS = 1e-3
+# Maximum (targets x samples) evaluated at once when building intervals
+DAYLIGHT_BLOCK_ELEMENTS = 1_000_000
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
 
 
 def calculate_sun_position(timestamp: datetime) -> Tuple[float, float, float]:
@@ -227,3 +251,418 @@ def calculate_solar_zenith_angle(
     else:
         # Sun is below horizon
         return 180.0  # Maximum possible value
+
+
+def _days_since_j2000(epoch_s: ArrayLike) -> np.ndarray:
+    """Days since the J2000.0 epoch for Unix epoch seconds."""
+    return (np.asarray(epoch_s, dtype=np.float64) - J2000_EPOCH_SECONDS) / 86400.0
+
+
+def calculate_sun_position_array(epoch_s: ArrayLike) -> np.ndarray:
+    """
+    Sun position in ECI coordinates for many times.
+
+    Array version of calculate_sun_position.
+
+    Args:
+        epoch_s: Unix epoch seconds (UTC), any shape
+
+    Returns:
+        Positions in kilometers, shape epoch_s.shape + (3,)
+    """
+    days = _days_since_j2000(epoch_s)
+
+    mean_anomaly = np.radians(357.52911 + 0.98560028 * days) % (2 * math.pi)
+    center = np.radians(
+        1.914602 * np.sin(mean_anomaly) + 0.019993 * np.sin(2 * mean_anomaly)
+    )
+    lambda_sun = np.radians(280.46646 + 0.98564736 * days) + center
+    epsilon = math.radians(23.439291)
+
+    return np.stack(
+        (
+            AU_KM * np.cos(lambda_sun),
+            AU_KM * np.sin(lambda_sun) * math.cos(epsilon),
+            AU_KM * np.sin(lambda_sun) * math.sin(epsilon),
+        ),
+        axis=-1,
+    )
+
+
+def calculate_gmst_array(epoch_s: ArrayLike) -> np.ndarray:
+    """
+    Greenwich Mean Sidereal Time in degrees for many times.
+
+    Array version of calculate_gmst.
+
+    Args:
+        epoch_s: Unix epoch seconds (UTC), any shape
+
+    Returns:
+        GMST in degrees, same shape as epoch_s
+    """
+    days = _days_since_j2000(epoch_s)
+    T = days / 36525.0
+    gmst = 280.46061837 + 360.98564736629 * days + 0.000387933 * T * T
+    return gmst % 360.0
+
+
+def _sun_sin_elevation(
+    target_lat: ArrayLike, target_lon: ArrayLike, epoch_s: ArrayLike
+) -> np.ndarray:
+    """
+    Sine of the sun elevation at target locations (inputs broadcast together).
+
+    The sun position and GMST are evaluated once per time, so latitudes of
+    shape (K, 1) against times of shape (1, N) cost N sun positions.
+    """
+    epoch_s = np.asarray(epoch_s, dtype=np.float64)
+    sun = calculate_sun_position_array(epoch_s)
+    lon_rad = np.radians(
+        np.asarray(target_lon, dtype=np.float64) + calculate_gmst_array(epoch_s)
+    )
+    lat_rad = np.radians(np.asarray(target_lat, dtype=np.float64))
+
+    cos_lat = np.cos(lat_rad)
+    up = np.stack(
+        np.broadcast_arrays(
+            cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)
+        ),
+        axis=-1,
+    )
+    sun_vec = sun - EARTH_RADIUS_KM * up
+    return cast(
+        np.ndarray,
+        np.einsum("...i,...i->...", sun_vec, up) / np.linalg.norm(sun_vec, axis=-1),
+    )
+
+
+def get_sun_elevation_array(
+    target_lat: ArrayLike, target_lon: ArrayLike, epoch_s: ArrayLike
+) -> np.ndarray:
+    """
+    Sun elevation angles for many locations and/or times.
+
+    Array version of get_sun_elevation. Inputs are broadcast together.
+
+    Args:
+        target_lat: Target latitudes in degrees
+        target_lon: Target longitudes in degrees
+        epoch_s: Unix epoch seconds (UTC)
+
+    Returns:
+        Sun elevation angles in degrees
+    """
+    sin_elevation = _sun_sin_elevation(target_lat, target_lon, epoch_s)
+    return cast(np.ndarray, np.degrees(np.arcsin(np.clip(sin_elevation, -1.0, 1.0))))
+
+
+def is_target_illuminated_array(
+    target_lat: ArrayLike,
+    target_lon: ArrayLike,
+    epoch_s: ArrayLike,
+    min_sun_elevation: float = 0.0,
+) -> np.ndarray:
+    """
+    Illumination of ground targets for many locations and/or times.
+
+    Array version of is_target_illuminated. Inputs are broadcast together.
+
+    Args:
+        target_lat: Target latitudes in degrees
+        target_lon: Target longitudes in degrees
+        epoch_s: Unix epoch seconds (UTC)
+        min_sun_elevation: Minimum sun elevation angle in degrees (default 0)
+
+    Returns:
+        Boolean array, True where the target is illuminated
+    """
+    return get_sun_elevation_array(target_lat, target_lon, epoch_s) >= (
+        min_sun_elevation
+    )
+
+
+def _epoch_seconds(timestamp: datetime) -> float:
+    """Unix epoch seconds of a datetime (naive datetimes are UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+def _sun_rate_bound(target_lat: np.ndarray) -> np.ndarray:
+    """
+    Upper bound on |d sin(sun elevation)/dt| (1/s) at each latitude.
+
+    The local up vector turns at the Earth rotation rate times cos(lat) and
+    the sun direction drifts at most SUN_DIRECTION_RATE_RAD_S.
+    """
+    return cast(
+        np.ndarray,
+        SUN_RATE_SAFETY_FACTOR
+        * (
+            EARTH_ROTATION_RATE_RAD_S * np.abs(np.cos(np.radians(target_lat)))
+            + SUN_DIRECTION_RATE_RAD_S
+        ),
+    )
+
+
+def _terminator_crossings(
+    target_lat: np.ndarray,
+    target_lon: np.ndarray,
+    threshold: float,
+    times: np.ndarray,
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Locate every threshold crossing of the sun elevation between samples.
+
+    An interval between two samples can only contain a crossing if its end
+    values differ in sign or are closer to the threshold than the elevation
+    rate bound allows the sun to travel in that time. Such intervals are
+    halved until they are shorter than DAYLIGHT_TOLERANCE_SECONDS, keeping
+    only halves that still may contain a crossing, so brief days or nights
+    between two coarse samples are not lost.
+
+    Args:
+        target_lat: Latitudes in degrees, shape (K,)
+        target_lon: Longitudes in degrees, shape (K,)
+        threshold: sin(min_sun_elevation)
+        times: Sample epoch seconds, shape (N,)
+        values: sin(sun elevation) - threshold at the samples, shape (K, N)
+
+    Returns:
+        Tuple of (rows, times, rising) for each crossing. Rising crossings
+        report the first lit time found, setting crossings the last one.
+    """
+    rate = _sun_rate_bound(target_lat)
+    lit = values >= 0
+    reach = rate[:, None] * np.diff(times)[None, :]
+    candidate = (lit[:, :-1] != lit[:, 1:]) | (
+        np.abs(values[:, :-1]) + np.abs(values[:, 1:]) <= reach
+    )
+    rows, cols = np.nonzero(candidate)
+    t0, t1 = times[cols], times[cols + 1]
+    f0, f1 = values[rows, cols], values[rows, cols + 1]
+
+    found_rows: List[np.ndarray] = []
+    found_times: List[np.ndarray] = []
+    found_rising: List[np.ndarray] = []
+    while rows.size:
+        done = t1 - t0 <= DAYLIGHT_TOLERANCE_SECONDS
+        crossing = done & ((f0 >= 0) != (f1 >= 0))
+        rising = f1[crossing] >= 0
+        found_rows.append(rows[crossing])
+        found_times.append(np.where(rising, t1[crossing], t0[crossing]))
+        found_rising.append(rising)
+
+        keep = ~done
+        rows, t0, t1, f0, f1 = rows[keep], t0[keep], t1[keep], f0[keep], f1[keep]
+        tm = 0.5 * (t0 + t1)
+        fm = (
+            _sun_sin_elevation(target_lat[rows], target_lon[rows], tm) - threshold
+            if rows.size
+            else tm
+        )
+
+        rows = np.concatenate((rows, rows))
+        t0, t1 = np.concatenate((t0, tm)), np.concatenate((tm, t1))
+        f0, f1 = np.concatenate((f0, fm)), np.concatenate((fm, f1))
+        keep = ((f0 >= 0) != (f1 >= 0)) | (
+            np.abs(f0) + np.abs(f1) <= rate[rows] * (t1 - t0)
+        )
+        rows, t0, t1, f0, f1 = rows[keep], t0[keep], t1[keep], f0[keep], f1[keep]
+
+    return (
+        np.concatenate(found_rows) if found_rows else np.empty(0, dtype=np.intp),
+        np.concatenate(found_times) if found_times else np.empty(0),
+        np.concatenate(found_rising) if found_rising else np.empty(0, dtype=bool),
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class DaylightIntervals:
+    """
+    Sunlit intervals of one ground location over a time window.
+
+    Build them for many targets at once with DaylightIntervals.compute().
+    A time t within the window is lit when sunrise_s[i] <= t <= sunset_s[i]
+    for some i; interval edges are within DAYLIGHT_TOLERANCE_SECONDS of the
+    true terminator crossings and err on the dark side. Times outside the
+    window are evaluated directly.
+
+    Attributes:
+        latitude: Target latitude in degrees
+        longitude: Target longitude in degrees
+        start_epoch_s: Window start (Unix epoch seconds)
+        end_epoch_s: Window end (Unix epoch seconds)
+        sunrise_s: Start of each sunlit interval (epoch seconds), sorted
+        sunset_s: End of each sunlit interval (epoch seconds), sorted
+        min_sun_elevation: Sun elevation threshold in degrees
+    """
+
+    latitude: float
+    longitude: float
+    start_epoch_s: float
+    end_epoch_s: float
+    sunrise_s: np.ndarray
+    sunset_s: np.ndarray
+    min_sun_elevation: float = 0.0
+
+    @classmethod
+    def compute(
+        cls,
+        latitudes: ArrayLike,
+        longitudes: ArrayLike,
+        start_time: datetime,
+        end_time: datetime,
+        min_sun_elevation: float = 0.0,
+    ) -> List["DaylightIntervals"]:
+        """
+        Sunlit intervals for many locations over one window.
+
+        The sun elevation of all locations is sampled every
+        DAYLIGHT_SAMPLE_SECONDS as one array, and only intervals that may
+        contain a sunrise or sunset are refined.
+
+        Args:
+            latitudes: Target latitudes in degrees
+            longitudes: Target longitudes in degrees
+            start_time: Window start (UTC)
+            end_time: Window end (UTC)
+            min_sun_elevation: Sun elevation threshold in degrees (default 0)
+
+        Returns:
+            One DaylightIntervals per location, in input order
+
+        Raises:
+            ValueError: If end_time is before start_time
+        """
+        if end_time < start_time:
+            raise ValueError("end_time must not be before start_time")
+
+        lat = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+        lon = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+        start_s, end_s = _epoch_seconds(start_time), _epoch_seconds(end_time)
+        num_samples = max(1, math.ceil((end_s - start_s) / DAYLIGHT_SAMPLE_SECONDS))
+        times = np.linspace(start_s, end_s, num_samples + 1)
+        threshold = math.sin(math.radians(min_sun_elevation))
+
+        result: List["DaylightIntervals"] = []
+        block = max(1, DAYLIGHT_BLOCK_ELEMENTS // times.size)
+        for first in range(0, lat.size, block):
+            block_lat, block_lon = (
+                lat[first : first + block],
+                lon[first : first + block],
+            )
+            values = (
+                _sun_sin_elevation(block_lat[:, None], block_lon[:, None], times)
+                - threshold
+            )
+            rows, crossing_times, rising = _terminator_crossings(
+                block_lat, block_lon, threshold, times, values
+            )
+            order = np.lexsort((crossing_times, rows))
+            rows, crossing_times, rising = (
+                rows[order],
+                crossing_times[order],
+                rising[order],
+            )
+            bounds = np.searchsorted(rows, np.arange(block_lat.size + 1))
+
+            for row in range(block_lat.size):
+                events = slice(bounds[row], bounds[row + 1])
+                row_times, row_rising = crossing_times[events], rising[events]
+                sunrise = row_times[row_rising]
+                sunset = row_times[~row_rising]
+                if values[row, 0] >= 0:
+                    sunrise = np.concatenate(([start_s], sunrise))
+                if values[row, -1] >= 0:
+                    sunset = np.concatenate((sunset, [end_s]))
+                result.append(
+                    cls(
+                        latitude=float(block_lat[row]),
+                        longitude=float(block_lon[row]),
+                        start_epoch_s=start_s,
+                        end_epoch_s=end_s,
+                        sunrise_s=sunrise,
+                        sunset_s=sunset,
+                        min_sun_elevation=min_sun_elevation,
+                    )
+                )
+        return result
+
+    def __len__(self) -> int:
+        return int(self.sunrise_s.size)
+
+    def covers(self, start_epoch_s: float, end_epoch_s: float) -> bool:
+        """Whether the intervals span the given window."""
+        return self.start_epoch_s <= start_epoch_s and end_epoch_s <= self.end_epoch_s
+
+    def is_lit(self, epoch_s: ArrayLike) -> np.ndarray:
+        """
+        Whether the location is sunlit at the given times.
+
+        Args:
+            epoch_s: Unix epoch seconds (UTC), any shape
+
+        Returns:
+            Boolean array of the same shape
+        """
+        t = np.asarray(epoch_s, dtype=np.float64)
+        if self.sunrise_s.size:
+            index = np.searchsorted(self.sunrise_s, t, side="right") - 1
+            lit = (index >= 0) & (t <= self.sunset_s[np.maximum(index, 0)])
+        else:
+            lit = np.zeros(t.shape, dtype=bool)
+
+        outside = (t < self.start_epoch_s) | (t > self.end_epoch_s)
+        if outside.any():
+            lit = np.where(
+                outside,
+                is_target_illuminated_array(
+                    self.latitude, self.longitude, t, self.min_sun_elevation
+                ),
+                lit,
+            )
+        return lit
+
+    def next_lit_time(self, epoch_s: float) -> float:
+        """
+        Earliest time at or after epoch_s at which the location may be lit.
+
+        Args:
+            epoch_s: Unix epoch seconds (UTC)
+
+        Returns:
+            epoch_s itself if lit or outside the window, the next sunrise
+            otherwise, or the window end if the location stays dark
+        """
+        if bool(self.is_lit(epoch_s)) or not (
+            self.start_epoch_s <= epoch_s <= self.end_epoch_s
+        ):
+            return epoch_s
+        index = int(np.searchsorted(self.sunrise_s, epoch_s, side="right"))
+        if index < self.sunrise_s.size:
+            return float(self.sunrise_s[index])
+        return self.end_epoch_s
+
+    def windows(self) -> List[Tuple[datetime, datetime]]:
+        """Sunlit intervals as (sunrise, sunset) naive UTC datetimes."""
+        return [
+            (
+                datetime.fromtimestamp(float(rise), tz=timezone.utc).replace(
+                    tzinfo=None
+                ),
+                datetime.fromtimestamp(float(sets), tz=timezone.utc).replace(
+                    tzinfo=None
+                ),
+            )
+            for rise, sets in zip(self.sunrise_s, self.sunset_s)
+        ]
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"DaylightIntervals(lat={self.latitude:.4f}, lon={self.longitude:.4f}, "
+            f"intervals={len(self)})"
+        )
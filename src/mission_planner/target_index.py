@@ -0,0 +1,217 @@
+"""
+Spatial index over ground targets.
+
+Targets are bucketed by their unit position vector on a uniform 3-D grid
+whose cell size matches the access radius. Satellite samples are grouped
+by the cell of their sub-satellite point, and each group only needs to be
+checked against the targets in the surrounding 3x3x3 cells. Samples far
+from every target cost nothing, so dense target decks clustered in one
+region are screened in proportion to the time the satellite spends near
+them rather than to targets x samples.
+"""
+
+import math
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .targets import GroundTarget
+from .utils import EARTH_RADIUS_KM, ground_arc_distance_km
+
+# Extra access radius covering the index's spherical-Earth simplifications
+INDEX_PADDING_RAD = 1e-3
+# Smallest grid cell (unit-sphere chord); keeps the grid size bounded
+MIN_CELL_SIZE = 0.02
+
+_NEIGHBOR_OFFSETS = np.array(
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+)
+
+
+def access_half_angle_rad(target: GroundTarget, sat_alt_km: float) -> float:
+    """
+    Earth central angle from the sub-satellite point within which a target can be seen.
+
+    Imaging targets are limited by the spacecraft roll cone (plus the 0.1°
+    aiming tolerance used by the visibility check), communication targets by
+    their elevation mask.
+
+    Args:
+        target: Ground target
+        sat_alt_km: Satellite altitude in km
+
+    Returns:
+        Central angle in radians
+    """
+    if target.mission_type == "imaging":
+        max_roll = getattr(target, "max_spacecraft_roll", None) or 45.0
+        return ground_arc_distance_km(sat_alt_km, max_roll + 0.1) / EARTH_RADIUS_KM
+
+    elevation_rad = math.radians(target.elevation_mask)
+    cos_arg = EARTH_RADIUS_KM * math.cos(elevation_rad) / (EARTH_RADIUS_KM + sat_alt_km)
+    return math.acos(min(1.0, cos_arg)) - elevation_rad
+
+
+def _unit_vectors(latitudes_deg: np.ndarray, longitudes_deg: np.ndarray) -> np.ndarray:
+    """Unit position vectors (N, 3) for geodetic latitudes/longitudes on a sphere."""
+    lat_rad = np.radians(latitudes_deg)
+    lon_rad = np.radians(longitudes_deg)
+    cos_lat = np.cos(lat_rad)
+    return np.stack(
+        (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)), axis=1
+    )
+
+
+class TargetIndex:
+    """
+    Bucket grid over target unit vectors for access-radius queries.
+
+    The grid is built for a query radius; queries with a larger radius
+    rebuild it. Row numbers returned by queries index the target list the
+    index was built from.
+    """
+
+    def __init__(self, targets: Sequence[GroundTarget]) -> None:
+        """
+        Initialize index.
+
+        Args:
+            targets: Ground targets (order defines row numbers)
+        """
+        self.targets: List[GroundTarget] = list(targets)
+        self.unit_vectors = _unit_vectors(
+            np.array([t.latitude for t in self.targets], dtype=np.float64),
+            np.array([t.longitude for t in self.targets], dtype=np.float64),
+        )
+        self._cell_size = 0.0
+        self._cells_per_axis = 0
+        self._buckets: Dict[int, np.ndarray] = {}
+        self._neighborhoods: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def access_radius_rad(self, max_sat_alt_km: float) -> float:
+        """
+        Query radius covering every target's access region.
+
+        Args:
+            max_sat_alt_km: Highest satellite altitude over the search window
+
+        Returns:
+            Largest access half-angle over all targets, plus INDEX_PADDING_RAD
+        """
+        if not self.targets:
+            return 0.0
+        return (
+            max(access_half_angle_rad(t, max_sat_alt_km) for t in self.targets)
+            + INDEX_PADDING_RAD
+        )
+
+    def query(self, lat_deg: float, lon_deg: float, radius_rad: float) -> np.ndarray:
+        """
+        Rows of targets within a central angle of a point.
+
+        Args:
+            lat_deg: Latitude of the point in degrees
+            lon_deg: Longitude of the point in degrees
+            radius_rad: Central angle in radians
+
+        Returns:
+            Sorted target rows
+        """
+        point = _unit_vectors(np.array([lat_deg]), np.array([lon_deg]))
+        for rows, _ in self.candidate_groups(point, radius_rad):
+            inside = self.unit_vectors[rows] @ point[0] >= math.cos(radius_rad)
+            return np.asarray(rows[inside])
+        return np.empty(0, dtype=np.intp)
+
+    def candidate_groups(
+        self, sample_vectors: np.ndarray, radius_rad: float
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Group samples by grid cell with the targets that may be near them.
+
+        Every target within radius_rad of a sample is among the rows yielded
+        with that sample's group; rows may also include targets slightly
+        outside it, so callers still apply their own test.
+
+        Args:
+            sample_vectors: Unit vectors of sub-satellite points, shape (N, 3)
+            radius_rad: Query central angle in radians
+
+        Yields:
+            Tuples of (target rows, sample indices), both sorted; groups with
+            no nearby targets are skipped
+        """
+        if not self.targets or sample_vectors.shape[0] == 0:
+            return
+        self._build(radius_rad)
+
+        cells = self._cell_ids(sample_vectors)
+        order = np.argsort(cells, kind="stable")
+        unique_cells, group_starts = np.unique(cells[order], return_index=True)
+        group_ends = np.append(group_starts[1:], order.size)
+        for cell, begin, end in zip(
+            unique_cells.tolist(), group_starts.tolist(), group_ends.tolist()
+        ):
+            rows = self._neighborhood(cell)
+            if rows.size:
+                yield rows, order[begin:end]
+
+    def _build(self, radius_rad: float) -> None:
+        """Bucket targets on a grid whose cells span the query radius."""
+        chord = 2.0 * math.sin(min(radius_rad, math.pi) / 2.0)
+        cell_size = max(chord, MIN_CELL_SIZE)
+        if self._buckets and cell_size <= self._cell_size:
+            return
+
+        self._cell_size = cell_size
+        self._cells_per_axis = int(math.ceil(2.0 / cell_size)) + 1
+        cells = self._cell_ids(self.unit_vectors)
+        order = np.argsort(cells, kind="stable")
+        unique_cells, group_starts = np.unique(cells[order], return_index=True)
+        self._buckets = {
+            cell: rows
+            for cell, rows in zip(
+                unique_cells.tolist(), np.split(order, group_starts[1:])
+            )
+        }
+        self._neighborhoods = {}
+
+    def _cell_coords(self, vectors: np.ndarray) -> np.ndarray:
+        """Integer grid coordinates (N, 3) of unit vectors."""
+        coords = np.floor((vectors + 1.0) / self._cell_size).astype(np.int64)
+        return np.clip(coords, 0, self._cells_per_axis - 1)
+
+    def _cell_ids(self, vectors: np.ndarray) -> np.ndarray:
+        """Flat grid cell ID per unit vector."""
+        coords = self._cell_coords(vectors)
+        n = self._cells_per_axis
+        return np.asarray(coords[:, 0] + n * (coords[:, 1] + n * coords[:, 2]))
+
+    def _neighborhood(self, cell: int) -> np.ndarray:
+        """Sorted rows of targets in the 3x3x3 block of cells around a cell."""
+        rows = self._neighborhoods.get(cell)
+        if rows is not None:
+            return rows
+
+        n = self._cells_per_axis
+        center = np.array([cell % n, (cell // n) % n, cell // (n * n)])
+        neighbors = center + _NEIGHBOR_OFFSETS
+        valid = ((neighbors >= 0) & (neighbors < n)).all(axis=1)
+        neighbors = neighbors[valid]
+        buckets = [
+            self._buckets[c]
+            for c in (
+                neighbors[:, 0] + n * (neighbors[:, 1] + n * neighbors[:, 2])
+            ).tolist()
+            if c in self._buckets
+        ]
+        rows = np.sort(np.concatenate(buckets)) if buckets else np.empty(0, np.intp)
+        self._neighborhoods[cell] = rows
+        return rows
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"TargetIndex(targets={len(self.targets)})"
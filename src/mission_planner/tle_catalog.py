@@ -0,0 +1,349 @@
+"""
+Indexed loader for large TLE catalog files.
+
+A TLECatalog parses a TLE file once into a compact index (byte offset per
+entry, name and NORAD ID lookups, and a trigram index for substring search)
+and reads individual entries by seeking to their offset. Parsed entries are
+kept in a bounded LRU cache, and the index is rebuilt only when the file's
+modification time or size changes.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENTRY_CACHE_SIZE = 512
+MAX_OPEN_CATALOGS = 16
+
+_catalogs: "OrderedDict[str, TLECatalog]" = OrderedDict()
+_catalogs_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TLEEntry:
+    """
+    One satellite from a TLE catalog.
+
+    Attributes:
+        name: Satellite name (title line)
+        line1: TLE line 1
+        line2: TLE line 2
+    """
+
+    name: str
+    line1: str
+    line2: str
+
+    @property
+    def norad_id(self) -> str:
+        """NORAD catalog number from line 1."""
+        return self.line1[2:7].strip()
+
+    def lines(self) -> List[str]:
+        """Return [name, line1, line2] as accepted by SatelliteOrbit."""
+        return [self.name, self.line1, self.line2]
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to dictionary."""
+        return {"name": self.name, "line1": self.line1, "line2": self.line2}
+
+
+class TLECatalog:
+    """
+    Offset index over a TLE file.
+
+    Name lookups are case-insensitive. Entries are three-line sets (name,
+    line 1, line 2); two-line sets without a title line are indexed under
+    their NORAD ID.
+    """
+
+    def __init__(
+        self,
+        tle_file_path: Union[str, Path],
+        cache_size: int = DEFAULT_ENTRY_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize catalog and build the index.
+
+        Args:
+            tle_file_path: Path to TLE file
+            cache_size: Maximum number of parsed entries kept in memory
+
+        Raises:
+            FileNotFoundError: If TLE file doesn't exist
+        """
+        self.path = Path(tle_file_path)
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._offsets: List[int] = []
+        self._names: List[str] = []
+        self._names_upper: List[str] = []
+        self._by_name: Dict[str, int] = {}
+        self._by_norad_id: Dict[str, int] = {}
+        self._trigrams: Dict[str, List[int]] = {}
+        self._entries: "OrderedDict[int, TLEEntry]" = OrderedDict()
+
+        self._refresh()
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._offsets)
+
+    def names(self) -> List[str]:
+        """Satellite names in file order."""
+        self._refresh()
+        return list(self._names)
+
+    def get(self, name: str) -> Optional[TLEEntry]:
+        """
+        Look up a satellite by exact (case-insensitive) name.
+
+        Args:
+            name: Satellite name
+
+        Returns:
+            First entry with that name, or None
+        """
+        self._refresh()
+        index = self._by_name.get(name.strip().upper())
+        return None if index is None else self._entry(index)
+
+    def get_by_norad_id(self, norad_id: Union[int, str]) -> Optional[TLEEntry]:
+        """
+        Look up a satellite by NORAD catalog number.
+
+        Args:
+            norad_id: NORAD ID (leading zeros optional)
+
+        Returns:
+            Entry, or None if the ID is not in the catalog
+        """
+        self._refresh()
+        index = self._by_norad_id.get(str(norad_id).strip().lstrip("0") or "0")
+        return None if index is None else self._entry(index)
+
+    def find(self, name: str) -> Optional[TLEEntry]:
+        """
+        First entry (in file order) whose name contains the given text.
+
+        Matches the lookup rule of SatelliteOrbit.from_tle_file.
+
+        Args:
+            name: Case-insensitive text to look for in satellite names
+
+        Returns:
+            Entry, or None if nothing matches
+        """
+        matches = self._match_indices(name, limit=1)
+        return self._entry(matches[0]) if matches else None
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[TLEEntry]:
+        """
+        Entries whose name contains the query (case-insensitive), in file order.
+
+        Args:
+            query: Search text
+            limit: Optional maximum number of results
+
+        Returns:
+            Matching entries
+        """
+        return [self._entry(i) for i in self._match_indices(query, limit)]
+
+    def count(self, query: str) -> int:
+        """Number of entries whose name contains the query."""
+        return len(self._match_indices(query))
+
+    def __iter__(self) -> Iterator[TLEEntry]:
+        """Iterate over all entries in file order (one sequential read)."""
+        self._refresh()
+        with open(self.path, "rb") as f:
+            for offset in list(self._offsets):
+                f.seek(offset)
+                yield self._read_entry(f)
+
+    def _match_indices(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Indices of entries whose name contains query, in file order."""
+        self._refresh()
+        needle = query.strip().upper()
+        if not needle:
+            return []
+
+        if len(needle) < 3:
+            # Too short for the trigram index; names are already in memory
+            found = (i for i, name in enumerate(self._names_upper) if needle in name)
+            return list(islice(found, limit))
+
+        postings = []
+        for trigram in _trigrams(needle):
+            posting = self._trigrams.get(trigram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        common: Set[int] = set(postings[0])
+        for posting in postings[1:]:
+            common.intersection_update(posting)
+            if not common:
+                return []
+
+        matches = []
+        for index in sorted(common):
+            if needle in self._names_upper[index]:
+                matches.append(index)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def _entry(self, index: int) -> TLEEntry:
+        """Return a parsed entry, reading it from disk on a cache miss."""
+        with self._lock:
+            entry = self._entries.get(index)
+            if entry is not None:
+                self._entries.move_to_end(index)
+                return entry
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offsets[index])
+            entry = self._read_entry(f)
+
+        with self._lock:
+            self._entries[index] = entry
+            if len(self._entries) > self.cache_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _read_entry(f: BinaryIO) -> TLEEntry:
+        """Parse the entry starting at the current file position."""
+        lines: List[str] = []
+        while len(lines) < 3:
+            raw = f.readline()
+            if not raw:
+                break
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                lines.append(line)
+        if len(lines) >= 2 and lines[0].startswith("1 ") and lines[1].startswith("2 "):
+            # Two-line set without a title line
+            return TLEEntry(lines[0][2:7].strip(), lines[0], lines[1])
+        return TLEEntry(lines[0], lines[1], lines[2])
+
+    def _refresh(self) -> None:
+        """Rebuild the index if the file changed since it was built."""
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return
+        with self._lock:
+            if signature != self._signature:
+                self._build_index()
+                self._signature = signature
+
+    def _build_index(self) -> None:
+        """Scan the file once, recording the offset and keys of each entry."""
+        offsets: List[int] = []
+        names: List[str] = []
+        norad_ids: List[str] = []
+
+        # Last two non-empty (offset, line) pairs before the current line
+        previous: Optional[Tuple[int, str]] = None
+        before_previous: Optional[Tuple[int, str]] = None
+        position = 0
+        with open(self.path, "rb") as f:
+            for raw in f:
+                offset = position
+                position += len(raw)
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+
+                if (
+                    line.startswith("2 ")
+                    and previous is not None
+                    and previous[1].startswith("1 ")
+                ):
+                    norad_id = previous[1][2:7].strip()
+                    title = before_previous
+                    if title is not None and not title[1].startswith(("1 ", "2 ")):
+                        offsets.append(title[0])
+                        names.append(title[1])
+                    else:
+                        offsets.append(previous[0])
+                        names.append(norad_id)
+                    norad_ids.append(norad_id)
+                    previous = before_previous = None
+                    continue
+
+                before_previous, previous = previous, (offset, line)
+
+        by_name: Dict[str, int] = {}
+        by_norad_id: Dict[str, int] = {}
+        trigrams: Dict[str, List[int]] = {}
+        names_upper = [name.upper() for name in names]
+        for index, (name_upper, norad_id) in enumerate(zip(names_upper, norad_ids)):
+            by_name.setdefault(name_upper, index)
+            by_norad_id.setdefault(norad_id.lstrip("0") or "0", index)
+            for trigram in _trigrams(name_upper):
+                posting = trigrams.setdefault(trigram, [])
+                if not posting or posting[-1] != index:
+                    posting.append(index)
+
+        self._offsets = offsets
+        self._names = names
+        self._names_upper = names_upper
+        self._by_name = by_name
+        self._by_norad_id = by_norad_id
+        self._trigrams = trigrams
+        self._entries = OrderedDict()
+
+        logger.debug(f"Indexed {len(offsets)} TLE entries from {self.path}")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"TLECatalog(path='{self.path}', entries={len(self._offsets)})"
+
+
+def get_tle_catalog(tle_file_path: Union[str, Path]) -> TLECatalog:
+    """
+    Return the shared catalog for a TLE file, creating it on first use.
+
+    Catalogs are kept per resolved path (up to MAX_OPEN_CATALOGS, least
+    recently used dropped first) and reindex themselves when the file changes.
+
+    Args:
+        tle_file_path: Path to TLE file
+
+    Returns:
+        TLECatalog for the file
+
+    Raises:
+        FileNotFoundError: If TLE file doesn't exist
+    """
+    key = str(Path(tle_file_path).resolve())
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is not None:
+            _catalogs.move_to_end(key)
+            return catalog
+
+    catalog = TLECatalog(key)
+    with _catalogs_lock:
+        _catalogs[key] = catalog
+        while len(_catalogs) > MAX_OPEN_CATALOGS:
+            _catalogs.popitem(last=False)
+    return catalog
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Set of three-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
@@ -7,17 +7,35 @@ over ground targets with configurable elevation masks.
 
 import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
 from orbit_predictor.locations import Location  # type: ignore[import-untyped]
 from orbit_predictor.predictors import TLEPredictor  # type: ignore[import-untyped]
 
-from .orbit import SatelliteOrbit
-from .sunlight import is_target_illuminated
+from .ephemeris import Ephemeris
+from .ephemeris_cache import build_ephemeris
+from .orbit import (
+    PropagatedStates,
+    SatelliteOrbit,
+    datetime_to_epoch_seconds,
+    epoch_seconds_to_datetime,
+)
+from .sunlight import DaylightIntervals, is_target_illuminated
+from .target_index import INDEX_PADDING_RAD, TargetIndex, access_half_angle_rad
 from .targets import GroundTarget
 
 logger = logging.getLogger(__name__)
@@ -37,11 +55,34 @@ ORBITAL_SKIP_DISTANCE_KM = (
 )
 MAX_ORBITAL_SKIP_SECONDS = 1200.0  # Maximum skip ahead time (20 minutes)
 
+# Safe coarse steps (refinement_method="brent")
+EARTH_ROTATION_RATE_RAD_S = 7.2921159e-5
+MOTION_BOUND_SAMPLE_SECONDS = 60.0  # Sample spacing for altitude/rate bounds
+MOTION_BOUND_ALTITUDE_PAD_KM = 10.0  # Covers extrema between bound samples
+MOTION_BOUND_SAFETY_FACTOR = 1.05  # Covers geodetic vs geocentric angle rates
+REFINEMENT_METHODS = ("bisection", "brent")
+
+# Multi-target visibility matrix
+MATRIX_BLOCK_ELEMENTS = 1_000_000  # (targets x samples) evaluated per block
+MATRIX_CANDIDATE_SLACK = 1e-6  # Widening of the screening thresholds (sine/cosine)
+MATRIX_MIN_TARGETS = 16  # Serial searches with this many targets use the matrix
+
+# Streaming pass search (iter_passes)
+STREAM_CHUNK = timedelta(days=1)  # Default time block per search
+STREAM_LOOKAHEAD_SECONDS = 1800.0  # Initial search past a block to complete passes
+
+# PassDetails enrichment sections, in computation order (quality reads the
+# geometry and lighting sections)
+ENRICHMENT_SECTIONS = ("geometry", "lighting", "quality", "maneuver")
+
+# Sections an enrichment section reads while it is computed
+ENRICHMENT_DEPENDENCIES = {"quality": ("geometry", "lighting")}
+
 # Cache configuration
 SATELLITE_POSITION_CACHE_SIZE = 10000  # LRU cache size for satellite positions
 
 
-@dataclass
+@dataclass(slots=True)
 class PassGeometry:
     """Geometry data at a specific moment during a pass."""
 
@@ -63,7 +104,7 @@ class PassGeometry:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PassLighting:
     """Lighting conditions during a pass."""
 
@@ -86,7 +127,7 @@ class PassLighting:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PassQuality:
     """Quality metrics for imaging passes."""
 
@@ -107,7 +148,7 @@ class PassQuality:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PassManeuver:
     """Maneuver requirements for a pass."""
 
@@ -130,9 +171,74 @@ class PassManeuver:
         return result
 
 
+def normalize_enrichment_sections(
+    sections: Optional[Iterable[str]],
+) -> FrozenSet[str]:
+    """
+    Validate a selection of PassDetails enrichment sections.
+
+    Args:
+        sections: Section names, or None for all of ENRICHMENT_SECTIONS
+
+    Returns:
+        Frozen set of section names
+
+    Raises:
+        ValueError: If a section name is unknown
+    """
+    if sections is None:
+        return frozenset(ENRICHMENT_SECTIONS)
+    selected = frozenset(sections)
+    unknown = selected.difference(ENRICHMENT_SECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown enrichment sections {sorted(unknown)}; "
+            f"expected a subset of {list(ENRICHMENT_SECTIONS)}"
+        )
+    return selected
+
+
+class _LazySection:
+    """
+    PassDetails field computed on first access when its section is pending.
+
+    The value lives in the instance ``__dict__`` under the underscored field
+    name, so once computed (or assigned) it is read back without recomputing.
+    """
+
+    def __init__(self, section: str) -> None:
+        self.section = section
+        self.attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return None  # Dataclass field default
+        if self.section in obj._pending_sections:
+            obj._resolve_section(self.section)
+        return obj.__dict__.get(self.attr)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.attr] = value
+
+
+def _lazy_section(section: str) -> Any:
+    """Field default making a PassDetails field lazily computed."""
+    return _LazySection(section)
+
+
 @dataclass
 class PassDetails:
-    """STK-like comprehensive details about a satellite pass over a target."""
+    """
+    STK-like comprehensive details about a satellite pass over a target.
+
+    The enrichment sections (geometry_aos/tca/los, lighting, quality,
+    maneuver) may be attached lazily by
+    VisibilityCalculator.enrich_pass_with_stk_data(lazy=True); each section
+    is then computed on first access and memoized.
+    """
 
     # Core identification
     target_name: str
@@ -149,13 +255,14 @@ class PassDetails:
     satellite_id: str = ""
     pass_index: int = 0
 
-    # Enhanced STK-like data
-    geometry_aos: Optional[PassGeometry] = None  # Geometry at AOS
-    geometry_tca: Optional[PassGeometry] = None  # Geometry at TCA (max elevation)
-    geometry_los: Optional[PassGeometry] = None  # Geometry at LOS
-    lighting: Optional[PassLighting] = None
-    quality: Optional[PassQuality] = None
-    maneuver: Optional[PassManeuver] = None
+    # Enhanced STK-like data (computed on first access when attached lazily)
+    # Geometry at AOS, TCA (max elevation) and LOS
+    geometry_aos: Optional[PassGeometry] = _lazy_section("geometry")
+    geometry_tca: Optional[PassGeometry] = _lazy_section("geometry")
+    geometry_los: Optional[PassGeometry] = _lazy_section("geometry")
+    lighting: Optional[PassLighting] = _lazy_section("lighting")
+    quality: Optional[PassQuality] = _lazy_section("quality")
+    maneuver: Optional[PassManeuver] = _lazy_section("maneuver")
 
     # Legacy fields for backward compatibility
     incidence_angle_deg: Optional[float] = None
@@ -168,8 +275,69 @@ class PassDetails:
     _imaging_opportunities: Optional[List[Any]] = None
     _imaging_window: Optional[List[Any]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert pass details to dictionary with STK-like structure."""
+    # Lazy enrichment: sections still to compute and the function computing one
+    _pending_sections: FrozenSet[str] = field(
+        default=frozenset(), repr=False, compare=False
+    )
+    _enrichment: Optional[Callable[["PassDetails", str], None]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def _resolve_section(self, section: str) -> None:
+        """
+        Compute a pending enrichment section.
+
+        The section leaves the pending set while it is computed (its own
+        fields are read back during the computation) and returns to it if
+        the computation raises. The enrichment function, and the calculator
+        it is bound to, is released once no section is pending.
+        """
+        self._pending_sections = self._pending_sections - {section}
+        try:
+            if self._enrichment is not None:
+                self._enrichment(self, section)
+        except BaseException:
+            self._pending_sections = self._pending_sections | {section}
+            raise
+        if not self._pending_sections:
+            self._enrichment = None
+
+    def __copy__(self) -> "PassDetails":
+        """Shallow copy; pending sections stay lazy on the copy."""
+        duplicate = self.__class__.__new__(self.__class__)
+        duplicate.__dict__.update(self.__dict__)
+        return duplicate
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle state with every pending section computed.
+
+        The enrichment function is bound to a VisibilityCalculator, which
+        cannot be pickled, so pending sections are resolved (and memoized
+        on this pass) before the state is taken.
+        """
+        for section in ENRICHMENT_SECTIONS:
+            if section in self._pending_sections:
+                self._resolve_section(section)
+        state = self.__dict__.copy()
+        state["_pending_sections"] = frozenset()
+        state["_enrichment"] = None
+        return state
+
+    def to_dict(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Convert pass details to dictionary with STK-like structure.
+
+        Args:
+            sections: Enrichment sections to include (default: all). Sections
+                left out are neither serialized nor computed; without the
+                geometry section off_nadir_deg is derived from max elevation.
+
+        Returns:
+            Dictionary of core pass fields and the selected sections
+        """
+        include = normalize_enrichment_sections(sections)
+        geometry_tca = self.geometry_tca if "geometry" in include else None
         duration_s = (self.end_time - self.start_time).total_seconds()
 
         result = {
@@ -194,32 +362,31 @@ class PassDetails:
         }
 
         # Add geometry at key moments
-        if self.geometry_aos:
-            result["geometry_aos"] = self.geometry_aos.to_dict()
-        if self.geometry_tca:
-            result["geometry_tca"] = self.geometry_tca.to_dict()
-        if self.geometry_los:
-            result["geometry_los"] = self.geometry_los.to_dict()
+        if "geometry" in include:
+            if self.geometry_aos:
+                result["geometry_aos"] = self.geometry_aos.to_dict()
+            if geometry_tca:
+                result["geometry_tca"] = geometry_tca.to_dict()
+            if self.geometry_los:
+                result["geometry_los"] = self.geometry_los.to_dict()
 
         # Add lighting conditions
-        if self.lighting:
+        if "lighting" in include and self.lighting:
             result["lighting"] = self.lighting.to_dict()
 
         # Add quality metrics
-        if self.quality:
+        if "quality" in include and self.quality:
             result["quality"] = self.quality.to_dict()
 
         # Add maneuver requirements
-        if self.maneuver:
+        if "maneuver" in include and self.maneuver:
             result["maneuver"] = self.maneuver.to_dict()
 
         # Explicit off-nadir angle for frontend display
         # For imaging passes: max_elevation = 90 - off_nadir, so off_nadir = 90 - max_elevation
         # For communication passes: off_nadir ≈ 90 - elevation (zenith angle approximation)
-        if self.geometry_tca and hasattr(self.geometry_tca, "incidence_angle_deg"):
-            result["off_nadir_deg"] = round(
-                abs(self.geometry_tca.incidence_angle_deg), 2
-            )
+        if geometry_tca and hasattr(geometry_tca, "incidence_angle_deg"):
+            result["off_nadir_deg"] = round(abs(geometry_tca.incidence_angle_deg), 2)
         else:
             result["off_nadir_deg"] = round(90.0 - self.max_elevation, 2)
 
@@ -348,6 +515,11 @@ class VisibilityCalculator:
     ADAPTIVE_STEP_SHRINK_FACTOR = 0.3  # Shrink aggressively near transitions
     ADAPTIVE_STEP_GROW_FACTOR = 1.2  # Grow conservatively (stay cautious)
     ADAPTIVE_MAX_REFINEMENT_ITERS = 30  # More iterations for accuracy
+    ADAPTIVE_REFINEMENT_METHOD = "bisection"  # Default edge refinement
+
+    # Imaging opportunity extraction
+    IMAGING_SAMPLE_SECONDS = 10.0  # Sample spacing inside adaptive windows
+    IMAGING_MIN_SEPARATION_SECONDS = 0.0  # Spacing of kept samples (0 keeps all)
 
     # Speed-optimized preset (use only after validation):
     # ADAPTIVE_INITIAL_STEP_SECONDS = 60.0
@@ -359,17 +531,44 @@ class VisibilityCalculator:
     # ADAPTIVE_STEP_GROW_FACTOR = 1.5
     # ADAPTIVE_MAX_REFINEMENT_ITERS = 20
 
-    def __init__(self, satellite: "SatelliteOrbit", use_adaptive: bool = False) -> None:
+    def __init__(
+        self,
+        satellite: "SatelliteOrbit",
+        use_adaptive: bool = False,
+        ephemeris: Optional[Ephemeris] = None,
+        refinement_method: Optional[str] = None,
+    ) -> None:
         """
         Initialize visibility calculator with satellite orbit predictor.
 
         Args:
             satellite: SatelliteOrbit instance with predictor
             use_adaptive: Enable adaptive time-stepping (default: False for backward compatibility)
-        """
+            ephemeris: Shared interpolated ephemeris for the satellite. If not
+                given, one is built on first use for the search window.
+            refinement_method: Adaptive edge refinement, "bisection" (default)
+                or "brent". Brent mode root-finds on the continuous event
+                function and takes provably safe coarse steps.
+
+        Raises:
+            ValueError: If refinement_method is not recognised
+        """
+        refinement_method = refinement_method or self.ADAPTIVE_REFINEMENT_METHOD
+        if refinement_method not in REFINEMENT_METHODS:
+            raise ValueError(
+                f"Invalid refinement method: {refinement_method}. "
+                f"Must be one of {REFINEMENT_METHODS}."
+            )
+
         self.satellite = satellite
         self.predictor = satellite.predictor
         self.use_adaptive = use_adaptive
+        self.ephemeris = ephemeris
+        self.refinement_method = refinement_method
+        self.event_evaluations = 0  # Event function calls (adaptive search cost)
+        self._motion_bounds: Dict[
+            Tuple[datetime, datetime], Tuple[float, float, float, float]
+        ] = {}
         self._all_imaging_opportunities: List[Any] = (
             []
         )  # Store all imaging opportunities for visualization
@@ -379,6 +578,9 @@ class VisibilityCalculator:
         self._location_cache: Dict[Tuple[float, float, float], Location] = (
             {}
         )  # Cache Location objects per target
+        self._daylight_cache: Dict[Tuple[float, float], DaylightIntervals] = (
+            {}
+        )  # Sunlit intervals per optical target location
 
         # Create a bound LRU-cached method for satellite positions
         # This prevents unbounded memory growth during long mission analyses
@@ -443,20 +645,89 @@ class VisibilityCalculator:
             )
         return self._location_cache[key]
 
-    def _get_satellite_position_impl(self, timestamp_rounded: datetime) -> Any:
+    def _get_satellite_position_impl(
+        self, epoch_second: int
+    ) -> Tuple[float, float, float]:
+        """
+        Get satellite position for a whole second (implementation for LRU cache).
+
+        Note: This method is wrapped by LRU cache in __init__. It is keyed by
+        integer epoch seconds, which hash far faster than datetimes.
+
+        Args:
+            epoch_second: Unix epoch second (UTC), truncated
+
+        Returns:
+            Tuple of (latitude, longitude, altitude_km)
+        """
+        return self._position_at(float(epoch_second))
+
+    def ensure_ephemeris(self, start_time: datetime, end_time: datetime) -> None:
+        """
+        Make sure an interpolated ephemeris covers the search window.
+
+        Builds one Ephemeris for the window when none is attached or the
+        attached one does not cover it, so every target searched over the
+        window shares a single propagation. Node blocks come from the disk
+        ephemeris cache when one is configured.
+
+        Args:
+            start_time: Start of search window (UTC)
+            end_time: End of search window (UTC)
+        """
+        if self.ephemeris is not None and self.ephemeris.covers(start_time, end_time):
+            return
+        try:
+            self.set_ephemeris(build_ephemeris(self.satellite, start_time, end_time))
+        except ValueError as e:
+            logger.warning(f"Could not build ephemeris, using SGP4 directly: {e}")
+            self.set_ephemeris(None)
+
+    def set_ephemeris(self, ephemeris: Optional[Ephemeris]) -> None:
+        """
+        Attach an ephemeris built elsewhere (e.g. shared between processes).
+
+        Args:
+            ephemeris: Ephemeris of this calculator's satellite, or None to
+                propagate with SGP4 directly
         """
-        Get satellite position for timestamp (implementation for LRU cache).
+        self.ephemeris = ephemeris
+        self._get_satellite_position.cache_clear()
 
-        Note: This method is wrapped by LRU cache in __init__.
-        The timestamp should be pre-rounded for consistent cache hits.
+    def get_satellite_position(self, timestamp: datetime) -> Tuple[float, float, float]:
+        """
+        Get satellite (lat, lon, alt_km), from the ephemeris when it covers timestamp.
 
         Args:
-            timestamp_rounded: UTC datetime (rounded to nearest second)
+            timestamp: UTC datetime
 
         Returns:
-            Satellite position object
+            Tuple of (latitude, longitude, altitude_km)
+        """
+        if self.ephemeris is not None and self.ephemeris.covers(timestamp):
+            return self.ephemeris.get_position(timestamp)
+        return self.satellite.get_position(timestamp)
+
+    def _position_at(self, epoch_s: float) -> Tuple[float, float, float]:
         """
-        return self.predictor.get_position(timestamp_rounded)
+        Satellite (lat, lon, alt_km) at epoch seconds.
+
+        Used by the adaptive search, which keeps time as float seconds and
+        only builds datetimes for SGP4 calls outside the ephemeris.
+        """
+        if self.ephemeris is not None and self.ephemeris.covers(epoch_s):
+            return self.ephemeris.position_at(epoch_s)
+        return self.satellite.get_position(epoch_seconds_to_datetime(epoch_s))
+
+    def _propagate(self, epoch_s: np.ndarray) -> PropagatedStates:
+        """Batch satellite states, from the ephemeris when it covers all samples."""
+        if (
+            self.ephemeris is not None
+            and epoch_s.size
+            and self.ephemeris.covers(float(epoch_s[0]), float(epoch_s[-1]))
+        ):
+            return self.ephemeris.propagate(epoch_s)
+        return self.satellite.propagate(epoch_s)
 
     def calculate_elevation_azimuth(
         self, target: GroundTarget, timestamp: datetime
@@ -475,14 +746,14 @@ class VisibilityCalculator:
             # Get cached location object
             location = self._get_location(target)
 
-            # Get cached satellite position (round to nearest second for cache hits)
-            sat_position = self._get_satellite_position(
-                timestamp.replace(microsecond=0)
+            # Get cached satellite position (truncated to the second for cache hits)
+            sat_lat, sat_lon, sat_alt = self._get_satellite_position(
+                math.floor(datetime_to_epoch_seconds(timestamp))
             )
 
             # Calculate elevation and azimuth
-            elevation = self._calculate_elevation(location, sat_position, timestamp)
-            azimuth = self._calculate_azimuth(location, sat_position, timestamp)
+            elevation = self._elevation_from_llh(location, sat_lat, sat_lon, sat_alt)
+            azimuth = self._azimuth_from_llh(location, sat_lat, sat_lon)
 
             return elevation, azimuth
 
@@ -529,25 +800,36 @@ class VisibilityCalculator:
             sat_position: Satellite position
             timestamp: UTC datetime
 
+        Returns:
+            Elevation angle in degrees
+        """
+        sat_lat, sat_lon, sat_alt_km = sat_position.position_llh
+        return self._elevation_from_llh(location, sat_lat, sat_lon, sat_alt_km)
+
+    def _elevation_from_llh(
+        self, location: Location, sat_lat: float, sat_lon: float, sat_alt_km: float
+    ) -> float:
+        """
+        Elevation angle from a ground location to a satellite (lat, lon, alt_km).
+
+        Args:
+            location: Ground location
+            sat_lat, sat_lon, sat_alt_km: Satellite position (degrees, km)
+
         Returns:
             Elevation angle in degrees
         """
         # Earth radius in km
         earth_radius = EARTH_RADIUS_KM
 
-        # Extract satellite position from position_llh
-        sat_lat, sat_lon, sat_alt_km = sat_position.position_llh
-
         # Calculate satellite ECEF coordinates
         sat_lat_rad = math.radians(sat_lat)
         sat_lon_rad = math.radians(sat_lon)
-        sat_x = (
-            (earth_radius + sat_alt_km) * math.cos(sat_lat_rad) * math.cos(sat_lon_rad)
-        )
-        sat_y = (
-            (earth_radius + sat_alt_km) * math.cos(sat_lat_rad) * math.sin(sat_lon_rad)
-        )
-        sat_z = (earth_radius + sat_alt_km) * math.sin(sat_lat_rad)
+        sat_r = earth_radius + sat_alt_km
+        cos_sat_lat = math.cos(sat_lat_rad)
+        sat_x = sat_r * cos_sat_lat * math.cos(sat_lon_rad)
+        sat_y = sat_r * cos_sat_lat * math.sin(sat_lon_rad)
+        sat_z = sat_r * math.sin(sat_lat_rad)
 
         # Get cached ground location ECEF coordinates
         ground_x, ground_y, ground_z = self._get_ground_ecef(location)
@@ -562,18 +844,12 @@ class VisibilityCalculator:
 
         # Calculate elevation angle correctly using local horizon
         if range_km > 0:
-            # Local up vector (from Earth center to ground station)
-            up_x = ground_x / earth_radius
-            up_y = ground_y / earth_radius
-            up_z = ground_z / earth_radius
-
             # Dot product of satellite vector with local up vector
-            dot_product = dx * up_x + dy * up_y + dz * up_z
+            dot_product = (dx * ground_x + dy * ground_y + dz * ground_z) / earth_radius
 
             # Elevation angle relative to local horizon
-            elevation_rad = math.asin(dot_product / range_km)
-            elevation_deg = math.degrees(elevation_rad)
-            return max(elevation_deg, -90.0)  # Clamp to valid range
+            elevation_rad = math.asin(max(-1.0, min(1.0, dot_product / range_km)))
+            return math.degrees(elevation_rad)
 
         return 0.0
 
@@ -591,9 +867,21 @@ class VisibilityCalculator:
         Returns:
             Azimuth angle in degrees (0° = North, 90° = East)
         """
-        # Extract satellite position from position_llh
-        sat_lat, sat_lon, sat_alt_km = sat_position.position_llh
+        sat_lat, sat_lon, _ = sat_position.position_llh
+        return self._azimuth_from_llh(location, sat_lat, sat_lon)
+
+    @staticmethod
+    def _azimuth_from_llh(location: Location, sat_lat: float, sat_lon: float) -> float:
+        """
+        Azimuth angle from a ground location to a sub-satellite point.
+
+        Args:
+            location: Ground location
+            sat_lat, sat_lon: Satellite latitude and longitude (degrees)
 
+        Returns:
+            Azimuth angle in degrees (0° = North, 90° = East)
+        """
         # Convert to radians
         lat_rad = math.radians(location.latitude_deg)
         lon_rad = math.radians(location.longitude_deg)
@@ -612,9 +900,7 @@ class VisibilityCalculator:
         azimuth_deg = math.degrees(azimuth_rad)
 
         # Convert to 0-360 range
-        azimuth_deg = (azimuth_deg + 360) % 360
-
-        return azimuth_deg
+        return (azimuth_deg + 360) % 360
 
     def _is_target_visible(
         self, target: GroundTarget, timestamp: datetime, elevation: float
@@ -643,7 +929,7 @@ class VisibilityCalculator:
                 return False
 
             # Get satellite position for imaging visibility check
-            sat_lat, sat_lon, sat_alt = self.satellite.get_position(timestamp)
+            sat_lat, sat_lon, sat_alt = self.get_satellite_position(timestamp)
 
             # Get spacecraft roll limit for visibility (NOT sensor FOV!)
             # For visibility analysis, we need max spacecraft roll, not the narrow sensor FOV
@@ -725,14 +1011,62 @@ class VisibilityCalculator:
         # SAR imaging works day and night, so no sunlight constraint
         imaging_type = getattr(target, "imaging_type", "optical")
         if imaging_type == "optical":
-            illuminated = is_target_illuminated(
-                target.latitude, target.longitude, timestamp, min_sun_elevation=0.0
-            )
-            if not illuminated:
+            if not self._is_target_lit(
+                target, datetime_to_epoch_seconds(timestamp)
+            ):
                 return False
 
         return True
 
+    def _target_daylight(
+        self, targets: List[GroundTarget], start_time: datetime, end_time: datetime
+    ) -> List[DaylightIntervals]:
+        """
+        Sunlit intervals of each target over a search window.
+
+        Intervals are cached per target location; locations without cached
+        intervals covering the window are computed together in one batch.
+
+        Args:
+            targets: Ground targets
+            start_time: Start of search window (UTC)
+            end_time: End of search window (UTC)
+
+        Returns:
+            One DaylightIntervals per target, in input order
+        """
+        start_s = datetime_to_epoch_seconds(start_time)
+        end_s = datetime_to_epoch_seconds(end_time)
+        missing = sorted(
+            {
+                (t.latitude, t.longitude)
+                for t in targets
+                if (t.latitude, t.longitude) not in self._daylight_cache
+                or not self._daylight_cache[(t.latitude, t.longitude)].covers(
+                    start_s, end_s
+                )
+            }
+        )
+        if missing:
+            latitudes, longitudes = zip(*missing)
+            computed = DaylightIntervals.compute(
+                latitudes, longitudes, start_time, end_time
+            )
+            self._daylight_cache.update(zip(missing, computed))
+        return [self._daylight_cache[(t.latitude, t.longitude)] for t in targets]
+
+    def _is_target_lit(self, target: GroundTarget, epoch_s: float) -> bool:
+        """Sunlight at a target, from its cached daylight intervals if available."""
+        daylight = self._daylight_cache.get((target.latitude, target.longitude))
+        if daylight is None:
+            return is_target_illuminated(
+                target.latitude,
+                target.longitude,
+                epoch_seconds_to_datetime(epoch_s),
+                min_sun_elevation=0.0,
+            )
+        return bool(daylight.is_lit(epoch_s))
+
     def _calculate_look_angle(
         self,
         sat_lat: float,
@@ -831,7 +1165,7 @@ class VisibilityCalculator:
 
         # Get satellite velocity vector (approximate using position 1 second later)
         try:
-            sat_pos_future = self.satellite.get_position(
+            sat_pos_future = self.get_satellite_position(
                 timestamp + timedelta(seconds=1)
             )
             sat_lat_future, sat_lon_future, _ = sat_pos_future
@@ -1024,9 +1358,7 @@ class VisibilityCalculator:
         # Target is above horizon if angle is less than (90° + horizon angle)
         return angle_to_target < (math.pi / 2 + horizon_angle_rad)
 
-    def _compute_event_function(
-        self, target: GroundTarget, timestamp: datetime
-    ) -> float:
+    def _compute_event_function(self, target: GroundTarget, epoch_s: float) -> float:
         """
         Compute the event function g(t) for visibility detection.
 
@@ -1041,20 +1373,31 @@ class VisibilityCalculator:
 
         Args:
             target: Ground target
-            timestamp: UTC datetime
+            epoch_s: Unix epoch seconds (UTC)
 
         Returns:
             Event function value (positive = visible, negative = not visible)
         """
+        self.event_evaluations += 1
         try:
             # OPTIMIZATION: Fast ground-track prefilter (avoids 80-90% of expensive calculations)
-            sat_lat, sat_lon, sat_alt = self.satellite.get_position(timestamp)
+            sat_lat, sat_lon, sat_alt = self._position_at(epoch_s)
             if not self._is_satellite_near_target(
-                target, timestamp, sat_lat, sat_lon, sat_alt
+                target, epoch_s, sat_lat, sat_lon, sat_alt
             ):
                 return -90.0  # Far away - fast rejection without full 3D calculation
 
-            elevation, _ = self.calculate_elevation_azimuth(target, timestamp)
+            if self.refinement_method == "brent":
+                # Root finding needs g(t) continuous in t, so use the
+                # position at the exact time (not the per-second cache)
+                elevation = self._elevation_from_llh(
+                    self._get_location(target), sat_lat, sat_lon, sat_alt
+                )
+            else:
+                elevation = self._elevation_from_llh(
+                    self._get_location(target),
+                    *self._get_satellite_position(math.floor(epoch_s)),
+                )
 
             # Communication missions: simple elevation check
             if target.mission_type == "communication":
@@ -1086,13 +1429,7 @@ class VisibilityCalculator:
                 # For OPTICAL imaging, require target to be illuminated by sunlight
                 imaging_type = getattr(target, "imaging_type", "optical")
                 if imaging_type == "optical":
-                    illuminated = is_target_illuminated(
-                        target.latitude,
-                        target.longitude,
-                        timestamp,
-                        min_sun_elevation=0.0,
-                    )
-                    if not illuminated:
+                    if not self._is_target_lit(target, epoch_s):
                         return (
                             -90.0
                         )  # Target in darkness - not valid for optical imaging
@@ -1104,26 +1441,29 @@ class VisibilityCalculator:
             return elevation - target.elevation_mask
 
         except Exception as e:
-            logger.warning(f"Error computing event function at {timestamp}: {e}")
+            logger.warning(
+                f"Error computing event function at "
+                f"{epoch_seconds_to_datetime(epoch_s)}: {e}"
+            )
             return -90.0  # Conservative: assume not visible
 
     def _estimate_geometry_change_rate(
-        self, target: GroundTarget, t1: datetime, g1: float, t2: datetime, g2: float
+        self, target: GroundTarget, t1: float, g1: float, t2: float, g2: float
     ) -> float:
         """
         Estimate rate of change in visibility geometry between two time points.
 
         Args:
             target: Ground target
-            t1: First timestamp
+            t1: First time (epoch seconds)
             g1: Event function value at t1
-            t2: Second timestamp
+            t2: Second time (epoch seconds)
             g2: Event function value at t2
 
         Returns:
             Normalized change rate (0 = no change, 1 = rapid change)
         """
-        dt_seconds = (t2 - t1).total_seconds()
+        dt_seconds = t2 - t1
         if dt_seconds <= 0:
             return 0.0
 
@@ -1165,11 +1505,11 @@ class VisibilityCalculator:
     def _refine_edge_time(
         self,
         target: GroundTarget,
-        t_before: datetime,
-        t_after: datetime,
+        t_before: float,
+        t_after: float,
         g_before: float,
         g_after: float,
-    ) -> datetime:
+    ) -> float:
         """
         Refine edge time using bisection root-finding.
 
@@ -1177,8 +1517,8 @@ class VisibilityCalculator:
 
         Args:
             target: Ground target
-            t_before: Time before transition (known sign)
-            t_after: Time after transition (opposite sign)
+            t_before: Epoch seconds before transition (known sign)
+            t_after: Epoch seconds after transition (opposite sign)
             g_before: Event function value at t_before
             g_after: Event function value at t_after
 
@@ -1188,7 +1528,7 @@ class VisibilityCalculator:
         # Ensure we have a sign change
         if (g_before * g_after) > 0:
             # No sign change - return midpoint
-            return t_before + (t_after - t_before) / 2
+            return (t_before + t_after) / 2
 
         # Bisection method
         t_left = t_before
@@ -1198,12 +1538,11 @@ class VisibilityCalculator:
 
         for iteration in range(self.ADAPTIVE_MAX_REFINEMENT_ITERS):
             # Check convergence
-            dt = (t_right - t_left).total_seconds()
-            if dt <= self.ADAPTIVE_REFINEMENT_TOLERANCE:
+            if t_right - t_left <= self.ADAPTIVE_REFINEMENT_TOLERANCE:
                 break
 
             # Bisect
-            t_mid = t_left + (t_right - t_left) / 2
+            t_mid = (t_left + t_right) / 2
             g_mid = self._compute_event_function(target, t_mid)
 
             # Update interval
@@ -1217,7 +1556,171 @@ class VisibilityCalculator:
                 g_left = g_mid
 
         # Return midpoint of final interval
-        return t_left + (t_right - t_left) / 2
+        return (t_left + t_right) / 2
+
+    def _refine_edge_time_brent(
+        self,
+        target: GroundTarget,
+        t_before: float,
+        t_after: float,
+        g_before: float,
+        g_after: float,
+    ) -> float:
+        """
+        Refine edge time using Brent's method.
+
+        Combines inverse quadratic interpolation and secant steps with
+        bisection fallback (Brent 1973, "zeroin"), so the bracket always
+        holds the sign change. On the smooth geometric part of the event
+        function this converges in a few evaluations; at sunlight or
+        horizon discontinuities it degrades to bisection.
+
+        Args:
+            target: Ground target
+            t_before: Epoch seconds before transition (known sign)
+            t_after: Epoch seconds after transition (opposite sign)
+            g_before: Event function value at t_before
+            g_after: Event function value at t_after
+
+        Returns:
+            Refined edge time (accurate to ADAPTIVE_REFINEMENT_TOLERANCE)
+        """
+        if (g_before * g_after) > 0:
+            return (t_before + t_after) / 2
+
+        # Work in seconds after t_before; the root stays within [b, c]
+        tol = self.ADAPTIVE_REFINEMENT_TOLERANCE / 2
+        a, fa = 0.0, g_before
+        b, fb = t_after - t_before, g_after
+        c, fc = a, fa
+        d = e = b - a
+        m = 0.5 * (c - b)
+
+        for iteration in range(self.ADAPTIVE_MAX_REFINEMENT_ITERS):
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            m = 0.5 * (c - b)
+            if abs(m) <= tol or fb == 0:
+                break
+
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # Secant step
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    # Inverse quadratic interpolation
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, fa = b, fb
+            b += d if abs(d) > tol else math.copysign(tol, m)
+            fb = self._compute_event_function(target, t_before + b)
+
+        if fb == 0:
+            return t_before + b
+        # Return midpoint of final interval
+        return t_before + b + m
+
+    def _get_motion_bounds(
+        self, start_time: datetime, end_time: datetime
+    ) -> Tuple[float, float, float, float]:
+        """
+        Bounds on satellite motion over a search window (cached per window).
+
+        Returns:
+            Tuple of (min_alt_km, max_alt_km, max sub-satellite angular rate
+            in rad/s, max speed relative to the rotating Earth in km/s)
+        """
+        key = (start_time, end_time)
+        if key not in self._motion_bounds:
+            _, epoch_s = self._sample_times(
+                start_time - timedelta(seconds=MOTION_BOUND_SAMPLE_SECONDS),
+                end_time + timedelta(seconds=MOTION_BOUND_SAMPLE_SECONDS),
+                MOTION_BOUND_SAMPLE_SECONDS,
+            )
+            states = self._propagate(epoch_s)
+            position = states.position_ecef
+            velocity = states.velocity_ecef
+            r = np.linalg.norm(position, axis=1)
+            inertial_rate = np.linalg.norm(np.cross(position, velocity), axis=1) / (
+                r * r
+            )
+            altitude = states.position_llh[:, 2]
+            self._motion_bounds[key] = (
+                float(altitude.min()) - MOTION_BOUND_ALTITUDE_PAD_KM,
+                float(altitude.max()) + MOTION_BOUND_ALTITUDE_PAD_KM,
+                MOTION_BOUND_SAFETY_FACTOR
+                * (float(inertial_rate.max()) + EARTH_ROTATION_RATE_RAD_S),
+                MOTION_BOUND_SAFETY_FACTOR
+                * float(
+                    (
+                        np.linalg.norm(velocity, axis=1) + EARTH_ROTATION_RATE_RAD_S * r
+                    ).max()
+                ),
+            )
+        return self._motion_bounds[key]
+
+    def _safe_step_seconds(
+        self,
+        target: GroundTarget,
+        epoch_s: float,
+        g: float,
+        motion_bounds: Tuple[float, float, float, float],
+    ) -> float:
+        """
+        Longest step over which visibility provably cannot change.
+
+        Two bounds are used:
+        - Outside the access region: the sub-satellite point needs at least
+          (psi - access angle) / max angular rate to reach it, where psi is
+          the Earth central angle to the target.
+        - For a geometric margin g (elevation above the mask, or pointing
+          cone margin), elevation and off-nadir angles change no faster
+          than (psi rate + relative speed / minimum range), so g keeps its
+          sign for |g| / that rate.
+
+        The -90 sentinel (horizon, prefilter or darkness) carries no margin,
+        so only the access-region bound applies to it.
+
+        Returns:
+            Safe step in seconds (0 when no bound applies)
+        """
+        min_alt_km, max_alt_km, psi_rate, relative_speed = motion_bounds
+        sat_lat, sat_lon, _ = self._position_at(epoch_s)
+        psi = (
+            self._calculate_ground_distance(
+                sat_lat, sat_lon, target.latitude, target.longitude
+            )
+            / EARTH_RADIUS_KM
+        )
+        safe_step = (
+            psi - access_half_angle_rad(target, max_alt_km) - INDEX_PADDING_RAD
+        ) / psi_rate
+
+        if g != -90.0 and min_alt_km > 0:
+            angle_rate_deg = math.degrees(psi_rate + relative_speed / min_alt_km)
+            safe_step = max(safe_step, abs(g) / angle_rate_deg)
+
+        return max(0.0, safe_step)
 
     def _find_visibility_windows_adaptive(
         self, target: GroundTarget, start_time: datetime, end_time: datetime
@@ -1228,6 +1731,9 @@ class VisibilityCalculator:
         Phase 1 (Coarse): Scan with adaptive steps to bracket transitions
         Phase 2 (Refine): Refine each bracket to high accuracy using bisection
 
+        The scan keeps time as float epoch seconds; datetimes are only built
+        for the returned window edges.
+
         Args:
             target: Ground target
             start_time: Search window start
@@ -1236,67 +1742,92 @@ class VisibilityCalculator:
         Returns:
             List of (aos_time, los_time) tuples for each visibility window
         """
-        windows = []
-        current_time = start_time
+        windows: List[Tuple[float, float]] = []
+        start_s = datetime_to_epoch_seconds(start_time)
+        end_s = datetime_to_epoch_seconds(end_time)
+        current_s = start_s
         step_seconds = self.ADAPTIVE_INITIAL_STEP_SECONDS
+        use_brent = self.refinement_method == "brent"
+        motion_bounds = (
+            self._get_motion_bounds(start_time, end_time) if use_brent else None
+        )
+        daylight = (
+            self._target_daylight([target], start_time, end_time)[0]
+            if target.mission_type == "imaging"
+            and getattr(target, "imaging_type", "optical") == "optical"
+            else None
+        )
 
         # Initial evaluation
-        g_current = self._compute_event_function(target, current_time)
+        g_current = self._compute_event_function(target, current_s)
         in_window = g_current > 0
 
-        window_start = current_time if in_window else None
+        window_start = current_s if in_window else None
 
         # Statistics for logging
-        total_evaluations = 1
+        initial_evaluations = self.event_evaluations - 1
         coarse_evaluations = 1
 
         # Coarse scan with adaptive stepping
-        while current_time < end_time:
+        while current_s < end_s:
+            # Optical targets cannot be imaged at night: jump to the next sunrise
+            if daylight is not None and g_current <= 0:
+                sunrise_s = daylight.next_lit_time(current_s)
+                if sunrise_s > current_s:
+                    current_s = min(end_s, sunrise_s)
+                    g_current = self._compute_event_function(target, current_s)
+                    coarse_evaluations += 1
+                    if g_current > 0:
+                        window_start = current_s
+                    continue
+
             # Calculate next time point
-            next_time = current_time + timedelta(seconds=step_seconds)
-            if next_time > end_time:
-                next_time = end_time
+            next_s = min(current_s + step_seconds, end_s)
 
             # Evaluate at next point
-            g_next = self._compute_event_function(target, next_time)
-            total_evaluations += 1
+            g_next = self._compute_event_function(target, next_s)
             coarse_evaluations += 1
 
             # Detect sign change (transition)
             transition_detected = (g_current > 0) != (g_next > 0)
 
-            if transition_detected:
+            if transition_detected and use_brent:
+                # Refine directly on the coarse bracket (both ends evaluated)
+                edge_s = self._refine_edge_time_brent(
+                    target, current_s, next_s, g_current, g_next
+                )
+                if g_next > 0:
+                    window_start = edge_s
+                elif window_start is not None:
+                    windows.append((window_start, edge_s))
+                    window_start = None
+                step_seconds = self.ADAPTIVE_MIN_STEP_SECONDS * 2
+            elif transition_detected:
                 # OPTIMIZATION: Expand search window with margin for safety
                 # This prevents missing brief passes when using large coarse steps
                 margin_seconds = (
                     step_seconds * 3
                 )  # Look 3 steps back/forward (increased for safety)
 
-                search_start = max(
-                    start_time, current_time - timedelta(seconds=margin_seconds)
-                )
-                search_end = min(
-                    end_time, next_time + timedelta(seconds=margin_seconds)
-                )
+                search_start = max(start_s, current_s - margin_seconds)
+                search_end = min(end_s, next_s + margin_seconds)
 
                 # Re-evaluate at expanded boundaries
                 g_search_start = self._compute_event_function(target, search_start)
                 g_search_end = self._compute_event_function(target, search_end)
-                total_evaluations += 2
 
                 # Refine the edge within expanded window
-                edge_time = self._refine_edge_time(
+                edge_s = self._refine_edge_time(
                     target, search_start, search_end, g_search_start, g_search_end
                 )
-                total_evaluations += self.ADAPTIVE_MAX_REFINEMENT_ITERS  # Approximate
 
                 if g_next > 0:
                     # Rising edge: AOS (acquisition of signal)
-                    window_start = edge_time
+                    window_start = edge_s
                 else:
                     # Falling edge: LOS (loss of signal)
                     if window_start is not None:
-                        windows.append((window_start, edge_time))
+                        windows.append((window_start, edge_s))
                         window_start = None
 
                 # After transition, use smaller step
@@ -1304,40 +1835,53 @@ class VisibilityCalculator:
             else:
                 # No transition: adjust step based on change rate
                 change_rate = self._estimate_geometry_change_rate(
-                    target, current_time, g_current, next_time, g_next
+                    target, current_s, g_current, next_s, g_next
                 )
                 step_seconds = self._adaptive_step_size(step_seconds, change_rate)
 
                 # OPTIMIZATION: Orbital skip ahead when satellite is very far away
                 # Check if we can skip ahead by a large time interval
                 if (
-                    g_next < -50.0
+                    not use_brent and g_next < -50.0
                 ):  # Very negative = definitely not visible and far away
-                    sat_lat, sat_lon, sat_alt = self.satellite.get_position(next_time)
+                    sat_lat, sat_lon, sat_alt = self._position_at(next_s)
                     skip_seconds = self._calculate_orbital_skip_ahead(
-                        target, next_time, sat_lat, sat_lon, sat_alt
+                        target, next_s, sat_lat, sat_lon, sat_alt
                     )
                     if skip_seconds > 0:
                         # Skip ahead - satellite is on opposite side of Earth
                         step_seconds = max(step_seconds, skip_seconds)
 
+            if use_brent:
+                assert motion_bounds is not None
+                step_seconds = max(
+                    step_seconds,
+                    self._safe_step_seconds(target, next_s, g_next, motion_bounds),
+                )
+
             # Move to next point
-            current_time = next_time
+            current_s = next_s
             g_current = g_next
 
         # Handle ongoing window at end
         if window_start is not None:
-            windows.append((window_start, end_time))
+            windows.append((window_start, end_s))
 
         # Log statistics
-        total_duration = (end_time - start_time).total_seconds()
+        total_evaluations = self.event_evaluations - initial_evaluations
         logger.debug(
-            f"Adaptive search: {total_evaluations} evaluations "
-            f"({coarse_evaluations} coarse) over {total_duration/3600:.1f}h, "
-            f"found {len(windows)} windows"
+            f"Adaptive search ({self.refinement_method}): "
+            f"{total_evaluations} evaluations ({coarse_evaluations} coarse) "
+            f"over {(end_s - start_s)/3600:.1f}h, found {len(windows)} windows"
         )
 
-        return windows
+        # Window edges as datetimes, offset from the caller's start time
+        def to_datetime(epoch_s: float) -> datetime:
+            if epoch_s == end_s:
+                return end_time
+            return start_time + timedelta(seconds=epoch_s - start_s)
+
+        return [(to_datetime(aos_s), to_datetime(los_s)) for aos_s, los_s in windows]
 
     def _calculate_ground_distance(
         self, lat1: float, lon1: float, lat2: float, lon2: float
@@ -1373,7 +1917,7 @@ class VisibilityCalculator:
     def _is_satellite_near_target(
         self,
         target: GroundTarget,
-        timestamp: datetime,
+        epoch_s: float,
         sat_lat: float,
         sat_lon: float,
         sat_alt: float,
@@ -1388,7 +1932,7 @@ class VisibilityCalculator:
 
         Args:
             target: Ground target
-            timestamp: UTC datetime
+            epoch_s: Unix epoch seconds (UTC)
             sat_lat, sat_lon, sat_alt: Satellite position (degrees, km)
 
         Returns:
@@ -1424,7 +1968,7 @@ class VisibilityCalculator:
     def _calculate_orbital_skip_ahead(
         self,
         target: GroundTarget,
-        timestamp: datetime,
+        epoch_s: float,
         sat_lat: float,
         sat_lon: float,
         sat_alt: float,
@@ -1438,7 +1982,7 @@ class VisibilityCalculator:
 
         Args:
             target: Ground target
-            timestamp: UTC datetime
+            epoch_s: Unix epoch seconds (UTC)
             sat_lat, sat_lon, sat_alt: Satellite position (degrees, km)
 
         Returns:
@@ -1470,29 +2014,111 @@ class VisibilityCalculator:
 
         return skip_seconds
 
+    @staticmethod
+    def _separated_indices(epoch_s: np.ndarray, min_separation_s: float) -> np.ndarray:
+        """
+        Greedy selection of samples at least min_separation_s apart.
+
+        Keeps the first sample and then each next sample at or beyond the last
+        kept one plus the separation. The successor of every sample is found
+        with one searchsorted call, so only kept samples are visited.
+
+        Args:
+            epoch_s: Sample times in epoch seconds, sorted ascending
+            min_separation_s: Minimum spacing between kept samples
+
+        Returns:
+            Indices of the kept samples, ascending
+        """
+        if min_separation_s <= 0 or epoch_s.size < 2:
+            return np.arange(epoch_s.size)
+        successors = np.searchsorted(epoch_s, epoch_s + min_separation_s, side="left")
+        kept = []
+        i = 0
+        while i < epoch_s.size:
+            kept.append(i)
+            i = int(successors[i])
+        return np.asarray(kept, dtype=np.intp)
+
     def _apply_imaging_separation_filter(
         self, passes: List[PassDetails], target: GroundTarget
     ) -> List[PassDetails]:
         """
         Filter imaging passes based on satellite agility.
 
-        For imaging missions, satellite passes are grouped by orbital periods.
-        This method doesn't filter passes anymore - all passes are kept.
-        Filtering is now handled by satellite agility parameter during
-        opportunity detection.
+        Passes are kept greedily in time order when their imaging time is at
+        least IMAGING_MIN_SEPARATION_SECONDS after the last kept pass. With the
+        default separation of zero all passes are kept; agility limits are
+        applied during opportunity detection and scheduling.
 
         Args:
             passes: List of all detected passes
             target: Ground target
 
         Returns:
-            All passes (no filtering applied)
+            Kept passes in time order
         """
+        if not passes:
+            return []
+        passes = sorted(passes, key=lambda p: p.max_elevation_time)
+        epoch_s = np.fromiter(
+            (datetime_to_epoch_seconds(p.max_elevation_time) for p in passes),
+            dtype=np.float64,
+            count=len(passes),
+        )
+        kept = self._separated_indices(epoch_s, self.IMAGING_MIN_SEPARATION_SECONDS)
         logger.debug(
-            "Imaging passes: %d total (no separation filtering - using satellite agility)",
+            "Imaging passes: %d total, %d after separation filtering",
             len(passes),
+            kept.size,
+        )
+        return [passes[i] for i in kept.tolist()]
+
+    def _imaging_samples(
+        self,
+        target: GroundTarget,
+        epoch_s: np.ndarray,
+        daylight: Optional[DaylightIntervals] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate imaging visibility of a target at many sample times at once.
+
+        A sample is visible when the target is above the horizon, inside the
+        spacecraft roll cone and, for optical targets, sunlit. Samples at
+        night are dropped before propagation.
+
+        Args:
+            target: Ground target with imaging constraints
+            epoch_s: Sample times in epoch seconds, sorted ascending
+            daylight: Sunlit intervals of the target (optical targets only)
+
+        Returns:
+            Tuple of (indices into epoch_s, sat_llh, elevations, azimuths,
+            look_angles) for the visible samples
+        """
+        index = np.arange(epoch_s.size)
+        if daylight is not None:
+            index = index[daylight.is_lit(epoch_s)]
+        if index.size == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return index, np.empty((0, 3), dtype=np.float64), empty, empty, empty
+
+        sat_llh = self._propagate(epoch_s[index]).position_llh
+        elevations, azimuths = self._elevation_azimuth_arrays(
+            self._get_location(target), sat_llh
+        )
+        look_angles = self._look_angle_arrays(
+            sat_llh, target.latitude, target.longitude
+        )
+        cone_deg = getattr(target, "max_spacecraft_roll", None) or 45.0
+        visible = (elevations > 0) & (look_angles <= cone_deg + 0.1)
+        return (
+            index[visible],
+            sat_llh[visible],
+            elevations[visible],
+            azimuths[visible],
+            look_angles[visible],
         )
-        return passes
 
     def _process_imaging_opportunities(
         self,
@@ -1510,6 +2136,8 @@ class VisibilityCalculator:
         3. Applies minimum separation filtering within each pass
         4. Stores all potential opportunities for visualization
 
+        The whole window is sampled and evaluated as arrays in one batch.
+
         Args:
             target: Ground target with imaging constraints
             start_time: Start of search window (UTC)
@@ -1519,154 +2147,173 @@ class VisibilityCalculator:
         Returns:
             List of filtered imaging opportunities
         """
-        imaging_opportunities: List[Any] = []
-        all_potential_opportunities: List[Any] = []  # Store for visualization
-        current_time = start_time
-        time_step = timedelta(seconds=time_step_seconds)
-
         logger.debug(
             "Processing imaging opportunities for %s from %s to %s",
             target.name,
             start_time,
             end_time,
         )
+        if end_time < start_time:
+            self._all_imaging_opportunities = []
+            return []
 
-        # Find all imaging opportunities
-        while current_time <= end_time:
-            try:
-                elevation, azimuth = self.calculate_elevation_azimuth(
-                    target, current_time
-                )
+        num_steps = (
+            int((end_time - start_time).total_seconds() // time_step_seconds) + 1
+        )
+        epoch_s = datetime_to_epoch_seconds(start_time) + (
+            np.arange(num_steps, dtype=np.float64) * time_step_seconds
+        )
 
-                # Check if target is visible for imaging (within pointing cone)
-                if self._is_target_visible(target, current_time, elevation):
-                    # Get satellite position for this opportunity
-                    sat_lat, sat_lon, sat_alt = self.satellite.get_position(
-                        current_time
-                    )
+        # Optical targets are only sampled in daylight
+        daylight = (
+            self._target_daylight([target], start_time, end_time)[0]
+            if getattr(target, "imaging_type", "optical") == "optical"
+            else None
+        )
+        index, sat_llh, elevations, azimuths, look_angles = self._imaging_samples(
+            target, epoch_s, daylight
+        )
+        step = timedelta(seconds=time_step_seconds)
+        timestamps = [start_time + i * step for i in index.tolist()]
+
+        logger.debug("Found %d potential imaging opportunities", len(timestamps))
+
+        return self._build_imaging_passes(
+            target,
+            timestamps,
+            epoch_s[index],
+            sat_llh,
+            elevations,
+            azimuths,
+            look_angles,
+        )
 
-                    # Calculate look angle (off-nadir) for STK comparison
-                    look_angle = self._calculate_look_angle(
-                        sat_lat, sat_lon, sat_alt, target.latitude, target.longitude
-                    )
+    def _build_imaging_passes(
+        self,
+        target: GroundTarget,
+        timestamps: List[datetime],
+        epoch_s: np.ndarray,
+        sat_llh: np.ndarray,
+        elevations: np.ndarray,
+        azimuths: np.ndarray,
+        look_angles: np.ndarray,
+    ) -> List[PassDetails]:
+        """
+        Group imaging samples into passes and build one PassDetails per pass.
 
-                    opportunity = {
-                        "time": current_time,
-                        "elevation": elevation,
-                        "look_angle": look_angle,  # Off-nadir angle for STK reporting
-                        "azimuth": azimuth,
-                        "sat_lat": sat_lat,
-                        "sat_lon": sat_lon,
-                        "sat_alt": sat_alt,
-                    }
-                    all_potential_opportunities.append(opportunity)
+        Grouping, separation filtering and best-sample selection work on the
+        sample arrays; opportunity dicts are only built for the returned
+        passes and visualization.
 
-                current_time += time_step
-
-            except Exception as e:
-                logger.warning(
-                    f"Error processing imaging opportunity at {current_time}: {e}"
-                )
-                current_time += time_step
-                continue
-
-        logger.debug(
-            "Found %d potential imaging opportunities",
-            len(all_potential_opportunities),
-        )
+        Args:
+            target: Ground target with imaging constraints
+            timestamps: Times of the visible samples, ascending
+            epoch_s: The same times in epoch seconds
+            sat_llh: Satellite (lat_deg, lon_deg, alt_km) per sample, shape (N, 3)
+            elevations: Target elevation angles in degrees
+            azimuths: Azimuth angles in degrees
+            look_angles: Off-nadir look angles in degrees
 
+        Returns:
+            List of filtered imaging opportunities
+        """
         # Store all opportunities for visualization (we'll need this later)
+        all_potential_opportunities = [
+            {
+                "time": timestamp,
+                "elevation": elevation,
+                "look_angle": look_angle,  # Off-nadir angle for STK reporting
+                "azimuth": azimuth,
+                "sat_lat": sat_lat,
+                "sat_lon": sat_lon,
+                "sat_alt": sat_alt,
+            }
+            for (
+                timestamp,
+                elevation,
+                look_angle,
+                azimuth,
+                (sat_lat, sat_lon, sat_alt),
+            ) in zip(
+                timestamps,
+                elevations.tolist(),
+                look_angles.tolist(),
+                azimuths.tolist(),
+                sat_llh.tolist(),
+            )
+        ]
         self._all_imaging_opportunities = all_potential_opportunities
 
-        # Group opportunities by orbital pass and apply separation filtering
         if not all_potential_opportunities:
             return []
 
-        # Group consecutive opportunities into passes
-        passes = self._group_opportunities_into_passes(
-            all_potential_opportunities, target
-        )
-
-        # Apply separation filtering within each pass
         filtered_passes = []
-        for pass_opportunities in passes:
-            filtered_opportunities = self._filter_opportunities_within_pass(
-                pass_opportunities, target
+        for pass_start, pass_end in self._group_opportunities_into_passes(
+            epoch_s, target
+        ):
+            kept = pass_start + self._filter_opportunities_within_pass(
+                epoch_s[pass_start:pass_end], target
             )
+            if kept.size == 0:
+                continue
 
-            if filtered_opportunities:
-                # Create ONE PassDetails per orbital pass (not per opportunity)
-                # Use the opportunity with BEST look angle (minimum off-nadir = closest to nadir)
-                best_opp = min(filtered_opportunities, key=lambda x: x["look_angle"])
+            # Create ONE PassDetails per orbital pass (not per opportunity)
+            # Use the opportunity with BEST look angle
+            # (minimum off-nadir = closest to nadir)
+            best = int(kept[np.argmin(look_angles[kept])])
+            best_time = timestamps[best]
+            best_look_angle = float(look_angles[best])
 
-                # Calculate imaging window from FILTERED opportunities (after separation filtering)
-                # This ensures the window only includes valid imaging times
-                imaging_window_start = min(
-                    opp["time"] for opp in filtered_opportunities
+            # Imaging window spans the FILTERED opportunities (kept is ascending)
+            imaging_window_start = timestamps[int(kept[0])]
+            imaging_window_end = timestamps[int(kept[-1])]
+
+            # Compute SIGNED roll angle (critical for scheduler maneuver calculations!)
+            # Computed at the best opportunity for clear left/right geometry
+            try:
+                sat_lat, sat_lon, sat_alt = self.get_satellite_position(best_time)
+                local_incidence_deg = self._calculate_signed_roll_angle(
+                    sat_lat,
+                    sat_lon,
+                    sat_alt,
+                    target.latitude,
+                    target.longitude,
+                    best_time,
                 )
-                imaging_window_end = max(opp["time"] for opp in filtered_opportunities)
-
-                # DEBUG: Log window calculation
-                logger.debug(
-                    "Target %s: best_opp=%s window=[%s to %s] in_window=%s",
-                    target.name,
-                    best_opp["time"],
-                    imaging_window_start,
-                    imaging_window_end,
-                    imaging_window_start <= best_opp["time"] <= imaging_window_end,
+            except Exception as e:
+                logger.warning(
+                    f"Could not calculate signed roll angle, using unsigned proxy: {e}"
                 )
+                local_incidence_deg = best_look_angle  # Fallback to unsigned
 
-                # Convert off-nadir angle to STK format (from local horizontal)
+            # PassDetails stores FULL window for visualization (start to end of
+            # pass) but max_elevation_time stores the optimal imaging time (min
+            # incidence angle). Scheduler will use max_elevation_time,
+            # visualization uses start/end
+            best_azimuth = float(azimuths[best])
+            pass_details = PassDetails(
+                target_name=target.name,
+                satellite_name=self.satellite.satellite_name,
+                start_time=imaging_window_start,
+                max_elevation_time=best_time,  # Optimal imaging time for scheduler
+                end_time=imaging_window_end,
                 # STK measures from horizontal, not nadir: STK_angle = 90° - off_nadir
-                stk_elevation = 90.0 - best_opp["look_angle"]
-
-                # Compute SIGNED roll angle (critical for scheduler maneuver calculations!)
-                # Must compute at pass start (or best opportunity) for clear left/right geometry
-                try:
-                    sat_lat, sat_lon, sat_alt = self.satellite.get_position(
-                        best_opp["time"]
-                    )
-                    local_incidence_deg = self._calculate_signed_roll_angle(
-                        sat_lat,
-                        sat_lon,
-                        sat_alt,
-                        target.latitude,
-                        target.longitude,
-                        best_opp[
-                            "time"
-                        ],  # Use best opportunity time for clear geometry
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Could not calculate signed roll angle, using unsigned proxy: {e}"
-                    )
-                    local_incidence_deg = best_opp["look_angle"]  # Fallback to unsigned
-
-                # PassDetails stores FULL window for visualization (start to end of pass)
-                # but max_elevation_time stores the optimal imaging time (min incidence angle)
-                # Scheduler will use max_elevation_time, visualization uses start/end
-                pass_details = PassDetails(
-                    target_name=target.name,
-                    satellite_name=self.satellite.satellite_name,
-                    start_time=imaging_window_start,  # Full window start for visualization
-                    max_elevation_time=best_opp[
-                        "time"
-                    ],  # Optimal imaging time for scheduler
-                    end_time=imaging_window_end,  # Full window end for visualization
-                    max_elevation=stk_elevation,  # STK-style angle (from horizontal)
-                    start_azimuth=best_opp["azimuth"],
-                    max_elevation_azimuth=best_opp["azimuth"],
-                    end_azimuth=best_opp["azimuth"],
-                    incidence_angle_deg=local_incidence_deg,  # Best off-nadir (proxy for incidence) for quality planning
-                    mode="IMAGING",  # Imaging mission type
-                )
+                max_elevation=90.0 - best_look_angle,
+                start_azimuth=best_azimuth,
+                max_elevation_azimuth=best_azimuth,
+                end_azimuth=best_azimuth,
+                incidence_angle_deg=local_incidence_deg,
+                mode="IMAGING",  # Imaging mission type
+            )
 
-                # Store both filtered opportunities and full imaging window
-                pass_details._imaging_opportunities = filtered_opportunities
-                pass_details._imaging_window = (
-                    pass_opportunities  # All potential opportunities
-                )
-                filtered_passes.append(pass_details)
+            # Store both filtered opportunities and full imaging window
+            pass_details._imaging_opportunities = [
+                all_potential_opportunities[i] for i in kept.tolist()
+            ]
+            pass_details._imaging_window = all_potential_opportunities[
+                pass_start:pass_end
+            ]
+            filtered_passes.append(pass_details)
 
         logger.debug(
             "After separation filtering: %d imaging opportunities",
@@ -1675,63 +2322,45 @@ class VisibilityCalculator:
         return filtered_passes
 
     def _group_opportunities_into_passes(
-        self, opportunities: List[dict], target: GroundTarget
-    ) -> List[List[dict]]:
+        self, epoch_s: np.ndarray, target: GroundTarget
+    ) -> List[Tuple[int, int]]:
         """
-        Group consecutive imaging opportunities into orbital passes.
+        Group consecutive imaging samples into orbital passes.
+
+        A new pass starts wherever the gap to the previous sample exceeds
+        PASS_GAP_THRESHOLD_SECONDS.
 
         Args:
-            opportunities: List of imaging opportunity dictionaries
+            epoch_s: Sample times in epoch seconds, ascending
             target: Ground target
 
         Returns:
-            List of passes, each containing a list of opportunities
+            List of half-open (start_idx, end_idx) sample ranges, one per pass
         """
-        if not opportunities:
+        if epoch_s.size == 0:
             return []
-
-        passes = []
-        current_pass = [opportunities[0]]
-
-        for i in range(1, len(opportunities)):
-            curr_opp = opportunities[i]
-            prev_opp = opportunities[i - 1]
-
-            # Check time gap between opportunities
-            time_gap = (curr_opp["time"] - prev_opp["time"]).total_seconds()
-
-            # If gap is more than 5 minutes, start a new pass
-            if time_gap > PASS_GAP_THRESHOLD_SECONDS:
-                passes.append(current_pass)
-                current_pass = [curr_opp]
-            else:
-                current_pass.append(curr_opp)
-
-        # Add the last pass
-        if current_pass:
-            passes.append(current_pass)
-
-        # Logging removed from hot path for performance
-        return passes
+        breaks = np.flatnonzero(np.diff(epoch_s) > PASS_GAP_THRESHOLD_SECONDS) + 1
+        bounds = np.concatenate(([0], breaks, [epoch_s.size])).tolist()
+        return list(zip(bounds[:-1], bounds[1:]))
 
     def _filter_opportunities_within_pass(
-        self, opportunities: List[dict], target: GroundTarget
-    ) -> List[dict]:
+        self, epoch_s: np.ndarray, target: GroundTarget
+    ) -> np.ndarray:
         """
-        Filter imaging opportunities within a single pass based on satellite agility.
+        Filter imaging samples within a single pass based on satellite agility.
 
-        Satellite agility determines how quickly the satellite can slew between targets.
-        This is handled during opportunity detection, so this method returns all opportunities.
+        Samples are kept greedily in time order at least
+        IMAGING_MIN_SEPARATION_SECONDS apart. The default separation of zero
+        keeps every sample; agility limits are applied during detection.
 
         Args:
-            opportunities: List of opportunities within a single pass
+            epoch_s: Sample times of one pass in epoch seconds, ascending
             target: Ground target
 
         Returns:
-            All opportunities (filtering handled by satellite agility during detection)
+            Indices of the kept samples within the pass, ascending
         """
-        # Logging removed from hot path for performance
-        return opportunities
+        return self._separated_indices(epoch_s, self.IMAGING_MIN_SEPARATION_SECONDS)
 
     def get_all_imaging_opportunities(self) -> List[dict]:
         """
@@ -1767,130 +2396,87 @@ class VisibilityCalculator:
         Returns:
             List of PassDetails objects
         """
+        # One interpolated ephemeris serves every target searched over this window
+        self.ensure_ephemeris(start_time, end_time)
+
         # Route to adaptive method if enabled
         if self.use_adaptive:
             return self._find_passes_adaptive(target, start_time, end_time)
 
-        # Traditional fixed-step method (unchanged)
-        passes = []
-        current_time = start_time
-        time_step = timedelta(seconds=time_step_seconds)
-
-        in_pass = False
-        pass_start_time: Optional[datetime] = None
-        pass_elevations: List[float] = []
-        pass_times: List[datetime] = []
-        pass_azimuths: List[float] = []
+        # Imaging opportunities are extracted by their own scan; the
+        # elevation-only pass scan below would be discarded for them.
+        if target.mission_type == "imaging":
+            passes = self._process_imaging_opportunities(
+                target, start_time, end_time, time_step_seconds
+            )
+            logger.info(f"Found {len(passes)} imaging opportunities for {target.name}")
+            return passes
 
         logger.info(
             f"Finding passes for {target.name} from {start_time} to {end_time} (fixed-step)"
         )
 
-        while current_time <= end_time:
-            try:
-                elevation, azimuth = self.calculate_elevation_azimuth(
-                    target, current_time
-                )
+        # Propagate the whole window in one batch and evaluate geometry as arrays
+        timestamps, epoch_s = self._sample_times(
+            start_time, end_time, time_step_seconds
+        )
+        if not timestamps:
+            logger.info(f"Found 0 passes for {target.name}")
+            return []
 
-                # Check visibility based on mission type
-                is_visible = self._is_target_visible(target, current_time, elevation)
-
-                if is_visible:
-                    if not in_pass:
-                        # Start of new pass
-                        in_pass = True
-                        pass_start_time = current_time
-                        pass_elevations = [elevation]
-                        pass_times = [current_time]
-                        pass_azimuths = [azimuth]
-                    else:
-                        # Continue current pass
-                        pass_elevations.append(elevation)
-                        pass_times.append(current_time)
-                        pass_azimuths.append(azimuth)
-                else:
-                    if in_pass:
-                        # End of current pass
-                        in_pass = False
-
-                        if len(pass_elevations) > 0:
-                            # Find maximum elevation
-                            max_elev_idx = np.argmax(pass_elevations)
-                            max_elevation = pass_elevations[max_elev_idx]
-                            max_elev_time = pass_times[max_elev_idx]
-                            max_elev_azimuth = pass_azimuths[max_elev_idx]
-
-                            # Calculate SIGNED incidence angle at PASS START (not max elevation!)
-                            # CRITICAL: Must compute at pass start when target is at edge of FOV
-                            # At max elevation, satellite is overhead and left/right is ambiguous!
-                            # Use pass_times[0] which is guaranteed to exist
-                            actual_start_time = pass_times[0]
-                            try:
-                                sat_lat, sat_lon, sat_alt = self.satellite.get_position(
-                                    actual_start_time
-                                )
-                                incidence_angle = self._calculate_signed_roll_angle(
-                                    sat_lat,
-                                    sat_lon,
-                                    sat_alt,
-                                    target.latitude,
-                                    target.longitude,
-                                    actual_start_time,  # Use pass START for clear left/right geometry
-                                )
-                            except Exception as e:
-                                logger.warning(
-                                    f"Could not calculate signed incidence angle: {e}"
-                                )
-                                incidence_angle = None
-
-                            # Create pass details
-                            pass_details = PassDetails(
-                                target_name=target.name,
-                                satellite_name=self.satellite.satellite_name,
-                                start_time=actual_start_time,
-                                max_elevation_time=max_elev_time,
-                                end_time=pass_times[-1],
-                                max_elevation=max_elevation,
-                                start_azimuth=pass_azimuths[0],
-                                max_elevation_azimuth=max_elev_azimuth,
-                                end_azimuth=pass_azimuths[-1],
-                                incidence_angle_deg=incidence_angle,
-                                mode=getattr(
-                                    target, "mission_type", "COMMUNICATION"
-                                ).upper(),
-                            )
-
-                            passes.append(pass_details)
-                            # Logging removed from hot path for performance
-
-                current_time += time_step
+        location = self._get_location(target)
+        states = self._propagate(epoch_s)
+        elevations, azimuths = self._elevation_azimuth_arrays(
+            location, states.position_llh
+        )
 
-            except Exception as e:
-                logger.warning(f"Error calculating visibility at {current_time}: {e}")
-                current_time += time_step
-                continue
+        passes = self._communication_passes(
+            target, timestamps, states.position_llh, elevations, azimuths
+        )
+
+        logger.info(f"Found {len(passes)} passes for {target.name}")
+        return passes
+
+    def _communication_passes(
+        self,
+        target: GroundTarget,
+        timestamps: List[datetime],
+        position_llh: np.ndarray,
+        elevations: np.ndarray,
+        azimuths: np.ndarray,
+    ) -> List[PassDetails]:
+        """
+        Build PassDetails for each run of samples above the elevation mask.
 
-        # Handle case where pass is ongoing at end of time window
-        if in_pass and len(pass_elevations) > 0:
-            max_elev_idx = np.argmax(pass_elevations)
-            max_elevation = pass_elevations[max_elev_idx]
-            max_elev_time = pass_times[max_elev_idx]
-            max_elev_azimuth = pass_azimuths[max_elev_idx]
+        Args:
+            target: Ground target
+            timestamps: Sample times
+            position_llh: Satellite (lat_deg, lon_deg, alt_km) per sample
+            elevations: Elevation per sample in degrees
+            azimuths: Azimuth per sample in degrees
+
+        Returns:
+            List of PassDetails objects
+        """
+        passes = []
+        visible = elevations >= target.elevation_mask
+        for start_idx, end_idx in self._visible_runs(visible):
+            pass_elevations = elevations[start_idx : end_idx + 1]
+            max_elev_idx = start_idx + int(np.argmax(pass_elevations))
+            actual_start_time = timestamps[start_idx]
 
             # Calculate SIGNED incidence angle at PASS START (not max elevation!)
             # CRITICAL: Must compute at pass start when target is at edge of FOV
             # At max elevation, satellite is overhead and left/right is ambiguous!
-            # Use pass_times[0] which is guaranteed to exist when we have pass_elevations
-            actual_start = pass_times[0]
             try:
-                sat_lat, sat_lon, sat_alt = self.satellite.get_position(actual_start)
+                sat_lat, sat_lon, sat_alt = position_llh[start_idx]
                 incidence_angle = self._calculate_signed_roll_angle(
-                    sat_lat,
-                    sat_lon,
-                    sat_alt,
+                    float(sat_lat),
+                    float(sat_lon),
+                    float(sat_alt),
                     target.latitude,
                     target.longitude,
-                    actual_start,  # Use pass START for clear left/right geometry
+                    actual_start_time,  # Use pass START for clear left/right geometry
                 )
             except Exception as e:
                 logger.warning(f"Could not calculate signed incidence angle: {e}")
@@ -1899,29 +2485,150 @@ class VisibilityCalculator:
             pass_details = PassDetails(
                 target_name=target.name,
                 satellite_name=self.satellite.satellite_name,
-                start_time=actual_start,
-                max_elevation_time=max_elev_time,
-                end_time=pass_times[-1],
-                max_elevation=max_elevation,
-                start_azimuth=pass_azimuths[0],
-                max_elevation_azimuth=max_elev_azimuth,
-                end_azimuth=pass_azimuths[-1],
+                start_time=actual_start_time,
+                max_elevation_time=timestamps[max_elev_idx],
+                end_time=timestamps[end_idx],
+                max_elevation=float(elevations[max_elev_idx]),
+                start_azimuth=float(azimuths[start_idx]),
+                max_elevation_azimuth=float(azimuths[max_elev_idx]),
+                end_azimuth=float(azimuths[end_idx]),
                 incidence_angle_deg=incidence_angle,
                 mode=getattr(target, "mission_type", "COMMUNICATION").upper(),
             )
-
             passes.append(pass_details)
 
-        # For imaging missions, find all imaging opportunities and apply separation filtering
-        if target.mission_type == "imaging":
-            passes = self._process_imaging_opportunities(
-                target, start_time, end_time, time_step_seconds
+        return passes
+
+    @staticmethod
+    def _sample_times(
+        start_time: datetime, end_time: datetime, time_step_seconds: float
+    ) -> Tuple[List[datetime], np.ndarray]:
+        """
+        Build the fixed-step sample grid for a search window.
+
+        Returns:
+            Tuple of (datetimes, epoch seconds array) covering start..end inclusive
+        """
+        if end_time < start_time:
+            return [], np.empty(0, dtype=np.float64)
+        num_steps = (
+            int((end_time - start_time).total_seconds() // time_step_seconds) + 1
+        )
+        step = timedelta(seconds=time_step_seconds)
+        timestamps = [start_time + i * step for i in range(num_steps)]
+        epoch_s = datetime_to_epoch_seconds(start_time) + (
+            np.arange(num_steps, dtype=np.float64) * time_step_seconds
+        )
+        return timestamps, epoch_s
+
+    @staticmethod
+    def _visible_runs(visible: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Find contiguous runs of True samples.
+
+        Returns:
+            List of inclusive (start_idx, end_idx) index pairs
+        """
+        if visible.size == 0:
+            return []
+        padded = np.concatenate(([False], visible, [False])).astype(np.int8)
+        edges = np.diff(padded)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1) - 1
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def _elevation_azimuth_arrays(
+        self, location: Location, sat_llh: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized elevation/azimuth from a ground location to many satellite samples.
+
+        Uses the same spherical-Earth model as _calculate_elevation and
+        _calculate_azimuth.
+
+        Args:
+            location: Ground location
+            sat_llh: Satellite (lat_deg, lon_deg, alt_km) samples, shape (N, 3)
+
+        Returns:
+            Tuple of (elevations_deg, azimuths_deg) arrays
+        """
+        earth_radius = EARTH_RADIUS_KM
+
+        ground_x, ground_y, ground_z = self._get_ground_ecef(location)
+        ground_up_x = ground_x / earth_radius
+        ground_up_y = ground_y / earth_radius
+        ground_up_z = ground_z / earth_radius
+
+        sat_lat_rad = np.radians(sat_llh[:, 0])
+        sat_lon_rad = np.radians(sat_llh[:, 1])
+        sat_r = earth_radius + sat_llh[:, 2]
+        cos_sat_lat = np.cos(sat_lat_rad)
+
+        dx = sat_r * cos_sat_lat * np.cos(sat_lon_rad) - ground_x
+        dy = sat_r * cos_sat_lat * np.sin(sat_lon_rad) - ground_y
+        dz = sat_r * np.sin(sat_lat_rad) - ground_z
+
+        ranges = np.sqrt(dx * dx + dy * dy + dz * dz)
+        dot_products = dx * ground_up_x + dy * ground_up_y + dz * ground_up_z
+        with np.errstate(invalid="ignore", divide="ignore"):
+            elevations = np.degrees(
+                np.arcsin(np.clip(dot_products / ranges, -1.0, 1.0))
             )
-            logger.info(f"Found {len(passes)} imaging opportunities for {target.name}")
-        else:
-            logger.info(f"Found {len(passes)} passes for {target.name}")
+        elevations = np.where(ranges > 0, elevations, 0.0)
 
-        return passes
+        ground_lat_rad = math.radians(location.latitude_deg)
+        ground_lon_rad = math.radians(location.longitude_deg)
+        dlon = sat_lon_rad - ground_lon_rad
+        y_az = np.sin(dlon) * cos_sat_lat
+        x_az = math.cos(ground_lat_rad) * np.sin(sat_lat_rad) - math.sin(
+            ground_lat_rad
+        ) * cos_sat_lat * np.cos(dlon)
+        azimuths = (np.degrees(np.arctan2(y_az, x_az)) + 360) % 360
+
+        return elevations, azimuths
+
+    @staticmethod
+    def _look_angle_arrays(
+        sat_llh: np.ndarray, target_lat: float, target_lon: float
+    ) -> np.ndarray:
+        """
+        Vectorized off-nadir look angle from many satellite samples to a target.
+
+        Uses the same spherical-Earth model as _calculate_look_angle.
+
+        Args:
+            sat_llh: Satellite (lat_deg, lon_deg, alt_km) samples, shape (N, 3)
+            target_lat: Target latitude in degrees
+            target_lon: Target longitude in degrees
+
+        Returns:
+            Look angles in degrees, shape (N,)
+        """
+        earth_radius = EARTH_RADIUS_KM
+
+        sat_lat_rad = np.radians(sat_llh[:, 0])
+        sat_lon_rad = np.radians(sat_llh[:, 1])
+        sat_r = earth_radius + sat_llh[:, 2]
+        cos_sat_lat = np.cos(sat_lat_rad)
+        sat_x = sat_r * cos_sat_lat * np.cos(sat_lon_rad)
+        sat_y = sat_r * cos_sat_lat * np.sin(sat_lon_rad)
+        sat_z = sat_r * np.sin(sat_lat_rad)
+
+        target_lat_rad = math.radians(target_lat)
+        target_lon_rad = math.radians(target_lon)
+        target_x = earth_radius * math.cos(target_lat_rad) * math.cos(target_lon_rad)
+        target_y = earth_radius * math.cos(target_lat_rad) * math.sin(target_lon_rad)
+        target_z = earth_radius * math.sin(target_lat_rad)
+
+        dx = target_x - sat_x
+        dy = target_y - sat_y
+        dz = target_z - sat_z
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cos_angle = -(sat_x * dx + sat_y * dy + sat_z * dz) / (
+                sat_r * np.sqrt(dx * dx + dy * dy + dz * dz)
+            )
+        return np.asarray(np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0))))
 
     def _find_passes_adaptive(
         self, target: GroundTarget, start_time: datetime, end_time: datetime
@@ -1994,40 +2701,30 @@ class VisibilityCalculator:
         num_samples = max(5, int(duration / 10))  # At least 5 samples, every 10 seconds
         sample_step = duration / num_samples
 
-        elevations = []
-        azimuths = []
-        times = []
-
-        for i in range(num_samples + 1):
-            sample_time = window_start + timedelta(seconds=i * sample_step)
-            if sample_time > window_end:
-                sample_time = window_end
-
-            elevation, azimuth = self.calculate_elevation_azimuth(target, sample_time)
-            elevations.append(elevation)
-            azimuths.append(azimuth)
-            times.append(sample_time)
-
-        if not elevations:
-            return None
+        # All samples in one batch; the last one lands exactly on window_end
+        offsets = np.minimum(np.arange(num_samples + 1) * sample_step, duration)
+        sat_llh = self._propagate(
+            datetime_to_epoch_seconds(window_start) + offsets
+        ).position_llh
+        elevations, azimuths = self._elevation_azimuth_arrays(
+            self._get_location(target), sat_llh
+        )
 
         # Find maximum elevation
-        max_idx = np.argmax(elevations)
-        max_elevation = elevations[max_idx]
-        max_elev_time = times[max_idx]
-        max_elev_azimuth = azimuths[max_idx]
+        max_idx = int(np.argmax(elevations))
 
         # Create pass details
         return PassDetails(
             target_name=target.name,
             satellite_name=self.satellite.satellite_name,
             start_time=window_start,
-            max_elevation_time=max_elev_time,
+            max_elevation_time=window_start
+            + timedelta(seconds=float(offsets[max_idx])),
             end_time=window_end,
-            max_elevation=max_elevation,
-            start_azimuth=azimuths[0],
-            max_elevation_azimuth=max_elev_azimuth,
-            end_azimuth=azimuths[-1],
+            max_elevation=float(elevations[max_idx]),
+            start_azimuth=float(azimuths[0]),
+            max_elevation_azimuth=float(azimuths[max_idx]),
+            end_azimuth=float(azimuths[-1]),
         )
 
     def _process_imaging_opportunities_adaptive(
@@ -2036,6 +2733,9 @@ class VisibilityCalculator:
         """
         Process imaging opportunities using adaptive windows.
 
+        Every window is sampled at IMAGING_SAMPLE_SECONDS and all samples are
+        evaluated as arrays in one batch.
+
         Args:
             target: Ground target
             windows: List of (start, end) visibility windows
@@ -2043,147 +2743,54 @@ class VisibilityCalculator:
         Returns:
             List of PassDetails for imaging opportunities
         """
-        all_potential_opportunities = []
-
-        # For each window, sample to find imaging opportunities
-        for window_start, window_end in windows:
-            duration = (window_end - window_start).total_seconds()
-            # Sample at 10-second intervals within each window
-            sample_step = 10.0
-            current_time = window_start
-
-            while current_time <= window_end:
-                try:
-                    elevation, azimuth = self.calculate_elevation_azimuth(
-                        target, current_time
-                    )
-
-                    # Check if visible (pointing cone constraints already in event function)
-                    if self._is_target_visible(target, current_time, elevation):
-                        sat_lat, sat_lon, sat_alt = self.satellite.get_position(
-                            current_time
-                        )
-
-                        # Calculate look angle (off-nadir) for STK comparison
-                        look_angle = self._calculate_look_angle(
-                            sat_lat, sat_lon, sat_alt, target.latitude, target.longitude
-                        )
-
-                        opportunity = {
-                            "time": current_time,
-                            "elevation": elevation,
-                            "look_angle": look_angle,  # Off-nadir angle for STK reporting
-                            "azimuth": azimuth,
-                            "sat_lat": sat_lat,
-                            "sat_lon": sat_lon,
-                            "sat_alt": sat_alt,
-                        }
-                        all_potential_opportunities.append(opportunity)
-
-                    current_time += timedelta(seconds=sample_step)
-
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing imaging opportunity at {current_time}: {e}"
-                    )
-                    current_time += timedelta(seconds=sample_step)
-                    continue
-
-        logger.debug(
-            "Found %d potential imaging opportunities (adaptive)",
-            len(all_potential_opportunities),
-        )
-
-        # Store for visualization
-        self._all_imaging_opportunities = all_potential_opportunities
-
-        if not all_potential_opportunities:
+        if not windows:
+            self._all_imaging_opportunities = []
             return []
 
-        # Group into passes and apply separation filtering (reuse existing logic)
-        passes = self._group_opportunities_into_passes(
-            all_potential_opportunities, target
+        sample_step = self.IMAGING_SAMPLE_SECONDS
+        counts = np.array(
+            [
+                int((window_end - window_start).total_seconds() // sample_step) + 1
+                for window_start, window_end in windows
+            ]
         )
+        counts = np.maximum(counts, 0)
+        window_of = np.repeat(np.arange(len(windows)), counts)
+        offsets = (
+            np.arange(window_of.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        ) * sample_step
+        window_epochs = np.array(
+            [datetime_to_epoch_seconds(window_start) for window_start, _ in windows]
+        )
+        epoch_s = window_epochs[window_of] + offsets
 
-        filtered_passes = []
-        for pass_opportunities in passes:
-            filtered_opportunities = self._filter_opportunities_within_pass(
-                pass_opportunities, target
-            )
-
-            if filtered_opportunities:
-                # Use the opportunity with BEST look angle (minimum off-nadir = closest to nadir)
-                best_opp = min(filtered_opportunities, key=lambda x: x["look_angle"])
-                # Calculate imaging window from FILTERED opportunities (after separation filtering)
-                imaging_window_start = min(
-                    opp["time"] for opp in filtered_opportunities
-                )
-                imaging_window_end = max(opp["time"] for opp in filtered_opportunities)
-
-                # DEBUG: Log window calculation
-                logger.debug(
-                    "Target %s (adaptive): best_opp=%s window=[%s to %s] in_window=%s",
-                    target.name,
-                    best_opp["time"],
-                    imaging_window_start,
-                    imaging_window_end,
-                    imaging_window_start <= best_opp["time"] <= imaging_window_end,
-                )
-
-                # Convert off-nadir angle to STK format (from local horizontal)
-                # STK measures from horizontal, not nadir: STK_angle = 90° - off_nadir
-                stk_elevation = 90.0 - best_opp["look_angle"]
-
-                # Compute SIGNED roll angle (critical for scheduler maneuver calculations!)
-                # Must compute at pass start (or best opportunity) for clear left/right geometry
-                try:
-                    sat_lat, sat_lon, sat_alt = self.satellite.get_position(
-                        best_opp["time"]
-                    )
-                    local_incidence_deg = self._calculate_signed_roll_angle(
-                        sat_lat,
-                        sat_lon,
-                        sat_alt,
-                        target.latitude,
-                        target.longitude,
-                        best_opp[
-                            "time"
-                        ],  # Use best opportunity time for clear geometry
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Could not calculate signed roll angle, using unsigned proxy: {e}"
-                    )
-                    local_incidence_deg = best_opp["look_angle"]  # Fallback to unsigned
-
-                # PassDetails stores FULL window for visualization (start to end of pass)
-                # but max_elevation_time stores the optimal imaging time (min incidence angle)
-                # Scheduler will use max_elevation_time, visualization uses start/end
-                pass_details = PassDetails(
-                    target_name=target.name,
-                    satellite_name=self.satellite.satellite_name,
-                    start_time=imaging_window_start,  # Full window start for visualization
-                    max_elevation_time=best_opp[
-                        "time"
-                    ],  # Optimal imaging time for scheduler
-                    end_time=imaging_window_end,  # Full window end for visualization
-                    max_elevation=stk_elevation,  # STK-style angle (from horizontal)
-                    start_azimuth=best_opp["azimuth"],
-                    max_elevation_azimuth=best_opp["azimuth"],
-                    end_azimuth=best_opp["azimuth"],
-                    incidence_angle_deg=local_incidence_deg,  # Best off-nadir (proxy for incidence) for quality planning
-                    mode="IMAGING",  # Imaging mission type
-                )
-
-                pass_details._imaging_opportunities = filtered_opportunities
-                pass_details._imaging_window = pass_opportunities
-                filtered_passes.append(pass_details)
+        # Sunlight (pointing cone constraints are already in the event function)
+        daylight = (
+            self._target_daylight([target], windows[0][0], windows[-1][1])[0]
+            if getattr(target, "imaging_type", "optical") == "optical"
+            else None
+        )
+        index, sat_llh, elevations, azimuths, look_angles = self._imaging_samples(
+            target, epoch_s, daylight
+        )
+        timestamps = [
+            windows[w][0] + timedelta(seconds=offset)
+            for w, offset in zip(window_of[index].tolist(), offsets[index].tolist())
+        ]
 
         logger.debug(
-            "After separation filtering: %d imaging opportunities (adaptive)",
-            len(filtered_passes),
+            "Found %d potential imaging opportunities (adaptive)", len(timestamps)
+        )
+
+        return self._build_imaging_passes(
+            target,
+            timestamps,
+            epoch_s[index],
+            sat_llh,
+            elevations,
+            azimuths,
+            look_angles,
         )
-        return filtered_passes
 
     def get_next_pass(
         self, target: GroundTarget, start_time: datetime, max_search_hours: int = 48
@@ -2253,73 +2860,21 @@ class VisibilityCalculator:
             f"Finding passes (vectorized) for {target.name} from {start_time} to {end_time}"
         )
 
-        # Generate all timestamps
-        time_delta = timedelta(seconds=time_step_seconds)
-        num_steps = int((end_time - start_time).total_seconds() / time_step_seconds) + 1
+        self.ensure_ephemeris(start_time, end_time)
 
-        # Create timestamp array
-        timestamps = [start_time + i * time_delta for i in range(num_steps)]
+        # Generate all timestamps and propagate them in one batch
+        timestamps, epoch_s = self._sample_times(
+            start_time, end_time, time_step_seconds
+        )
         n = len(timestamps)
+        if n == 0:
+            return []
 
-        # Get cached location for target
         location = self._get_location(target)
-        earth_radius = EARTH_RADIUS_KM
-
-        # Pre-compute ground station ECEF (constant)
-        ground_x, ground_y, ground_z = self._get_ground_ecef(location)
-        ground_up_x = ground_x / earth_radius
-        ground_up_y = ground_y / earth_radius
-        ground_up_z = ground_z / earth_radius
-
-        # Get all satellite positions (vectorized via caching)
-        sat_positions_list = []
-        for ts in timestamps:
-            pos = self._get_satellite_position(ts)
-            sat_lat, sat_lon, sat_alt = pos.position_llh
-            sat_positions_list.append((sat_lat, sat_lon, sat_alt))
-
-        # Convert to NumPy arrays
-        sat_positions_arr = np.array(sat_positions_list)
-        sat_lats = sat_positions_arr[:, 0]
-        sat_lons = sat_positions_arr[:, 1]
-        sat_alts = sat_positions_arr[:, 2]
-
-        # Vectorized ECEF conversion
-        sat_lat_rad = np.radians(sat_lats)
-        sat_lon_rad = np.radians(sat_lons)
-
-        sat_x = (earth_radius + sat_alts) * np.cos(sat_lat_rad) * np.cos(sat_lon_rad)
-        sat_y = (earth_radius + sat_alts) * np.cos(sat_lat_rad) * np.sin(sat_lon_rad)
-        sat_z = (earth_radius + sat_alts) * np.sin(sat_lat_rad)
-
-        # Vectorized vector from ground to satellite
-        dx = sat_x - ground_x
-        dy = sat_y - ground_y
-        dz = sat_z - ground_z
-
-        # Vectorized range calculation
-        ranges = np.sqrt(dx * dx + dy * dy + dz * dz)
-
-        # Vectorized elevation calculation
-        dot_products = dx * ground_up_x + dy * ground_up_y + dz * ground_up_z
-        elevation_rads = np.arcsin(np.clip(dot_products / ranges, -1.0, 1.0))
-        elevations = np.degrees(elevation_rads)
-
-        # Vectorized azimuth calculation
-        ground_lat = location.latitude_deg
-        ground_lon = location.longitude_deg
-        ground_lat_rad = np.radians(ground_lat)
-        ground_lon_rad = np.radians(ground_lon)
-
-        dlon = sat_lon_rad - ground_lon_rad
-        y_az = np.sin(dlon) * np.cos(sat_lat_rad)
-        x_az = np.cos(ground_lat_rad) * np.sin(sat_lat_rad) - np.sin(
-            ground_lat_rad
-        ) * np.cos(sat_lat_rad) * np.cos(dlon)
-
-        azimuth_rads = np.arctan2(y_az, x_az)
-        azimuths = np.degrees(azimuth_rads)
-        azimuths = (azimuths + 360) % 360  # Convert to 0-360 range
+        states = self._propagate(epoch_s)
+        elevations, azimuths = self._elevation_azimuth_arrays(
+            location, states.position_llh
+        )
 
         # Find passes using vectorized operations
         above_mask = elevations >= target.elevation_mask
@@ -2370,6 +2925,438 @@ class VisibilityCalculator:
         logger.info(f"Found {len(passes)} passes for {target.name} (vectorized)")
         return passes
 
+    def find_passes_matrix(
+        self,
+        targets: List[GroundTarget],
+        start_time: datetime,
+        end_time: datetime,
+        time_step_seconds: float = 1,
+        refine_edges: bool = False,
+    ) -> Dict[str, List[PassDetails]]:
+        """
+        Find passes for many targets from one shared propagation.
+
+        The satellite is propagated once over the fixed-step grid. Elevation
+        masks (communication) and horizon plus pointing-cone limits (imaging)
+        are screened as a (targets x samples) boolean matrix, evaluated only
+        for the targets a spatial index places within access range of each
+        sample, and AOS/LOS edges are taken from its np.diff. Each candidate
+        run is then re-evaluated with the per-target geometry used by
+        find_passes, so passes match the fixed-step search on the same grid.
+        Optical imaging targets are masked by their precomputed daylight
+        intervals, so night-time candidates never reach the exact check.
+
+        Args:
+            targets: Ground targets
+            start_time: Start of search window (UTC)
+            end_time: End of search window (UTC)
+            time_step_seconds: Sample spacing in seconds
+            refine_edges: Bisect each AOS/LOS between its bracketing samples
+                to ADAPTIVE_REFINEMENT_TOLERANCE (useful with coarse steps)
+
+        Returns:
+            Dictionary mapping target names to lists of passes
+        """
+        if not targets:
+            return {}
+
+        self.ensure_ephemeris(start_time, end_time)
+        _, epoch_s = self._sample_times(start_time, end_time, time_step_seconds)
+        if epoch_s.size == 0:
+            return {target.name: [] for target in targets}
+
+        states = self._propagate(epoch_s)
+        geometry = self._matrix_target_geometry(targets)
+        candidate_runs = self._matrix_candidate_runs(
+            TargetIndex(targets), geometry, states.position_llh
+        )
+
+        optical = [
+            target.mission_type == "imaging"
+            and getattr(target, "imaging_type", "optical") == "optical"
+            for target in targets
+        ]
+        daylight = iter(
+            self._target_daylight(
+                [t for t, is_optical in zip(targets, optical) if is_optical],
+                start_time,
+                end_time,
+            )
+        )
+
+        step = timedelta(seconds=time_step_seconds)
+        visibility_windows: Dict[str, List[PassDetails]] = {}
+        visible_runs: List[List[Tuple[int, int]]] = []
+        for target, runs, is_optical in zip(targets, candidate_runs, optical):
+            passes, target_runs = self._matrix_target_passes(
+                target,
+                runs,
+                start_time,
+                step,
+                states,
+                next(daylight) if is_optical else None,
+            )
+            visibility_windows[target.name] = passes
+            visible_runs.append(target_runs)
+
+        if refine_edges:
+            self._refine_matrix_edges(
+                targets,
+                geometry,
+                visible_runs,
+                visibility_windows,
+                start_time,
+                epoch_s,
+                time_step_seconds,
+            )
+
+        total_passes = sum(len(passes) for passes in visibility_windows.values())
+        logger.info(
+            f"Found {total_passes} total passes across {len(targets)} targets (matrix)"
+        )
+        return visibility_windows
+
+    def _matrix_target_geometry(
+        self, targets: List[GroundTarget]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-target screening parameters for the visibility matrix.
+
+        Returns:
+            Tuple of (ground unit vectors (K, 3), ground radii (K,), minimum
+            sin(elevation) (K,), minimum cos(look angle) (K,))
+        """
+        n_targets = len(targets)
+        ground_unit = np.empty((n_targets, 3))
+        ground_r = np.empty(n_targets)
+        min_sin_elevation = np.empty(n_targets)
+        min_cos_look = np.full(n_targets, -np.inf)
+        for row, target in enumerate(targets):
+            ground = np.array(self._get_ground_ecef(self._get_location(target)))
+            ground_r[row] = np.linalg.norm(ground)
+            ground_unit[row] = ground / ground_r[row]
+            if target.mission_type == "imaging":
+                cone_deg = getattr(target, "max_spacecraft_roll", None) or 45.0
+                min_sin_elevation[row] = 0.0
+                min_cos_look[row] = math.cos(math.radians(min(cone_deg + 0.1, 180.0)))
+            else:
+                min_sin_elevation[row] = math.sin(math.radians(target.elevation_mask))
+        return ground_unit, ground_r, min_sin_elevation, min_cos_look
+
+    @staticmethod
+    def _matrix_geometry(
+        cos_psi: np.ndarray, sat_r: np.ndarray, ground_r: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        sin(elevation) and cos(look angle) from the Earth-central angle.
+
+        Closed forms of _calculate_elevation and _calculate_look_angle in
+        terms of cos(psi) between target and satellite position vectors, so
+        they broadcast over any (targets, samples) shape.
+
+        Returns:
+            Tuple of (sin_elevation, cos_look_angle) arrays
+        """
+        earth_radius = EARTH_RADIUS_KM
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ground_range = np.sqrt(
+                np.maximum(
+                    sat_r * sat_r
+                    + ground_r * ground_r
+                    - 2 * sat_r * ground_r * cos_psi,
+                    0.0,
+                )
+            )
+            sin_elevation = (
+                ground_r * (sat_r * cos_psi - ground_r) / (earth_radius * ground_range)
+            )
+            surface_range = np.sqrt(
+                np.maximum(
+                    sat_r * sat_r
+                    + earth_radius * earth_radius
+                    - 2 * sat_r * earth_radius * cos_psi,
+                    0.0,
+                )
+            )
+            cos_look = (sat_r - earth_radius * cos_psi) / surface_range
+        return sin_elevation, cos_look
+
+    @staticmethod
+    def _sat_unit_vectors(sat_llh: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Satellite unit position vectors (N, 3) and radii (N,) from geodetic LLH."""
+        sat_lat_rad = np.radians(sat_llh[:, 0])
+        sat_lon_rad = np.radians(sat_llh[:, 1])
+        cos_sat_lat = np.cos(sat_lat_rad)
+        sat_unit = np.stack(
+            (
+                cos_sat_lat * np.cos(sat_lon_rad),
+                cos_sat_lat * np.sin(sat_lon_rad),
+                np.sin(sat_lat_rad),
+            ),
+            axis=1,
+        )
+        return sat_unit, EARTH_RADIUS_KM + sat_llh[:, 2]
+
+    def _matrix_candidate_runs(
+        self,
+        index: TargetIndex,
+        geometry: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        sat_llh: np.ndarray,
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Screen targets against samples and return candidate runs.
+
+        The target index pairs each group of samples with the targets inside
+        the access radius of its sub-satellite points, so only those (target,
+        sample) blocks are evaluated (at most MATRIX_BLOCK_ELEMENTS at a time).
+        Thresholds are widened by MATRIX_CANDIDATE_SLACK so every sample that
+        passes the exact per-target check is a candidate.
+
+        Returns:
+            Per target, inclusive (start_idx, end_idx) candidate runs
+        """
+        ground_unit, ground_r, min_sin_elevation, min_cos_look = geometry
+        sat_unit, sat_r = self._sat_unit_vectors(sat_llh)
+        min_sin_elevation = min_sin_elevation - MATRIX_CANDIDATE_SLACK
+        min_cos_look = min_cos_look - MATRIX_CANDIDATE_SLACK
+        radius_rad = index.access_radius_rad(float(np.max(sat_llh[:, 2])))
+
+        pair_rows, pair_cols = [], []
+        for rows, samples in index.candidate_groups(sat_unit, radius_rad):
+            block = max(1, MATRIX_BLOCK_ELEMENTS // rows.size)
+            for offset in range(0, samples.size, block):
+                cols = samples[offset : offset + block]
+                cos_psi = ground_unit[rows] @ sat_unit[cols].T
+                sin_elevation, cos_look = self._matrix_geometry(
+                    cos_psi, sat_r[None, cols], ground_r[rows, None]
+                )
+                candidate = (sin_elevation >= min_sin_elevation[rows, None]) & (
+                    cos_look >= min_cos_look[rows, None]
+                )
+                hit_rows, hit_cols = np.nonzero(candidate)
+                pair_rows.append(rows[hit_rows])
+                pair_cols.append(cols[hit_cols])
+
+        runs: List[List[Tuple[int, int]]] = [[] for _ in range(len(index))]
+        if not pair_rows:
+            return runs
+        rows = np.concatenate(pair_rows)
+        cols = np.concatenate(pair_cols)
+        order = np.lexsort((cols, rows))
+        rows, cols = rows[order], cols[order]
+
+        # A run ends where the target changes or the sample index jumps
+        breaks = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 1)) + 1
+        run_starts = np.concatenate(([0], breaks))
+        run_ends = np.concatenate((breaks - 1, [rows.size - 1]))
+        for row, start_idx, end_idx in zip(
+            rows[run_starts].tolist(),
+            cols[run_starts].tolist(),
+            cols[run_ends].tolist(),
+        ):
+            runs[row].append((start_idx, end_idx))
+        return runs
+
+    def _matrix_target_passes(
+        self,
+        target: GroundTarget,
+        runs: List[Tuple[int, int]],
+        start_time: datetime,
+        step: timedelta,
+        states: PropagatedStates,
+        daylight: Optional[DaylightIntervals] = None,
+    ) -> Tuple[List[PassDetails], List[Tuple[int, int]]]:
+        """
+        Exact passes of one target inside its candidate runs.
+
+        Runs of optical targets are masked by their daylight intervals first,
+        and runs entirely at night are skipped.
+
+        Returns:
+            Tuple of (passes, inclusive (start_idx, end_idx) visible runs)
+        """
+        location = self._get_location(target)
+        passes: List[PassDetails] = []
+        visible_runs: List[Tuple[int, int]] = []
+        samples: List[tuple] = []  # Visible imaging samples per run
+        imaging = target.mission_type == "imaging"
+        cone_deg = getattr(target, "max_spacecraft_roll", None) or 45.0
+
+        for run_start, run_end in runs:
+            if daylight is not None:
+                lit = daylight.is_lit(states.times[run_start : run_end + 1])
+                if not lit.any():
+                    continue
+
+            sat_llh = states.position_llh[run_start : run_end + 1]
+            timestamps = [start_time + i * step for i in range(run_start, run_end + 1)]
+            elevations, azimuths = self._elevation_azimuth_arrays(location, sat_llh)
+
+            if not imaging:
+                visible = elevations >= target.elevation_mask
+                passes.extend(
+                    self._communication_passes(
+                        target, timestamps, sat_llh, elevations, azimuths
+                    )
+                )
+            else:
+                look_angles = self._look_angle_arrays(
+                    sat_llh, target.latitude, target.longitude
+                )
+                visible = (elevations > 0) & (look_angles <= cone_deg + 0.1)
+                if daylight is not None:
+                    visible &= lit
+                hits = np.flatnonzero(visible)
+                samples.append(
+                    (
+                        [timestamps[i] for i in hits.tolist()],
+                        states.times[run_start + hits],
+                        sat_llh[hits],
+                        elevations[hits],
+                        azimuths[hits],
+                        look_angles[hits],
+                    )
+                )
+
+            visible_runs.extend(
+                (run_start + start_idx, run_start + end_idx)
+                for start_idx, end_idx in self._visible_runs(visible)
+            )
+
+        if imaging:
+            if samples:
+                timestamps_per_run, *arrays = zip(*samples)
+                passes = self._build_imaging_passes(
+                    target,
+                    [t for run in timestamps_per_run for t in run],
+                    *(np.concatenate(a) for a in arrays),
+                )
+            else:
+                self._all_imaging_opportunities = []
+        return passes, visible_runs
+
+    def _refine_matrix_edges(
+        self,
+        targets: List[GroundTarget],
+        geometry: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        visible_runs: List[List[Tuple[int, int]]],
+        visibility_windows: Dict[str, List[PassDetails]],
+        start_time: datetime,
+        epoch_s: np.ndarray,
+        time_step_seconds: float,
+    ) -> None:
+        """
+        Bisect every interior AOS/LOS of the matrix search in batched steps.
+
+        All edges are bisected together: each iteration propagates the
+        midpoints of every bracket in one call. Pass start/end times (and
+        communication start/end azimuths) are moved to the refined edges.
+        """
+        rows: List[int] = []
+        inside: List[int] = []
+        outside: List[int] = []
+        is_start: List[bool] = []
+        last_idx = epoch_s.size - 1
+        for row, runs in enumerate(visible_runs):
+            for start_idx, end_idx in runs:
+                if start_idx > 0:
+                    rows.append(row)
+                    inside.append(start_idx)
+                    outside.append(start_idx - 1)
+                    is_start.append(True)
+                if end_idx < last_idx:
+                    rows.append(row)
+                    inside.append(end_idx)
+                    outside.append(end_idx + 1)
+                    is_start.append(False)
+        if not rows:
+            return
+
+        row_arr = np.array(rows)
+        t_in = epoch_s[np.array(inside)]
+        t_out = epoch_s[np.array(outside)]
+        iterations = max(
+            0,
+            math.ceil(
+                math.log2(time_step_seconds / self.ADAPTIVE_REFINEMENT_TOLERANCE)
+            ),
+        )
+        for _ in range(iterations):
+            t_mid = (t_in + t_out) / 2
+            visible = self._matrix_visible_at(targets, geometry, row_arr, t_mid)
+            t_in = np.where(visible, t_mid, t_in)
+            t_out = np.where(visible, t_out, t_mid)
+        refined = (t_in + t_out) / 2
+
+        order = np.argsort(refined)
+        edge_llh = np.empty((refined.size, 3))
+        edge_llh[order] = self._propagate(refined[order]).position_llh
+
+        epoch0 = float(epoch_s[0])
+        edges: Dict[Tuple[int, bool, datetime], Tuple[datetime, np.ndarray]] = {}
+        step = timedelta(seconds=time_step_seconds)
+        for k, (row, idx, start_edge) in enumerate(zip(rows, inside, is_start)):
+            edges[(row, start_edge, start_time + idx * step)] = (
+                start_time + timedelta(seconds=float(refined[k]) - epoch0),
+                edge_llh[k],
+            )
+
+        for row, target in enumerate(targets):
+            location = self._get_location(target)
+            for pass_details in visibility_windows[target.name]:
+                for start_edge in (True, False):
+                    sample_time = (
+                        pass_details.start_time if start_edge else pass_details.end_time
+                    )
+                    edge = edges.get((row, start_edge, sample_time))
+                    if edge is None:
+                        continue
+                    edge_time, sat_llh = edge
+                    if start_edge:
+                        pass_details.start_time = edge_time
+                    else:
+                        pass_details.end_time = edge_time
+                    if target.mission_type == "imaging":
+                        continue
+                    _, azimuth = self._elevation_azimuth_arrays(
+                        location, sat_llh[None, :]
+                    )
+                    if start_edge:
+                        pass_details.start_azimuth = float(azimuth[0])
+                    else:
+                        pass_details.end_azimuth = float(azimuth[0])
+
+    def _matrix_visible_at(
+        self,
+        targets: List[GroundTarget],
+        geometry: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        rows: np.ndarray,
+        epoch_s: np.ndarray,
+    ) -> np.ndarray:
+        """Exact visibility of targets[rows[i]] at epoch_s[i], for all pairs at once."""
+        ground_unit, ground_r, min_sin_elevation, min_cos_look = geometry
+        order = np.argsort(epoch_s)
+        sat_llh = np.empty((epoch_s.size, 3))
+        sat_llh[order] = self._propagate(epoch_s[order]).position_llh
+        sat_unit, sat_r = self._sat_unit_vectors(sat_llh)
+
+        cos_psi = np.einsum("ij,ij->i", ground_unit[rows], sat_unit)
+        sin_elevation, cos_look = self._matrix_geometry(cos_psi, sat_r, ground_r[rows])
+        visible: np.ndarray = (sin_elevation >= min_sin_elevation[rows]) & (
+            cos_look >= min_cos_look[rows]
+        )
+
+        for row in np.unique(rows[visible]).tolist():
+            target = targets[row]
+            if (
+                target.mission_type == "imaging"
+                and getattr(target, "imaging_type", "optical") == "optical"
+            ):
+                pairs = np.flatnonzero(visible & (rows == row))
+                daylight = self._daylight_cache[(target.latitude, target.longitude)]
+                visible[pairs] = daylight.is_lit(epoch_s[pairs])
+        return visible
+
     def get_visibility_windows(
         self,
         targets: List[GroundTarget],
@@ -2386,64 +3373,54 @@ class VisibilityCalculator:
             targets: List of ground targets
             start_time: Start of search window (UTC)
             end_time: End of search window (UTC)
-            use_parallel: Enable parallel processing for multiple targets
+            use_parallel: Enable parallel processing across targets, or
+                across time slices for few targets over a long window
             max_workers: Maximum parallel workers (None = auto-detect)
             progress_callback: Optional callback(completed, total) for progress
 
         Returns:
             Dictionary mapping target names to lists of passes
         """
-        # Use parallel processing if enabled and we have multiple targets
-        if use_parallel and len(targets) > 1:
+        # Use parallel processing if enabled and there is work to split:
+        # several targets, or a window long enough to slice in time
+        if use_parallel and targets:
             try:
-                from .parallel import ParallelVisibilityCalculator
+                from .parallel import ParallelVisibilityCalculator, should_run_parallel
 
-                logger.info(f"Using parallel processing for {len(targets)} targets")
-                parallel_calc = ParallelVisibilityCalculator(
-                    self.satellite,
-                    max_workers=max_workers,
-                    use_adaptive=self.use_adaptive,
-                )
+                if should_run_parallel(
+                    len(targets), start_time, end_time, max_workers
+                ):
+                    logger.info(
+                        f"Using parallel processing for {len(targets)} targets"
+                    )
+                    parallel_calc = ParallelVisibilityCalculator(
+                        self.satellite,
+                        max_workers=max_workers,
+                        use_adaptive=self.use_adaptive,
+                    )
 
-                # Get results as dictionaries
-                results_dict = parallel_calc.get_visibility_windows(
-                    targets, start_time, end_time, progress_callback=progress_callback
-                )
+                    # Workers return packed pass tables; rebuild PassDetails here
+                    table = parallel_calc.compute_pass_table(
+                        targets,
+                        start_time,
+                        end_time,
+                        progress_callback=progress_callback,
+                    )
+                    visibility_windows: Dict[str, List[PassDetails]] = {
+                        target.name: [] for target in targets
+                    }
+                    for pass_detail in table.to_passes(tz=start_time.tzinfo):
+                        visibility_windows[pass_detail.target_name].append(pass_detail)
 
-                # Convert dictionary results back to PassDetails objects
-                visibility_windows = {}
-                for target_name, passes_dicts in results_dict.items():
-                    passes = []
-                    for p_dict in passes_dicts:
-                        # Reconstruct PassDetails from dict
-                        pass_detail = PassDetails(
-                            target_name=p_dict["target_name"],
-                            satellite_name=p_dict["satellite_name"],
-                            start_time=datetime.fromisoformat(p_dict["start_time"]),
-                            max_elevation_time=datetime.fromisoformat(
-                                p_dict["max_elevation_time"]
-                            ),
-                            end_time=datetime.fromisoformat(p_dict["end_time"]),
-                            max_elevation=p_dict["max_elevation"],
-                            start_azimuth=p_dict["start_azimuth"],
-                            max_elevation_azimuth=p_dict["max_elevation_azimuth"],
-                            end_azimuth=p_dict["end_azimuth"],
-                            incidence_angle_deg=p_dict.get(
-                                "incidence_angle_deg"
-                            ),  # Quality metric
-                            mode=p_dict.get("mode"),  # OPTICAL, SAR, or IMAGING
-                        )
-                        passes.append(pass_detail)
-                    visibility_windows[target_name] = passes
-
-                total_passes = sum(
-                    len(passes) for passes in visibility_windows.values()
-                )
-                logger.info(
-                    f"Found {total_passes} total passes across {len(targets)} targets (parallel)"
-                )
+                    total_passes = sum(
+                        len(passes) for passes in visibility_windows.values()
+                    )
+                    logger.info(
+                        f"Found {total_passes} total passes across {len(targets)} "
+                        "targets (parallel)"
+                    )
 
-                return visibility_windows
+                    return visibility_windows
 
             except ImportError as e:
                 logger.warning(
@@ -2454,6 +3431,13 @@ class VisibilityCalculator:
                     f"Parallel processing failed: {e}. Falling back to serial."
                 )
 
+        # Large fixed-step searches screen all targets in one matrix pass
+        if not self.use_adaptive and len(targets) >= MATRIX_MIN_TARGETS:
+            visibility_windows = self.find_passes_matrix(targets, start_time, end_time)
+            if progress_callback:
+                progress_callback(len(targets), len(targets))
+            return visibility_windows
+
         # Serial processing (original implementation)
         visibility_windows = {}
 
@@ -2469,62 +3453,201 @@ class VisibilityCalculator:
 
         return visibility_windows
 
+    def iter_passes(
+        self,
+        targets: List[GroundTarget],
+        start_time: datetime,
+        end_time: datetime,
+        chunk: timedelta = STREAM_CHUNK,
+    ) -> Iterator[PassDetails]:
+        """
+        Stream passes over many targets in chronological order.
+
+        The horizon is searched one time block at a time, so memory is bounded
+        by the passes (and ephemeris) of a single block rather than the whole
+        horizon. Each block owns the passes starting inside it and is searched
+        a little past its end, further while a pass it owns is still cut
+        short, so passes crossing block boundaries are yielded once and whole.
+        Pass times at block boundaries agree with a single search over the
+        horizon to within the search's time step or refinement tolerance.
+
+        Args:
+            targets: List of ground targets
+            start_time: Start of search window (UTC)
+            end_time: End of search window (UTC)
+            chunk: Length of each searched time block
+
+        Yields:
+            PassDetails ordered by start time (then target name)
+
+        Raises:
+            ValueError: If chunk is not positive
+        """
+        if chunk <= timedelta(0):
+            raise ValueError("chunk must be positive")
+
+        block_start = start_time
+        while block_start < end_time:
+            block_end = min(block_start + chunk, end_time)
+            yield from self.find_block_passes(
+                targets,
+                block_start,
+                block_end,
+                end_time,
+                include_block_start=block_start == start_time,
+            )
+            block_start = block_end
+
+    def find_block_passes(
+        self,
+        targets: List[GroundTarget],
+        block_start: datetime,
+        block_end: datetime,
+        end_time: datetime,
+        include_block_start: bool = True,
+    ) -> List[PassDetails]:
+        """
+        Find the passes starting inside one time block, each one whole.
+
+        The block owns passes starting in (block_start, block_end], or in
+        [block_start, block_end] when include_block_start is set (the first
+        block of a horizon); a pass already running at block_start belongs
+        to the previous block. The search runs a little past block_end, and
+        further while a pass it owns is still cut short, up to end_time.
+        Consecutive blocks therefore return every pass of the horizon once.
+
+        Args:
+            targets: List of ground targets
+            block_start: Start of the block (UTC)
+            block_end: End of the block (UTC)
+            end_time: End of the whole horizon; searches never pass it
+            include_block_start: Own passes starting exactly at block_start
+
+        Returns:
+            PassDetails ordered by start time (then target name)
+        """
+        lookahead = timedelta(seconds=STREAM_LOOKAHEAD_SECONDS)
+        pending = list(targets)
+        block_passes: List[PassDetails] = []
+
+        while pending:
+            search_end = min(block_end + lookahead, end_time)
+            windows = self.get_visibility_windows(pending, block_start, search_end)
+            cut_short = []
+            for target in pending:
+                owned = [
+                    p
+                    for p in windows.get(target.name, [])
+                    if (include_block_start or p.start_time > block_start)
+                    and p.start_time <= block_end
+                ]
+                if search_end < end_time and any(
+                    p.end_time >= search_end for p in owned
+                ):
+                    cut_short.append(target)
+                else:
+                    block_passes.extend(owned)
+            pending = cut_short
+            lookahead *= 2
+
+        block_passes.sort(key=lambda p: (p.start_time, p.target_name))
+        return block_passes
+
     def enrich_pass_with_stk_data(
         self,
         pass_details: PassDetails,
         target: GroundTarget,
         max_roll_rate_dps: float = 1.0,
         sensor_gsd_base_m: Optional[float] = None,
+        sections: Optional[Iterable[str]] = None,
+        lazy: bool = False,
     ) -> PassDetails:
         """
         Enrich a PassDetails object with comprehensive STK-like metrics.
 
         Computes geometry, lighting, quality, and maneuver data for the pass.
+        With lazy=True nothing is computed yet: each section is computed the
+        first time one of its fields is read and memoized on the pass.
 
         Args:
             pass_details: The basic pass details to enrich
             target: Ground target object
             max_roll_rate_dps: Maximum roll rate in deg/sec for slew time calc
             sensor_gsd_base_m: Base GSD at nadir (if None, GSD not computed)
+            sections: Enrichment sections to compute (default: all of
+                ENRICHMENT_SECTIONS); the sections they depend on (see
+                ENRICHMENT_DEPENDENCIES) are computed as well
+            lazy: Defer each section until first access
 
         Returns:
             The same PassDetails object with enhanced fields populated
-        """
-        try:
-            # Compute geometry at AOS, TCA, and LOS
-            pass_details.geometry_aos = self._compute_geometry_at_time(
-                target, pass_details.start_time, sensor_gsd_base_m
-            )
-            pass_details.geometry_tca = self._compute_geometry_at_time(
-                target, pass_details.max_elevation_time, sensor_gsd_base_m
-            )
-            pass_details.geometry_los = self._compute_geometry_at_time(
-                target, pass_details.end_time, sensor_gsd_base_m
-            )
 
-            # Compute lighting at TCA (most relevant moment)
-            pass_details.lighting = self._compute_lighting_at_time(
-                target, pass_details.max_elevation_time
-            )
+        Raises:
+            ValueError: If a section name is unknown
+        """
+        selected = normalize_enrichment_sections(sections)
+        for section in selected & ENRICHMENT_DEPENDENCIES.keys():
+            selected |= frozenset(ENRICHMENT_DEPENDENCIES[section])
+        compute = partial(
+            self._compute_enrichment_section,
+            target=target,
+            max_roll_rate_dps=max_roll_rate_dps,
+            sensor_gsd_base_m=sensor_gsd_base_m,
+        )
 
-            # Compute quality score
-            pass_details.quality = self._compute_quality_score(pass_details, target)
+        if lazy:
+            pass_details._enrichment = compute
+            pass_details._pending_sections = selected
+            return pass_details
 
-            # Compute maneuver requirements
-            pass_details.maneuver = self._compute_maneuver_requirements(
-                target, pass_details.max_elevation_time, max_roll_rate_dps
-            )
+        for section in ENRICHMENT_SECTIONS:
+            if section in selected:
+                compute(pass_details, section)
+        return pass_details
 
-            # Update legacy incidence angle from geometry
-            if pass_details.geometry_tca:
-                pass_details.incidence_angle_deg = (
-                    pass_details.geometry_tca.incidence_angle_deg
+    def _compute_enrichment_section(
+        self,
+        pass_details: PassDetails,
+        section: str,
+        target: GroundTarget,
+        max_roll_rate_dps: float = 1.0,
+        sensor_gsd_base_m: Optional[float] = None,
+    ) -> None:
+        """Compute one enrichment section of a pass (failures are logged)."""
+        try:
+            if section == "geometry":
+                # Compute geometry at AOS, TCA, and LOS
+                pass_details.geometry_aos = self._compute_geometry_at_time(
+                    target, pass_details.start_time, sensor_gsd_base_m
+                )
+                pass_details.geometry_tca = self._compute_geometry_at_time(
+                    target, pass_details.max_elevation_time, sensor_gsd_base_m
+                )
+                pass_details.geometry_los = self._compute_geometry_at_time(
+                    target, pass_details.end_time, sensor_gsd_base_m
                 )
 
-        except Exception as e:
-            logger.warning(f"Failed to enrich pass with STK data: {e}")
+                # Fill the legacy incidence angle unless the pass set one
+                if pass_details.incidence_angle_deg is None:
+                    pass_details.incidence_angle_deg = (
+                        pass_details.geometry_tca.incidence_angle_deg
+                    )
+            elif section == "lighting":
+                # Compute lighting at TCA (most relevant moment)
+                pass_details.lighting = self._compute_lighting_at_time(
+                    target, pass_details.max_elevation_time
+                )
+            elif section == "quality":
+                pass_details.quality = self._compute_quality_score(
+                    pass_details, target
+                )
+            elif section == "maneuver":
+                pass_details.maneuver = self._compute_maneuver_requirements(
+                    target, pass_details.max_elevation_time, max_roll_rate_dps
+                )
 
-        return pass_details
+        except Exception as e:
+            logger.warning(f"Failed to enrich pass with STK data ({section}): {e}")
 
     def _compute_geometry_at_time(
         self,
@@ -2534,7 +3657,7 @@ class VisibilityCalculator:
     ) -> PassGeometry:
         """Compute full geometry data at a specific time."""
         # Get satellite position
-        sat_lat, sat_lon, sat_alt = self.satellite.get_position(timestamp)
+        sat_lat, sat_lon, sat_alt = self.get_satellite_position(timestamp)
 
         # Calculate elevation and azimuth
         elevation, azimuth = self.calculate_elevation_azimuth(target, timestamp)
@@ -2604,15 +3727,13 @@ class VisibilityCalculator:
         timestamp: datetime,
     ) -> PassLighting:
         """Compute lighting conditions at a specific time."""
-        from .sunlight import get_sun_elevation, is_target_illuminated
+        from .sunlight import get_sun_elevation
 
         # Get sun elevation at target
         sun_elevation = get_sun_elevation(target.latitude, target.longitude, timestamp)
 
-        # Check if target is illuminated
-        target_sunlit = is_target_illuminated(
-            target.latitude, target.longitude, timestamp, min_sun_elevation=0.0
-        )
+        # Target is illuminated when the sun is above its horizon
+        target_sunlit = sun_elevation >= 0.0
 
         # Check if satellite is in sunlight (simplified - assume sunlit if sun elevation > -18°)
         # A more accurate calculation would check satellite position vs Earth shadow
@@ -2706,7 +3827,7 @@ class VisibilityCalculator:
         max_roll_rate_dps: float = 1.0,
     ) -> PassManeuver:
         """Compute maneuver requirements for imaging at a specific time."""
-        sat_lat, sat_lon, sat_alt = self.satellite.get_position(timestamp)
+        sat_lat, sat_lon, sat_alt = self.get_satellite_position(timestamp)
 
         # Calculate roll angle (signed)
         roll_angle = self._calculate_signed_roll_angle(
@@ -0,0 +1,356 @@
+"""
+In-memory cache of visibility passes for incremental analysis.
+
+Passes are cached per (satellite TLE, search mode, target geometry and
+constraints) together with the time ranges they cover. A new analysis only
+computes the sub-ranges of its window that are not covered yet, so sliding
+a multi-day horizon forward by a day costs one day of visibility search.
+
+Passes cut by the edge of a covered range are recomputed whole: every
+range that is computed is first widened until no cached pass is active
+within BOUNDARY_MARGIN_SECONDS of its ends, and the cached passes it
+overlaps are replaced by the new results. Passes that straddle the start or
+end of the requested window are recomputed over the window so they are
+clipped exactly as a full analysis would clip them. Pass times at range
+boundaries agree with a full analysis to within the search's time step
+(fixed-step) or refinement tolerance (adaptive).
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .ephemeris_cache import EphemerisCache
+from .orbit import SatelliteOrbit
+from .targets import GroundTarget
+from .visibility import PassDetails
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+# Quiet time required around the ends of every computed range
+BOUNDARY_MARGIN_SECONDS = 60.0
+
+ComputeFunction = Callable[
+    [List[GroundTarget], datetime, datetime], Dict[str, List[PassDetails]]
+]
+TimeRange = Tuple[datetime, datetime]
+
+_default_cache: Optional["VisibilityCache"] = None
+_default_cache_lock = threading.Lock()
+
+
+@dataclass
+class _CoverageEntry:
+    """Passes of one target and the merged time ranges they cover."""
+
+    covered: List[TimeRange] = field(default_factory=list)
+    passes: List[PassDetails] = field(default_factory=list)
+
+
+class VisibilityCache:
+    """
+    Per-target pass cache that computes only uncovered time ranges.
+
+    Entries are evicted least recently used first once more than
+    max_entries (satellite, target) pairs are cached. Returned passes are
+    shallow copies, so callers may tag or enrich them freely.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached (satellite, target) entries
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self.requested_target_seconds = 0.0
+        self.computed_target_seconds = 0.0
+        self._margin = timedelta(seconds=BOUNDARY_MARGIN_SECONDS)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _CoverageEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.requested_target_seconds = 0.0
+            self.computed_target_seconds = 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with the number of entries, the requested and
+            computed target-seconds, and the fraction served from cache
+        """
+        with self._lock:
+            entries = len(self._entries)
+            requested = self.requested_target_seconds
+            computed = self.computed_target_seconds
+        return {
+            "entries": entries,
+            "requested_target_seconds": requested,
+            "computed_target_seconds": computed,
+            "reuse_ratio": max(0.0, 1.0 - computed / requested) if requested else 0.0,
+        }
+
+    @staticmethod
+    def target_key(target: GroundTarget) -> Tuple[Hashable, ...]:
+        """
+        Key of the target properties that determine its passes.
+
+        Args:
+            target: Ground target
+
+        Returns:
+            Hashable tuple of name, geometry and visibility constraints
+        """
+        return (
+            target.name,
+            target.latitude,
+            target.longitude,
+            target.altitude,
+            target.mission_type,
+            target.elevation_mask,
+            target.max_spacecraft_roll,
+            target.sensor_fov_half_angle_deg,
+            getattr(target, "imaging_type", "optical"),
+        )
+
+    def get_visibility_windows(
+        self,
+        satellite: SatelliteOrbit,
+        targets: Sequence[GroundTarget],
+        start_time: datetime,
+        end_time: datetime,
+        compute: ComputeFunction,
+        search_key: Hashable = None,
+    ) -> Dict[str, List[PassDetails]]:
+        """
+        Passes of every target over a window, computing only what is missing.
+
+        Targets that need the same time range are computed in one call, so
+        batched and parallel searches keep working on the uncovered part.
+
+        Args:
+            satellite: Satellite the passes are computed for
+            targets: Ground targets (names must be unique)
+            start_time: Start of analysis window (UTC)
+            end_time: End of analysis window (UTC)
+            compute: Function (targets, start, end) -> {target name: passes}
+                running the actual visibility search
+            search_key: Hashable description of the search settings
+                (e.g. adaptive vs fixed-step); results are cached separately
+                per value
+
+        Returns:
+            Dictionary mapping target names to lists of passes
+        """
+        satellite_key = (
+            EphemerisCache.tle_key(satellite.tle_lines),
+            satellite.satellite_name,
+            search_key,
+            start_time.utcoffset() is None,
+        )
+        keys = [(satellite_key, self.target_key(t)) for t in targets]
+        window_seconds = (end_time - start_time).total_seconds() * len(targets)
+        computed_seconds = 0.0
+        with self._lock:
+            entries = [self._entries.get(key) or _CoverageEntry() for key in keys]
+            self.requested_target_seconds += window_seconds
+
+        # Fill the uncovered ranges; targets missing the same ranges share calls
+        groups: Dict[Tuple[TimeRange, ...], List[int]] = {}
+        for i, entry in enumerate(entries):
+            gaps = tuple(_subtract(start_time, end_time, entry.covered))
+            if gaps:
+                groups.setdefault(gaps, []).append(i)
+        for gaps, members in groups.items():
+            for gap_start, gap_end in gaps:
+                member_passes = [p for i in members for p in entries[i].passes]
+                range_start, range_end = self._widen(member_passes, gap_start, gap_end)
+                new_passes, cost = self._compute(
+                    compute, [targets[i] for i in members], range_start, range_end
+                )
+                computed_seconds += cost
+                for i in members:
+                    entry = entries[i]
+                    entry.passes = _replace_range(
+                        entry.passes,
+                        new_passes.get(targets[i].name, []),
+                        range_start,
+                        range_end,
+                    )
+                    entry.covered = _merge(entry.covered + [(range_start, range_end)])
+
+        with self._lock:
+            for key, entry in zip(keys, entries):
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        # Passes running across the window edges are clipped by recomputing
+        result = {
+            target.name: [
+                p
+                for p in entry.passes
+                if p.start_time <= end_time and p.end_time >= start_time
+            ]
+            for target, entry in zip(targets, entries)
+        }
+        edge_ranges = self._edge_ranges(targets, result, start_time, end_time)
+        for (range_start, range_end), members in edge_ranges.items():
+            new_passes, cost = self._compute(
+                compute, [targets[i] for i in members], range_start, range_end
+            )
+            computed_seconds += cost
+            for i in members:
+                name = targets[i].name
+                result[name] = _replace_range(
+                    result[name], new_passes.get(name, []), range_start, range_end
+                )
+
+        logger.info(
+            "Visibility cache: computed %.1f of %.1f target-hours (%d targets)",
+            computed_seconds / 3600.0,
+            window_seconds / 3600.0,
+            len(targets),
+        )
+        return {name: [copy.copy(p) for p in passes] for name, passes in result.items()}
+
+    def _compute(
+        self,
+        compute: ComputeFunction,
+        targets: List[GroundTarget],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Tuple[Dict[str, List[PassDetails]], float]:
+        """Run the visibility search for one range; returns passes and cost."""
+        cost = (end_time - start_time).total_seconds() * len(targets)
+        with self._lock:
+            self.computed_target_seconds += cost
+        return compute(targets, start_time, end_time), cost
+
+    def _widen(
+        self, passes: List[PassDetails], start_time: datetime, end_time: datetime
+    ) -> TimeRange:
+        """Widen a range until no pass is active within the margin of its ends."""
+        changed = True
+        while changed:
+            changed = False
+            for p in passes:
+                if p.start_time < start_time <= p.end_time + self._margin:
+                    start_time = p.start_time - self._margin
+                    changed = True
+                if p.start_time - self._margin <= end_time < p.end_time:
+                    end_time = p.end_time + self._margin
+                    changed = True
+        return start_time, end_time
+
+    def _edge_ranges(
+        self,
+        targets: Sequence[GroundTarget],
+        result: Dict[str, List[PassDetails]],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Dict[TimeRange, List[int]]:
+        """Ranges to recompute so passes straddling the window ends are clipped."""
+        at_start = [
+            i
+            for i, t in enumerate(targets)
+            if any(p.start_time < start_time for p in result[t.name])
+        ]
+        at_end = [
+            i
+            for i, t in enumerate(targets)
+            if any(p.end_time > end_time for p in result[t.name])
+        ]
+
+        ranges: Dict[TimeRange, List[int]] = {}
+        for members, at_window_start in ((at_start, True), (at_end, False)):
+            if not members:
+                continue
+            passes = [p for i in members for p in result[targets[i].name]]
+            edge = start_time if at_window_start else end_time
+            range_start, range_end = self._widen(passes, edge, edge)
+            ranges.setdefault(
+                (max(range_start, start_time), min(range_end, end_time)), []
+            ).extend(members)
+
+        if len(ranges) == 2:
+            (first, first_members), (second, second_members) = ranges.items()
+            if first[1] >= second[0]:
+                # The two edge ranges meet: recompute the whole window once
+                return {
+                    (start_time, end_time): sorted(
+                        set(first_members) | set(second_members)
+                    )
+                }
+        return ranges
+
+
+def get_visibility_cache() -> VisibilityCache:
+    """Return the process-wide visibility cache, creating it on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = VisibilityCache()
+        return _default_cache
+
+
+def _subtract(
+    start_time: datetime, end_time: datetime, covered: List[TimeRange]
+) -> List[TimeRange]:
+    """Parts of [start_time, end_time] not inside any merged covered range."""
+    gaps: List[TimeRange] = []
+    cursor = start_time
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end_time:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end_time:
+        gaps.append((cursor, end_time))
+    return gaps
+
+
+def _merge(ranges: List[TimeRange]) -> List[TimeRange]:
+    """Sort ranges and merge those that overlap or touch."""
+    merged: List[TimeRange] = []
+    for range_start, range_end in sorted(ranges):
+        if merged and range_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+        else:
+            merged.append((range_start, range_end))
+    return merged
+
+
+def _replace_range(
+    passes: List[PassDetails],
+    new_passes: List[PassDetails],
+    start_time: datetime,
+    end_time: datetime,
+) -> List[PassDetails]:
+    """Replace the passes overlapping [start_time, end_time] with new ones."""
+    kept = [p for p in passes if p.end_time < start_time or p.start_time > end_time]
+    return sorted(kept + list(new_passes), key=lambda p: p.start_time)
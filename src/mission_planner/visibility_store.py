@@ -0,0 +1,389 @@
+"""
+Persistent content-addressed store of visibility results.
+
+Each row of a SQLite file holds the passes of one target over one horizon,
+keyed by a SHA-256 hash of the canonical JSON of everything that determines
+them: TLE element lines and satellite name, the target's geometry and
+visibility constraints (name, lat/lon/alt, mission and imaging type,
+elevation mask, sensor FOV and roll limit), the search settings and the
+horizon. Identical requests are answered from the file across restarts,
+workspaces and processes; only targets without a stored result are
+searched.
+
+Payloads are pickled PassDetails lists, so the store file must only be
+written by this package (it lives next to the other local data files).
+Total payload size is bounded with least-recently-used eviction, and
+hit/miss counters are kept per process.
+
+The store is enabled process-wide by setting the
+``MISSION_PLANNER_VISIBILITY_STORE_PATH`` environment variable, or by
+calling :func:`configure_visibility_store`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Union
+
+from .orbit import SatelliteOrbit
+from .targets import GroundTarget
+from .visibility import PassDetails
+from .visibility_cache import ComputeFunction, VisibilityCache
+
+logger = logging.getLogger(__name__)
+
+VISIBILITY_STORE_PATH_ENV = "MISSION_PLANNER_VISIBILITY_STORE_PATH"
+VISIBILITY_STORE_MAX_MB_ENV = "MISSION_PLANNER_VISIBILITY_STORE_MAX_MB"
+
+DEFAULT_STORE_MAX_BYTES = 256 * 1024 * 1024
+# Bump when visibility results or the payload format change; older rows
+# then stop matching and age out through LRU eviction.
+STORE_FORMAT_VERSION = 2
+# Keys per SELECT (below SQLite's bound-parameter limit)
+_QUERY_CHUNK = 500
+
+_default_stores: Dict[Any, "VisibilityStore"] = {}
+_default_stores_lock = threading.Lock()
+
+
+class VisibilityStore:
+    """
+    Size-bounded SQLite file of per-target pass lists.
+
+    Safe to share between threads and processes: every operation uses its
+    own connection, and the database runs in WAL mode with a busy timeout.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], max_bytes: int = DEFAULT_STORE_MAX_BYTES
+    ) -> None:
+        """
+        Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Upper bound on the total size of stored payloads
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._counter_lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS visibility_results (
+                    key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_visibility_results_last_access "
+                "ON visibility_results(last_access)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error."""
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA busy_timeout = 5000")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def result_key(
+        satellite: SatelliteOrbit,
+        target: GroundTarget,
+        start_time: datetime,
+        end_time: datetime,
+        search_key: Hashable = None,
+    ) -> str:
+        """
+        Content hash identifying the passes of one target over one horizon.
+
+        Args:
+            satellite: Satellite the passes are computed for
+            target: Ground target
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            search_key: Description of the search settings
+
+        Returns:
+            Hex digest of the canonical request description
+        """
+        description = {
+            "version": STORE_FORMAT_VERSION,
+            "tle": [line.strip() for line in satellite.tle_lines[-2:]],
+            "satellite": satellite.satellite_name,
+            "target": list(VisibilityCache.target_key(target)),
+            "search": search_key,
+            "start": start_time.isoformat(),
+            "end": end_time.isoformat(),
+        }
+        canonical = json.dumps(description, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[PassDetails]]:
+        """
+        Stored pass lists for the given keys.
+
+        Args:
+            keys: Result keys
+
+        Returns:
+            Dictionary of the keys that were found; unreadable rows are
+            dropped and treated as missing
+        """
+        found: Dict[str, List[PassDetails]] = {}
+        unreadable: List[str] = []
+        with self._connect() as conn:
+            for offset in range(0, len(keys), _QUERY_CHUNK):
+                chunk = list(keys[offset : offset + _QUERY_CHUNK])
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT key, payload FROM visibility_results "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, payload in rows:
+                    try:
+                        found[key] = pickle.loads(zlib.decompress(payload))
+                    except Exception as e:
+                        logger.warning(f"Dropping unreadable visibility result: {e}")
+                        unreadable.append(key)
+
+            now = time.time()
+            conn.executemany(
+                "UPDATE visibility_results SET last_access = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+            conn.executemany(
+                "DELETE FROM visibility_results WHERE key = ?",
+                [(key,) for key in unreadable],
+            )
+
+        with self._counter_lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, results: Dict[str, List[PassDetails]]) -> None:
+        """
+        Store pass lists and evict the least recently used rows over the bound.
+
+        Args:
+            results: Dictionary mapping result keys to pass lists
+        """
+        now = time.time()
+        rows = []
+        for key, passes in results.items():
+            payload = zlib.compress(pickle.dumps(list(passes), pickle.HIGHEST_PROTOCOL))
+            rows.append((key, payload, len(payload), now))
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO visibility_results "
+                "(key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            evicted = self._evict(conn)
+
+        if evicted:
+            with self._counter_lock:
+                self.evictions += evicted
+            logger.debug(f"Evicted {evicted} visibility results from {self.path}")
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least recently used rows until the payloads fit max_bytes."""
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM visibility_results"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        evict_keys = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM visibility_results ORDER BY last_access"
+        ):
+            if total <= self.max_bytes:
+                break
+            evict_keys.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM visibility_results WHERE key = ?", evict_keys)
+        return len(evict_keys)
+
+    def get_visibility_windows(
+        self,
+        satellite: SatelliteOrbit,
+        targets: Sequence[GroundTarget],
+        start_time: datetime,
+        end_time: datetime,
+        compute: ComputeFunction,
+        search_key: Hashable = None,
+    ) -> Dict[str, List[PassDetails]]:
+        """
+        Passes of every target over a horizon, searching only unstored targets.
+
+        Targets without a stored result are computed in one call and stored.
+
+        Args:
+            satellite: Satellite the passes are computed for
+            targets: Ground targets (names must be unique)
+            start_time: Start of horizon (UTC)
+            end_time: End of horizon (UTC)
+            compute: Function (targets, start, end) -> {target name: passes}
+                running the actual visibility search
+            search_key: Description of the search settings (JSON-serializable)
+
+        Returns:
+            Dictionary mapping target names to lists of passes
+        """
+        keys = [
+            self.result_key(satellite, target, start_time, end_time, search_key)
+            for target in targets
+        ]
+        try:
+            stored = self.get_many(keys)
+        except sqlite3.Error as e:
+            logger.warning(f"Visibility store unavailable ({self.path}): {e}")
+            return compute(list(targets), start_time, end_time)
+
+        missing = [t for t, key in zip(targets, keys) if key not in stored]
+        computed = compute(missing, start_time, end_time) if missing else {}
+        if missing:
+            new_results = {
+                key: computed.get(target.name, [])
+                for target, key in zip(targets, keys)
+                if key not in stored
+            }
+            try:
+                self.put_many(new_results)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not store visibility results: {e}")
+            stored.update(new_results)
+
+        logger.info(
+            "Visibility store: %d of %d targets served from %s",
+            len(targets) - len(missing),
+            len(targets),
+            self.path.name,
+        )
+        return {target.name: stored[key] for target, key in zip(targets, keys)}
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return int(
+                conn.execute("SELECT COUNT(*) FROM visibility_results").fetchone()[0]
+            )
+
+    def clear(self) -> None:
+        """Delete every stored result and reset the counters."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM visibility_results")
+        with self._counter_lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Store statistics.
+
+        Returns:
+            Dictionary with path, entry count, stored bytes, size bound and
+            this process's hit/miss/eviction counters
+        """
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM visibility_results"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": int(entries),
+            "bytes": int(size),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"VisibilityStore(path='{self.path}', max_bytes={self.max_bytes})"
+
+
+def configure_visibility_store(
+    path: Optional[Union[str, Path]], max_bytes: Optional[int] = None
+) -> None:
+    """
+    Enable (or disable) the process-wide visibility store.
+
+    The settings are stored in the environment so worker processes started
+    afterwards use the same file.
+
+    Args:
+        path: SQLite database file, or None to disable the store
+        max_bytes: Optional size bound in bytes
+    """
+    if path is None:
+        os.environ.pop(VISIBILITY_STORE_PATH_ENV, None)
+        return
+    os.environ[VISIBILITY_STORE_PATH_ENV] = str(path)
+    if max_bytes is not None:
+        os.environ[VISIBILITY_STORE_MAX_MB_ENV] = str(max_bytes / (1024 * 1024))
+
+
+def get_visibility_store() -> Optional[VisibilityStore]:
+    """
+    Return the process-wide store configured through the environment.
+
+    Returns:
+        VisibilityStore, or None when the store is not enabled
+    """
+    path = os.environ.get(VISIBILITY_STORE_PATH_ENV, "").strip()
+    if not path:
+        return None
+
+    try:
+        max_mb = float(os.environ.get(VISIBILITY_STORE_MAX_MB_ENV, ""))
+        max_bytes = int(max_mb * 1024 * 1024)
+    except ValueError:
+        max_bytes = DEFAULT_STORE_MAX_BYTES
+
+    key = (path, max_bytes)
+    with _default_stores_lock:
+        store = _default_stores.get(key)
+        if store is None:
+            try:
+                store = VisibilityStore(path, max_bytes=max_bytes)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                logger.warning(f"Visibility store disabled ({path}): {e}")
+                return None
+            _default_stores[key] = store
+    return store
@@ -0,0 +1,121 @@
+"""
+Tests for constellation-wide batched propagation.
+
+Tests cover:
+- (N_sat, N_time, 3) state tensors match per-satellite propagation
+- Per-satellite slices
+- Batched ephemeris building, with and without the disk cache
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from mission_planner.constellation import Constellation
+from mission_planner.ephemeris_cache import EPHEMERIS_CACHE_DIR_ENV
+from mission_planner.orbit import SatelliteOrbit
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+NOAA_TLE = [
+    "NOAA 19",
+    "1 33591U 09005A   21275.51082176  .00000071  00000-0  63858-4 0  9991",
+    "2 33591  99.1802 299.9340 0013960 210.3962 149.6382 14.12478543652043",
+]
+
+START = datetime(2021, 10, 2, 12, 0, 0)
+END = START + timedelta(hours=3)
+
+
+@pytest.fixture
+def constellation():
+    return Constellation(
+        {
+            "sat_ISS": SatelliteOrbit(ISS_TLE, "ISS (ZARYA)"),
+            "sat_NOAA 19": SatelliteOrbit(NOAA_TLE, "NOAA 19"),
+        }
+    )
+
+
+@pytest.fixture
+def times():
+    return [START + timedelta(seconds=s) for s in range(0, 3 * 3600, 60)]
+
+
+class TestConstellationPropagate:
+    """Tests for batched propagation."""
+
+    def test_tensor_shapes(self, constellation, times) -> None:
+        states = constellation.propagate(times)
+
+        assert len(states) == 2
+        assert states.position_ecef.shape == (2, len(times), 3)
+        assert states.velocity_ecef.shape == (2, len(times), 3)
+        assert states.position_llh.shape == (2, len(times), 3)
+
+    def test_matches_per_satellite_propagation(self, constellation, times) -> None:
+        states = constellation.propagate(times)
+
+        for sat_id, orbit in constellation.satellites.items():
+            reference = orbit.propagate(times)
+            np.testing.assert_allclose(
+                states[sat_id].position_ecef, reference.position_ecef, atol=1e-9
+            )
+            np.testing.assert_allclose(
+                states[sat_id].position_llh, reference.position_llh, atol=1e-9
+            )
+
+    def test_unknown_satellite_slice_raises(self, constellation, times) -> None:
+        states = constellation.propagate(times)
+        with pytest.raises(ValueError):
+            states["sat_missing"]
+
+
+class TestBuildEphemerides:
+    """Tests for per-satellite ephemerides from one batch."""
+
+    def test_one_ephemeris_per_satellite(self, constellation, monkeypatch) -> None:
+        monkeypatch.delenv(EPHEMERIS_CACHE_DIR_ENV, raising=False)
+
+        ephemerides = constellation.build_ephemerides(START, END)
+
+        assert list(ephemerides) == ["sat_ISS", "sat_NOAA 19"]
+        for sat_id, ephemeris in ephemerides.items():
+            assert ephemeris.covers(START, END)
+            assert ephemeris.orbit is constellation.satellites[sat_id]
+            ts = START + timedelta(minutes=47, seconds=13)
+            assert ephemeris.get_position(ts) == pytest.approx(
+                constellation.satellites[sat_id].get_position(ts), abs=1e-3
+            )
+
+    def test_cached_satellites_skip_propagation(
+        self, constellation, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.setenv(EPHEMERIS_CACHE_DIR_ENV, str(tmp_path / "cache"))
+        constellation.build_ephemerides(START, END)
+
+        with patch.object(
+            Constellation, "_propagate_batch", side_effect=AssertionError("propagated")
+        ):
+            ephemerides = constellation.build_ephemerides(START, END)
+
+        assert len(ephemerides) == 2
+
+    def test_failed_satellite_is_skipped(self, constellation, monkeypatch) -> None:
+        monkeypatch.delenv(EPHEMERIS_CACHE_DIR_ENV, raising=False)
+        real_batch = Constellation._propagate_batch
+
+        def failing_batch(self, epoch_s, satellite_ids):
+            errors, position, velocity = real_batch(self, epoch_s, satellite_ids)
+            errors[0, -1] = 6
+            return errors, position, velocity
+
+        with patch.object(Constellation, "_propagate_batch", failing_batch):
+            ephemerides = constellation.build_ephemerides(START, END)
+
+        assert list(ephemerides) == ["sat_NOAA 19"]
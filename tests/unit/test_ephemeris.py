@@ -0,0 +1,219 @@
+"""
+Tests for the interpolated Ephemeris table.
+
+Tests cover:
+- Interpolation accuracy against direct SGP4 within the analytic bound
+- Deep-space (SDP4) orbits within the bound including node velocity errors
+- Coverage checks and out-of-range behaviour
+- Segmented node tables interpolate like joined ones
+- Sharing one ephemeris across targets in VisibilityCalculator
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from mission_planner.ephemeris import Ephemeris, node_grid
+from mission_planner.orbit import SatelliteOrbit, datetime_to_epoch_seconds
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+SAMPLE_TLE_LINES = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+
+GEO_TLE_LINES = [
+    "INTELSAT 904 (IS-904)",
+    "1 27380U 02007A   25222.39292387 -.00000203  00000+0  00000+0 0  9999",
+    "2 27380   6.1363  72.9204 0003212  95.4341 264.7376  1.00271965 48647",
+]
+
+START = datetime(2021, 10, 2, 12, 0, 0)
+END = START + timedelta(hours=6)
+
+
+@pytest.fixture
+def satellite():
+    return SatelliteOrbit(SAMPLE_TLE_LINES, "ISS (ZARYA)")
+
+
+@pytest.fixture
+def ephemeris(satellite):
+    return Ephemeris.from_orbit(satellite, START, END)
+
+
+class TestNodeGrid:
+    """Tests for node_grid helper."""
+
+    def test_aligned_to_step(self) -> None:
+        nodes = node_grid(1000.5, 1300.0, 60.0)
+        assert nodes[0] == 960.0
+        assert nodes[-1] == 1320.0
+        assert np.allclose(np.diff(nodes), 60.0)
+
+
+class TestEphemerisAccuracy:
+    """Interpolated states stay within the reported error bound."""
+
+    def test_error_bound_below_one_metre(self, ephemeris) -> None:
+        assert 0 < ephemeris.error_bound_km < 1e-3
+
+    def test_propagate_matches_sgp4(self, satellite, ephemeris) -> None:
+        times = START + np.arange(0, 6 * 3600, 7.3) * timedelta(seconds=1)
+        direct = satellite.propagate(list(times))
+        interp = ephemeris.propagate(list(times))
+
+        error_km = np.linalg.norm(direct.position_ecef - interp.position_ecef, axis=1)
+        assert error_km.max() <= ephemeris.error_bound_km
+
+    def test_get_position_matches_sgp4(self, satellite, ephemeris) -> None:
+        for offset in (0, 17, 1234.5, 21599):
+            ts = START + timedelta(seconds=offset)
+            lat, lon, alt = ephemeris.get_position(ts)
+            ref_lat, ref_lon, ref_alt = satellite.get_position(ts)
+            assert lat == pytest.approx(ref_lat, abs=1e-4)
+            assert lon == pytest.approx(ref_lon, abs=1e-4)
+            assert alt == pytest.approx(ref_alt, abs=1e-3)
+
+    def test_position_at_matches_get_position(self, ephemeris) -> None:
+        for offset in (0, 17, 1234.5, 21599):
+            ts = START + timedelta(seconds=offset)
+            assert ephemeris.position_at(
+                datetime_to_epoch_seconds(ts)
+            ) == pytest.approx(ephemeris.get_position(ts))
+
+    def test_get_state_reports_bound(self, ephemeris) -> None:
+        state = ephemeris.get_state(START)
+        assert state.error_estimate == ephemeris.error_bound_km
+        assert len(state.position_ecef) == 3
+
+
+class TestDeepSpaceBound:
+    """The bound covers SDP4 node velocity errors on deep-space orbits."""
+
+    @pytest.fixture
+    def geo(self):
+        return SatelliteOrbit(GEO_TLE_LINES, "INTELSAT 904 (IS-904)")
+
+    def test_geo_within_bound(self, geo) -> None:
+        start = datetime(2025, 8, 10, 0, 0, 0)
+        ephemeris = Ephemeris.from_orbit(geo, start, start + timedelta(hours=12))
+        times = start + np.arange(0, 12 * 3600, 7.3) * timedelta(seconds=1)
+        direct = geo.propagate(list(times))
+        interp = ephemeris.propagate(list(times))
+
+        error_km = np.linalg.norm(direct.position_ecef - interp.position_ecef, axis=1)
+        assert error_km.max() <= ephemeris.error_bound_km
+        assert ephemeris.error_bound_km < 1e-2
+
+    def test_detached_geo_bound_is_infinite(self, geo) -> None:
+        start = datetime(2025, 8, 10, 0, 0, 0)
+        ephemeris = Ephemeris.from_orbit(geo, start, start + timedelta(hours=1))
+        detached = Ephemeris(
+            ephemeris.satellite_name,
+            ephemeris.node_times,
+            ephemeris.position_eci,
+            ephemeris.velocity_eci,
+        )
+        assert detached.error_bound_km == float("inf")
+
+
+class TestEphemerisCoverage:
+    """Tests for covers() and out-of-range handling."""
+
+    def test_covers_horizon(self, ephemeris) -> None:
+        assert ephemeris.covers(START, END)
+        assert ephemeris.covers(datetime_to_epoch_seconds(START))
+        assert not ephemeris.covers(START, END + timedelta(hours=1))
+
+    def test_out_of_range_falls_back_to_orbit(self, satellite, ephemeris) -> None:
+        ts = END + timedelta(hours=2)
+        assert ephemeris.get_position(ts) == pytest.approx(satellite.get_position(ts))
+
+    def test_position_at_out_of_range_falls_back(self, satellite, ephemeris) -> None:
+        ts = END + timedelta(hours=2)
+        assert ephemeris.position_at(datetime_to_epoch_seconds(ts)) == pytest.approx(
+            satellite.get_position(ts)
+        )
+
+    def test_out_of_range_without_orbit_raises(self, ephemeris) -> None:
+        detached = Ephemeris(
+            ephemeris.satellite_name,
+            ephemeris.node_times,
+            ephemeris.position_eci,
+            ephemeris.velocity_eci,
+        )
+        with pytest.raises(ValueError):
+            detached.get_position(END + timedelta(hours=2))
+
+    def test_uneven_nodes_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            Ephemeris(
+                "X", np.array([0.0, 60.0, 150.0]), np.zeros((3, 3)), np.zeros((3, 3))
+            )
+
+
+class TestEphemerisSegments:
+    """Node tables held as consecutive segments."""
+
+    def test_segments_match_joined_nodes(self, ephemeris) -> None:
+        # Split the 364 node intervals into 4 segments sharing edge nodes
+        steps = (ephemeris.node_times.shape[0] - 1) // 4
+        rows = [slice(i * steps, (i + 1) * steps + 1) for i in range(4)]
+        segmented = Ephemeris(
+            ephemeris.satellite_name,
+            ephemeris.node_times,
+            [ephemeris.position_eci[r] for r in rows],
+            [ephemeris.velocity_eci[r] for r in rows],
+        )
+        times = START + np.arange(0, 6 * 3600, 7.3) * timedelta(seconds=1)
+
+        np.testing.assert_array_equal(
+            segmented.propagate(list(times)).position_ecef,
+            ephemeris.propagate(list(times)).position_ecef,
+        )
+        for ts in times[::97]:
+            assert segmented.get_position(ts) == ephemeris.get_position(ts)
+        np.testing.assert_array_equal(segmented.position_eci, ephemeris.position_eci)
+        assert segmented.error_bound_km == ephemeris.error_bound_km
+
+    def test_mismatched_segments_rejected(self, ephemeris) -> None:
+        with pytest.raises(ValueError, match="do not match"):
+            Ephemeris(
+                "X",
+                ephemeris.node_times,
+                [ephemeris.position_eci[:10], ephemeris.position_eci[9:]],
+                [ephemeris.velocity_eci[:10], ephemeris.velocity_eci[9:]],
+            )
+
+
+class TestVisibilityCalculatorEphemeris:
+    """VisibilityCalculator builds and reuses one ephemeris per window."""
+
+    def test_ephemeris_shared_across_targets(self, satellite) -> None:
+        calc = VisibilityCalculator(satellite, use_adaptive=False)
+        targets = [
+            GroundTarget(name="Athens", latitude=37.98, longitude=23.73),
+            GroundTarget(name="Rome", latitude=41.90, longitude=12.50),
+        ]
+
+        calc.find_passes(targets[0], START, END, time_step_seconds=30)
+        first = calc.ephemeris
+        calc.find_passes(targets[1], START, END, time_step_seconds=30)
+
+        assert first is not None
+        assert calc.ephemeris is first
+
+    def test_passes_match_direct_sgp4(self, satellite, ephemeris) -> None:
+        target = GroundTarget(name="Athens", latitude=37.98, longitude=23.73)
+        with_table = VisibilityCalculator(satellite, ephemeris=ephemeris)
+        direct = VisibilityCalculator(satellite)
+        direct.ensure_ephemeris = lambda *_: None
+
+        passes = with_table.find_passes(target, START, END, time_step_seconds=30)
+        reference = direct.find_passes(target, START, END, time_step_seconds=30)
+
+        assert [p.start_time for p in passes] == [p.start_time for p in reference]
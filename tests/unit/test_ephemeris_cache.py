@@ -0,0 +1,137 @@
+"""
+Tests for the on-disk ephemeris block cache.
+
+Tests cover:
+- Cached ephemerides match directly propagated ones
+- Repeat and overlapping horizons reuse blocks without propagation
+- LRU eviction, TLE invalidation and environment configuration
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from mission_planner.ephemeris import Ephemeris
+from mission_planner.ephemeris_cache import (
+    EPHEMERIS_CACHE_DIR_ENV,
+    EphemerisCache,
+    build_ephemeris,
+    get_ephemeris_cache,
+)
+from mission_planner.orbit import SatelliteOrbit
+
+SAMPLE_TLE_LINES = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+
+START = datetime(2021, 10, 2, 12, 0, 0)
+END = START + timedelta(hours=8)
+
+
+@pytest.fixture
+def satellite():
+    return SatelliteOrbit(SAMPLE_TLE_LINES, "ISS (ZARYA)")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EphemerisCache(tmp_path / "ephemeris")
+
+
+class TestEphemerisCache:
+    """Tests for EphemerisCache block storage."""
+
+    def test_matches_direct_propagation(self, satellite, cache) -> None:
+        cached = cache.get_ephemeris(satellite, START, END)
+        direct = Ephemeris.from_orbit(satellite, START, END)
+
+        assert cached.covers(START, END)
+        times = [START + timedelta(seconds=s) for s in range(0, 8 * 3600, 901)]
+        np.testing.assert_allclose(
+            cached.propagate(times).position_ecef,
+            direct.propagate(times).position_ecef,
+            atol=1e-9,
+        )
+
+    def test_blocks_are_memory_mapped(self, satellite, cache) -> None:
+        cache.get_ephemeris(satellite, START, END)
+        paths = list(cache.directory.glob("*.npy"))
+
+        assert paths
+        block = np.load(paths[0], mmap_mode="r")
+        assert isinstance(block, np.memmap)
+        assert block.shape[0] == 2 and block.shape[2] == 3
+
+    def test_multi_block_horizon_stays_mapped(self, satellite, cache) -> None:
+        cache.get_ephemeris(satellite, START, END)
+        ephemeris = cache.get_ephemeris(satellite, START, END)
+
+        segments = ephemeris._position_segments + ephemeris._velocity_segments
+        assert len(segments) > 2
+        for segment in segments:
+            base = segment
+            while not isinstance(base, np.memmap):
+                base = base.base
+                assert base is not None
+
+    def test_overlapping_horizon_skips_propagation(self, satellite, cache) -> None:
+        cache.get_ephemeris(satellite, START, END)
+
+        with patch.object(
+            SatelliteOrbit, "propagate_eci", side_effect=AssertionError("propagated")
+        ):
+            ephemeris = cache.get_ephemeris(
+                satellite, START + timedelta(hours=1), END - timedelta(hours=1)
+            )
+
+        assert ephemeris.covers(START + timedelta(hours=1), END - timedelta(hours=1))
+
+    def test_lru_eviction_bounds_size(self, satellite, tmp_path) -> None:
+        probe = EphemerisCache(tmp_path / "probe")
+        probe.get_ephemeris(satellite, START, START)
+        block_size = probe.size_bytes() // len(list(probe.directory.glob("*.npy")))
+
+        cache = EphemerisCache(tmp_path / "bounded", max_bytes=2 * block_size)
+        cache.get_ephemeris(satellite, START, START + timedelta(days=2))
+
+        assert cache.size_bytes() <= 2 * block_size
+
+    def test_invalidate_removes_tle_blocks(self, satellite, cache) -> None:
+        cache.get_ephemeris(satellite, START, END)
+
+        removed = cache.invalidate(SAMPLE_TLE_LINES[1:])
+
+        assert removed > 0
+        assert cache.size_bytes() == 0
+
+    def test_malformed_block_is_rebuilt(self, satellite, cache) -> None:
+        cache.get_ephemeris(satellite, START, START)
+        path = next(cache.directory.glob("*.npy"))
+        path.write_bytes(b"not a numpy file")
+
+        ephemeris = cache.get_ephemeris(satellite, START, START)
+
+        assert ephemeris.covers(START)
+        assert np.load(path).shape[0] == 2
+
+
+class TestDefaultCache:
+    """Tests for environment-configured cache."""
+
+    def test_disabled_without_env(self, monkeypatch) -> None:
+        monkeypatch.delenv(EPHEMERIS_CACHE_DIR_ENV, raising=False)
+        assert get_ephemeris_cache() is None
+
+    def test_build_ephemeris_uses_env_cache(
+        self, satellite, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.setenv(EPHEMERIS_CACHE_DIR_ENV, str(tmp_path / "env"))
+
+        ephemeris = build_ephemeris(satellite, START, END)
+
+        assert ephemeris.covers(START, END)
+        assert list((tmp_path / "env").glob("*.npy"))
@@ -0,0 +1,168 @@
+"""
+Tests for array-based imaging opportunity extraction.
+
+Tests cover:
+- Fixed-step extraction matches a per-sample scalar scan
+- Adaptive windows are sampled on their own 10 s grids
+- Pass grouping by time gap
+- Greedy minimum-separation filtering
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9025",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49572541123456",
+]
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(days=3)
+
+
+@pytest.fixture(scope="module")
+def satellite():
+    return SatelliteOrbit(ISS_TLE, "ISS")
+
+
+@pytest.fixture
+def target():
+    return GroundTarget("Athens", 37.98, 23.73, mission_type="imaging")
+
+
+def _scalar_scan(calc, target, start, end, step_seconds):
+    """Reference scan evaluating one sample at a time."""
+    times = []
+    current = start
+    while current <= end:
+        elevation, _ = calc.calculate_elevation_azimuth(target, current)
+        if calc._is_target_visible(target, current, elevation):
+            times.append(current)
+        current += timedelta(seconds=step_seconds)
+    return times
+
+
+def _greedy(times, separation):
+    kept = []
+    for i, t in enumerate(times):
+        if not kept or t >= times[kept[-1]] + separation:
+            kept.append(i)
+    return kept
+
+
+class TestFixedStepExtraction:
+    """Tests for _process_imaging_opportunities."""
+
+    def test_matches_scalar_scan(self, satellite, target) -> None:
+        calc = VisibilityCalculator(satellite)
+        passes = calc.find_passes(target, START, END, time_step_seconds=10)
+        opportunities = calc.get_all_imaging_opportunities()
+
+        expected = _scalar_scan(calc, target, START, END, 10)
+
+        assert passes
+        assert [o["time"] for o in opportunities] == expected
+        for pass_details in passes:
+            window = pass_details._imaging_window
+            best = min(window, key=lambda o: o["look_angle"])
+            assert pass_details.start_time == window[0]["time"]
+            assert pass_details.end_time == window[-1]["time"]
+            assert pass_details.max_elevation_time == best["time"]
+            assert pass_details.max_elevation == pytest.approx(
+                90.0 - best["look_angle"]
+            )
+            assert abs(pass_details.incidence_angle_deg) == pytest.approx(
+                best["look_angle"], abs=1e-6
+            )
+
+    def test_empty_window(self, satellite, target) -> None:
+        calc = VisibilityCalculator(satellite)
+
+        assert calc.find_passes(target, START, START - timedelta(hours=1)) == []
+        assert calc.get_all_imaging_opportunities() == []
+
+
+class TestAdaptiveExtraction:
+    """Tests for _process_imaging_opportunities_adaptive."""
+
+    def test_samples_each_window_on_its_grid(self, satellite, target) -> None:
+        calc = VisibilityCalculator(satellite, use_adaptive=True)
+        windows = [
+            (
+                START + timedelta(hours=8, minutes=40, microseconds=500),
+                START + timedelta(hours=8, minutes=50),
+            ),
+            (
+                START + timedelta(days=1, hours=7, minutes=50, seconds=3),
+                START + timedelta(days=1, hours=8),
+            ),
+        ]
+
+        calc._process_imaging_opportunities_adaptive(target, windows)
+        times = [o["time"] for o in calc.get_all_imaging_opportunities()]
+
+        expected = [
+            t
+            for window_start, window_end in windows
+            for t in _scalar_scan(calc, target, window_start, window_end, 10)
+        ]
+        assert times
+        assert times == expected
+
+
+class TestGroupingAndSeparation:
+    """Tests for pass grouping and the greedy separation filter."""
+
+    def test_groups_split_on_gaps(self, satellite, target) -> None:
+        calc = VisibilityCalculator(satellite)
+        epoch_s = np.array([0.0, 10.0, 20.0, 1000.0, 1010.0, 5000.0])
+
+        groups = calc._group_opportunities_into_passes(epoch_s, target)
+
+        assert groups == [(0, 3), (3, 5), (5, 6)]
+        assert calc._group_opportunities_into_passes(np.empty(0), target) == []
+
+    @pytest.mark.parametrize("separation", [0.0, 7.0, 25.0, 1000.0])
+    def test_greedy_matches_loop(self, separation) -> None:
+        rng = np.random.default_rng(3)
+        epoch_s = np.sort(rng.uniform(0, 600, 200))
+
+        kept = VisibilityCalculator._separated_indices(epoch_s, separation)
+
+        assert kept.tolist() == _greedy(epoch_s.tolist(), separation)
+
+    def test_within_pass_filter(self, satellite, target) -> None:
+        calc = VisibilityCalculator(satellite)
+        calc.IMAGING_MIN_SEPARATION_SECONDS = 60.0
+
+        passes = calc.find_passes(target, START, END, time_step_seconds=10)
+
+        assert passes
+        for pass_details in passes:
+            times = [o["time"] for o in pass_details._imaging_opportunities]
+            assert times[0] == pass_details._imaging_window[0]["time"]
+            assert all(
+                b - a >= timedelta(seconds=60) for a, b in zip(times, times[1:])
+            )
+
+    def test_pass_separation_filter(self, satellite, target) -> None:
+        calc = VisibilityCalculator(satellite)
+        passes = calc.find_passes(target, START, END, time_step_seconds=10)
+        assert len(passes) > 1
+
+        assert calc._apply_imaging_separation_filter(passes, target) == passes
+
+        calc.IMAGING_MIN_SEPARATION_SECONDS = 12 * 3600.0
+        kept = calc._apply_imaging_separation_filter(passes[::-1], target)
+        assert kept[0] is passes[0]
+        assert all(
+            b.max_elevation_time - a.max_elevation_time >= timedelta(hours=12)
+            for a, b in zip(kept, kept[1:])
+        )
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from mission_planner.orbit import SatelliteOrbit
@@ -209,3 +210,56 @@ class TestSatelliteOrbitAttributes:
 
     def test_has_tle_lines(self, satellite) -> None:
         assert hasattr(satellite, "tle_lines")
+
+
+class TestPropagate:
+    """Tests for batched propagate method."""
+
+    @pytest.fixture
+    def satellite(self):
+        return SatelliteOrbit(SAMPLE_TLE_LINES, "ISS (ZARYA)")
+
+    @pytest.fixture
+    def timestamps(self):
+        start = datetime(2021, 10, 3, 0, 0, 0)
+        return [start + timedelta(seconds=47 * i) for i in range(200)]
+
+    def test_matches_get_position(self, satellite, timestamps) -> None:
+        states = satellite.propagate(timestamps)
+
+        expected_llh = np.array([satellite.get_position(t) for t in timestamps])
+        expected_ecef = np.array(
+            [satellite.predictor.get_position(t).position_ecef for t in timestamps]
+        )
+
+        np.testing.assert_allclose(states.position_llh, expected_llh, atol=1e-6)
+        np.testing.assert_allclose(states.position_ecef, expected_ecef, atol=1e-3)
+
+    def test_accepts_epoch_seconds_and_datetime64(self, satellite, timestamps) -> None:
+        from_datetimes = satellite.propagate(timestamps)
+        from_datetime64 = satellite.propagate(
+            np.array(timestamps, dtype="datetime64[us]")
+        )
+        from_seconds = satellite.propagate(from_datetimes.times)
+
+        np.testing.assert_allclose(
+            from_datetime64.position_ecef, from_datetimes.position_ecef
+        )
+        np.testing.assert_allclose(
+            from_seconds.position_ecef, from_datetimes.position_ecef
+        )
+
+    def test_returns_contiguous_arrays(self, satellite, timestamps) -> None:
+        states = satellite.propagate(timestamps)
+
+        assert len(states) == len(timestamps)
+        for arr in (states.position_ecef, states.velocity_ecef, states.position_llh):
+            assert arr.shape == (len(timestamps), 3)
+            assert arr.flags["C_CONTIGUOUS"]
+        assert states.datetimes()[0] == timestamps[0]
+
+    def test_empty_input(self, satellite) -> None:
+        states = satellite.propagate(np.array([], dtype=np.float64))
+
+        assert len(states) == 0
+        assert states.position_llh.shape == (0, 3)
@@ -10,14 +10,65 @@ from datetime import datetime, timedelta
 from concurrent.futures import Future
 from concurrent.futures.process import BrokenProcessPool
 
+import mission_planner.parallel as parallel_module
+from mission_planner.orbit import SatelliteOrbit
 from mission_planner.parallel import (
+    INITIAL_BATCH_SIZE,
+    SLICE_ALIGN_SECONDS,
     get_optimal_workers,
     get_or_create_process_pool,
     cleanup_process_pool,
-    _compute_target_passes_worker,
+    next_batch_size,
+    should_run_parallel,
+    time_slices,
+    _compute_target_batch_worker,
     ParallelVisibilityCalculator,
     benchmark_parallel_speedup
 )
+from mission_planner.pass_table import PassTable
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import PassDetails, VisibilityCalculator
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9025",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49572541123456",
+]
+
+
+class InlineExecutor:
+    """Executor stand-in that runs each task immediately in-process."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        self.calls.append(MagicMock(args=args, kwargs=kwargs))
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def _target(name: str) -> GroundTarget:
+    return GroundTarget(name, 45.0, 10.0)
+
+
+def _pass(target_name: str) -> PassDetails:
+    start = datetime(2024, 1, 1, 12, 0, 0, 250)
+    return PassDetails(
+        target_name=target_name,
+        satellite_name='TEST-SAT',
+        start_time=start,
+        max_elevation_time=start + timedelta(minutes=4),
+        end_time=start + timedelta(minutes=8),
+        max_elevation=45.0,
+        start_azimuth=200.0,
+        max_elevation_azimuth=120.0,
+        end_azimuth=40.0,
+    )
 
 
 class TestGetOptimalWorkers:
@@ -136,10 +187,12 @@ class TestProcessPool:
         mock_executor = MagicMock()
         mock_executor_class.return_value = mock_executor
 
-        get_or_create_process_pool(4)
+        satellite_tle_data = {"name": "SAT", "line1": "1 ...", "line2": "2 ..."}
+        get_or_create_process_pool(4, satellite_tle_data, True)
 
         _, kwargs = mock_executor_class.call_args
-        assert kwargs["initializer"] is parallel_module._configure_worker_signals
+        assert kwargs["initializer"] is parallel_module._initialize_worker
+        assert kwargs["initargs"] == (satellite_tle_data, True, None)
 
         parallel_module._process_pool = None
         parallel_module._pool_max_workers = None
@@ -199,40 +252,39 @@ class TestProcessPool:
         parallel_module._pool_max_workers = None
 
 
-class TestComputeTargetPassesWorker:
-    """Tests for the worker function."""
+class TestComputeTargetBatchWorker:
+    """Tests for the worker functions."""
+
+    @pytest.fixture(autouse=True)
+    def clear_worker_cache(self):
+        """Start and end each test with an empty worker calculator cache."""
+        import mission_planner.parallel as parallel_module
+
+        parallel_module._worker_calculators.clear()
+        yield
+        parallel_module._worker_calculators.clear()
+
+    @pytest.fixture
+    def satellite_tle_data(self):
+        return {
+            'name': 'TEST-SAT',
+            'line1': '1 00000U 00000A   00000.00000000  .00000000  00000-0  00000-0 0  0000',
+            'line2': '2 00000  00.0000 000.0000 0000000 000.0000 000.0000 15.00000000 00000'
+        }
 
     @patch('mission_planner.visibility.VisibilityCalculator')
     @patch('mission_planner.targets.GroundTarget')
     @patch('mission_planner.orbit.SatelliteOrbit')
-    @patch('tempfile.NamedTemporaryFile')
-    @patch('os.path.exists')
-    @patch('os.unlink')
     def test_worker_computes_passes(
-        self, mock_unlink, mock_exists, mock_tempfile,
-        mock_sat_class, mock_target_class, mock_calc_class
+        self, mock_sat_class, mock_target_class, mock_calc_class,
+        satellite_tle_data
     ) -> None:
         """Test worker function computes passes correctly."""
-        # Setup mocks
-        mock_exists.return_value = True
-
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_file.name = '/tmp/test.tle'
-        mock_tempfile.return_value = mock_file
-
-        mock_sat = MagicMock()
-        mock_sat_class.from_tle_file.return_value = mock_sat
-
         mock_target = MagicMock()
         mock_target_class.return_value = mock_target
 
-        mock_pass = MagicMock()
-        mock_pass.to_dict.return_value = {'target_name': 'Test', 'max_elevation': 45.0}
-
         mock_calc = MagicMock()
-        mock_calc.find_passes.return_value = [mock_pass]
+        mock_calc.find_passes.return_value = [_pass('TestTarget')]
         mock_calc_class.return_value = mock_calc
 
         target_data = {
@@ -244,21 +296,97 @@ class TestComputeTargetPassesWorker:
             'elevation_mask': 10.0
         }
 
-        satellite_tle_data = {
-            'name': 'TEST-SAT',
-            'line1': '1 00000U 00000A   00000.00000000  .00000000  00000-0  00000-0 0  0000',
-            'line2': '2 00000  00.0000 000.0000 0000000 000.0000 000.0000 15.00000000 00000'
-        }
-
         start_time = datetime.utcnow()
         end_time = start_time + timedelta(hours=24)
 
-        result = _compute_target_passes_worker(
-            target_data, satellite_tle_data, start_time, end_time
+        table, _ = _compute_target_batch_worker(
+            [target_data], satellite_tle_data, start_time, end_time
         )
 
-        assert result[0] == 'TestTarget'
-        assert len(result[1]) == 1
+        assert [r.target_name for r in table] == ['TestTarget']
+        mock_sat_class.assert_called_once_with(
+            ['TEST-SAT', satellite_tle_data['line1'], satellite_tle_data['line2']],
+            'TEST-SAT',
+        )
+
+    @patch('mission_planner.visibility.VisibilityCalculator')
+    @patch('mission_planner.orbit.SatelliteOrbit')
+    def test_worker_reuses_calculator_per_satellite(
+        self, mock_sat_class, mock_calc_class, satellite_tle_data
+    ) -> None:
+        """The satellite is parsed once per worker, not once per target."""
+        mock_calc_class.return_value.find_passes.return_value = []
+        start_time = datetime(2024, 1, 1)
+        end_time = start_time + timedelta(hours=24)
+
+        for name in ('A', 'B', 'C'):
+            _compute_target_batch_worker(
+                [{'name': name, 'latitude': 10.0, 'longitude': 20.0}],
+                satellite_tle_data, start_time, end_time
+            )
+        _compute_target_batch_worker(
+            [{'name': 'D', 'latitude': 10.0, 'longitude': 20.0}],
+            satellite_tle_data, start_time, end_time, use_adaptive=True
+        )
+
+        assert mock_sat_class.call_count == 2
+        assert mock_calc_class.return_value.find_passes.call_count == 4
+        assert [c.kwargs['use_adaptive'] for c in mock_calc_class.call_args_list] == [
+            False, True
+        ]
+
+    @patch('mission_planner.parallel._configure_worker_signals')
+    @patch('mission_planner.visibility.VisibilityCalculator')
+    @patch('mission_planner.orbit.SatelliteOrbit')
+    def test_initializer_warms_cache(
+        self, mock_sat_class, mock_calc_class, mock_signals, satellite_tle_data
+    ) -> None:
+        """The pool initializer installs the satellite before any task runs."""
+        import mission_planner.parallel as parallel_module
+
+        parallel_module._initialize_worker(satellite_tle_data, False)
+        calc = parallel_module._get_worker_calculator(satellite_tle_data, False)
+
+        mock_signals.assert_called_once()
+        mock_sat_class.assert_called_once()
+        assert calc is mock_calc_class.return_value
+
+    @patch('mission_planner.parallel._configure_worker_signals')
+    @patch('mission_planner.orbit.SatelliteOrbit', side_effect=ValueError("bad TLE"))
+    def test_initializer_tolerates_bad_tle(
+        self, mock_sat_class, mock_signals, satellite_tle_data
+    ) -> None:
+        """A satellite that fails to parse must not kill the worker."""
+        import mission_planner.parallel as parallel_module
+
+        parallel_module._initialize_worker(satellite_tle_data)
+
+        mock_signals.assert_called_once()
+        assert not parallel_module._worker_calculators
+
+    @patch('mission_planner.visibility.VisibilityCalculator')
+    @patch('mission_planner.orbit.SatelliteOrbit')
+    def test_batch_worker_packs_passes(
+        self, mock_sat_class, mock_calc_class, satellite_tle_data
+    ) -> None:
+        """A batch returns one PassTable; failing targets add no passes."""
+        mock_calc_class.return_value.find_passes.side_effect = (
+            lambda target, *args: [_pass(target.name)]
+        )
+        batch = [
+            {'name': 'A', 'latitude': 10.0, 'longitude': 20.0},
+            {'name': 'Bad', 'latitude': 'invalid', 'longitude': 20.0},
+            {'name': 'B', 'latitude': 11.0, 'longitude': 21.0},
+        ]
+
+        table, elapsed = _compute_target_batch_worker(
+            batch, satellite_tle_data, datetime(2024, 1, 1), datetime(2024, 1, 2)
+        )
+
+        assert isinstance(table, PassTable)
+        assert [r.target_name for r in table] == ['A', 'B']
+        assert table.to_passes()[0] == _pass('A')
+        assert elapsed >= 0
 
     def test_worker_handles_exception(self) -> None:
         """Test worker handles exceptions gracefully."""
@@ -277,13 +405,12 @@ class TestComputeTargetPassesWorker:
         start_time = datetime.utcnow()
         end_time = start_time + timedelta(hours=24)
 
-        result = _compute_target_passes_worker(
-            target_data, satellite_tle_data, start_time, end_time
+        table, _ = _compute_target_batch_worker(
+            [target_data], satellite_tle_data, start_time, end_time
         )
 
-        # Should return target name and empty list on error
-        assert result[0] == 'FailTarget'
-        assert result[1] == []
+        # Should return an empty table on error
+        assert len(table) == 0
 
 
 class TestParallelVisibilityCalculator:
@@ -333,161 +460,133 @@ class TestParallelVisibilityCalculator:
 
         assert result == {}
 
+    @patch('mission_planner.parallel._compute_target_batch_worker')
     @patch('mission_planner.parallel.get_or_create_process_pool')
-    @patch('mission_planner.parallel.as_completed')
-    def test_get_visibility_windows_parallel(self, mock_as_completed, mock_pool, mock_satellite) -> None:
+    def test_get_visibility_windows_parallel(self, mock_pool, mock_worker, mock_satellite) -> None:
         """Test parallel visibility computation."""
-        # Setup mock futures
-        mock_future = MagicMock(spec=Future)
-        mock_future.result.return_value = ('Target1', [{'max_elevation': 45.0}])
-
-        mock_executor = MagicMock()
-        mock_executor.submit.return_value = mock_future
-        mock_pool.return_value = mock_executor
-
-        mock_as_completed.return_value = iter([mock_future])
-
-        # Create target
-        target = MagicMock()
-        target.name = 'Target1'
-        target.latitude = 45.0
-        target.longitude = 10.0
-        target.description = 'Test'
-        target.mission_type = 'communication'
-        target.elevation_mask = 10.0
-        target.sensor_fov_half_angle_deg = None
-        target.max_spacecraft_roll = None
+        mock_pool.return_value = InlineExecutor()
+        mock_worker.side_effect = lambda batch, **kwargs: (
+            PassTable.from_passes(
+                [_pass(t['name']) for t in batch if t['name'] == 'Target1']
+            ),
+            0.01,
+        )
 
         calc = ParallelVisibilityCalculator(mock_satellite, max_workers=2)
 
         result = calc.get_visibility_windows(
-            [target],
+            [_target('Target1'), _target('Target2')],
             datetime.utcnow(),
             datetime.utcnow() + timedelta(hours=24)
         )
 
-        assert 'Target1' in result
-        assert result['Target1'] == [{'max_elevation': 45.0}]
+        assert result['Target1'] == [_pass('Target1').to_dict()]
+        assert result['Target2'] == []
 
+    @patch('mission_planner.parallel._compute_target_batch_worker')
     @patch('mission_planner.parallel.get_or_create_process_pool')
-    @patch('mission_planner.parallel.as_completed')
-    def test_get_visibility_windows_with_progress(self, mock_as_completed, mock_pool, mock_satellite) -> None:
+    def test_get_visibility_windows_with_progress(self, mock_pool, mock_worker, mock_satellite) -> None:
         """Test parallel computation with progress callback."""
-        mock_future = MagicMock(spec=Future)
-        mock_future.result.return_value = ('Target1', [])
-
-        mock_executor = MagicMock()
-        mock_executor.submit.return_value = mock_future
-        mock_pool.return_value = mock_executor
-
-        mock_as_completed.return_value = iter([mock_future])
-
-        target = MagicMock()
-        target.name = 'Target1'
-        target.latitude = 45.0
-        target.longitude = 10.0
-        target.description = ''
-        target.mission_type = 'communication'
-        target.elevation_mask = 10.0
-        target.sensor_fov_half_angle_deg = None
-        target.max_spacecraft_roll = None
+        mock_pool.return_value = InlineExecutor()
+        mock_worker.side_effect = lambda batch, **kwargs: (
+            PassTable.from_passes([]), 0.01
+        )
 
         progress_calls = []
         def progress_callback(completed, total):
             progress_calls.append((completed, total))
 
-        calc = ParallelVisibilityCalculator(mock_satellite)
+        calc = ParallelVisibilityCalculator(mock_satellite, max_workers=2)
 
         calc.get_visibility_windows(
-            [target],
+            [_target(f'Target{i}') for i in range(5)],
             datetime.utcnow(),
             datetime.utcnow() + timedelta(hours=24),
             progress_callback=progress_callback
         )
 
-        assert len(progress_calls) == 1
-        assert progress_calls[0] == (1, 1)
+        assert progress_calls[-1] == (5, 5)
+        assert [c for c, _ in progress_calls] == sorted(c for c, _ in progress_calls)
 
+    @patch('mission_planner.parallel._compute_target_batch_worker')
     @patch('mission_planner.parallel.get_or_create_process_pool')
-    @patch('mission_planner.parallel.as_completed')
-    def test_get_visibility_windows_handles_errors(self, mock_as_completed, mock_pool, mock_satellite) -> None:
+    def test_get_visibility_windows_handles_errors(self, mock_pool, mock_worker, mock_satellite) -> None:
         """Test that errors in futures are handled."""
-        mock_future = MagicMock(spec=Future)
-        mock_future.result.side_effect = Exception("Worker error")
-
-        mock_executor = MagicMock()
-        mock_executor.submit.return_value = mock_future
-        mock_pool.return_value = mock_executor
-
-        # Map future to target name
-        mock_executor.submit.return_value = mock_future
-
-        mock_as_completed.return_value = iter([mock_future])
-
-        target = MagicMock()
-        target.name = 'Target1'
-        target.latitude = 45.0
-        target.longitude = 10.0
-        target.description = ''
-        target.mission_type = 'communication'
-        target.elevation_mask = 10.0
-        target.sensor_fov_half_angle_deg = None
-        target.max_spacecraft_roll = None
+        mock_pool.return_value = InlineExecutor()
+        mock_worker.side_effect = Exception("Worker error")
 
         calc = ParallelVisibilityCalculator(mock_satellite)
 
-        # Patch the future_to_target dict behavior
-        with patch.object(calc, 'get_visibility_windows') as mock_method:
-            mock_method.return_value = {'Target1': []}
-            result = calc.get_visibility_windows(
-                [target],
-                datetime.utcnow(),
-                datetime.utcnow() + timedelta(hours=24)
-            )
+        result = calc.get_visibility_windows(
+            [_target('Target1')],
+            datetime.utcnow(),
+            datetime.utcnow() + timedelta(hours=24)
+        )
 
         # Should return empty list for failed target
-        assert 'Target1' in result
+        assert result == {'Target1': []}
 
+    @patch("mission_planner.parallel._compute_target_batch_worker")
     @patch("mission_planner.parallel.cleanup_process_pool")
     @patch("mission_planner.parallel.get_or_create_process_pool")
-    @patch("mission_planner.parallel.as_completed")
     def test_get_visibility_windows_reraises_broken_process_pool(
         self,
-        mock_as_completed,
         mock_pool,
         mock_cleanup,
+        mock_worker,
         mock_satellite,
     ) -> None:
         """Catastrophic pool failures should bubble up so callers can fall back to serial."""
-        mock_future = MagicMock(spec=Future)
-        mock_future.result.side_effect = BrokenProcessPool("terminated abruptly")
-
-        mock_executor = MagicMock()
-        mock_executor.submit.return_value = mock_future
-        mock_pool.return_value = mock_executor
-        mock_as_completed.return_value = iter([mock_future])
-
-        target = MagicMock()
-        target.name = "Target1"
-        target.latitude = 45.0
-        target.longitude = 10.0
-        target.description = ""
-        target.mission_type = "communication"
-        target.elevation_mask = 10.0
-        target.sensor_fov_half_angle_deg = None
-        target.max_spacecraft_roll = None
+        mock_pool.return_value = InlineExecutor()
+        mock_worker.side_effect = BrokenProcessPool("terminated abruptly")
 
         calc = ParallelVisibilityCalculator(mock_satellite)
 
         with pytest.raises(BrokenProcessPool):
             calc.get_visibility_windows(
-                [target],
+                [_target("Target1")],
                 datetime.utcnow(),
                 datetime.utcnow() + timedelta(hours=24),
             )
 
         mock_cleanup.assert_called_once()
 
+    @patch('mission_planner.parallel._compute_target_batch_worker')
+    @patch('mission_planner.parallel.get_or_create_process_pool')
+    def test_batches_cover_targets_once(self, mock_pool, mock_worker, mock_satellite) -> None:
+        """Every target is submitted once; batches grow once cost is measured."""
+        mock_pool.return_value = InlineExecutor()
+        mock_worker.side_effect = lambda batch, **kwargs: (
+            PassTable.from_passes([_pass(t['name']) for t in batch]),
+            0.001 * len(batch),
+        )
+        targets = [_target(f'T{i:03d}') for i in range(300)]
+
+        calc = ParallelVisibilityCalculator(mock_satellite, max_workers=2)
+        table = calc.compute_pass_table(
+            targets, datetime.utcnow(), datetime.utcnow() + timedelta(hours=1)
+        )
+
+        batches = [c.args[0] for c in mock_worker.call_args_list]
+        names = [t['name'] for batch in batches for t in batch]
+        assert names == [t.name for t in targets]
+        assert len(batches[0]) == INITIAL_BATCH_SIZE
+        assert max(len(b) for b in batches) > INITIAL_BATCH_SIZE
+        assert len(batches) < len(targets)
+        assert len(table) == 300
+
+    def test_next_batch_size(self) -> None:
+        """Batch size follows measured cost, capped for load balance."""
+        assert next_batch_size(0, 4) == 0
+        assert next_batch_size(1000, 4) == INITIAL_BATCH_SIZE
+        assert next_batch_size(1, 4) == 1
+        # 0.25 s per task at 5 ms per target -> 50 targets
+        assert next_batch_size(1000, 4, 0.005) == 50
+        # Balance cap: 100 targets over 4 workers x 4 batches
+        assert next_batch_size(100, 4, 0.0001) == 7
+        # Slow targets go one per task
+        assert next_batch_size(1000, 4, 10.0) == 1
+
     def test_adaptive_mode_setting(self, mock_satellite) -> None:
         """Test adaptive mode is properly set."""
         calc_adaptive = ParallelVisibilityCalculator(mock_satellite, use_adaptive=True)
@@ -497,6 +596,93 @@ class TestParallelVisibilityCalculator:
         assert calc_fixed.use_adaptive is False
 
 
+class TestTimeSlicing:
+    """Tests for splitting few targets over a long window in time."""
+
+    # The first seam (START + 9 h) falls inside an Athens pass
+    START = datetime(2023, 12, 31, 23, 44)
+    END = START + timedelta(days=3)
+
+    @pytest.fixture(scope="class")
+    def satellite(self):
+        return SatelliteOrbit(ISS_TLE, "ISS")
+
+    @pytest.fixture(autouse=True)
+    def clear_worker_cache(self):
+        parallel_module._worker_calculators.clear()
+        yield
+        parallel_module._worker_calculators.clear()
+
+    def test_time_slices(self) -> None:
+        """Slices cover the window on whole-hour boundaries."""
+        slices = time_slices(self.START, self.END, 1, 4)
+
+        assert len(slices) == 8
+        assert slices[0][0] == self.START
+        assert slices[-1][1] == self.END
+        assert all(a[1] == b[0] for a, b in zip(slices, slices[1:]))
+        assert all(
+            (s - self.START).total_seconds() % SLICE_ALIGN_SECONDS == 0
+            for s, _ in slices
+        )
+
+        # Enough targets for the workers, or too short a window to split
+        assert time_slices(self.START, self.END, 4, 4) == []
+        assert time_slices(self.START, self.START + timedelta(hours=6), 1, 4) == []
+
+    @patch('mission_planner.parallel.get_optimal_workers', return_value=4)
+    def test_should_run_parallel(self, _mock_workers) -> None:
+        assert should_run_parallel(2, self.START, self.START + timedelta(hours=1))
+        assert should_run_parallel(1, self.START, self.END)
+        assert not should_run_parallel(1, self.START, self.START + timedelta(hours=6))
+
+    @pytest.mark.parametrize(
+        "mission_type,use_adaptive",
+        [("communication", False), ("imaging", False), ("communication", True)],
+    )
+    @patch('mission_planner.parallel.get_optimal_workers', return_value=4)
+    @patch('mission_planner.parallel.get_or_create_process_pool')
+    def test_sliced_matches_single_search(
+        self, mock_pool, _mock_workers, satellite, mission_type, use_adaptive
+    ) -> None:
+        """Stitched slices give the passes of one search, seam passes included."""
+        mock_pool.return_value = InlineExecutor()
+        target = GroundTarget(
+            "Athens", 37.98, 23.73,
+            mission_type=mission_type,
+            sensor_fov_half_angle_deg=1.0,
+            max_spacecraft_roll=45.0,
+        )
+        expected = VisibilityCalculator(
+            satellite, use_adaptive=use_adaptive
+        ).find_passes(target, self.START, self.END)
+
+        calc = ParallelVisibilityCalculator(
+            satellite, max_workers=4, use_adaptive=use_adaptive
+        )
+        table = calc.compute_pass_table([target], self.START, self.END)
+
+        slice_calls = [c.kwargs["time_slice"] for c in mock_pool.return_value.calls]
+        assert len(slice_calls) == 8
+        seams = [start for start, _ in slice_calls[1:]]
+        assert any(
+            p.start_time < seam < p.end_time for p in expected for seam in seams
+        ), "no pass crosses a slice seam"
+
+        got = sorted(table.to_passes(), key=lambda p: p.start_time)
+        assert len(got) == len(expected)
+        if use_adaptive:
+            # Adaptive edges and peak times depend on where the coarse steps
+            # land, so passes are matched by overlap and peak elevation
+            for g, e in zip(got, expected):
+                assert g.start_time < e.end_time and e.start_time < g.end_time
+                assert g.max_elevation == pytest.approx(e.max_elevation, abs=0.1)
+        else:
+            assert [p.to_dict(sections=()) for p in got] == [
+                p.to_dict(sections=()) for p in expected
+            ]
+
+
 class TestBenchmarkParallelSpeedup:
     """Tests for benchmark_parallel_speedup function."""
 
@@ -588,29 +774,20 @@ class TestParallelWithImagingType:
         sat.tle_lines = ["TEST-SAT", "line1", "line2"]
         return sat
 
+    @patch('mission_planner.parallel._compute_target_batch_worker')
     @patch('mission_planner.parallel.get_or_create_process_pool')
-    @patch('mission_planner.parallel.as_completed')
-    def test_imaging_type_passed_to_worker(self, mock_as_completed, mock_pool, mock_satellite) -> None:
+    def test_imaging_type_passed_to_worker(self, mock_pool, mock_worker, mock_satellite) -> None:
         """Test that imaging_type is included in target data."""
-        mock_future = MagicMock(spec=Future)
-        mock_future.result.return_value = ('ImagingTarget', [])
-
-        mock_executor = MagicMock()
-        mock_executor.submit.return_value = mock_future
-        mock_pool.return_value = mock_executor
-
-        mock_as_completed.return_value = iter([mock_future])
+        mock_pool.return_value = InlineExecutor()
+        mock_worker.return_value = (PassTable.from_passes([]), 0.01)
 
         # Create target with imaging_type
-        target = MagicMock()
-        target.name = 'ImagingTarget'
-        target.latitude = 45.0
-        target.longitude = 10.0
-        target.description = ''
-        target.mission_type = 'imaging'
-        target.elevation_mask = 10.0
-        target.sensor_fov_half_angle_deg = 1.0
-        target.max_spacecraft_roll = 45.0
+        target = GroundTarget(
+            'ImagingTarget', 45.0, 10.0,
+            mission_type='imaging',
+            sensor_fov_half_angle_deg=1.0,
+            max_spacecraft_roll=45.0,
+        )
         target.imaging_type = 'optical'
 
         calc = ParallelVisibilityCalculator(mock_satellite)
@@ -621,5 +798,6 @@ class TestParallelWithImagingType:
             datetime.utcnow() + timedelta(hours=24)
         )
 
-        # Verify submit was called
-        mock_executor.submit.assert_called()
+        (batch,), _ = mock_worker.call_args
+        assert batch[0]['imaging_type'] == 'optical'
+        assert batch[0]['max_spacecraft_roll'] == 45.0
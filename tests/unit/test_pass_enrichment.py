@@ -0,0 +1,240 @@
+"""
+Tests for lazy, section-selective PassDetails enrichment.
+
+Tests cover:
+- Lazy enrichment matches eager enrichment
+- Sections are computed on first access and memoized
+- Section selection for enrichment and serialization
+- Pass copies and pickling keep working; pickling resolves pending sections
+"""
+
+import copy
+import pickle
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.sar_visibility import SARPassDetails
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import (
+    ENRICHMENT_SECTIONS,
+    PassDetails,
+    VisibilityCalculator,
+)
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9025",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49572541123456",
+]
+
+START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return VisibilityCalculator(SatelliteOrbit(ISS_TLE, "ISS"), use_adaptive=False)
+
+
+@pytest.fixture
+def target():
+    return GroundTarget("Athens", 37.98, 23.73, mission_type="imaging")
+
+
+def _pass(start: datetime = START) -> PassDetails:
+    return PassDetails(
+        target_name="Athens",
+        satellite_name="ISS",
+        start_time=start,
+        max_elevation_time=start + timedelta(minutes=4),
+        end_time=start + timedelta(minutes=8),
+        max_elevation=45.0,
+        start_azimuth=200.0,
+        max_elevation_azimuth=120.0,
+        end_azimuth=40.0,
+    )
+
+
+class TestLazyEnrichment:
+    """Tests for enrich_pass_with_stk_data(lazy=True)."""
+
+    def test_lazy_matches_eager(self, calculator, target) -> None:
+        eager = calculator.enrich_pass_with_stk_data(_pass(), target)
+        lazy = calculator.enrich_pass_with_stk_data(_pass(), target, lazy=True)
+
+        assert lazy.to_dict() == eager.to_dict()
+        assert lazy.incidence_angle_deg == eager.incidence_angle_deg
+
+    def test_sections_computed_on_first_access(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, lazy=True
+        )
+        assert pass_details._pending_sections == frozenset(ENRICHMENT_SECTIONS)
+
+        with patch.object(
+            calculator,
+            "_compute_lighting_at_time",
+            wraps=calculator._compute_lighting_at_time,
+        ) as lighting:
+            assert pass_details.lighting is not None
+            assert pass_details.lighting is pass_details.lighting
+            assert lighting.call_count == 1
+
+        assert pass_details._pending_sections == frozenset(
+            {"geometry", "quality", "maneuver"}
+        )
+
+    def test_quality_pulls_in_dependencies(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, lazy=True
+        )
+
+        assert pass_details.quality is not None
+        assert pass_details._pending_sections == frozenset({"maneuver"})
+
+    def test_assignment_is_kept(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["maneuver"], lazy=True
+        )
+        pass_details.lighting = None
+
+        assert pass_details.geometry_tca is None
+        assert pass_details.lighting is None
+        assert pass_details.maneuver is not None
+
+    def test_copies_and_pickles(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["geometry"], lazy=True
+        )
+        duplicate = copy.copy(pass_details)
+
+        assert duplicate.geometry_tca is not None
+        assert pass_details._pending_sections == frozenset({"geometry"})
+
+        restored = pickle.loads(pickle.dumps(_pass()))
+        assert restored == _pass()
+        assert restored.geometry_aos is None
+
+    def test_pickle_resolves_pending_sections(self, calculator, target) -> None:
+        eager = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["geometry", "lighting"]
+        )
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["geometry", "lighting"], lazy=True
+        )
+
+        restored = pickle.loads(pickle.dumps(pass_details))
+
+        assert restored.to_dict() == eager.to_dict()
+        assert restored._pending_sections == frozenset()
+        assert restored._enrichment is None
+        assert pass_details._enrichment is None
+
+    def test_enrichment_released_when_resolved(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["lighting", "maneuver"], lazy=True
+        )
+
+        assert pass_details.lighting is not None
+        assert pass_details._enrichment is not None
+        assert pass_details.maneuver is not None
+        assert pass_details._enrichment is None
+
+    def test_failed_section_stays_pending(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["lighting"], lazy=True
+        )
+
+        with patch.object(
+            pass_details, "_enrichment", side_effect=KeyboardInterrupt
+        ), pytest.raises(KeyboardInterrupt):
+            pass_details.lighting
+
+        assert pass_details._pending_sections == frozenset({"lighting"})
+        assert pass_details.lighting is not None
+
+
+class TestSectionSelection:
+    """Tests for enriching and serializing selected sections."""
+
+    def test_eager_selected_sections(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, sections=["lighting", "maneuver"]
+        )
+
+        assert pass_details.lighting is not None
+        assert pass_details.maneuver is not None
+        assert pass_details.geometry_tca is None
+        assert pass_details.quality is None
+
+    def test_quality_alone_computes_its_dependencies(
+        self, calculator, target
+    ) -> None:
+        # 02:00 local time in Athens: the target is not illuminated
+        night = datetime(2024, 1, 1, 0, 0, 0)
+        eager = calculator.enrich_pass_with_stk_data(_pass(night), target)
+
+        for lazy in (False, True):
+            pass_details = calculator.enrich_pass_with_stk_data(
+                _pass(night), target, sections=["quality"], lazy=lazy
+            )
+
+            assert pass_details.quality == eager.quality
+            assert pass_details.quality.imaging_feasible is False
+            assert pass_details.quality.quality_score <= 50
+            assert "Target not illuminated" in (
+                pass_details.quality.feasibility_reason
+            )
+            assert pass_details.to_dict(sections=["quality"]) == eager.to_dict(
+                sections=["quality"]
+            )
+
+    def test_geometry_keeps_set_incidence_angle(self, calculator, target) -> None:
+        pass_details = _pass()
+        pass_details.incidence_angle_deg = -12.5
+
+        calculator.enrich_pass_with_stk_data(pass_details, target)
+
+        assert pass_details.geometry_tca is not None
+        assert pass_details.incidence_angle_deg == -12.5
+
+    def test_to_dict_sections(self, calculator, target) -> None:
+        pass_details = calculator.enrich_pass_with_stk_data(
+            _pass(), target, lazy=True
+        )
+
+        result = pass_details.to_dict(sections=["quality"])
+
+        assert "quality" in result
+        assert "maneuver" not in result
+        assert "geometry_tca" not in result
+        assert result["off_nadir_deg"] == pytest.approx(45.0)
+        assert "maneuver" in pass_details._pending_sections
+
+    def test_sar_to_dict_sections(self, calculator, target) -> None:
+        sar_pass = SARPassDetails(
+            target_name="Athens",
+            satellite_name="ISS",
+            start_time=START,
+            max_elevation_time=START + timedelta(minutes=4),
+            end_time=START + timedelta(minutes=8),
+            max_elevation=45.0,
+            start_azimuth=200.0,
+            max_elevation_azimuth=120.0,
+            end_azimuth=40.0,
+        )
+        calculator.enrich_pass_with_stk_data(sar_pass, target, lazy=True)
+
+        result = sar_pass.to_dict(sections=["lighting"])
+
+        assert "lighting" in result
+        assert "geometry_tca" not in result
+        assert "geometry" in sar_pass._pending_sections
+
+    def test_unknown_section_rejected(self, calculator, target) -> None:
+        with pytest.raises(ValueError, match="Unknown enrichment sections"):
+            calculator.enrich_pass_with_stk_data(_pass(), target, sections=["orbit"])
+        with pytest.raises(ValueError):
+            _pass().to_dict(sections=["orbit"])
@@ -0,0 +1,203 @@
+"""
+Tests for streaming pass search and export.
+
+Tests cover:
+- iter_passes matches a single search over the horizon
+- Chronological order and block-boundary passes
+- Streaming schedule export to JSON Lines, CSV and JSON
+- CLI plan --stream
+"""
+
+import csv
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from mission_planner.cli import main
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.planner import STREAM_CSV_FIELDS, MissionPlanner
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9025",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49572541123456",
+]
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(days=2)
+
+
+@pytest.fixture(scope="module")
+def satellite():
+    return SatelliteOrbit(ISS_TLE, "ISS")
+
+
+@pytest.fixture
+def targets():
+    return [
+        GroundTarget("Athens", 37.98, 23.73, mission_type="communication"),
+        GroundTarget("Denver", 39.74, -104.99, mission_type="communication"),
+        GroundTarget("Perth", -31.95, 115.86, mission_type="communication"),
+    ]
+
+
+def _pass_key(p):
+    return (p.target_name, p.start_time, p.end_time)
+
+
+class TestIterPasses:
+    """Tests for VisibilityCalculator.iter_passes."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"use_adaptive": False}, {"use_adaptive": True, "refinement_method": "brent"}],
+    )
+    def test_matches_full_search(self, satellite, targets, options) -> None:
+        calc = VisibilityCalculator(satellite, **options)
+        full = calc.get_visibility_windows(targets, START, END)
+        expected = [p for passes in full.values() for p in passes]
+
+        # Odd block length so block edges fall inside passes
+        streamed = list(
+            VisibilityCalculator(satellite, **options).iter_passes(
+                targets, START, END, chunk=timedelta(hours=1, minutes=7)
+            )
+        )
+
+        assert len(streamed) == len(expected)
+        tolerance = timedelta(seconds=1)
+        for got, want in zip(
+            sorted(streamed, key=_pass_key), sorted(expected, key=_pass_key)
+        ):
+            assert got.target_name == want.target_name
+            assert abs(got.start_time - want.start_time) <= tolerance
+            assert abs(got.end_time - want.end_time) <= tolerance
+
+    def test_chronological_order(self, satellite, targets) -> None:
+        calc = VisibilityCalculator(satellite, use_adaptive=False)
+        starts = [
+            p.start_time
+            for p in calc.iter_passes(targets, START, END, chunk=timedelta(hours=5))
+        ]
+
+        assert starts
+        assert starts == sorted(starts)
+
+    def test_is_lazy(self, satellite, targets) -> None:
+        calc = VisibilityCalculator(satellite, use_adaptive=False)
+        stream = calc.iter_passes(targets, START, START + timedelta(days=30))
+
+        first = next(stream)
+
+        assert START <= first.start_time < START + timedelta(days=1)
+        assert calc.ephemeris is not None
+        assert calc.ephemeris.end_epoch - calc.ephemeris.start_epoch < 2 * 86400
+
+    def test_invalid_chunk(self, satellite, targets) -> None:
+        calc = VisibilityCalculator(satellite)
+        with pytest.raises(ValueError):
+            list(calc.iter_passes(targets, START, END, chunk=timedelta(0)))
+
+
+class TestStreamingExport:
+    """Tests for MissionPlanner.export_schedule with streamed passes."""
+
+    def test_jsonl(self, satellite, targets, tmp_path) -> None:
+        planner = MissionPlanner(satellite, targets)
+        output = tmp_path / "schedule.jsonl"
+
+        count = planner.export_schedule(planner.iter_passes(START, END), output)
+
+        lines = output.read_text().splitlines()
+        assert count == len(lines) > 0
+        records = [json.loads(line) for line in lines]
+        assert [r["start_time"] for r in records] == sorted(
+            r["start_time"] for r in records
+        )
+
+    def test_csv(self, satellite, targets, tmp_path) -> None:
+        planner = MissionPlanner(satellite, targets)
+        output = tmp_path / "schedule.csv"
+
+        count = planner.export_schedule(planner.iter_passes(START, END), output)
+
+        with open(output, newline="") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert reader.fieldnames == STREAM_CSV_FIELDS
+        assert len(rows) == count > 0
+
+    @pytest.mark.parametrize("hours", [0, 48])
+    def test_json(self, satellite, targets, tmp_path, hours) -> None:
+        planner = MissionPlanner(satellite, targets)
+        output = tmp_path / "schedule.json"
+
+        count = planner.export_schedule(
+            planner.iter_passes(START, START + timedelta(hours=hours)), output
+        )
+
+        data = json.loads(output.read_text())
+        assert data["metadata"]["total_passes"] == count == len(data["passes"])
+
+    def test_dict_to_jsonl(self, satellite, targets, tmp_path) -> None:
+        planner = MissionPlanner(satellite, targets)
+        passes = planner.compute_passes(START, END)
+        output = tmp_path / "schedule.jsonl"
+
+        count = planner.export_schedule(passes, output)
+
+        assert count == sum(len(p) for p in passes.values())
+        assert len(output.read_text().splitlines()) == count
+
+
+class TestCliStream:
+    """Tests for plan --stream."""
+
+    def test_plan_stream(self, tmp_path) -> None:
+        tle_file = tmp_path / "iss.tle"
+        tle_file.write_text("\n".join(ISS_TLE) + "\n")
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "plan",
+                "--tle", str(tle_file),
+                "--satellite", "ISS (ZARYA)",
+                "--target", "Athens", "37.98", "23.73",
+                "--mission-type", "communication",
+                "--start-time", "2024-01-01 00:00:00",
+                "--duration", "48",
+                "--output", str(tmp_path / "out"),
+                "--format", "jsonl",
+                "--stream",
+                "--chunk-hours", "12",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        schedule = tmp_path / "out" / "mission_schedule.jsonl"
+        assert schedule.exists()
+        assert f"Exported {len(schedule.read_text().splitlines())} passes" in (
+            result.output
+        )
+
+    def test_plan_stream_requires_output(self, tmp_path) -> None:
+        tle_file = tmp_path / "iss.tle"
+        tle_file.write_text("\n".join(ISS_TLE) + "\n")
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "plan",
+                "--tle", str(tle_file),
+                "--satellite", "ISS (ZARYA)",
+                "--target", "Athens", "37.98", "23.73",
+                "--stream",
+            ],
+        )
+
+        assert "--stream requires --output" in result.output
@@ -0,0 +1,230 @@
+"""
+Tests for the columnar PassTable.
+
+Tests cover:
+- Round trip between PassDetails and table rows
+- Zero-copy selection by satellite and target
+- to_records() parity with PassDetails.to_dict()
+- Merging tables and time-zone-aware materialization
+- Scheduling directly from a table
+- Memory per pass
+"""
+
+import dataclasses
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.pass_table import PASS_DTYPE, PassRow, PassTable
+from mission_planner.scheduler import (
+    AlgorithmType,
+    MissionScheduler,
+    ScheduledOpportunity,
+    SchedulerConfig,
+)
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import PassDetails, PassGeometry, VisibilityCalculator
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9025",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49572541123456",
+]
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(days=1)
+
+
+@pytest.fixture(scope="module")
+def windows():
+    calc = VisibilityCalculator(SatelliteOrbit(ISS_TLE, "ISS"), use_adaptive=True)
+    targets = [
+        GroundTarget("Athens", 37.98, 23.73, mission_type="imaging"),
+        GroundTarget("Denver", 39.74, -104.99, mission_type="communication"),
+    ]
+    return calc.get_visibility_windows(targets, START, END)
+
+
+def _pass(target, satellite, offset_min, satellite_id="") -> PassDetails:
+    start = START + timedelta(minutes=offset_min, microseconds=250)
+    return PassDetails(
+        target_name=target,
+        satellite_name=satellite,
+        start_time=start,
+        max_elevation_time=start + timedelta(minutes=3),
+        end_time=start + timedelta(minutes=6),
+        max_elevation=40.0 + offset_min / 100,
+        start_azimuth=200.0,
+        max_elevation_azimuth=100.0,
+        end_azimuth=20.0,
+        satellite_id=satellite_id,
+        pass_index=offset_min,
+        incidence_angle_deg=-12.5 if offset_min % 2 else None,
+        mode="OPTICAL" if offset_min % 3 else None,
+    )
+
+
+def _synthetic():
+    return [
+        _pass(target, satellite, offset)
+        for offset, (target, satellite) in enumerate(
+            [(t, s) for s in ("SAT-B", "SAT-A") for t in ("T2", "T1", "T3")] * 3
+        )
+    ]
+
+
+class TestPassTable:
+    """Tests for building and reading PassTables."""
+
+    def test_round_trip(self, windows) -> None:
+        passes = [p for plist in windows.values() for p in plist]
+        assert passes
+
+        table = PassTable.from_windows(windows)
+        restored = {(p.target_name, p.start_time): p for p in table.to_passes()}
+
+        assert len(table) == len(passes)
+        for p in passes:
+            row = restored[(p.target_name, p.start_time)]
+            assert row.to_dict() == p.to_dict()
+
+    def test_row_view_attributes(self) -> None:
+        table = PassTable.from_passes([_pass("T1", "SAT-A", 1, "sat_a")])
+        row = table[0]
+
+        assert isinstance(row, PassRow)
+        assert row.target_name == "T1"
+        assert row.satellite_id == "sat_a"
+        assert row.start_time == START + timedelta(minutes=1, microseconds=250)
+        assert row.incidence_angle_deg == -12.5
+        assert row.mode == "OPTICAL"
+        assert row.geometry_tca is None
+        assert table[-1].pass_index == 1
+        with pytest.raises(IndexError):
+            table[1]
+        with pytest.raises(AttributeError):
+            row.extra = 1
+
+    def test_sorted_by_satellite_target_start(self) -> None:
+        table = PassTable.from_passes(_synthetic())
+        keys = [(r.satellite_name, r.target_name, r.start_time) for r in table]
+
+        assert keys == sorted(keys)
+
+    def test_selection_is_zero_copy(self) -> None:
+        table = PassTable.from_passes(_synthetic())
+
+        sat_a = table.for_satellite("SAT-A")
+        t1_on_a = sat_a.for_target("T1")
+
+        assert len(sat_a) == 9
+        assert np.shares_memory(sat_a.data, table.data)
+        assert np.shares_memory(t1_on_a.data, table.data)
+        assert {r.target_name for r in t1_on_a} == {"T1"}
+        assert len(t1_on_a) == 3
+        assert sat_a.target_names is table.target_names
+
+        # Across satellites the target's rows are not contiguous
+        t1 = table.for_target("T1")
+        assert len(t1) == 6
+        assert not np.shares_memory(t1.data, table.data)
+        assert len(table.for_target("missing")) == 0
+        assert np.shares_memory(table[2:5].data, table.data)
+
+    def test_records_match_to_dict(self) -> None:
+        passes = _synthetic()
+        table = PassTable.from_passes(passes)
+
+        expected = sorted(
+            (p.to_dict(sections=()) for p in passes),
+            key=lambda d: (d["satellite_name"], d["target"], d["start_time"]),
+        )
+        assert table.to_records() == expected
+        assert PassTable.from_passes([]).to_records() == []
+
+    def test_to_passes_keeps_time_zone(self) -> None:
+        tz = timezone(timedelta(hours=2))
+        passes = [
+            dataclasses.replace(
+                p,
+                start_time=p.start_time.replace(tzinfo=timezone.utc).astimezone(tz),
+                max_elevation_time=p.max_elevation_time.replace(
+                    tzinfo=timezone.utc
+                ).astimezone(tz),
+                end_time=p.end_time.replace(tzinfo=timezone.utc).astimezone(tz),
+            )
+            for p in _synthetic()
+        ]
+
+        restored = PassTable.from_passes(passes).to_passes(tz=tz)
+
+        assert sorted(restored, key=lambda p: p.start_time) == sorted(
+            passes, key=lambda p: p.start_time
+        )
+        assert restored[0].start_time.tzinfo is tz
+
+    def test_concatenate_remaps_labels(self) -> None:
+        passes = _synthetic()
+        parts = [PassTable.from_passes(passes[i::3]) for i in range(3)]
+
+        merged = PassTable.concatenate(parts + [PassTable.from_passes([])])
+
+        assert merged.to_records() == PassTable.from_passes(passes).to_records()
+        assert len(PassTable.concatenate([])) == 0
+
+    def test_invalid_dtype_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            PassTable(np.zeros(3), [], [])
+
+    def test_memory_per_pass(self) -> None:
+        passes = _synthetic()
+        table = PassTable.from_passes(passes)
+        per_object = len(pickle.dumps(passes[0]))
+
+        assert table.nbytes / len(table) == PASS_DTYPE.itemsize
+        assert PASS_DTYPE.itemsize * 5 < per_object
+
+
+class TestSchedulingFromTable:
+    """Tests for handing a PassTable to the scheduler."""
+
+    def test_schedule_accepts_table(self, windows) -> None:
+        table = PassTable.from_windows(windows)
+        scheduler = MissionScheduler(SchedulerConfig())
+        positions = {"Athens": (37.98, 23.73), "Denver": (39.74, -104.99)}
+
+        from_table, _ = scheduler.schedule(table, positions, AlgorithmType.FIRST_FIT)
+        from_list, _ = scheduler.schedule(
+            table.to_opportunities(), positions, AlgorithmType.FIRST_FIT
+        )
+
+        assert from_table
+        assert [s.opportunity_id for s in from_table] == [
+            s.opportunity_id for s in from_list
+        ]
+
+    def test_opportunity_ids_unique(self) -> None:
+        passes = [_pass("T1", "SAT-A", offset) for offset in (0, 100, 200)]
+        for pass_details in passes:
+            pass_details.pass_index = 0
+        passes.append(_pass("T2", "SAT-A", 50))
+
+        opportunities = PassTable.from_passes(passes).to_opportunities()
+
+        assert [o.id for o in opportunities] == [
+            "SAT-A_T1_0",
+            "SAT-A_T1_1",
+            "SAT-A_T1_2",
+            "SAT-A_T2_0",
+        ]
+
+
+class TestSlots:
+    """Per-row classes without per-instance dictionaries."""
+
+    @pytest.mark.parametrize("cls", [PassGeometry, ScheduledOpportunity, PassRow])
+    def test_no_instance_dict(self, cls) -> None:
+        assert "__slots__" in vars(cls)
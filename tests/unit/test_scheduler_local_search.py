@@ -0,0 +1,183 @@
+"""
+Tests for the anytime local-search improvement stage.
+
+Tests cover:
+- Improvement over greedy seeds, with valid schedules
+- Move cap reproducibility, wall-clock budget and best-so-far on early stops
+- Move bookkeeping (apply/undo) keeps chains consistent
+- Disabled by default
+"""
+
+import math
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from mission_planner.scheduler import (
+    AlgorithmType,
+    FeasibilityKernel,
+    MissionScheduler,
+    Opportunity,
+    SchedulerConfig,
+    _LocalSearch,
+    SlewTransitionMatrix,
+)
+
+BASE = datetime(2025, 1, 15, 12, 0, 0)
+
+
+def _random_opportunities(n: int, hours: float, seed: int, satellites: int = 2):
+    rng = random.Random(seed)
+    opportunities = []
+    for i in range(n):
+        start = BASE + timedelta(seconds=rng.uniform(0, hours * 3600))
+        opportunities.append(
+            Opportunity(
+                id=f"o{i}",
+                satellite_id=f"sat{rng.randrange(satellites)}",
+                target_id=f"t{rng.randrange(n // 3)}",
+                start_time=start,
+                end_time=start + timedelta(seconds=60),
+                incidence_angle=rng.uniform(-40, 40),
+                value=rng.uniform(0.1, 5.0),
+            )
+        )
+    return opportunities
+
+
+def _assert_valid(config: SchedulerConfig, schedule, opportunities) -> None:
+    assert len({s.target_id for s in schedule}) == len(schedule)
+    kernel = FeasibilityKernel(config)
+    by_id = {o.id: o for o in opportunities}
+    for satellite_id in {s.satellite_id for s in schedule}:
+        previous = None
+        for item in schedule:
+            if item.satellite_id != satellite_id:
+                continue
+            feasible, *details = kernel.is_feasible(
+                previous, by_id[item.opportunity_id], {}
+            )
+            assert feasible
+            previous = item
+
+
+@pytest.fixture(scope="module")
+def opportunities():
+    return _random_opportunities(1500, hours=6, seed=11)
+
+
+class TestImprovement:
+    """Tests for SchedulerConfig.improve_budget_ms and improve_max_moves."""
+
+    @pytest.mark.parametrize(
+        "algorithm", [AlgorithmType.FIRST_FIT, AlgorithmType.BEST_FIT]
+    )
+    def test_improves_greedy_seed(self, opportunities, algorithm) -> None:
+        config = SchedulerConfig(
+            max_roll_rate_dps=1.0, improve_max_moves=20000, improve_seed=1
+        )
+        _, greedy = MissionScheduler(SchedulerConfig(max_roll_rate_dps=1.0)).schedule(
+            opportunities, {}, algorithm
+        )
+
+        schedule, metrics = MissionScheduler(config).schedule(
+            opportunities, {}, algorithm
+        )
+
+        assert metrics.total_value > greedy.total_value
+        assert metrics.local_search_gain == pytest.approx(
+            metrics.total_value - greedy.total_value
+        )
+        assert metrics.local_search_moves == 20000
+        assert metrics.seed == 1
+        assert "local_search_gain" in metrics.to_dict()
+        _assert_valid(config, schedule, opportunities)
+
+    def test_move_cap_is_reproducible(self, opportunities) -> None:
+        config = SchedulerConfig(
+            max_roll_rate_dps=1.0, improve_max_moves=5000, improve_seed=4
+        )
+
+        runs = [
+            MissionScheduler(config).schedule(
+                opportunities, {}, AlgorithmType.BEST_FIT
+            )
+            for _ in range(2)
+        ]
+
+        (first, first_metrics), (second, second_metrics) = runs
+        assert [s.opportunity_id for s in first] == [s.opportunity_id for s in second]
+        assert first_metrics.total_value == second_metrics.total_value
+
+    def test_budget_stops_before_cap(self, opportunities) -> None:
+        config = SchedulerConfig(
+            max_roll_rate_dps=1.0, improve_budget_ms=1.0, improve_max_moves=10**9
+        )
+
+        _, metrics = MissionScheduler(config).schedule(
+            opportunities, {}, AlgorithmType.FIRST_FIT
+        )
+
+        assert metrics.local_search_moves < 10**9
+        assert metrics.local_search_gain >= 0
+
+    def test_disabled_by_default(self, opportunities) -> None:
+        _, metrics = MissionScheduler(SchedulerConfig()).schedule(
+            opportunities[:50], {}, AlgorithmType.FIRST_FIT
+        )
+
+        assert metrics.local_search_moves is None
+        assert "local_search_moves" not in metrics.to_dict()
+
+    def test_negative_budget_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            SchedulerConfig(improve_budget_ms=-1)
+        with pytest.raises(ValueError):
+            SchedulerConfig(improve_max_moves=0)
+
+
+class TestLocalSearch:
+    """Tests for the annealing state."""
+
+    @staticmethod
+    def _search(opportunities, seed=0):
+        kernel = FeasibilityKernel(SchedulerConfig(max_roll_rate_dps=1.0))
+        ordered = sorted(opportunities, key=lambda o: o.start_time)
+        transitions = {
+            sat_id: SlewTransitionMatrix(
+                kernel, [o for o in ordered if o.satellite_id == sat_id], False
+            )
+            for sat_id in ("sat0", "sat1")
+        }
+        return _LocalSearch(transitions, {}, random.Random(seed))
+
+    def test_expired_deadline_keeps_seed(self, opportunities) -> None:
+        search = self._search(opportunities)
+
+        assert search.run(time.perf_counter() - 1) == 0
+        assert search.best() == (0.0, {"sat0": [], "sat1": []})
+
+    def test_state_stays_consistent(self, opportunities) -> None:
+        search = self._search(opportunities)
+
+        assert search.run(math.inf, 5000) == 5000
+
+        scheduled = {
+            (sat_id, i) for sat_id, chain in search.chains.items() for i in chain
+        }
+        assert scheduled == set(search.scheduled.values())
+        assert search.value == pytest.approx(
+            sum(search.values[sat_id][i] for sat_id, i in scheduled)
+        )
+        best_value, best_chains = search.best()
+        assert best_value >= search.value - 1e-9
+        total = 0.0
+        for sat_id, chain in best_chains.items():
+            transitions = search.transitions[sat_id]
+            assert chain == sorted(chain)
+            for i, j in zip(chain, chain[1:]):
+                assert transitions.can_follow(i, j)
+            total += sum(search.values[sat_id][i] for i in chain)
+        assert total == pytest.approx(best_value)
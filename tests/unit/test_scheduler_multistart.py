@@ -0,0 +1,204 @@
+"""
+Tests for multistart randomized scheduling.
+
+Tests cover:
+- Randomized starts report true values and are reproducible
+- The best start is never worse than the plain algorithm
+- Pool path: inputs shipped once through shared memory, same results
+  (also with a move-capped local search)
+- Argument validation
+"""
+
+import random
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import mission_planner.parallel as parallel_module
+from mission_planner.scheduler import (
+    AlgorithmType,
+    MissionScheduler,
+    Opportunity,
+    SchedulerConfig,
+)
+
+BASE = datetime(2025, 1, 15, 12, 0, 0)
+
+
+class InlineExecutor:
+    """Executor stand-in that runs each task immediately in-process."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        self.calls.append(MagicMock(args=args, kwargs=kwargs))
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def _random_opportunities(n: int, hours: float, seed: int):
+    rng = random.Random(seed)
+    opportunities = []
+    for i in range(n):
+        start = BASE + timedelta(seconds=rng.uniform(0, hours * 3600))
+        opportunities.append(
+            Opportunity(
+                id=f"o{i}",
+                satellite_id=f"sat{rng.randrange(2)}",
+                target_id=f"t{rng.randrange(n // 3)}",
+                start_time=start,
+                end_time=start + timedelta(seconds=60),
+                incidence_angle=rng.uniform(-40, 40),
+                value=rng.uniform(0.1, 5.0),
+            )
+        )
+    return opportunities
+
+
+@pytest.fixture(scope="module")
+def opportunities():
+    return _random_opportunities(900, hours=3, seed=4)
+
+
+@pytest.fixture
+def scheduler():
+    return MissionScheduler(SchedulerConfig(max_roll_rate_dps=1.0))
+
+
+@pytest.fixture(autouse=True)
+def clean_worker_payloads():
+    yield
+    parallel_module._worker_payloads.clear()
+
+
+class TestScheduleMultistart:
+    """Tests for MissionScheduler.schedule_multistart."""
+
+    @pytest.mark.parametrize(
+        "algorithm", [AlgorithmType.FIRST_FIT, AlgorithmType.BEST_FIT]
+    )
+    def test_best_of_starts(self, scheduler, opportunities, algorithm) -> None:
+        _, plain = scheduler.schedule(opportunities, {}, algorithm)
+
+        schedule, metrics = scheduler.schedule_multistart(
+            opportunities, {}, n_starts=6, seed=3, algorithm=algorithm, max_workers=1
+        )
+
+        values = metrics.multistart_values
+        assert len(values) == 6
+        assert values[0] == pytest.approx(plain.total_value)
+        assert len(set(values)) > 1
+        assert metrics.total_value == max(values)
+        assert metrics.total_value >= plain.total_value
+        assert metrics.seed is None or 4 <= metrics.seed <= 8
+        assert sum(s.value for s in schedule) == pytest.approx(metrics.total_value)
+        assert len({s.target_id for s in schedule}) == len(schedule)
+        assert len(metrics.to_dict()["multistart_values"]) == 6
+
+    def test_perturbed_start_reports_true_values(
+        self, scheduler, opportunities
+    ) -> None:
+        values = {o.id: o.value for o in opportunities}
+
+        schedule, metrics = scheduler.schedule_perturbed(
+            opportunities, {}, AlgorithmType.BEST_FIT, seed=5
+        )
+        again, _ = scheduler.schedule_perturbed(
+            opportunities, {}, AlgorithmType.BEST_FIT, seed=5
+        )
+
+        assert all(s.value == values[s.opportunity_id] for s in schedule)
+        assert metrics.total_value == pytest.approx(sum(s.value for s in schedule))
+        assert metrics.seed == 5
+        assert [s.opportunity_id for s in again] == [
+            s.opportunity_id for s in schedule
+        ]
+
+    def test_validation(self, scheduler, opportunities) -> None:
+        with pytest.raises(ValueError):
+            scheduler.schedule_multistart(opportunities, {}, n_starts=0)
+        with pytest.raises(ValueError):
+            scheduler.schedule_multistart(
+                opportunities, {}, algorithm=AlgorithmType.OPTIMAL_DP
+            )
+
+
+class TestPoolStarts:
+    """Tests for run_schedule_starts with a worker pool."""
+
+    def test_ships_inputs_once(self, scheduler, opportunities) -> None:
+        serial = scheduler.schedule_multistart(
+            opportunities, {}, n_starts=4, seed=1, max_workers=1
+        )
+        executor = InlineExecutor()
+
+        with patch.object(
+            parallel_module, "get_optimal_workers", return_value=2
+        ), patch.object(
+            parallel_module, "get_or_create_process_pool", return_value=executor
+        ), patch.object(
+            parallel_module.pickle,
+            "loads",
+            side_effect=parallel_module.pickle.loads,
+        ) as loads:
+            schedule, metrics = scheduler.schedule_multistart(
+                opportunities, {}, n_starts=4, seed=1
+            )
+
+        assert metrics.multistart_values == serial[1].multistart_values
+        assert [s.opportunity_id for s in schedule] == [
+            s.opportunity_id for s in serial[0]
+        ]
+        # Tasks carry the block name and seed only; unpickled once
+        assert [call.args[3] for call in executor.calls] == [None, 2, 3, 4]
+        assert loads.call_count == 1
+        block_name = executor.calls[0].args[0]
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=block_name)
+
+    def test_move_capped_improvement_matches_serial(self, opportunities) -> None:
+        scheduler = MissionScheduler(
+            SchedulerConfig(max_roll_rate_dps=1.0, improve_max_moves=2000)
+        )
+        serial = scheduler.schedule_multistart(
+            opportunities, {}, n_starts=3, seed=2, max_workers=1
+        )
+
+        with patch.object(
+            parallel_module, "get_optimal_workers", return_value=2
+        ), patch.object(
+            parallel_module, "get_or_create_process_pool", return_value=InlineExecutor()
+        ):
+            schedule, metrics = scheduler.schedule_multistart(
+                opportunities, {}, n_starts=3, seed=2
+            )
+
+        assert metrics.multistart_values == serial[1].multistart_values
+        assert [s.opportunity_id for s in schedule] == [
+            s.opportunity_id for s in serial[0]
+        ]
+
+    def test_broken_pool_falls_back(self, scheduler, opportunities) -> None:
+        pool = MagicMock()
+        pool.submit.return_value.result.side_effect = BrokenProcessPool()
+
+        with patch.object(
+            parallel_module, "get_optimal_workers", return_value=2
+        ), patch.object(
+            parallel_module, "get_or_create_process_pool", return_value=pool
+        ), patch.object(parallel_module, "cleanup_process_pool") as cleanup:
+            _, metrics = scheduler.schedule_multistart(
+                opportunities, {}, n_starts=3, seed=1
+            )
+
+        cleanup.assert_called_once()
+        assert len(metrics.multistart_values) == 3
@@ -0,0 +1,287 @@
+"""
+Tests for the optimal-DP scheduler.
+
+Tests cover:
+- Vectorized maneuver times match the scalar model
+- Chain DP and transitions on small instances
+- Kernel lookups from transition matrices match the scalar path exactly
+- Exact optimum against brute force
+- Value against the greedy algorithms, reported bound and gap
+- Time budget
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from mission_planner.scheduler import (
+    AlgorithmType,
+    FeasibilityKernel,
+    MissionScheduler,
+    Opportunity,
+    SchedulerConfig,
+    SlewTransitionMatrix,
+)
+
+BASE = datetime(2025, 1, 15, 12, 0, 0)
+
+
+def _opportunity(
+    opp_id: str,
+    offset_s: float,
+    incidence: float,
+    value: float,
+    target_id: str = "",
+    satellite_id: str = "sat",
+) -> Opportunity:
+    start = BASE + timedelta(seconds=offset_s)
+    return Opportunity(
+        id=opp_id,
+        satellite_id=satellite_id,
+        target_id=target_id or opp_id,
+        start_time=start,
+        end_time=start + timedelta(seconds=60),
+        incidence_angle=incidence,
+        value=value,
+    )
+
+
+def _random_opportunities(n: int, hours: float, seed: int, satellites: int = 1):
+    rng = random.Random(seed)
+    return [
+        _opportunity(
+            f"o{i}",
+            rng.uniform(0, hours * 3600),
+            rng.uniform(-40, 40),
+            rng.uniform(0.1, 5.0),
+            target_id=f"t{rng.randrange(max(1, n // 3))}",
+            satellite_id=f"sat{rng.randrange(satellites)}",
+        )
+        for i in range(n)
+    ]
+
+
+def _chain_feasible(kernel: FeasibilityKernel, chain) -> bool:
+    previous = None
+    for opp in chain:
+        feasible, *details = kernel.is_feasible(previous, opp, {})
+        if not feasible:
+            return False
+        previous = MissionScheduler(kernel.config)._scheduled_from(opp, *details)
+    return True
+
+
+def _brute_force_value(config: SchedulerConfig, opportunities) -> float:
+    kernel = FeasibilityKernel(config)
+    ordered = sorted(opportunities, key=lambda o: o.start_time)
+    best = 0.0
+    for size in range(1, len(ordered) + 1):
+        for chain in combinations(ordered, size):
+            if len({o.target_id for o in chain}) < size:
+                continue
+            if _chain_feasible(kernel, chain):
+                best = max(best, sum(o.value for o in chain))
+    return best
+
+
+class TestManeuverTimes:
+    """Tests for FeasibilityKernel.compute_maneuver_times."""
+
+    @pytest.mark.parametrize("pitch", [False, True])
+    def test_matches_scalar(self, pitch) -> None:
+        kernel = FeasibilityKernel(
+            SchedulerConfig(max_pitch_rate_dps=0.5, max_pitch_accel_dps2=0.2)
+        )
+        rng = np.random.default_rng(5)
+        delta_roll = rng.uniform(-90, 90, 200)
+        delta_pitch = rng.uniform(-40, 40, 200) if pitch else None
+
+        times = kernel.compute_maneuver_times(delta_roll, delta_pitch)
+
+        expected = [
+            kernel.compute_maneuver_time(
+                abs(r), abs(delta_pitch[k]) if pitch else 0.0
+            )
+            for k, r in enumerate(delta_roll)
+        ]
+        np.testing.assert_array_equal(times, expected)
+
+
+class TestSlewTransitionMatrix:
+    """Tests for the per-satellite transition matrix and chain DP."""
+
+    def test_predecessors_match_kernel(self) -> None:
+        config = SchedulerConfig(max_roll_rate_dps=1.0)
+        kernel = FeasibilityKernel(config)
+        opportunities = sorted(
+            _random_opportunities(60, hours=0.5, seed=3),
+            key=lambda o: o.start_time,
+        )
+        transitions = SlewTransitionMatrix(kernel, opportunities, use_pitch=False)
+
+        for j, i in combinations(range(len(opportunities)), 2):
+            i, j = min(i, j), max(i, j)
+            expected = _chain_feasible(kernel, [opportunities[i], opportunities[j]])
+            assert transitions.can_follow(i, j) == expected
+
+    def test_best_chain_skips_non_positive(self) -> None:
+        kernel = FeasibilityKernel(SchedulerConfig())
+        opportunities = [
+            _opportunity("a", 0, 0.0, 1.0),
+            _opportunity("b", 100, 0.0, 1.0),
+            _opportunity("c", 200, 0.0, 1.0),
+        ]
+        transitions = SlewTransitionMatrix(kernel, opportunities, use_pitch=False)
+
+        assert transitions.best_chain([1.0, -2.0, 3.0]) == (4.0, [0, 2])
+        assert transitions.best_chain([0.0, 0.0, 0.0]) == (0.0, [])
+
+    @pytest.mark.parametrize("use_pitch", [False, True])
+    def test_kernel_lookups_match_scalar(self, use_pitch) -> None:
+        config = SchedulerConfig(
+            max_roll_rate_dps=1.0, max_pitch_rate_dps=0.5, max_spacecraft_pitch_deg=30
+        )
+        opportunities = sorted(
+            _random_opportunities(80, hours=0.5, seed=8, satellites=2),
+            key=lambda o: o.start_time,
+        )
+        for k, opp in enumerate(opportunities):
+            opp.pitch_angle = (k % 7 - 3) * 8.0
+        scalar, prepared = FeasibilityKernel(config), FeasibilityKernel(config)
+        prepared.prepare_transitions(opportunities)
+        matrices = prepared.transition_matrices(use_pitch)
+        method = "is_feasible_2d" if use_pitch else "is_feasible"
+        scheduler = MissionScheduler(config)
+
+        checked = 0
+        for a, b in combinations(opportunities, 2):
+            first = getattr(scalar, method)(None, a, {})
+            previous = scheduler._scheduled_from(a, *first[1:])
+            expected = getattr(scalar, method)(previous, b, {})
+            if a.satellite_id == b.satellite_id and expected[0] is not False:
+                assert prepared._lookup_transition(previous, b, use_pitch)
+                checked += 1
+            assert getattr(prepared, method)(previous, b, {}) == expected
+
+        assert checked > 0
+        assert sum(m.nnz for m in matrices.values()) < len(opportunities) ** 2 / 2
+
+    def test_lookup_falls_back(self) -> None:
+        kernel = FeasibilityKernel(SchedulerConfig(max_roll_rate_dps=1.0))
+        a, b = _opportunity("a", 0, 10.0, 1.0), _opportunity("b", 100, -10.0, 1.0)
+        duplicate = _opportunity("a", 200, 5.0, 1.0)
+        scheduler = MissionScheduler(kernel.config)
+        first = scheduler._scheduled_from(a, *kernel.is_feasible(None, a, {})[1:])
+
+        # Not built yet
+        kernel.prepare_transitions([a, b])
+        assert kernel._lookup_transition(first, b, False) is None
+        kernel.transition_matrices(False)
+        assert kernel._lookup_transition(first, b, False) is not None
+        # Another opportunity object, and a different attitude
+        copy = _opportunity("b", 100, -10.0, 1.0)
+        assert kernel._lookup_transition(first, copy, False) is None
+        first.roll_angle = 12.0
+        assert kernel._lookup_transition(first, b, False) is None
+        # Duplicate ids are not indexed
+        kernel.prepare_transitions([a, b, duplicate])
+        kernel.transition_matrices(False)
+        first.roll_angle = 10.0
+        assert kernel._lookup_transition(first, b, False) is None
+
+    def test_schedule_releases_matrices(self) -> None:
+        config = SchedulerConfig(max_roll_rate_dps=1.0)
+        opportunities = _random_opportunities(200, hours=1, seed=6, satellites=2)
+        scheduler = MissionScheduler(config)
+
+        schedule, _ = scheduler.schedule(opportunities, {}, AlgorithmType.OPTIMAL_DP)
+
+        assert scheduler.kernel._transition_matrices == {}
+        assert scheduler.kernel._transition_opportunities is None
+        for satellite_id in ("sat0", "sat1"):
+            chain = [
+                o
+                for s in schedule
+                for o in opportunities
+                if o.id == s.opportunity_id and o.satellite_id == satellite_id
+            ]
+            assert _chain_feasible(FeasibilityKernel(config), chain)
+
+
+class TestOptimalSchedule:
+    """Tests for AlgorithmType.OPTIMAL_DP."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_brute_force(self, seed) -> None:
+        config = SchedulerConfig(max_roll_rate_dps=1.0)
+        opportunities = _random_opportunities(11, hours=0.1, seed=seed)
+
+        schedule, metrics = MissionScheduler(config).schedule(
+            opportunities, {}, AlgorithmType.OPTIMAL_DP
+        )
+
+        optimum = _brute_force_value(config, opportunities)
+        assert metrics.total_value == pytest.approx(optimum)
+        # The Lagrangian bound is valid but may keep a duality gap
+        assert metrics.value_upper_bound >= optimum - 1e-9
+        assert metrics.optimality_gap == pytest.approx(
+            (metrics.value_upper_bound - optimum) / metrics.value_upper_bound
+        )
+
+    def test_beats_greedy_on_oversubscribed_day(self) -> None:
+        config = SchedulerConfig(max_roll_rate_dps=1.0)
+        opportunities = _random_opportunities(1500, hours=6, seed=11, satellites=2)
+        scheduler = MissionScheduler(config)
+
+        schedule, metrics = scheduler.schedule(
+            opportunities, {}, AlgorithmType.OPTIMAL_DP
+        )
+
+        for algorithm in (AlgorithmType.FIRST_FIT, AlgorithmType.BEST_FIT):
+            _, greedy = scheduler.schedule(opportunities, {}, algorithm)
+            assert metrics.total_value >= greedy.total_value
+        assert metrics.value_upper_bound >= metrics.total_value
+        assert 0.0 <= metrics.optimality_gap < 0.05
+        assert "optimality_gap" in metrics.to_dict()
+
+        # One acquisition per target, slew-feasible on each satellite
+        assert len({s.target_id for s in schedule}) == len(schedule)
+        kernel = FeasibilityKernel(config)
+        by_id = {o.id: o for o in opportunities}
+        for satellite_id in ("sat0", "sat1"):
+            chain = [
+                by_id[s.opportunity_id]
+                for s in schedule
+                if s.satellite_id == satellite_id
+            ]
+            assert _chain_feasible(kernel, chain)
+
+    def test_respects_budget(self) -> None:
+        config = SchedulerConfig(max_roll_rate_dps=1.0, optimal_budget_ms=50.0)
+        opportunities = _random_opportunities(4000, hours=12, seed=2)
+
+        started = time.perf_counter()
+        schedule, metrics = MissionScheduler(config).schedule(
+            opportunities, {}, AlgorithmType.OPTIMAL_DP
+        )
+
+        # One iteration always completes; the budget stops the rest
+        assert time.perf_counter() - started < 5.0
+        assert schedule
+        assert metrics.value_upper_bound >= metrics.total_value
+
+    def test_empty(self) -> None:
+        schedule, metrics = MissionScheduler(SchedulerConfig()).schedule(
+            [], {}, AlgorithmType.OPTIMAL_DP
+        )
+
+        assert schedule == []
+        assert metrics.total_value == 0.0
+
+    def test_budget_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            SchedulerConfig(optimal_budget_ms=0)
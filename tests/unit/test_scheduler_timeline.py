@@ -0,0 +1,136 @@
+"""
+Tests for per-satellite scheduling timelines.
+
+Tests cover:
+- SatelliteTimeline ordering, neighbours and removal
+- Range queries in insertion order
+- Best-fit schedules keep slew gaps between every pair of items
+"""
+
+import random
+from datetime import datetime, timedelta
+from itertools import combinations
+
+from mission_planner.scheduler import (
+    MIN_GAP_SECONDS,
+    AlgorithmType,
+    MissionScheduler,
+    Opportunity,
+    SatelliteTimeline,
+    ScheduledOpportunity,
+    SchedulerConfig,
+)
+
+BASE = datetime(2025, 1, 15, 12, 0, 0)
+
+
+def _item(opp_id: str, offset_s: float, incidence: float = 0.0) -> ScheduledOpportunity:
+    start = BASE + timedelta(seconds=offset_s)
+    return ScheduledOpportunity(
+        opportunity_id=opp_id,
+        satellite_id="sat",
+        target_id=opp_id,
+        start_time=start,
+        end_time=start + timedelta(seconds=5),
+        delta_roll=0.0,
+        incidence_angle=incidence,
+    )
+
+
+def _timeline(*items: ScheduledOpportunity) -> SatelliteTimeline:
+    timeline = SatelliteTimeline()
+    for item in items:
+        timeline.add(item.start_time, item.end_time, item)
+    return timeline
+
+
+def _random_opportunities(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    opportunities = []
+    for i in range(n):
+        start = BASE + timedelta(seconds=rng.uniform(0, 6 * 3600))
+        opportunities.append(
+            Opportunity(
+                id=f"o{i}",
+                satellite_id=f"sat{rng.randrange(3)}",
+                target_id=f"t{rng.randrange(n // 4)}",
+                start_time=start,
+                end_time=start + timedelta(seconds=60),
+                incidence_angle=rng.uniform(-40, 40),
+                value=rng.uniform(0.1, 5.0),
+            )
+        )
+    return opportunities
+
+
+class TestSatelliteTimeline:
+    """Tests for the sorted interval index."""
+
+    def test_iterates_chronologically(self) -> None:
+        a, b, c = _item("a", 100), _item("b", 0), _item("c", 50)
+        timeline = _timeline(a, b, c)
+
+        assert len(timeline) == 3
+        assert [entry[2] for entry in timeline] == [b, c, a]
+
+    def test_neighbors(self) -> None:
+        a, b = _item("a", 0), _item("b", 100)
+        timeline = _timeline(a, b)
+
+        before, after = timeline.neighbors(BASE + timedelta(seconds=50))
+        assert before[2] is a
+        assert after[2] is b
+        # An entry starting at the same time is the successor
+        before, after = timeline.neighbors(BASE + timedelta(seconds=100))
+        assert before[2] is a
+        assert after[2] is b
+        assert timeline.neighbors(BASE - timedelta(seconds=1))[0] is None
+        assert timeline.neighbors(BASE + timedelta(seconds=101))[1] is None
+        assert SatelliteTimeline().neighbors(BASE) == (None, None)
+
+    def test_remove(self) -> None:
+        a, b, c = _item("a", 0), _item("b", 10), _item("c", 10)
+        timeline = _timeline(a, b, c)
+
+        timeline.remove(c)
+        timeline.remove(_item("missing", 10))
+
+        assert [entry[2] for entry in timeline] == [a, b]
+
+    def test_overlapping_in_insertion_order(self) -> None:
+        items = [_item("late", 300), _item("early", 100), _item("mid", 200)]
+        timeline = _timeline(*items, _item("far", 900))
+
+        found = timeline.overlapping(
+            BASE + timedelta(seconds=103), BASE + timedelta(seconds=300)
+        )
+
+        # "early" ends at 105 s, inside the range
+        assert [entry[2].opportunity_id for entry in found] == ["late", "early", "mid"]
+
+    def test_slew_reach(self) -> None:
+        timeline = _timeline(_item("a", 0, incidence=-30.0))
+
+        assert timeline.slew_reach_s(10.0, 2.0) == 15.0
+        assert timeline.slew_reach_s(-40.0, 2.0) == 20.0
+        assert timeline.slew_reach_s(0.0, 100.0) == MIN_GAP_SECONDS
+
+
+class TestBestFitWithTimeline:
+    """Best-fit schedules checked against every pair of scheduled items."""
+
+    def test_pairwise_slew_gaps(self) -> None:
+        config = SchedulerConfig(max_roll_rate_dps=2.0)
+        schedule, _ = MissionScheduler(config).schedule(
+            _random_opportunities(2000), {}, AlgorithmType.BEST_FIT
+        )
+
+        assert schedule
+        assert len({s.target_id for s in schedule}) == len(schedule)
+        for a, b in combinations(schedule, 2):
+            if a.satellite_id != b.satellite_id:
+                continue
+            first, second = sorted((a, b), key=lambda s: s.start_time)
+            gap = (second.start_time - first.end_time).total_seconds()
+            roll_diff = abs(abs(first.incidence_angle) - abs(second.incidence_angle))
+            assert gap >= max(MIN_GAP_SECONDS, roll_diff / config.max_roll_rate_dps)
@@ -0,0 +1,178 @@
+"""
+Tests for ephemeris tables shared with process-pool workers.
+
+Tests cover:
+- Attached ephemeris matches the published one, without copying nodes
+- Block lifetime: close, release at pool cleanup
+- Worker-side attachment and eviction
+- Parallel runs publish once and unlink afterwards
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+import mission_planner.parallel as parallel_module
+from mission_planner.ephemeris import Ephemeris
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.parallel import ParallelVisibilityCalculator
+from mission_planner.pass_table import PassTable
+from mission_planner.shared_ephemeris import (
+    SharedEphemeris,
+    attach_shared_ephemeris,
+    release_shared_ephemerides,
+)
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9025",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49572541123456",
+]
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(hours=6)
+
+
+@pytest.fixture(scope="module")
+def satellite():
+    return SatelliteOrbit(ISS_TLE, "ISS")
+
+
+@pytest.fixture(scope="module")
+def ephemeris(satellite):
+    return Ephemeris.from_orbit(satellite, START, END)
+
+
+@pytest.fixture(autouse=True)
+def clean_worker_state():
+    yield
+    for calc in parallel_module._worker_calculators.values():
+        calc.set_ephemeris(None)
+    parallel_module._worker_calculators.clear()
+    parallel_module._worker_ephemerides.clear()
+    release_shared_ephemerides()
+
+
+class TestSharedEphemeris:
+    """Tests for publishing and attaching blocks."""
+
+    def test_attached_matches_published(self, satellite, ephemeris) -> None:
+        with SharedEphemeris(ephemeris) as shared:
+            block, attached = attach_shared_ephemeris(shared.spec, orbit=satellite)
+
+            epoch_s = np.linspace(ephemeris.start_epoch, ephemeris.end_epoch, 500)
+            np.testing.assert_array_equal(
+                attached.propagate(epoch_s).position_llh,
+                ephemeris.propagate(epoch_s).position_llh,
+            )
+            assert attached.satellite_name == "ISS"
+            assert attached.tle_lines == ISS_TLE
+            assert attached.orbit is satellite
+            for nodes in (attached.node_times, attached.position_eci):
+                assert not nodes.flags.owndata
+
+            del attached
+            block.close()
+
+    def test_close_unlinks(self, ephemeris) -> None:
+        shared = SharedEphemeris(ephemeris)
+        spec = shared.spec
+
+        shared.close()
+        shared.close()
+
+        assert shared.closed
+        with pytest.raises(FileNotFoundError):
+            attach_shared_ephemeris(spec)
+
+    def test_pool_cleanup_releases_blocks(self, ephemeris) -> None:
+        shared = SharedEphemeris(ephemeris)
+
+        parallel_module.cleanup_process_pool()
+
+        assert shared.closed
+        with pytest.raises(FileNotFoundError):
+            attach_shared_ephemeris(shared.spec)
+
+
+class TestWorkerAttachment:
+    """Tests for the worker side of the parallel calculator."""
+
+    def test_attaches_once_and_evicts(self, satellite, ephemeris) -> None:
+        calc = VisibilityCalculator(satellite)
+        parallel_module._worker_calculators[("key", False)] = calc
+        blocks = [SharedEphemeris(ephemeris) for _ in range(3)]
+
+        parallel_module._attach_worker_ephemeris(calc, blocks[0].spec)
+        first = calc.ephemeris
+        parallel_module._attach_worker_ephemeris(calc, blocks[0].spec)
+
+        assert calc.ephemeris is first
+        assert list(parallel_module._worker_ephemerides) == [blocks[0].spec.block_name]
+
+        parallel_module._attach_worker_ephemeris(calc, blocks[1].spec)
+        parallel_module._attach_worker_ephemeris(calc, blocks[2].spec)
+
+        assert list(parallel_module._worker_ephemerides) == [
+            b.spec.block_name for b in blocks[1:]
+        ]
+        assert calc.ephemeris is parallel_module._worker_ephemerides[
+            blocks[2].spec.block_name
+        ][1]
+
+    def test_released_block_falls_back(self, satellite, ephemeris) -> None:
+        shared = SharedEphemeris(ephemeris)
+        shared.close()
+        tle_data = {"name": "ISS", "line1": ISS_TLE[1], "line2": ISS_TLE[2]}
+
+        passes = parallel_module._find_target_passes(
+            {"name": "Athens", "latitude": 37.98, "longitude": 23.73},
+            tle_data,
+            START,
+            END,
+            10,
+            False,
+            shared.spec,
+        )
+
+        assert isinstance(passes, list)
+        calc = next(iter(parallel_module._worker_calculators.values()))
+        assert calc.ephemeris is not None
+
+
+class TestParallelPublishing:
+    """ParallelVisibilityCalculator publishes one block per run."""
+
+    @patch("mission_planner.parallel._compute_target_batch_worker")
+    @patch("mission_planner.parallel.get_or_create_process_pool")
+    def test_publishes_and_unlinks(self, mock_pool, mock_worker, satellite) -> None:
+        specs = []
+
+        def submit(fn, batch):
+            specs.append(fn.keywords["shared_ephemeris"])
+            block, attached = attach_shared_ephemeris(specs[-1])
+            assert attached.covers(START, END)
+            del attached
+            block.close()
+            future = MagicMock()
+            future.result.return_value = (PassTable.from_passes([]), 0.0)
+            return future
+
+        mock_pool.return_value.submit.side_effect = submit
+        with patch(
+            "mission_planner.parallel.wait",
+            side_effect=lambda pending, return_when: (set(pending), set()),
+        ):
+            calc = ParallelVisibilityCalculator(satellite, max_workers=2)
+            calc.compute_pass_table(
+                [GroundTarget(f"T{i}", 10.0, 20.0) for i in range(3)], START, END
+            )
+
+        assert len({s.block_name for s in specs}) == 1
+        assert mock_pool.call_args.args[3] == specs[0]
+        with pytest.raises(FileNotFoundError):
+            attach_shared_ephemeris(specs[0])
@@ -0,0 +1,175 @@
+"""
+Tests for vectorized solar geometry and daylight intervals.
+
+Tests cover:
+- Array functions agree with their scalar counterparts
+- Daylight intervals agree with a dense scalar scan, including short days
+- Lookups outside the precomputed window
+- Optical visibility scans skip the night
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import mission_planner.sunlight as sunlight_module
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.sunlight import (
+    DaylightIntervals,
+    calculate_gmst,
+    calculate_gmst_array,
+    calculate_sun_position,
+    calculate_sun_position_array,
+    get_sun_elevation,
+    get_sun_elevation_array,
+    is_target_illuminated_array,
+)
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+START = datetime(2025, 6, 20)
+END = START + timedelta(days=2)
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+
+
+def _epoch(timestamp):
+    return timestamp.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _datetime(epoch_s):
+    return datetime.fromtimestamp(epoch_s, tz=timezone.utc).replace(tzinfo=None)
+
+
+class TestArrayFunctions:
+    """Array versions reproduce the scalar functions."""
+
+    def test_match_scalar_functions(self) -> None:
+        rng = np.random.default_rng(0)
+        epoch_s = _epoch(START) + rng.uniform(0, 365 * 86400, 50)
+        lat = rng.uniform(-90, 90, 50)
+        lon = rng.uniform(-180, 180, 50)
+
+        positions = calculate_sun_position_array(epoch_s)
+        gmst = calculate_gmst_array(epoch_s)
+        elevations = get_sun_elevation_array(lat, lon, epoch_s)
+
+        assert positions.shape == (50, 3)
+        for i, t in enumerate(epoch_s):
+            timestamp = _datetime(t)
+            np.testing.assert_allclose(
+                positions[i], calculate_sun_position(timestamp), rtol=1e-9
+            )
+            assert gmst[i] == pytest.approx(calculate_gmst(timestamp), abs=1e-6)
+            assert elevations[i] == pytest.approx(
+                get_sun_elevation(lat[i], lon[i], timestamp), abs=1e-6
+            )
+
+    def test_broadcasts_locations_against_times(self) -> None:
+        epoch_s = _epoch(START) + np.arange(0, 86400, 3600.0)
+        lat = np.array([[0.0], [45.0], [-60.0]])
+        lon = np.array([[0.0], [90.0], [-120.0]])
+
+        lit = is_target_illuminated_array(lat, lon, epoch_s)
+
+        assert lit.shape == (3, 24)
+        for row in range(3):
+            expected = get_sun_elevation_array(lat[row, 0], lon[row, 0], epoch_s) >= 0
+            np.testing.assert_array_equal(lit[row], expected)
+
+
+class TestDaylightIntervals:
+    """Precomputed sunlit intervals."""
+
+    @staticmethod
+    def _assert_matches_scan(daylight, step_seconds=30.0) -> None:
+        grid = np.arange(daylight.start_epoch_s, daylight.end_epoch_s, step_seconds)
+        expected = is_target_illuminated_array(
+            daylight.latitude, daylight.longitude, grid
+        )
+        np.testing.assert_array_equal(daylight.is_lit(grid), expected)
+
+    def test_matches_dense_scan(self) -> None:
+        # Equator, mid-latitudes, near the polar circles and polar day/night
+        lat = [0.0, 45.0, -45.0, 66.0, -66.0, 75.0, -75.0]
+        lon = [0.0, 100.0, -30.0, 20.0, 170.0, -90.0, 45.0]
+
+        result = DaylightIntervals.compute(lat, lon, START, END)
+
+        assert [d.latitude for d in result] == lat
+        for daylight in result:
+            self._assert_matches_scan(daylight)
+        assert len(result[0]) == 2
+        # Midsummer: polar day in the north, polar night in the south
+        assert len(result[5]) == 1 and result[5].windows() == [(START, END)]
+        assert len(result[6]) == 0
+
+    def test_short_days_between_coarse_samples(self, monkeypatch) -> None:
+        # Near the winter polar circle the sun only grazes the horizon;
+        # coarse samples six hours apart must not lose those short days.
+        monkeypatch.setattr(sunlight_module, "DAYLIGHT_SAMPLE_SECONDS", 6 * 3600.0)
+        lat = np.linspace(-67.5, -66.0, 7)
+
+        result = DaylightIntervals.compute(lat, np.zeros_like(lat), START, END)
+
+        assert any(0 < len(d) for d in result)
+        for daylight in result:
+            self._assert_matches_scan(daylight, step_seconds=10.0)
+
+    def test_edges_are_sunrise_and_sunset(self) -> None:
+        (daylight,) = DaylightIntervals.compute([45.0], [10.0], START, END)
+        eps = 0.01
+
+        for sunrise, sunset in zip(daylight.sunrise_s, daylight.sunset_s):
+            assert get_sun_elevation_array(45.0, 10.0, sunrise + eps) > 0
+            assert get_sun_elevation_array(45.0, 10.0, sunrise - eps) < 0
+            assert get_sun_elevation_array(45.0, 10.0, sunset - eps) > 0
+            assert get_sun_elevation_array(45.0, 10.0, sunset + eps) < 0
+
+    def test_next_lit_time_and_outside_window(self) -> None:
+        (daylight,) = DaylightIntervals.compute([45.0], [10.0], START, END)
+        night = daylight.sunset_s[0] + 3600.0
+        outside = daylight.end_epoch_s + 12 * 3600.0
+
+        assert daylight.next_lit_time(night) == daylight.sunrise_s[1]
+        assert daylight.next_lit_time(float(daylight.sunrise_s[0])) == (
+            daylight.sunrise_s[0]
+        )
+        assert daylight.next_lit_time(outside) == outside
+        assert bool(daylight.is_lit(outside)) == bool(
+            is_target_illuminated_array(45.0, 10.0, outside)
+        )
+
+    def test_reversed_window_raises(self) -> None:
+        with pytest.raises(ValueError):
+            DaylightIntervals.compute([0.0], [0.0], END, START)
+
+
+class TestOpticalSearchSkipsNight:
+    """Optical imaging scans never evaluate geometry at night."""
+
+    def test_fixed_step_scan_only_samples_daylight(self) -> None:
+        calculator = VisibilityCalculator(SatelliteOrbit(ISS_TLE, "ISS (ZARYA)"))
+        target = GroundTarget("Optical", 12.0, 100.0, max_spacecraft_roll=45.0)
+        start = datetime(2021, 10, 2)
+        end = start + timedelta(hours=24)
+        sampled = []
+        original = calculator._propagate
+
+        def record(epoch_s):
+            sampled.extend(epoch_s.tolist())
+            return original(epoch_s)
+
+        with patch.object(calculator, "_propagate", record):
+            passes = calculator.find_passes(target, start, end, time_step_seconds=10)
+
+        (daylight,) = calculator._target_daylight([target], start, end)
+        assert passes
+        assert 0 < len(sampled) < 0.75 * (24 * 3600 / 10)
+        assert daylight.is_lit(np.array(sampled)).all()
@@ -0,0 +1,97 @@
+"""
+Tests for the spatial target index.
+
+Tests cover:
+- Access half-angles for imaging and communication targets
+- Point queries against a brute-force scan
+- Sample grouping never drops a target within the radius
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from mission_planner.target_index import TargetIndex, access_half_angle_rad
+from mission_planner.targets import GroundTarget
+from mission_planner.utils import EARTH_RADIUS_KM, ground_arc_distance_km
+
+
+def _random_targets(n, seed=0, lat=(-80.0, 80.0), lon=(-180.0, 180.0)):
+    rng = np.random.default_rng(seed)
+    return [
+        GroundTarget(f"T{i}", float(rng.uniform(*lat)), float(rng.uniform(*lon)))
+        for i in range(n)
+    ]
+
+
+def _central_angles(index, lat, lon):
+    point = np.array(
+        [
+            math.cos(math.radians(lat)) * math.cos(math.radians(lon)),
+            math.cos(math.radians(lat)) * math.sin(math.radians(lon)),
+            math.sin(math.radians(lat)),
+        ]
+    )
+    return np.arccos(np.clip(index.unit_vectors @ point, -1.0, 1.0))
+
+
+class TestAccessHalfAngle:
+    """Tests for access_half_angle_rad."""
+
+    def test_imaging_uses_roll_cone(self) -> None:
+        target = GroundTarget("img", 0.0, 0.0, max_spacecraft_roll=30.0)
+        expected = ground_arc_distance_km(500.0, 30.1) / EARTH_RADIUS_KM
+        assert access_half_angle_rad(target, 500.0) == pytest.approx(expected)
+
+    def test_communication_zero_mask_is_horizon(self) -> None:
+        target = GroundTarget(
+            "gs", 0.0, 0.0, mission_type="communication", elevation_mask=0.0
+        )
+        horizon = math.acos(EARTH_RADIUS_KM / (EARTH_RADIUS_KM + 500.0))
+        assert access_half_angle_rad(target, 500.0) == pytest.approx(horizon)
+
+    def test_higher_mask_shrinks_access(self) -> None:
+        low = GroundTarget("a", 0.0, 0.0, mission_type="communication")
+        high = GroundTarget(
+            "b", 0.0, 0.0, mission_type="communication", elevation_mask=30.0
+        )
+        assert access_half_angle_rad(high, 500.0) < access_half_angle_rad(low, 500.0)
+
+
+class TestTargetIndex:
+    """Tests for TargetIndex queries."""
+
+    @pytest.mark.parametrize("radius_deg", [0.5, 5.0, 25.0])
+    def test_query_matches_brute_force(self, radius_deg) -> None:
+        index = TargetIndex(_random_targets(500))
+        radius = math.radians(radius_deg)
+
+        for lat, lon in [(0.0, 0.0), (45.0, 170.0), (-60.0, -179.5), (89.0, 10.0)]:
+            expected = np.flatnonzero(_central_angles(index, lat, lon) <= radius)
+            np.testing.assert_array_equal(index.query(lat, lon, radius), expected)
+
+    def test_groups_cover_every_nearby_pair(self) -> None:
+        index = TargetIndex(_random_targets(300, lat=(30.0, 40.0), lon=(10.0, 25.0)))
+        samples = _random_targets(2000, seed=1)
+        sample_vectors = TargetIndex(samples).unit_vectors
+        radius = math.radians(12.0)
+
+        seen = set()
+        visited = np.zeros(len(samples), dtype=bool)
+        for rows, sample_idx in index.candidate_groups(sample_vectors, radius):
+            assert not visited[sample_idx].any()
+            visited[sample_idx] = True
+            seen.update((int(r), int(s)) for r in rows for s in sample_idx)
+
+        angles = np.arccos(np.clip(index.unit_vectors @ sample_vectors.T, -1.0, 1.0))
+        near = {(int(r), int(s)) for r, s in zip(*np.nonzero(angles <= radius))}
+        assert near <= seen
+        # Samples on the far side of the globe are never paired with targets
+        assert not visited.all()
+
+    def test_empty_index(self) -> None:
+        index = TargetIndex([])
+        assert len(index) == 0
+        assert index.query(0.0, 0.0, 0.1).size == 0
+        assert index.access_radius_rad(500.0) == 0.0
@@ -0,0 +1,158 @@
+"""
+Tests for the indexed TLE catalog loader.
+
+Tests cover:
+- Name, NORAD ID and substring lookups
+- Reindexing when the file changes
+- from_tle_file / from_norad_id on top of the catalog
+- TLE search and catalog endpoints served from the local index
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.tle_catalog import TLECatalog, get_tle_catalog
+
+ISS = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+NOAA_18 = [
+    "NOAA 18",
+    "1 28654U 05018A   21275.50920185  .00000077  00000-0  66814-4 0  9999",
+    "2 28654  99.0478 317.0187 0014159  52.1497 308.0963 14.12705046844327",
+]
+NOAA_19 = [
+    "NOAA 19",
+    "1 33591U 09005A   21275.51082176  .00000071  00000-0  63858-4 0  9991",
+    "2 33591  99.1802 299.9340 0013960 210.3962 149.6382 14.12478543652043",
+]
+
+
+@pytest.fixture
+def tle_file(tmp_path):
+    path = tmp_path / "catalog.tle"
+    path.write_text("\n".join(ISS + NOAA_18 + NOAA_19) + "\n")
+    return path
+
+
+class TestTLECatalog:
+    """Tests for TLECatalog lookups."""
+
+    def test_indexes_all_entries(self, tle_file) -> None:
+        catalog = TLECatalog(tle_file)
+        assert len(catalog) == 3
+        assert catalog.names() == ["ISS (ZARYA)", "NOAA 18", "NOAA 19"]
+
+    def test_exact_name_lookup_is_case_insensitive(self, tle_file) -> None:
+        entry = TLECatalog(tle_file).get("noaa 19")
+        assert entry is not None
+        assert entry.lines() == NOAA_19
+
+    def test_norad_id_lookup(self, tle_file) -> None:
+        catalog = TLECatalog(tle_file)
+        assert catalog.get_by_norad_id(28654).name == "NOAA 18"
+        assert catalog.get_by_norad_id("25544").name == "ISS (ZARYA)"
+        assert catalog.get_by_norad_id(99999) is None
+
+    def test_search_substring_in_file_order(self, tle_file) -> None:
+        catalog = TLECatalog(tle_file)
+        assert [e.name for e in catalog.search("oaa")] == ["NOAA 18", "NOAA 19"]
+        assert [e.name for e in catalog.search("noaa", limit=1)] == ["NOAA 18"]
+        assert catalog.count("noaa") == 2
+        assert catalog.search("zzz") == []
+
+    def test_short_query(self, tle_file) -> None:
+        assert [e.name for e in TLECatalog(tle_file).search("19")] == ["NOAA 19"]
+
+    def test_two_line_sets_indexed_by_norad_id(self, tmp_path) -> None:
+        path = tmp_path / "two_line.tle"
+        path.write_text("\n".join(ISS[1:] + NOAA_19[1:]) + "\n")
+
+        catalog = TLECatalog(path)
+
+        assert catalog.names() == ["25544", "33591"]
+        assert catalog.get_by_norad_id(33591).line2 == NOAA_19[2]
+
+    def test_reindexes_when_file_changes(self, tle_file) -> None:
+        catalog = TLECatalog(tle_file)
+        tle_file.write_text("\n".join(NOAA_19) + "\n")
+        os.utime(tle_file, ns=(0, 10**18))
+
+        assert catalog.names() == ["NOAA 19"]
+        assert catalog.get("ISS (ZARYA)") is None
+
+    def test_iterates_all_entries(self, tle_file) -> None:
+        assert [e.lines() for e in TLECatalog(tle_file)] == [ISS, NOAA_18, NOAA_19]
+
+    def test_shared_catalog_per_path(self, tle_file) -> None:
+        assert get_tle_catalog(tle_file) is get_tle_catalog(str(tle_file))
+
+
+class TestSatelliteOrbitFromCatalog:
+    """Tests for SatelliteOrbit constructors backed by the catalog."""
+
+    def test_from_tle_file_first_substring_match(self, tle_file) -> None:
+        sat = SatelliteOrbit.from_tle_file(tle_file, "NOAA")
+        assert sat.tle_lines == NOAA_18
+
+    def test_from_norad_id(self, tle_file) -> None:
+        sat = SatelliteOrbit.from_norad_id(tle_file, 33591)
+        assert sat.satellite_name == "NOAA 19"
+        assert sat.tle_lines == NOAA_19
+
+    def test_from_norad_id_not_found(self, tle_file) -> None:
+        with pytest.raises(ValueError):
+            SatelliteOrbit.from_norad_id(tle_file, 11111)
+
+
+class TestTLEEndpoints:
+    """TLE search and catalog endpoints use the downloaded, indexed catalog."""
+
+    @pytest.fixture
+    def catalog_dir(self, tmp_path, monkeypatch):
+        import backend.main as main_module
+
+        response = MagicMock()
+        response.text = "\n".join(ISS + NOAA_18 + NOAA_19)
+        fetch = MagicMock(return_value=response)
+        monkeypatch.setattr(main_module, "TLE_CATALOG_DIR", str(tmp_path))
+        monkeypatch.setattr(main_module.requests, "get", fetch)
+        return fetch
+
+    def test_search_downloads_once(self, test_client, catalog_dir) -> None:
+        first = test_client.post(
+            "/api/v1/tle/search", json={"query": "NOAA", "source": "celestrak_active"}
+        )
+        second = test_client.post(
+            "/api/v1/tle/search", json={"query": "iss", "source": "celestrak_active"}
+        )
+
+        assert first.status_code == 200
+        assert first.json()["count"] == 2
+        assert [s["name"] for s in second.json()["satellites"]] == ["ISS (ZARYA)"]
+        assert catalog_dir.call_count == 1
+
+    def test_catalog_lists_all_entries(self, test_client, catalog_dir) -> None:
+        response = test_client.get("/api/v1/tle/catalog/celestrak_active")
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+
+    def test_unknown_source(self, test_client, catalog_dir) -> None:
+        response = test_client.get("/api/v1/tle/catalog/not_a_source")
+        assert response.status_code == 404
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, catalog_dir) -> None:
+        import backend.main as main_module
+
+        with patch.object(
+            main_module.os, "replace", side_effect=OSError("disk full")
+        ), pytest.raises(OSError):
+            main_module._get_source_catalog("celestrak_active")
+
+        assert list(tmp_path.iterdir()) == []
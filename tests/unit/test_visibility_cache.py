@@ -0,0 +1,208 @@
+"""
+Tests for the incremental visibility cache.
+
+Tests cover:
+- Only uncovered time ranges are computed
+- Passes straddling coverage and window edges match a full computation
+- Cache keys separate targets, constraints and search settings
+- Returned passes are copies; LRU eviction
+- MissionPlanner integration on a shifted horizon
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.planner import MissionPlanner
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import PassDetails
+from mission_planner.visibility_cache import VisibilityCache
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+
+DAY0 = datetime(2021, 10, 2)
+
+
+@pytest.fixture(scope="module")
+def satellite():
+    return SatelliteOrbit(ISS_TLE, "ISS (ZARYA)")
+
+
+def _pass(name, start, end):
+    return PassDetails(
+        target_name=name,
+        satellite_name="ISS (ZARYA)",
+        start_time=start,
+        max_elevation_time=start + (end - start) / 2,
+        end_time=end,
+        max_elevation=45.0,
+        start_azimuth=0.0,
+        max_elevation_azimuth=90.0,
+        end_azimuth=180.0,
+    )
+
+
+class FakeSearch:
+    """Visibility search over fixed true passes, clipped to the search window."""
+
+    def __init__(self, period_minutes=95, duration_minutes=10, offset_minutes=7):
+        self.calls = []
+        self.windows = [
+            (
+                DAY0 + timedelta(minutes=offset_minutes + k * period_minutes),
+                DAY0
+                + timedelta(minutes=offset_minutes + k * period_minutes)
+                + timedelta(minutes=duration_minutes),
+            )
+            for k in range(200)
+        ]
+
+    def __call__(self, targets, start, end):
+        self.calls.append(([t.name for t in targets], start, end))
+        return {
+            t.name: [
+                _pass(t.name, max(s, start), min(e, end))
+                for s, e in self.windows
+                if s <= end and e >= start
+            ]
+            for t in targets
+        }
+
+
+def _times(passes):
+    return [(p.start_time, p.end_time) for p in passes]
+
+
+def _targets():
+    return [GroundTarget("A", 10.0, 20.0), GroundTarget("B", -30.0, 140.0)]
+
+
+class TestVisibilityCache:
+    """Coverage tracking and range computation."""
+
+    def test_repeat_request_is_served_from_cache(self, satellite) -> None:
+        cache, search = VisibilityCache(), FakeSearch()
+        start, end = DAY0, DAY0 + timedelta(days=2)
+
+        first = cache.get_visibility_windows(satellite, _targets(), start, end, search)
+        second = cache.get_visibility_windows(satellite, _targets(), start, end, search)
+
+        assert len(search.calls) == 1
+        assert search.calls[0] == (["A", "B"], start, end)
+        assert _times(first["A"]) == _times(second["A"])
+        assert cache.stats()["reuse_ratio"] == pytest.approx(0.5)
+
+    def test_shifted_horizon_computes_only_new_range(self, satellite) -> None:
+        cache, search = VisibilityCache(), FakeSearch()
+        # Window ends fall inside true passes
+        start = DAY0 + timedelta(minutes=9)
+        cache.get_visibility_windows(
+            satellite, _targets(), start, start + timedelta(days=3), search
+        )
+        shifted = start + timedelta(days=1)
+        shifted_end = shifted + timedelta(days=3)
+
+        result = cache.get_visibility_windows(
+            satellite, _targets(), shifted, shifted_end, search
+        )
+
+        expected = FakeSearch()(_targets(), shifted, shifted_end)
+        for name in ("A", "B"):
+            assert _times(result[name]) == _times(expected[name])
+        computed = sum((end - begin).total_seconds() for _, begin, end in search.calls)
+        # Three days at first, then one day plus boundary margins and edge clips
+        assert computed < (4 * 86400 + 3600)
+
+    def test_gap_inside_coverage(self, satellite) -> None:
+        cache, search = VisibilityCache(), FakeSearch()
+        first = (DAY0, DAY0 + timedelta(hours=10, minutes=12))
+        second = (DAY0 + timedelta(hours=20), DAY0 + timedelta(days=1, minutes=3))
+        for window in (first, second):
+            cache.get_visibility_windows(satellite, _targets(), *window, search)
+
+        result = cache.get_visibility_windows(
+            satellite, _targets(), DAY0, second[1], search
+        )
+
+        expected = FakeSearch()(_targets(), DAY0, second[1])
+        assert _times(result["A"]) == _times(expected["A"])
+
+    def test_keys_separate_constraints_and_search(self, satellite) -> None:
+        cache, search = VisibilityCache(), FakeSearch()
+        window = (DAY0, DAY0 + timedelta(hours=6))
+        masked = GroundTarget("A", 10.0, 20.0, elevation_mask=30.0)
+
+        cache.get_visibility_windows(satellite, [_targets()[0]], *window, search)
+        cache.get_visibility_windows(satellite, [masked], *window, search)
+        cache.get_visibility_windows(
+            satellite, [_targets()[0]], *window, search, search_key="adaptive"
+        )
+        cache.get_visibility_windows(satellite, [_targets()[0]], *window, search)
+
+        assert len(search.calls) == 3
+        assert len(cache) == 3
+
+    def test_returns_copies(self, satellite) -> None:
+        cache, search = VisibilityCache(), FakeSearch()
+        window = (DAY0, DAY0 + timedelta(hours=6))
+
+        first = cache.get_visibility_windows(satellite, _targets(), *window, search)
+        first["A"][0].satellite_id = "sat_other"
+        second = cache.get_visibility_windows(satellite, _targets(), *window, search)
+
+        assert second["A"][0].satellite_id == ""
+
+    def test_lru_eviction(self, satellite) -> None:
+        cache, search = VisibilityCache(max_entries=1), FakeSearch()
+        window = (DAY0, DAY0 + timedelta(hours=6))
+
+        cache.get_visibility_windows(satellite, _targets(), *window, search)
+
+        assert len(cache) == 1
+        cache.get_visibility_windows(satellite, [_targets()[1]], *window, search)
+        assert len(search.calls) == 1
+
+    def test_invalid_max_entries(self) -> None:
+        with pytest.raises(ValueError):
+            VisibilityCache(max_entries=0)
+
+
+class TestPlannerIntegration:
+    """MissionPlanner.compute_passes with a visibility cache."""
+
+    def test_shifted_horizon_matches_full_computation(self, satellite) -> None:
+        targets = [
+            GroundTarget(
+                "Station", 40.0, -100.0, mission_type="communication", elevation_mask=5
+            ),
+            GroundTarget(
+                "Equator", 0.0, 30.0, mission_type="communication", elevation_mask=0
+            ),
+        ]
+        planner = MissionPlanner(satellite, targets)
+        cache = VisibilityCache()
+        progress = []
+
+        for hours in (0, 7, 13):
+            start = DAY0 + timedelta(hours=hours)
+            end = start + timedelta(days=1)
+            cached = planner.compute_passes(
+                start,
+                end,
+                use_adaptive=False,
+                visibility_cache=cache,
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+            full = planner.compute_passes(start, end, use_adaptive=False)
+            for target in targets:
+                assert [p.to_dict() for p in cached[target.name]] == [
+                    p.to_dict() for p in full[target.name]
+                ]
+
+        assert progress == [(2, 2)] * 3
+        assert cache.stats()["reuse_ratio"] > 0.3
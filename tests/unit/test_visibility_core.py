@@ -177,7 +177,7 @@ class TestGetVisibilityWindows:
 
         assert "TestTarget" in result
 
-    @patch("mission_planner.parallel.ParallelVisibilityCalculator.get_visibility_windows")
+    @patch("mission_planner.parallel.ParallelVisibilityCalculator.compute_pass_table")
     def test_parallel_broken_pool_falls_back_to_serial(
         self,
         mock_parallel_get_visibility_windows,
@@ -0,0 +1,120 @@
+"""
+Tests for the multi-target visibility matrix.
+
+Tests cover:
+- Matrix passes match fixed-step find_passes for communication and imaging
+- Runs that span screening block boundaries
+- Batched AOS/LOS refinement on a coarse grid
+- Routing of large serial searches through the matrix
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+import mission_planner.visibility as visibility_module
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+
+START = datetime(2021, 10, 2, 0, 0, 0)
+END = START + timedelta(hours=6)
+
+
+def _targets():
+    sar = GroundTarget("Athens SAR", 37.98, 23.73, max_spacecraft_roll=30.0)
+    sar.imaging_type = "sar"
+    return [
+        GroundTarget(
+            "Station", 40.0, -100.0, mission_type="communication", elevation_mask=5.0
+        ),
+        GroundTarget("Optical", 12.0, 100.0, max_spacecraft_roll=45.0),
+        sar,
+        GroundTarget("Nowhere", 89.0, 0.0, mission_type="communication"),
+    ]
+
+
+@pytest.fixture
+def calculator():
+    return VisibilityCalculator(SatelliteOrbit(ISS_TLE, "ISS (ZARYA)"))
+
+
+def _as_dicts(passes):
+    return [p.to_dict() for p in passes]
+
+
+class TestFindPassesMatrix:
+    """Matrix search agrees with the per-target fixed-step search."""
+
+    def test_matches_find_passes(self, calculator) -> None:
+        targets = _targets()
+
+        result = calculator.find_passes_matrix(targets, START, END)
+
+        assert list(result) == [t.name for t in targets]
+        assert sum(len(passes) for passes in result.values()) > 0
+        for target in targets:
+            expected = calculator.find_passes(target, START, END)
+            actual = result[target.name]
+            assert len(actual) == len(expected), target.name
+            for got, want in zip(_as_dicts(actual), _as_dicts(expected)):
+                assert got == pytest.approx(want, abs=1e-6)
+
+    def test_block_boundaries_do_not_split_passes(
+        self, calculator, monkeypatch
+    ) -> None:
+        targets = _targets()
+        expected = calculator.find_passes_matrix(targets, START, END)
+
+        monkeypatch.setattr(visibility_module, "MATRIX_BLOCK_ELEMENTS", 97)
+        result = calculator.find_passes_matrix(targets, START, END)
+
+        for target in targets:
+            assert _as_dicts(result[target.name]) == _as_dicts(expected[target.name])
+
+    def test_refined_edges_on_coarse_grid(self, calculator) -> None:
+        targets = _targets()
+        fine = calculator.find_passes_matrix(targets, START, END)
+
+        coarse = calculator.find_passes_matrix(
+            targets, START, END, time_step_seconds=20, refine_edges=True
+        )
+
+        for target in targets:
+            assert len(coarse[target.name]) == len(fine[target.name])
+            for got, want in zip(coarse[target.name], fine[target.name]):
+                # Fine passes are quantized to whole seconds
+                assert abs((got.start_time - want.start_time).total_seconds()) <= 1.5
+                assert abs((got.end_time - want.end_time).total_seconds()) <= 1.5
+
+    def test_empty_targets(self, calculator) -> None:
+        assert calculator.find_passes_matrix([], START, END) == {}
+
+
+class TestVisibilityWindowsRouting:
+    """Large fixed-step searches use the matrix instead of per-target scans."""
+
+    def test_many_targets_use_matrix(self, calculator, monkeypatch) -> None:
+        monkeypatch.setattr(visibility_module, "MATRIX_MIN_TARGETS", 2)
+        targets = _targets()
+        progress = []
+
+        with patch.object(
+            calculator, "find_passes", side_effect=AssertionError("per-target scan")
+        ):
+            result = calculator.get_visibility_windows(
+                targets,
+                START,
+                END,
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+
+        assert list(result) == [t.name for t in targets]
+        assert progress == [(len(targets), len(targets))]
@@ -0,0 +1,175 @@
+"""
+Tests for adaptive AOS/LOS refinement modes.
+
+Tests cover:
+- Refinement method validation
+- Brent refinement agrees with bisection in fewer evaluations
+- Safe coarse steps never skip visibility
+- Brent-mode windows against the STK access report in examples/
+- Float epoch-second time inside the adaptive search
+"""
+
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit, datetime_to_epoch_seconds
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import VisibilityCalculator
+
+ICEYE_TLE = [
+    "ICEYE-X44",
+    "1 62707U 25009DC  25288.94104150  .00005233  00000+0  49676-3 0  9994",
+    "2 62707  97.7279   6.9881 0001205 170.4542 189.6701 14.93939975 63446",
+]
+STK_CSV = (
+    Path(__file__).parents[2]
+    / "examples"
+    / "verification"
+    / "stk_imaging_opportunities.csv"
+)
+
+START = datetime(2025, 10, 15)
+END = datetime(2025, 10, 17)
+
+
+@pytest.fixture(scope="module")
+def satellite():
+    return SatelliteOrbit(ICEYE_TLE, "ICEYE-X44")
+
+
+def _sar_target(name="T1", lat=84.699032, lon=66.784494):
+    target = GroundTarget(
+        name, lat, lon, mission_type="imaging", max_spacecraft_roll=45.0
+    )
+    target.imaging_type = "sar"
+    return target
+
+
+def _calculator(satellite, method):
+    calc = VisibilityCalculator(satellite, use_adaptive=True, refinement_method=method)
+    calc.ensure_ephemeris(START, END)
+    return calc
+
+
+class TestRefinementMethod:
+    """Tests for refinement method selection."""
+
+    def test_default_is_bisection(self, satellite) -> None:
+        assert VisibilityCalculator(satellite).refinement_method == "bisection"
+
+    def test_invalid_method_raises(self, satellite) -> None:
+        with pytest.raises(ValueError):
+            VisibilityCalculator(satellite, refinement_method="newton")
+
+
+class TestBrentRefinement:
+    """Tests for Brent edge refinement and safe coarse steps."""
+
+    def test_brent_matches_bisection_with_fewer_evaluations(self, satellite) -> None:
+        target = _sar_target()
+        bisection = _calculator(satellite, "bisection")
+        brent = _calculator(satellite, "brent")
+        # Bracket around the first STK AOS for T1 (08:31:32.755)
+        t_before = datetime_to_epoch_seconds(datetime(2025, 10, 15, 8, 31, 0))
+        t_after = t_before + 60.0
+
+        edges = {}
+        evaluations = {}
+        for calc in (bisection, brent):
+            g_before = calc._compute_event_function(target, t_before)
+            g_after = calc._compute_event_function(target, t_after)
+            start = calc.event_evaluations
+            refine = (
+                calc._refine_edge_time_brent
+                if calc.refinement_method == "brent"
+                else calc._refine_edge_time
+            )
+            edges[calc.refinement_method] = refine(
+                target, t_before, t_after, g_before, g_after
+            )
+            evaluations[calc.refinement_method] = calc.event_evaluations - start
+
+        assert abs(edges["brent"] - edges["bisection"]) <= 0.5
+        assert evaluations["brent"] < evaluations["bisection"]
+
+    def test_safe_step_never_skips_visibility(self, satellite) -> None:
+        target = _sar_target()
+        calc = _calculator(satellite, "brent")
+        bounds = calc._get_motion_bounds(START, END)
+
+        t = datetime_to_epoch_seconds(START)
+        while t < datetime_to_epoch_seconds(START + timedelta(hours=6)):
+            g = calc._compute_event_function(target, t)
+            step = calc._safe_step_seconds(target, t, g, bounds)
+            if step >= 2:
+                visible = [
+                    calc._compute_event_function(target, t + s) > 0
+                    for s in range(1, int(step))
+                ]
+                assert all(v == (g > 0) for v in visible)
+            t += max(step, 30)
+
+    def test_windows_match_stk_with_fewer_evaluations(self, satellite) -> None:
+        fmt = "%Y-%m-%d %H:%M:%S.%f"
+        with open(STK_CSV) as f:
+            stk = [
+                (
+                    datetime.strptime(r["Start_Time"], fmt),
+                    datetime.strptime(r["End_Time"], fmt),
+                )
+                for r in csv.DictReader(f)
+                if r["Target"] == "T1"
+            ]
+        stk = [w for w in stk if START <= w[0] and w[1] <= END]
+        target = _sar_target()
+
+        bisection = _calculator(satellite, "bisection")
+        bisection._find_visibility_windows_adaptive(target, START, END)
+        brent = _calculator(satellite, "brent")
+        windows = brent._find_visibility_windows_adaptive(target, START, END)
+
+        assert len(windows) == len(stk)
+        for (aos, los), (stk_aos, stk_los) in zip(windows, stk):
+            # STK used a different TLE epoch; agreement is ~1 s
+            assert abs((aos - stk_aos).total_seconds()) <= 2.0
+            assert abs((los - stk_los).total_seconds()) <= 2.0
+        assert brent.event_evaluations * 4 < bisection.event_evaluations
+
+
+class TestEpochSecondsCore:
+    """The adaptive search keeps time as float seconds internally."""
+
+    def test_windows_are_datetimes_within_search(self, satellite) -> None:
+        calc = _calculator(satellite, "brent")
+
+        windows = calc._find_visibility_windows_adaptive(_sar_target(), START, END)
+
+        assert windows
+        for aos, los in windows:
+            assert isinstance(aos, datetime) and isinstance(los, datetime)
+            assert START <= aos < los <= END
+
+    def test_window_open_at_end_returns_exact_end(self, satellite) -> None:
+        calc = _calculator(satellite, "brent")
+        aos, los = calc._find_visibility_windows_adaptive(_sar_target(), START, END)[0]
+        end = aos + (los - aos) / 2
+
+        windows = calc._find_visibility_windows_adaptive(_sar_target(), START, end)
+
+        assert windows[-1][1] is end
+
+    def test_position_cache_keyed_by_epoch_second(self, satellite) -> None:
+        calc = _calculator(satellite, "bisection")
+        t = datetime(2025, 10, 15, 8, 31, 0, 400000)
+
+        calc.calculate_elevation_azimuth(_sar_target(), t)
+        calc.calculate_elevation_azimuth(_sar_target(), t.replace(microsecond=900000))
+
+        info = calc._get_satellite_position.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert calc._get_satellite_position(
+            int(datetime_to_epoch_seconds(t))
+        ) == pytest.approx(calc.get_satellite_position(t.replace(microsecond=0)))
@@ -0,0 +1,252 @@
+"""
+Tests for the persistent visibility result store.
+
+Tests cover:
+- Result keys are stable and separate TLEs, targets, horizons and settings
+- Results survive reopening the store file
+- Hit/miss counters and LRU eviction by size
+- Unreadable rows are recomputed
+- MissionPlanner integration
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from mission_planner.orbit import SatelliteOrbit
+from mission_planner.planner import MissionPlanner
+from mission_planner.targets import GroundTarget
+from mission_planner.visibility import PassDetails
+from mission_planner.visibility_cache import VisibilityCache
+from mission_planner.visibility_store import (
+    VisibilityStore,
+    configure_visibility_store,
+    get_visibility_store,
+)
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21275.52531015  .00001296  00000-0  29941-4 0  9998",
+    "2 25544  51.6442 208.5455 0003525 319.8489 175.3714 15.48919755305637",
+]
+OTHER_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21276.52531015  .00001296  00000-0  29941-4 0  9997",
+    "2 25544  51.6442 203.5455 0003525 319.8489 175.3714 15.48919755305652",
+]
+
+START = datetime(2021, 10, 2)
+END = START + timedelta(hours=12)
+
+
+@pytest.fixture(scope="module")
+def satellite():
+    return SatelliteOrbit(ISS_TLE, "ISS (ZARYA)")
+
+
+class FakeSearch:
+    """Visibility search returning one pass per target."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, targets, start, end):
+        self.calls.append([t.name for t in targets])
+        return {
+            t.name: [
+                PassDetails(
+                    target_name=t.name,
+                    satellite_name="ISS (ZARYA)",
+                    start_time=start + timedelta(hours=1),
+                    max_elevation_time=start + timedelta(hours=1, minutes=4),
+                    end_time=start + timedelta(hours=1, minutes=8),
+                    max_elevation=45.0,
+                    start_azimuth=0.0,
+                    max_elevation_azimuth=90.0,
+                    end_azimuth=180.0,
+                )
+            ]
+            for t in targets
+        }
+
+
+def _targets(count=2):
+    return [GroundTarget(f"T{i}", 10.0 * i, 20.0 * i) for i in range(count)]
+
+
+class TestResultKey:
+    """Content-addressed result keys."""
+
+    def test_key_is_stable(self, satellite) -> None:
+        target = _targets(1)[0]
+        copy = SatelliteOrbit(list(ISS_TLE), "ISS (ZARYA)")
+
+        key = VisibilityStore.result_key(satellite, target, START, END, "adaptive")
+
+        assert key == VisibilityStore.result_key(
+            copy, _targets(1)[0], START, END, "adaptive"
+        )
+        assert len(key) == 64
+
+    def test_key_changes_with_inputs(self, satellite) -> None:
+        target = _targets(1)[0]
+        base = VisibilityStore.result_key(satellite, target, START, END)
+        masked = GroundTarget("T0", 0.0, 0.0, elevation_mask=30.0)
+        rolled = GroundTarget("T0", 0.0, 0.0, max_spacecraft_roll=10.0)
+
+        variants = [
+            VisibilityStore.result_key(
+                SatelliteOrbit(OTHER_TLE, "ISS (ZARYA)"), target, START, END
+            ),
+            VisibilityStore.result_key(satellite, masked, START, END),
+            VisibilityStore.result_key(satellite, rolled, START, END),
+            VisibilityStore.result_key(satellite, target, START, END, "fixed-step"),
+            VisibilityStore.result_key(
+                satellite, target, START, END + timedelta(hours=1)
+            ),
+        ]
+
+        assert len({base, *variants}) == len(variants) + 1
+
+
+class TestVisibilityStore:
+    """Persistence, counters and eviction."""
+
+    def test_results_survive_reopening(self, satellite, tmp_path) -> None:
+        path = tmp_path / "store.sqlite"
+        search = FakeSearch()
+        first = VisibilityStore(path).get_visibility_windows(
+            satellite, _targets(), START, END, search
+        )
+
+        reopened = VisibilityStore(path)
+        second = reopened.get_visibility_windows(
+            satellite, _targets(), START, END, search
+        )
+
+        assert search.calls == [["T0", "T1"]]
+        for name in ("T0", "T1"):
+            assert [p.to_dict() for p in second[name]] == [
+                p.to_dict() for p in first[name]
+            ]
+        assert reopened.stats()["hits"] == 2
+
+    def test_only_missing_targets_are_computed(self, satellite, tmp_path) -> None:
+        store, search = VisibilityStore(tmp_path / "store.sqlite"), FakeSearch()
+        store.get_visibility_windows(satellite, _targets(2), START, END, search)
+
+        result = store.get_visibility_windows(
+            satellite, _targets(3), START, END, search
+        )
+
+        assert search.calls == [["T0", "T1"], ["T2"]]
+        assert set(result) == {"T0", "T1", "T2"}
+        stats = store.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 3, 3)
+        assert stats["hit_rate"] == pytest.approx(0.4)
+
+    def test_empty_results_are_stored(self, satellite, tmp_path) -> None:
+        store = VisibilityStore(tmp_path / "store.sqlite")
+        calls = []
+
+        def no_passes(targets, start, end):
+            calls.append(len(targets))
+            return {}
+
+        for _ in range(2):
+            result = store.get_visibility_windows(
+                satellite, _targets(), START, END, no_passes
+            )
+
+        assert calls == [2]
+        assert result == {"T0": [], "T1": []}
+
+    def test_lru_eviction_by_size(self, satellite, tmp_path) -> None:
+        store = VisibilityStore(tmp_path / "store.sqlite")
+        search = FakeSearch()
+        store.get_visibility_windows(satellite, _targets(1), START, END, search)
+        entry_size = store.stats()["bytes"]
+        # Room for two entries (payload sizes differ by a few bytes per target)
+        store = VisibilityStore(
+            tmp_path / "store.sqlite", max_bytes=2 * entry_size + entry_size // 2
+        )
+
+        # T0 is stored first but used again, so T1 is the oldest when T2 arrives
+        store.get_visibility_windows(satellite, _targets(2), START, END, search)
+        store.get_visibility_windows(satellite, _targets(1), START, END, search)
+        store.get_visibility_windows(satellite, _targets(3)[2:], START, END, search)
+
+        stats = store.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= stats["max_bytes"]
+        store.get_visibility_windows(satellite, _targets(1), START, END, search)
+        assert search.calls == [["T0"], ["T1"], ["T2"]]
+
+    def test_unreadable_row_is_recomputed(self, satellite, tmp_path) -> None:
+        store, search = VisibilityStore(tmp_path / "store.sqlite"), FakeSearch()
+        store.get_visibility_windows(satellite, _targets(1), START, END, search)
+        with store._connect() as conn:
+            conn.execute("UPDATE visibility_results SET payload = x'00'")
+
+        result = store.get_visibility_windows(
+            satellite, _targets(1), START, END, search
+        )
+
+        assert len(search.calls) == 2
+        assert len(result["T0"]) == 1
+        assert len(store) == 1
+
+    def test_clear_and_invalid_size(self, satellite, tmp_path) -> None:
+        store = VisibilityStore(tmp_path / "store.sqlite")
+        store.get_visibility_windows(satellite, _targets(), START, END, FakeSearch())
+
+        store.clear()
+
+        assert len(store) == 0
+        assert store.stats()["misses"] == 0
+        with pytest.raises(ValueError):
+            VisibilityStore(tmp_path / "other.sqlite", max_bytes=0)
+
+    def test_configured_from_environment(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.delenv("MISSION_PLANNER_VISIBILITY_STORE_PATH", raising=False)
+        monkeypatch.delenv("MISSION_PLANNER_VISIBILITY_STORE_MAX_MB", raising=False)
+        assert get_visibility_store() is None
+
+        configure_visibility_store(tmp_path / "env.sqlite", max_bytes=1024 * 1024)
+        store = get_visibility_store()
+
+        assert store is get_visibility_store()
+        assert store.path == tmp_path / "env.sqlite"
+        assert store.max_bytes == 1024 * 1024
+        configure_visibility_store(None)
+        assert get_visibility_store() is None
+
+
+class TestPlannerIntegration:
+    """MissionPlanner.compute_passes with a visibility store."""
+
+    def test_stored_passes_match_computation(self, satellite, tmp_path) -> None:
+        targets = [
+            GroundTarget(
+                "Station", 40.0, -100.0, mission_type="communication", elevation_mask=5
+            ),
+        ]
+        planner = MissionPlanner(satellite, targets)
+        store = VisibilityStore(tmp_path / "store.sqlite")
+        end = START + timedelta(days=1)
+
+        full = planner.compute_passes(START, end, use_adaptive=False)
+        for cache in (None, VisibilityCache()):
+            stored = planner.compute_passes(
+                START,
+                end,
+                use_adaptive=False,
+                visibility_cache=cache,
+                visibility_store=store,
+            )
+            assert [p.to_dict() for p in stored["Station"]] == [
+                p.to_dict() for p in full["Station"]
+            ]
+
+        assert store.stats()["hits"] == 1